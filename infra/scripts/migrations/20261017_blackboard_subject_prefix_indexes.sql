@@ -0,0 +1,69 @@
+-- 20261017_blackboard_subject_prefix_indexes.sql
+--
+-- Prefix-searchable subject indexes for core.blackboard_entries.
+--
+-- Nearly every BlackboardQueryService / BlackboardClaimService method filters
+-- with `subject LIKE '<prefix>%'` plus a status predicate. The existing
+-- idx_blackboard_subject_status btree uses the database collation, which the
+-- planner cannot turn into a LIKE-prefix range scan (it can only do that for
+-- "C" collation or text_pattern_ops). So those queries end up scanning the
+-- status index and filtering on subject, or scanning the whole table. Their
+-- cost grows with the ledger, and the ledger grows without bound with
+-- telemetry and resolved history.
+--
+-- This migration replaces that index with:
+--
+--   idx_blackboard_subject_pattern_status (subject text_pattern_ops, status)
+--       General-purpose. Serves subject equality (the post_observation
+--       indeterminate dedup, which is what idx_blackboard_subject_status was
+--       added for) and LIKE-prefix scans in any status, e.g. the
+--       resolved/abandoned history lookups.
+--
+--   idx_blackboard_finding_working_set (subject text_pattern_ops, created_at)
+--       WHERE entry_type = 'finding' AND status IN (open, claimed, awaiting_reaudit)
+--       The claim and open-fetch hot path, plus the awaiting_reaudit drain.
+--       Its size tracks the working set, not the history, so claim latency
+--       stays flat as resolved rows pile up. created_at is the claim ORDER
+--       BY, so the oldest-first claim reads the index in order. The
+--       `status = 'open'` predicates imply the index predicate.
+--
+--   idx_blackboard_finding_live_subject (subject text_pattern_ops)
+--       WHERE entry_type = 'finding' AND status NOT IN (resolved, abandoned)
+--       The sensor-dedup reads (fetch_active_finding_subjects_by_prefix,
+--       fetch_open_finding_subjects_by_prefix), which must also see
+--       suppressed / deferred_to_proposal / indeterminate rows.
+--
+-- The partial indexes pay off even for a prepared statement that Postgres
+-- has switched to a generic plan (where `LIKE $1` cannot be turned into a
+-- range scan): the fallback is a full scan of a working-set-sized index, not
+-- of the table.
+--
+-- Regression benchmark:
+-- tests/body/services/blackboard_service/test_subject_index_plan.py
+-- (integration). It EXPLAINs the hot-path shapes over a synthetic
+-- million-row ledger.
+--
+-- Online: CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+-- block, so this file has no BEGIN/COMMIT. Run it with plain
+-- `psql -f` (autocommit). Idempotent. Writers need not be quiesced. The new
+-- indexes are built before the old one is dropped, so no query is ever left
+-- without an index.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blackboard_subject_pattern_status
+    ON core.blackboard_entries USING btree (subject text_pattern_ops, status);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blackboard_finding_working_set
+    ON core.blackboard_entries USING btree (subject text_pattern_ops, created_at)
+    WHERE entry_type = 'finding'
+      AND status IN ('open', 'claimed', 'awaiting_reaudit');
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blackboard_finding_live_subject
+    ON core.blackboard_entries USING btree (subject text_pattern_ops)
+    WHERE entry_type = 'finding'
+      AND status NOT IN ('resolved', 'abandoned');
+
+-- Superseded by idx_blackboard_subject_pattern_status (a text_pattern_ops
+-- btree serves equality as well as prefix matching).
+DROP INDEX CONCURRENTLY IF EXISTS core.idx_blackboard_subject_status;
+
+ANALYZE core.blackboard_entries;
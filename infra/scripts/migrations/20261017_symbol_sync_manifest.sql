@@ -0,0 +1,38 @@
+-- 20261017_symbol_sync_manifest.sql
+--
+-- Incremental symbol sync (body.introspection.sync).
+--
+-- sync.knowledge_graph re-parsed every module under src/ and diffed the whole
+-- of core.symbols against a staging copy of every symbol on every run. This
+-- migration adds the state the incremental sync needs:
+--
+--   core.symbol_sync_manifest
+--       One row per module the sync has extracted: its stat identity
+--       (mtime_ns, size), its sha256 and the scanner version that extracted
+--       it. A module whose stat and scanner version match its row is not
+--       read. One whose stat changed but whose hash did not is not
+--       re-parsed. The sync writes the manifest in the same transaction as
+--       the symbol merge, so the two never disagree. An empty manifest
+--       (first run, or after a TRUNCATE) makes the next sync a full sync.
+--
+--   idx_symbols_source_file (split_part(symbol_path, '::', 1))
+--       The module a symbol was extracted from. The merge restricts its
+--       deletes to the changed modules through this expression.
+--
+-- Idempotent. Safe on a populated database: the table starts empty, so the
+-- first sync after this migration is a full sync that populates it.
+
+CREATE TABLE IF NOT EXISTS core.symbol_sync_manifest (
+    file_path text NOT NULL,
+    mtime_ns bigint NOT NULL,
+    size bigint NOT NULL,
+    content_hash text NOT NULL,
+    scanner_version text NOT NULL,
+    synced_at timestamp with time zone DEFAULT now() NOT NULL,
+    CONSTRAINT symbol_sync_manifest_pkey PRIMARY KEY (file_path)
+);
+
+COMMENT ON TABLE core.symbol_sync_manifest IS 'Per-module change-detection state of the symbol sync (body.introspection.sync). Written in the same transaction as the core.symbols merge. Rows are derived state: truncating the table forces a full sync.';
+
+CREATE INDEX IF NOT EXISTS idx_symbols_source_file
+    ON core.symbols USING btree (split_part(symbol_path, '::'::text, 1));
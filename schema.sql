@@ -1611,6 +1611,27 @@ CREATE TABLE core.symbol_vector_links (
 );
 
 
+--
+-- Name: symbol_sync_manifest; Type: TABLE; Schema: core; Owner: -
+--
+
+CREATE TABLE core.symbol_sync_manifest (
+    file_path text NOT NULL,
+    mtime_ns bigint NOT NULL,
+    size bigint NOT NULL,
+    content_hash text NOT NULL,
+    scanner_version text NOT NULL,
+    synced_at timestamp with time zone DEFAULT now() NOT NULL
+);
+
+
+--
+-- Name: TABLE symbol_sync_manifest; Type: COMMENT; Schema: core; Owner: -
+--
+
+COMMENT ON TABLE core.symbol_sync_manifest IS 'Per-module change-detection state of the symbol sync (body.introspection.sync). Written in the same transaction as the core.symbols merge. Rows are derived state: truncating the table forces a full sync.';
+
+
 --
 -- Name: symbols; Type: TABLE; Schema: core; Owner: -
 --
@@ -4053,6 +4074,14 @@ ALTER TABLE ONLY core.symbols
     ADD CONSTRAINT symbols_pkey PRIMARY KEY (id);
 
 
+--
+-- Name: symbol_sync_manifest symbol_sync_manifest_pkey; Type: CONSTRAINT; Schema: core; Owner: -
+--
+
+ALTER TABLE ONLY core.symbol_sync_manifest
+    ADD CONSTRAINT symbol_sync_manifest_pkey PRIMARY KEY (file_path);
+
+
 --
 -- Name: symbols symbols_symbol_path_key; Type: CONSTRAINT; Schema: core; Owner: -
 --
@@ -4477,10 +4506,24 @@ CREATE INDEX idx_blackboard_status ON core.blackboard_entries USING btree (statu
 
 
 --
--- Name: idx_blackboard_subject_status; Type: INDEX; Schema: core; Owner: -
+-- Name: idx_blackboard_finding_live_subject; Type: INDEX; Schema: core; Owner: -
+--
+
+CREATE INDEX idx_blackboard_finding_live_subject ON core.blackboard_entries USING btree (subject text_pattern_ops) WHERE ((entry_type = 'finding'::text) AND (status <> ALL (ARRAY['resolved'::text, 'abandoned'::text])));
+
+
+--
+-- Name: idx_blackboard_finding_working_set; Type: INDEX; Schema: core; Owner: -
+--
+
+CREATE INDEX idx_blackboard_finding_working_set ON core.blackboard_entries USING btree (subject text_pattern_ops, created_at) WHERE ((entry_type = 'finding'::text) AND (status = ANY (ARRAY['open'::text, 'claimed'::text, 'awaiting_reaudit'::text])));
+
+
+--
+-- Name: idx_blackboard_subject_pattern_status; Type: INDEX; Schema: core; Owner: -
 --
 
-CREATE INDEX idx_blackboard_subject_status ON core.blackboard_entries USING btree (subject, status);
+CREATE INDEX idx_blackboard_subject_pattern_status ON core.blackboard_entries USING btree (subject text_pattern_ops, status);
 
 
 --
@@ -5098,6 +5141,13 @@ CREATE INDEX idx_symbols_public_active ON core.symbols USING btree (id, symbol_p
 CREATE INDEX idx_symbols_qualname ON core.symbols USING btree (qualname);
 
 
+--
+-- Name: idx_symbols_source_file; Type: INDEX; Schema: core; Owner: -
+--
+
+CREATE INDEX idx_symbols_source_file ON core.symbols USING btree (split_part(symbol_path, '::'::text, 1));
+
+
 --
 -- Name: idx_symbols_state; Type: INDEX; Schema: core; Owner: -
 --
@@ -35,7 +35,9 @@ class AuditClient:
         policy_ids: list[str] | None = None,
         files: list[str] | None = None,
         force_llm: bool = False,
+        no_cache: bool = False,
         source: str = "api",
+        workers: int | None = None,
     ) -> dict:
         """POST /v1/audit/runs with wait=true — full sync audit result.
 
@@ -57,6 +59,8 @@ class AuditClient:
                 "policy_ids": policy_ids or [],
                 "files": files or [],
                 "force_llm": force_llm,
+                "no_cache": no_cache,
+                "workers": workers,
                 "source": source,
                 "wait": True,
             },
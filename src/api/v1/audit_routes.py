@@ -42,7 +42,7 @@ from fastapi import (
     Request,
     Response,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -92,6 +92,11 @@ class CreateAuditRunRequest(BaseModel):
     policy_ids: list[str] = []
     files: list[str] = []
     force_llm: bool = False
+    # Drop persisted per-file verdicts before the run (wait=true only).
+    no_cache: bool = False
+    # Worker processes for CPU-bound engines (wait=true only); None uses
+    # operational_config.audit.parallel_workers.
+    workers: int | None = Field(default=None, ge=0)
     wait: bool = False
     source: str = "api"
 
@@ -133,6 +138,8 @@ async def create_audit_run(
             policy_ids=payload.policy_ids,
             files=payload.files,
             force_llm=payload.force_llm,
+            no_cache=payload.no_cache,
+            workers=payload.workers,
             source=payload.source,
         )
 
@@ -5,10 +5,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from pathlib import Path
 from typing import Any
 
 from shared.infrastructure.intent.operational_config import load_operational_config
+from shared.infrastructure.vector.point_ids import load_point_ids_by_file
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
 
 
 _CFG_CHK = load_operational_config().chunking
@@ -181,32 +187,65 @@ async def _embed_and_upsert(
     artifact_type: str,
     qdrant: Any,
     cognitive: Any,
+    force: bool = False,
 ) -> int:
-    """Embed chunks and upsert to Qdrant. Returns number of chunks upserted."""
+    """Sync one file's chunks to Qdrant. Returns the file's chunk count.
+
+    Point IDs are keyed on the chunk's content hash — the same identity
+    RepoEmbedderWorker uses — so both writers converge on one point per
+    distinct chunk. Chunks whose point already exists are not re-embedded
+    unless ``force`` is set (needed after an embedding model or dimension
+    change, when the stored vectors are stale under the same ids); the
+    file's other stored points (edited-away chunks, legacy
+    ``::chunk::{i}`` points) are deleted after the upsert either way.
+    """
     from qdrant_client import models as qm
 
     from shared.universal import get_deterministic_id
 
     await qdrant.ensure_collection(collection_name=collection)
+    try:
+        existing: set[str] | None = (
+            await load_point_ids_by_file(qdrant, collection, [file_path])
+        )[file_path]
+    except Exception as exc:
+        logger.warning(
+            "sync.vectors_code: could not read stored chunks for %s (%s); "
+            "re-embedding all chunks",
+            file_path,
+            exc,
+        )
+        existing = None
+
+    wanted: dict[str, tuple[dict[str, Any], str, str]] = {}
+    for chunk in chunks:
+        if not chunk["text"]:
+            continue
+        digest = hashlib.sha256(chunk["text"].encode("utf-8")).hexdigest()
+        item_id = f"{file_path}::chunk::{digest}"
+        point_id = str(get_deterministic_id(item_id))
+        wanted.setdefault(point_id, (chunk, item_id, digest))
+
+    reused = set(wanted) & existing if existing is not None and not force else set()
+    new = [pid for pid in wanted if pid not in reused]
 
     # Concurrency is bounded by the Vectorizer LLMClient's
     # asyncio.Semaphore(max_concurrent) at the resource layer, so the
     # gather here can fan out the full chunk list without overrunning the
-    # embedding host. Order is preserved, so the deterministic chunk
-    # index (used to build the Qdrant point ID) stays stable.
+    # embedding host.
     embeddings = await asyncio.gather(
-        *(cognitive.get_embedding_for_code(c["text"]) for c in chunks)
+        *(cognitive.get_embedding_for_code(wanted[pid][0]["text"]) for pid in new)
     )
 
     points = []
-    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+    for point_id, embedding in zip(new, embeddings):
         if embedding is None:
             continue
-        item_id = f"{file_path}::chunk::{i}"
-        point_id = get_deterministic_id(item_id)
+        chunk, item_id, digest = wanted[point_id]
         payload = {
             **chunk["metadata"],
             "item_id": item_id,
+            "content_sha256": digest,
             "artifact_type": artifact_type,
             "file_path": file_path,
         }
@@ -224,5 +263,9 @@ async def _embed_and_upsert(
 
     if points:
         await qdrant.upsert_points(collection_name=collection, points=points, wait=True)
+    if existing:
+        orphans = sorted(existing - set(wanted))
+        if orphans:
+            await qdrant.delete_points(orphans, wait=True, collection_name=collection)
 
-    return len(points)
+    return len(reused) + len(points)
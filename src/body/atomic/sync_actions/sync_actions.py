@@ -176,10 +176,13 @@ async def action_sync_code_vectors(
         await crawl_svc.run_crawl(repo_root, cognitive_service)
 
         # Phase 1.5: Force — reset chunk_count on already-embedded artifacts so
-        # the embed loop re-processes them. Permanently-skipped artifacts
-        # (chunk_count = -1) are left alone. Qdrant point IDs are deterministic
-        # from (file_path, chunk_index), so the upsert overwrites existing
-        # vectors rather than producing duplicates.
+        # the embed loop re-processes them, and re-embed every chunk instead
+        # of reusing stored points (required after an embedding model or
+        # dimension change). Permanently-skipped artifacts (chunk_count = -1)
+        # are left alone. Qdrant point IDs are deterministic from
+        # (file_path, chunk content hash), so the upsert overwrites existing
+        # vectors rather than producing duplicates; points no chunk maps to
+        # any more (including legacy position-keyed ones) are deleted.
         reset_count = 0
         if force:
             reset_count = await artifact_svc.reset_pending_chunk_counts()
@@ -244,6 +247,7 @@ async def action_sync_code_vectors(
                         artifact_type=artifact_type,
                         qdrant=qdrant,
                         cognitive=cognitive_service,
+                        force=force,
                     )
 
                     await artifact_svc.update_artifact_chunk_count(
@@ -91,3 +91,12 @@ async def core_lifespan(app: FastAPI):
         yield
     finally:
         logger.info("🛑 CORE system shutting down.")
+        cognitive_service = getattr(core_context, "cognitive_service", None)
+        if cognitive_service is not None:
+            try:
+                await cognitive_service.aclose()
+            except Exception as e:
+                logger.warning("LLM client pool close failed: %s", e)
+        from mind.governance.audit_worker_pool import shutdown_audit_pool
+
+        shutdown_audit_pool()
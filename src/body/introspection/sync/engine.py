@@ -1,73 +1,200 @@
 # src/body/introspection/sync/engine.py
 
-"""Refactored logic for src/features/introspection/sync/engine.py."""
+"""Refactored logic for src/features/introspection/sync/engine.py.
+
+The merge loads the scanned symbols into a staging table with COPY (asyncpg
+copy_records_to_table on the session's own connection) and diffs it against
+core.symbols with NOT EXISTS anti-joins. When the caller passes the changed
+modules, the staging table holds only their symbols and deletes are
+restricted to those modules (idx_symbols_source_file), so the cost follows
+the size of the change rather than the size of core.symbols.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .scanner import SyncManifest
 
-# ID: 1d4f3f97-e8ce-4ebc-82b4-2d7f41ba55dd
-async def run_db_merge(session: AsyncSession, code_state: list[dict]) -> dict[str, int]:
-    """Executes the set-based merge logic exactly as in the original file."""
-    stats = {"scanned": len(code_state), "inserted": 0, "updated": 0, "deleted": 0}
 
+_STAGING_COLUMNS = (
+    "id",
+    "symbol_path",
+    "module",
+    "qualname",
+    "kind",
+    "ast_signature",
+    "fingerprint",
+    "state",
+    "is_public",
+    "calls",
+    "domain",
+)
+
+
+async def _copy_rows(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: list[tuple[Any, ...]],
+) -> None:
+    """Bulk-load ``records`` into a session-local table.
+
+    COPY through the session's own asyncpg connection, so the rows are
+    visible to the session's transaction. Drivers without
+    copy_records_to_table fall back to an executemany INSERT.
+    """
+    if not records:
+        return
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    copy = getattr(raw.driver_connection, "copy_records_to_table", None)
+    if copy is not None:
+        await copy(table, records=records, columns=list(columns))
+        return
     await session.execute(
+        text(
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)})"
+        ),
+        [dict(zip(columns, record)) for record in records],
+    )
+
+
+# ID: 6b8d2f94-3e1a-4c57-a9d0-b4e7c1f5a382
+async def load_sync_manifest(session: AsyncSession) -> SyncManifest:
+    """The per-module state recorded by the last sync."""
+    result = await session.execute(
         text(
             """
-        CREATE TEMPORARY TABLE core_symbols_staging (LIKE core.symbols INCLUDING DEFAULTS) ON COMMIT DROP;
+        SELECT file_path, mtime_ns, size, content_hash, scanner_version
+        FROM core.symbol_sync_manifest
     """
         )
     )
+    return {row[0]: (row[1], row[2], row[3], row[4]) for row in result.fetchall()}
 
-    if code_state:
+
+# ID: 4d9a1e63-7f2c-4b85-b0e6-c3a8f5d2e917
+async def save_sync_manifest(
+    session: AsyncSession,
+    entries: SyncManifest,
+    removed_files: list[str],
+    replace: bool = False,
+) -> None:
+    """Record the modules this sync scanned and forget the removed ones.
+
+    ``replace`` (after a full sync) drops every previous entry first.
+    """
+    if replace:
+        await session.execute(text("DELETE FROM core.symbol_sync_manifest"))
+    elif removed_files:
         await session.execute(
             text(
-                """
-            INSERT INTO core_symbols_staging (id, symbol_path, module, qualname, kind, ast_signature, fingerprint, state, is_public, calls, domain)
-            VALUES (:id, :symbol_path, :module, :qualname, :kind, :ast_signature, :fingerprint, :state, :is_public, :calls, :domain)
-        """
+                "DELETE FROM core.symbol_sync_manifest "
+                "WHERE file_path = ANY(cast(:paths as text[]))"
             ),
-            code_state,
+            {"paths": removed_files},
         )
+    if not entries:
+        return
+    paths = list(entries)
+    await session.execute(
+        text(
+            """
+        INSERT INTO core.symbol_sync_manifest
+            (file_path, mtime_ns, size, content_hash, scanner_version, synced_at)
+        SELECT m.file_path, m.mtime_ns, m.size, m.content_hash, m.scanner_version, NOW()
+        FROM unnest(
+            cast(:paths as text[]), cast(:mtimes as bigint[]), cast(:sizes as bigint[]),
+            cast(:hashes as text[]), cast(:versions as text[])
+        ) AS m(file_path, mtime_ns, size, content_hash, scanner_version)
+        ON CONFLICT (file_path) DO UPDATE SET
+            mtime_ns = EXCLUDED.mtime_ns,
+            size = EXCLUDED.size,
+            content_hash = EXCLUDED.content_hash,
+            scanner_version = EXCLUDED.scanner_version,
+            synced_at = EXCLUDED.synced_at
+    """
+        ),
+        {
+            "paths": paths,
+            "mtimes": [entries[p][0] for p in paths],
+            "sizes": [entries[p][1] for p in paths],
+            "hashes": [entries[p][2] for p in paths],
+            "versions": [entries[p][3] for p in paths],
+        },
+    )
 
-    # 1. Calculate Deleted
-    stats["deleted"] = (
-        await session.execute(
-            text(
-                "SELECT COUNT(*) FROM core.symbols WHERE symbol_path NOT IN (SELECT symbol_path FROM core_symbols_staging)"
-            )
-        )
-    ).scalar_one()
-    # 2. Calculate Inserted
-    stats["inserted"] = (
-        await session.execute(
-            text(
-                "SELECT COUNT(*) FROM core_symbols_staging WHERE symbol_path NOT IN (SELECT symbol_path FROM core.symbols)"
-            )
+
+# ID: 1d4f3f97-e8ce-4ebc-82b4-2d7f41ba55dd
+async def run_db_merge(
+    session: AsyncSession,
+    code_state: list[dict],
+    changed_files: list[str] | None = None,
+) -> dict[str, int]:
+    """Merge ``code_state`` into core.symbols with set-based statements.
+
+    ``changed_files`` None: ``code_state`` is the whole tree, and every
+    symbol missing from it is deleted. Otherwise ``code_state`` holds the
+    symbols of ``changed_files`` only, and only those modules' missing
+    symbols are deleted.
+    """
+    stats = {"scanned": len(code_state), "inserted": 0, "updated": 0, "deleted": 0}
+
+    await session.execute(
+        text(
+            """
+        CREATE TEMPORARY TABLE core_symbols_staging (LIKE core.symbols INCLUDING DEFAULTS) ON COMMIT DROP;
+    """
         )
-    ).scalar_one()
-    # 3. Calculate Updated
-    stats["updated"] = (
+    )
+    await _copy_rows(
+        session,
+        "core_symbols_staging",
+        _STAGING_COLUMNS,
+        [tuple(sym[c] for c in _STAGING_COLUMNS) for sym in code_state],
+    )
+    await session.execute(text("ANALYZE core_symbols_staging"))
+
+    if changed_files is None:
+        scope = ""
+    else:
         await session.execute(
             text(
                 """
-        SELECT COUNT(*) FROM core.symbols s JOIN core_symbols_staging st ON s.symbol_path = st.symbol_path
-        WHERE s.fingerprint != st.fingerprint OR s.calls::text != st.calls::text OR s.domain != st.domain OR s.kind != st.kind
-    """
+            CREATE TEMPORARY TABLE core_symbols_sync_scope (file_path text PRIMARY KEY) ON COMMIT DROP;
+        """
             )
         )
-    ).scalar_one()
+        await _copy_rows(
+            session,
+            "core_symbols_sync_scope",
+            ("file_path",),
+            [(path,) for path in changed_files],
+        )
+        scope = """
+          AND split_part(s.symbol_path, '::', 1) IN (SELECT file_path FROM core_symbols_sync_scope)"""
 
-    # Apply Operations
-    await session.execute(
+    # 1. Deleted: symbols of the scanned modules that are no longer in code.
+    deleted = await session.execute(
         text(
-            "DELETE FROM core.symbols WHERE symbol_path NOT IN (SELECT symbol_path FROM core_symbols_staging)"
+            f"""
+        DELETE FROM core.symbols s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM core_symbols_staging st WHERE st.symbol_path = s.symbol_path
+        ){scope}
+    """
         )
     )
+    stats["deleted"] = deleted.rowcount or 0
 
-    await session.execute(
+    # 2. Updated: structural changes to existing symbols.
+    updated = await session.execute(
         text(
             """
         UPDATE core.symbols
@@ -78,6 +205,7 @@ async def run_db_merge(session: AsyncSession, code_state: list[dict]) -> dict[st
     """
         )
     )
+    stats["updated"] = updated.rowcount or 0
 
     # ADR-151 D5: propagate deprecation-marker state to existing rows —
     # deliberately scoped to transitions INTO or OUT OF 'deprecated' so the
@@ -98,14 +226,18 @@ async def run_db_merge(session: AsyncSession, code_state: list[dict]) -> dict[st
     )
     stats["state_transitions"] = getattr(state_result, "rowcount", 0)
 
-    await session.execute(
+    # 3. Inserted: symbols new to core.symbols.
+    inserted = await session.execute(
         text(
             """
         INSERT INTO core.symbols (id, symbol_path, module, qualname, kind, ast_signature, fingerprint, state, is_public, calls, domain, created_at, updated_at, last_modified, first_seen, last_seen)
         SELECT id, symbol_path, module, qualname, kind, ast_signature, fingerprint, state, is_public, calls, domain, NOW(), NOW(), NOW(), NOW(), NOW()
-        FROM core_symbols_staging ON CONFLICT (symbol_path) DO NOTHING;
+        FROM core_symbols_staging st
+        WHERE NOT EXISTS (SELECT 1 FROM core.symbols s WHERE s.symbol_path = st.symbol_path)
+        ON CONFLICT (symbol_path) DO NOTHING;
     """
         )
     )
+    stats["inserted"] = inserted.rowcount or 0
 
     return stats
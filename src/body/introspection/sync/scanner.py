@@ -1,11 +1,36 @@
 # src/body/introspection/sync/scanner.py
 
-"""Refactored logic for src/features/introspection/sync/scanner.py."""
+"""Refactored logic for src/features/introspection/sync/scanner.py.
+
+Symbols are extracted per module by _scan_module. SymbolScanner.scan_changes
+only re-extracts the modules that changed since the manifest of the last
+sync:
+
+- a module whose (mtime_ns, size) and scanner version match its manifest
+  entry is not read;
+- a module whose stat changed is read and hashed, and re-parsed only if its
+  sha256 changed too;
+- when enough modules need reading, they are spread over a spawned process
+  pool (sync.symbol_scan_workers), since parsing is CPU-bound.
+
+The scanner version is a digest of the extraction code (this module, the
+visitor, shared.ast_utility, the domain mapper), so editing any of them
+re-extracts every module once.
+"""
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import inspect
 import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -17,40 +42,193 @@ from .visitor import SymbolVisitor
 
 logger = logging.getLogger(__name__)
 
+# repo-relative module path -> (mtime_ns, size, content_hash, scanner_version)
+SyncManifest = dict[str, tuple[int, int, str, str]]
+
+# Below this many modules to read, a pool costs more to spawn than it saves.
+_POOL_MIN_FILES = 64
+_POOL_CHUNKSIZE = 16
+
+# A module modified this recently may change again within the same mtime
+# tick; its stat is not recorded, so the next sync re-hashes it.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+# ID: 5a1c8e37-2d4f-4b96-a0e3-c7f9d2b6e814
+class ModuleScan:
+    """One module's scan outcome.
+
+    ``symbols`` is None when the module's content hash matched its manifest
+    entry (nothing to re-extract); ``error`` is set when it could not be
+    read or parsed.
+    """
+
+    file_path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    symbols: list[dict[str, Any]] | None
+    error: str | None = None
+
+
+@dataclass
+# ID: 9e4b2d71-6c3a-4f58-b1e7-d0a5c8f3e629
+class SymbolScanResult:
+    """What a sync has to merge.
+
+    - symbols: every symbol of the re-extracted modules.
+    - changed_files: modules whose symbols ``symbols`` replaces.
+    - removed_files: manifest modules that no longer exist.
+    - manifest: entries to write back (re-extracted or re-stat'ed modules).
+    - unchanged: modules skipped on stat or hash.
+    - failed: modules that could not be read or parsed.
+    """
+
+    symbols: list[dict[str, Any]] = field(default_factory=list)
+    changed_files: list[str] = field(default_factory=list)
+    removed_files: list[str] = field(default_factory=list)
+    manifest: SyncManifest = field(default_factory=dict)
+    unchanged: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+@cache
+# ID: 2f7d9a43-8b1e-4c65-a3d0-e6c4b9f1a572
+def scanner_version() -> str:
+    """Digest of the code that turns a module into symbol rows."""
+    from shared import ast_utility
+    from shared.utils import domain_mapper
+
+    from . import visitor
+
+    digest = hashlib.sha256()
+    for module in (sys.modules[__name__], visitor, ast_utility, domain_mapper):
+        digest.update(inspect.getsource(module).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _scan_module(repo_root: str, rel_path: str, known_hash: str | None) -> ModuleScan:
+    """Hash ``rel_path`` and extract its symbols unless its hash is ``known_hash``.
+
+    Module-level so it can run in a pool worker.
+    """
+    file_path = os.path.join(repo_root, rel_path)
+    try:
+        st = os.stat(file_path)
+        with open(file_path, "rb") as fh:
+            data = fh.read()
+    except OSError as exc:
+        return ModuleScan(rel_path, 0, 0, "", None, str(exc))
+    content_hash = hashlib.sha256(data).hexdigest()
+    if content_hash == known_hash:
+        return ModuleScan(rel_path, st.st_mtime_ns, st.st_size, content_hash, None)
+    try:
+        tree = ast.parse(data.decode("utf-8"), filename=file_path)
+        module_path = rel_path.replace(".py", "").replace("/", ".")
+        domain = map_module_to_domain(module_path)
+        visitor = SymbolVisitor(rel_path)
+        visitor.visit(tree)
+    except Exception as exc:
+        return ModuleScan(
+            rel_path, st.st_mtime_ns, st.st_size, content_hash, None, str(exc)
+        )
+    for sym in visitor.symbols:
+        sym["domain"] = domain
+    return ModuleScan(
+        rel_path, st.st_mtime_ns, st.st_size, content_hash, visitor.symbols
+    )
+
 
 # ID: 73de4c04-495b-4ecb-bf94-04e06acdbf2d
 class SymbolScanner:
     """Scans the codebase to extract symbol information."""
 
-    def __init__(self, repo_root: Path) -> None:
+    def __init__(self, repo_root: Path, workers: int = 1) -> None:
         self.repo_root = repo_root
+        self.workers = workers if workers > 0 else os.cpu_count() or 1
 
     # ID: 3659a617-162e-41e5-979d-af439c230b17
     def scan(self) -> list[dict[str, Any]]:
+        """Every public symbol under src/ (a full scan)."""
+        return self.scan_changes({}).symbols
+
+    # ID: 8c3e5b19-4a7d-4f20-9b6e-f1d8a2c7e453
+    def scan_changes(self, manifest: SyncManifest) -> SymbolScanResult:
+        """Re-extract the modules under src/ that changed since ``manifest``."""
         src_dir = self.repo_root / "src"
-        all_symbols: list[dict[str, Any]] = []
+        result = SymbolScanResult()
 
         if not src_dir.exists():
             logger.warning("Source directory not found: %s", src_dir)
-            return []
-
-        for file_path in src_dir.rglob("*.py"):
+            return result
+
+        version = scanner_version()
+        root = str(self.repo_root)
+        walked: set[str] = set()
+        to_read: list[tuple[str, str | None]] = []
+        for dirpath, _dirnames, filenames in os.walk(src_dir):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            for name in filenames:
+                if not name.endswith(".py"):
+                    continue
+                rel_path = f"{rel_dir}/{name}"
+                walked.add(rel_path)
+                entry = manifest.get(rel_path)
+                if entry is not None and entry[3] == version:
+                    try:
+                        st = os.stat(os.path.join(dirpath, name))
+                    except OSError:
+                        st = None
+                    if st is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                        result.unchanged += 1
+                        continue
+                    to_read.append((rel_path, entry[2]))
+                else:
+                    to_read.append((rel_path, None))
+
+        by_path: dict[str, dict[str, Any]] = {}
+        now_ns = time.time_ns()
+        for scan in self._scan_modules(to_read):
+            if scan.error is not None:
+                logger.error("Error scanning %s: %s", scan.file_path, scan.error)
+                result.failed.append(scan.file_path)
+                continue
+            mtime_ns = scan.mtime_ns if now_ns - scan.mtime_ns >= _RACY_WINDOW_NS else 0
+            result.manifest[scan.file_path] = (
+                mtime_ns,
+                scan.size,
+                scan.content_hash,
+                version,
+            )
+            if scan.symbols is None:
+                result.unchanged += 1
+                continue
+            result.changed_files.append(scan.file_path)
+            for sym in scan.symbols:
+                by_path[sym["symbol_path"]] = sym
+
+        result.symbols = list(by_path.values())
+        result.removed_files = sorted(manifest.keys() - walked)
+        return result
+
+    def _scan_modules(self, to_read: list[tuple[str, str | None]]) -> list[ModuleScan]:
+        root = str(self.repo_root)
+        if self.workers > 1 and len(to_read) >= _POOL_MIN_FILES:
             try:
-                content = file_path.read_text(encoding="utf-8")
-                tree = ast.parse(content, filename=str(file_path))
-                rel_path_str = str(file_path.relative_to(self.repo_root))
-
-                module_path = rel_path_str.replace(".py", "").replace("/", ".")
-                domain = map_module_to_domain(module_path)
-
-                visitor = SymbolVisitor(rel_path_str)
-                visitor.visit(tree)
-
-                for sym in visitor.symbols:
-                    sym["domain"] = domain
-                    all_symbols.append(sym)
+                with ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(to_read) // _POOL_CHUNKSIZE),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    return list(
+                        pool.map(
+                            _scan_module,
+                            [root] * len(to_read),
+                            [rel_path for rel_path, _ in to_read],
+                            [known for _, known in to_read],
+                            chunksize=_POOL_CHUNKSIZE,
+                        )
+                    )
             except Exception as exc:
-                logger.error("Error scanning %s: %s", file_path, exc)
-
-        unique_symbols = {s["symbol_path"]: s for s in all_symbols}
-        return list(unique_symbols.values())
+                logger.warning("Symbol scan pool failed (%s); scanning in-process", exc)
+        return [_scan_module(root, rel_path, known) for rel_path, known in to_read]
@@ -3,10 +3,15 @@
 """
 Symbol Synchronization Service
 Orchestrates Mind/Body alignment via modularized components.
+
+Incremental by default: only modules changed since the manifest of the last
+sync (core.symbol_sync_manifest) are re-parsed and merged. An empty manifest,
+or ``full=True``, syncs the whole tree.
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,7 +20,7 @@ from shared.action_types import ActionImpact, ActionResult
 from shared.atomic_action import atomic_action
 from shared.logger import getLogger
 
-from .sync.engine import run_db_merge
+from .sync.engine import load_sync_manifest, run_db_merge, save_sync_manifest
 from .sync.scanner import SymbolScanner
 
 
@@ -30,23 +35,52 @@ logger = getLogger(__name__)
     category="introspection",
 )
 # ID: 3d99a5e7-06f8-4cfa-aba8-41a6e0655987
-async def run_sync_with_db(session: AsyncSession, **kwargs) -> ActionResult:
-    """Entry point for the database-centric sync logic."""
+async def run_sync_with_db(
+    session: AsyncSession, full: bool = False, **kwargs
+) -> ActionResult:
+    """Entry point for the database-centric sync logic.
+
+    ``full`` ignores the manifest: every module is re-parsed and every
+    symbol missing from the tree is deleted.
+    """
     start_time = time.time()
     logger.info("🚀 Starting symbol sync with database (Mind/Body alignment)")
 
     # 1. Scan the Body
     from shared.infrastructure.bootstrap_registry import bootstrap_registry
+    from shared.infrastructure.intent.operational_config import (
+        load_operational_config,
+    )
 
-    scanner = SymbolScanner(repo_root=bootstrap_registry.get_repo_path())
-    code_state = scanner.scan()
+    manifest = {} if full else await load_sync_manifest(session)
+    scanner = SymbolScanner(
+        repo_root=bootstrap_registry.get_repo_path(),
+        workers=load_operational_config().sync.symbol_scan_workers,
+    )
+    scan = await asyncio.to_thread(scanner.scan_changes, manifest)
 
-    # 2. Update the Mind
-    stats = await run_db_merge(session, code_state)
+    # 2. Update the Mind. Without a manifest the scan is the whole tree and
+    # the merge diffs all of core.symbols; otherwise only the changed and
+    # removed modules.
+    stats = await run_db_merge(
+        session,
+        scan.symbols,
+        changed_files=(scan.changed_files + scan.removed_files) if manifest else None,
+    )
+    await save_sync_manifest(
+        session, scan.manifest, scan.removed_files, replace=not manifest
+    )
     await session.commit()
+    stats["modules_changed"] = len(scan.changed_files)
+    stats["modules_removed"] = len(scan.removed_files)
+    stats["modules_unchanged"] = scan.unchanged
+    stats["modules_failed"] = len(scan.failed)
 
     logger.info(
-        "✅ Sync complete. Scanned: %d, New: %d, Updated: %d, Delta: %d",
+        "✅ Sync complete. Modules changed: %d (unchanged: %d). "
+        "Scanned: %d, New: %d, Updated: %d, Delta: %d",
+        stats["modules_changed"],
+        stats["modules_unchanged"],
         stats["scanned"],
         stats["inserted"],
         stats["updated"],
@@ -164,9 +164,8 @@ class BlackboardService:
         pattern is:
           - fetch_open_findings → resolve_entries  (TestRunnerSensor)
 
-        All updates run inside a single transaction. Returns the count of
-        rows actually updated (entries already terminalized or missing are
-        not counted).
+        One set-based UPDATE for all ids. Returns the count of rows actually
+        updated (entries already terminalized or missing are not counted).
 
         Scope note: as of ADR-015 D4, neither ViolationRemediatorWorker
         path calls this method. The happy path uses defer_entries_to_proposal
@@ -179,26 +178,28 @@ class BlackboardService:
         Covers:
           - TestRunnerSensor (direct)
         """
+        if not entry_ids:
+            return 0
+
         from body.services.service_registry import ServiceRegistry
 
-        resolved_count = 0
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                for entry_id in entry_ids:
-                    result = await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'resolved',
-                                resolved_at = now(),
-                                updated_at = now()
-                            WHERE id = cast(:entry_id as uuid)
-                              AND status IN ('open', 'claimed')
-                            """
-                        ),
-                        {"entry_id": entry_id},
-                    )
-                    resolved_count += result.rowcount
+                result = await session.execute(
+                    text(
+                        """
+                        UPDATE core.blackboard_entries
+                        SET status = 'resolved',
+                            resolved_at = now(),
+                            updated_at = now()
+                        WHERE id = ANY(cast(:ids as uuid[]))
+                          AND status IN ('open', 'claimed')
+                        RETURNING id
+                        """
+                    ),
+                    {"ids": [str(entry_id) for entry_id in entry_ids]},
+                )
+                resolved_count = len(result.fetchall())
         return resolved_count
 
     # ID: a7b2c8d3-e4f5-6789-abcd-ef0123456789
@@ -218,24 +219,23 @@ class BlackboardService:
 
         from body.services.service_registry import ServiceRegistry
 
-        released = 0
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                for entry_id in entry_ids:
-                    result = await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'open',
-                                claimed_by = NULL,
-                                updated_at = now()
-                            WHERE id = cast(:entry_id as uuid)
-                              AND status = 'claimed'
-                            """
-                        ),
-                        {"entry_id": entry_id},
-                    )
-                    released += result.rowcount
+                result = await session.execute(
+                    text(
+                        """
+                        UPDATE core.blackboard_entries
+                        SET status = 'open',
+                            claimed_by = NULL,
+                            updated_at = now()
+                        WHERE id = ANY(cast(:ids as uuid[]))
+                          AND status = 'claimed'
+                        RETURNING id
+                        """
+                    ),
+                    {"ids": [str(entry_id) for entry_id in entry_ids]},
+                )
+                released = len(result.fetchall())
         return released
 
     # ID: 4c7a9e2f-b518-4d63-a0e1-d6f3b82c5a10
@@ -250,24 +250,23 @@ class BlackboardService:
 
         from body.services.service_registry import ServiceRegistry
 
-        abandoned = 0
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                for entry_id in entry_ids:
-                    result = await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'abandoned',
-                                resolved_at = now(),
-                                updated_at = now()
-                            WHERE id = cast(:entry_id as uuid)
-                              AND status = 'claimed'
-                            """
-                        ),
-                        {"entry_id": entry_id},
-                    )
-                    abandoned += result.rowcount
+                result = await session.execute(
+                    text(
+                        """
+                        UPDATE core.blackboard_entries
+                        SET status = 'abandoned',
+                            resolved_at = now(),
+                            updated_at = now()
+                        WHERE id = ANY(cast(:ids as uuid[]))
+                          AND status = 'claimed'
+                        RETURNING id
+                        """
+                    ),
+                    {"ids": [str(entry_id) for entry_id in entry_ids]},
+                )
+                abandoned = len(result.fetchall())
         return abandoned
 
     # ID: 46b1652f-d096-4f31-8ea3-8bfec88a48e3
@@ -394,28 +393,27 @@ class BlackboardService:
 
         from body.services.service_registry import ServiceRegistry
 
-        updated = 0
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                for entry_id in entry_ids:
-                    result = await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'indeterminate',
-                                -- ADR-091 D2-A1: a finding delegated to the
-                                -- governor is closed by a human, never by the
-                                -- reaudit sensor. The transition owns the field.
-                                resolution_mechanism = 'human',
-                                resolved_at = now(),
-                                updated_at = now()
-                            WHERE id = cast(:entry_id as uuid)
-                              AND status = 'claimed'
-                            """
-                        ),
-                        {"entry_id": entry_id},
-                    )
-                    updated += result.rowcount
+                result = await session.execute(
+                    text(
+                        """
+                        UPDATE core.blackboard_entries
+                        SET status = 'indeterminate',
+                            -- ADR-091 D2-A1: a finding delegated to the
+                            -- governor is closed by a human, never by the
+                            -- reaudit sensor. The transition owns the field.
+                            resolution_mechanism = 'human',
+                            resolved_at = now(),
+                            updated_at = now()
+                        WHERE id = ANY(cast(:ids as uuid[]))
+                          AND status = 'claimed'
+                        RETURNING id
+                        """
+                    ),
+                    {"ids": [str(entry_id) for entry_id in entry_ids]},
+                )
+                updated = len(result.fetchall())
         return updated
 
     # ID: 3209a4b6-09d9-4ba5-8e67-0e5dc4028237
@@ -706,86 +704,70 @@ class BlackboardService:
         D2 canonical format — applies to audit, test-runner, and coherence
         sensor namespaces).
 
-        The two transitions run in one transaction. Returns lists of
-        released and resolved subjects for the drainer's release-pass
-        report.
+        Each transition is one set-based UPDATE ... RETURNING; the two run
+        in one transaction. Returns lists of released and resolved subjects
+        for the drainer's release-pass report.
         """
         from body.services.service_registry import ServiceRegistry
 
-        released_subjects: list[str] = []
-        resolved_subjects: list[str] = []
+        current = sorted(current_violation_subjects)
 
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                pending = await session.execute(
+                released = await session.execute(
                     text(
                         """
-                        SELECT id, subject
-                        FROM core.blackboard_entries
+                        UPDATE core.blackboard_entries
+                        SET status = 'open',
+                            updated_at = now()
                         WHERE entry_type = 'finding'
                           AND status = 'awaiting_reaudit'
                           AND (subject = :prefix
                                OR subject LIKE :prefix || '.%'
                                OR subject LIKE :prefix || '::%')
-                        FOR UPDATE
+                          AND subject = ANY(cast(:current as text[]))
+                        RETURNING subject
                         """
                     ),
-                    {"prefix": subject_prefix},
+                    {"prefix": subject_prefix, "current": current},
                 )
-                rows = pending.fetchall()
-
-                release_ids: list[str] = []
-                resolve_ids: list[str] = []
-                for row in rows:
-                    entry_id = str(row[0])
-                    subject = str(row[1])
-                    if subject in current_violation_subjects:
-                        release_ids.append(entry_id)
-                        released_subjects.append(subject)
-                    else:
-                        resolve_ids.append(entry_id)
-                        resolved_subjects.append(subject)
-
-                if release_ids:
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'open',
-                                updated_at = now()
-                            WHERE id = ANY(cast(:ids as uuid[]))
-                              AND status = 'awaiting_reaudit'
-                            """
-                        ),
-                        {"ids": release_ids},
-                    )
+                released_subjects = [str(row[0]) for row in released.fetchall()]
 
-                if resolve_ids:
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'resolved',
-                                resolved_at = now(),
-                                updated_at = now(),
-                                payload = jsonb_set(
-                                    payload,
-                                    '{resolution}',
-                                    jsonb_build_object(
-                                        'reason', 'audit re-evaluation: condition no longer present',
-                                        'resolved_by', cast(:resolved_by as text),
-                                        'resolution_authority', 'system.audit',
-                                        'resolved_at', to_char(now() at time zone 'UTC',
-                                                               'YYYY-MM-DD"T"HH24:MI:SS"Z"')
-                                    ),
-                                    true
-                                )
-                            WHERE id = ANY(cast(:ids as uuid[]))
-                              AND status = 'awaiting_reaudit'
-                            """
-                        ),
-                        {"ids": resolve_ids, "resolved_by": resolved_by},
-                    )
+                resolved = await session.execute(
+                    text(
+                        """
+                        UPDATE core.blackboard_entries
+                        SET status = 'resolved',
+                            resolved_at = now(),
+                            updated_at = now(),
+                            payload = jsonb_set(
+                                payload,
+                                '{resolution}',
+                                jsonb_build_object(
+                                    'reason', 'audit re-evaluation: condition no longer present',
+                                    'resolved_by', cast(:resolved_by as text),
+                                    'resolution_authority', 'system.audit',
+                                    'resolved_at', to_char(now() at time zone 'UTC',
+                                                           'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+                                ),
+                                true
+                            )
+                        WHERE entry_type = 'finding'
+                          AND status = 'awaiting_reaudit'
+                          AND (subject = :prefix
+                               OR subject LIKE :prefix || '.%'
+                               OR subject LIKE :prefix || '::%')
+                          AND subject <> ALL(cast(:current as text[]))
+                        RETURNING subject
+                        """
+                    ),
+                    {
+                        "prefix": subject_prefix,
+                        "current": current,
+                        "resolved_by": resolved_by,
+                    },
+                )
+                resolved_subjects = [str(row[0]) for row in resolved.fetchall()]
 
         return {
             "released_subjects": released_subjects,
@@ -822,61 +804,43 @@ class BlackboardService:
         """
         from body.services.service_registry import ServiceRegistry
 
-        resolved_subjects: list[str] = []
-
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                pending = await session.execute(
+                resolved = await session.execute(
                     text(
                         """
-                        SELECT id, subject
-                        FROM core.blackboard_entries
+                        UPDATE core.blackboard_entries
+                        SET status = 'resolved',
+                            resolved_at = now(),
+                            updated_at = now(),
+                            payload = jsonb_set(
+                                payload,
+                                '{resolution}',
+                                jsonb_build_object(
+                                    'reason', 'ADR-127 clean-pass: violation no longer present on re-audit',
+                                    'resolved_by', cast(:resolved_by as text),
+                                    'resolution_authority', 'system.audit',
+                                    'resolved_at', to_char(now() at time zone 'UTC',
+                                                           'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+                                ),
+                                true
+                            )
                         WHERE entry_type = 'finding'
                           AND status = 'indeterminate'
                           AND (subject = :prefix
                                OR subject LIKE :prefix || '.%'
                                OR subject LIKE :prefix || '::%')
-                        FOR UPDATE
+                          AND subject <> ALL(cast(:current as text[]))
+                        RETURNING subject
                         """
                     ),
-                    {"prefix": subject_prefix},
+                    {
+                        "prefix": subject_prefix,
+                        "current": sorted(current_violation_subjects),
+                        "resolved_by": resolved_by,
+                    },
                 )
-                rows = pending.fetchall()
-
-                resolve_ids: list[str] = []
-                for row in rows:
-                    entry_id = str(row[0])
-                    subject = str(row[1])
-                    if subject not in current_violation_subjects:
-                        resolve_ids.append(entry_id)
-                        resolved_subjects.append(subject)
-
-                if resolve_ids:
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'resolved',
-                                resolved_at = now(),
-                                updated_at = now(),
-                                payload = jsonb_set(
-                                    payload,
-                                    '{resolution}',
-                                    jsonb_build_object(
-                                        'reason', 'ADR-127 clean-pass: violation no longer present on re-audit',
-                                        'resolved_by', cast(:resolved_by as text),
-                                        'resolution_authority', 'system.audit',
-                                        'resolved_at', to_char(now() at time zone 'UTC',
-                                                               'YYYY-MM-DD"T"HH24:MI:SS"Z"')
-                                    ),
-                                    true
-                                )
-                            WHERE id = ANY(cast(:ids as uuid[]))
-                              AND status = 'indeterminate'
-                            """
-                        ),
-                        {"ids": resolve_ids, "resolved_by": resolved_by},
-                    )
+                resolved_subjects = [str(row[0]) for row in resolved.fetchall()]
 
         return {"resolved_subjects": resolved_subjects}
 
@@ -914,61 +878,43 @@ class BlackboardService:
         """
         from body.services.service_registry import ServiceRegistry
 
-        resolved_subjects: list[str] = []
-
         async with ServiceRegistry.session() as session:
             async with session.begin():
-                pending = await session.execute(
+                resolved = await session.execute(
                     text(
                         """
-                        SELECT id, subject
-                        FROM core.blackboard_entries
+                        UPDATE core.blackboard_entries
+                        SET status = 'resolved',
+                            resolved_at = now(),
+                            updated_at = now(),
+                            payload = jsonb_set(
+                                payload,
+                                '{resolution}',
+                                jsonb_build_object(
+                                    'reason', 'ADR-127 D7 clean-pass: violation no longer present (Type-B abandoned finding)',
+                                    'resolved_by', cast(:resolved_by as text),
+                                    'resolution_authority', 'system.audit',
+                                    'resolved_at', to_char(now() at time zone 'UTC',
+                                                           'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+                                ),
+                                true
+                            )
                         WHERE entry_type = 'finding'
                           AND status = 'abandoned'
                           AND (subject = :prefix
                                OR subject LIKE :prefix || '.%'
                                OR subject LIKE :prefix || '::%')
-                        FOR UPDATE
+                          AND subject <> ALL(cast(:current as text[]))
+                        RETURNING subject
                         """
                     ),
-                    {"prefix": subject_prefix},
+                    {
+                        "prefix": subject_prefix,
+                        "current": sorted(current_violation_subjects),
+                        "resolved_by": resolved_by,
+                    },
                 )
-                rows = pending.fetchall()
-
-                resolve_ids: list[str] = []
-                for row in rows:
-                    entry_id = str(row[0])
-                    subject = str(row[1])
-                    if subject not in current_violation_subjects:
-                        resolve_ids.append(entry_id)
-                        resolved_subjects.append(subject)
-
-                if resolve_ids:
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE core.blackboard_entries
-                            SET status = 'resolved',
-                                resolved_at = now(),
-                                updated_at = now(),
-                                payload = jsonb_set(
-                                    payload,
-                                    '{resolution}',
-                                    jsonb_build_object(
-                                        'reason', 'ADR-127 D7 clean-pass: violation no longer present (Type-B abandoned finding)',
-                                        'resolved_by', cast(:resolved_by as text),
-                                        'resolution_authority', 'system.audit',
-                                        'resolved_at', to_char(now() at time zone 'UTC',
-                                                               'YYYY-MM-DD"T"HH24:MI:SS"Z"')
-                                    ),
-                                    true
-                                )
-                            WHERE id = ANY(cast(:ids as uuid[]))
-                              AND status = 'abandoned'
-                            """
-                        ),
-                        {"ids": resolve_ids, "resolved_by": resolved_by},
-                    )
+                resolved_subjects = [str(row[0]) for row in resolved.fetchall()]
 
         return {"resolved_subjects": resolved_subjects}
 
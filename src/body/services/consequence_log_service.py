@@ -182,6 +182,61 @@ class ConsequenceLogService:
             "causing_commit_sha": row.post_execution_sha,
         }
 
+    # ID: fda2055f-aa60-4ff2-9584-6a636108e500
+    async def find_causes_for_files(
+        self,
+        file_paths: list[str],
+        lookback_seconds: int = _CFG_CL.default_lookback_seconds,
+    ) -> dict[str, dict[str, str | None]]:
+        """
+        find_cause_for_file for many files in one query.
+
+        Each path is joined laterally to its own most-recent match, so the
+        heuristic is the same as calling find_cause_for_file once per path,
+        but it costs one round-trip instead of one per path.
+
+        Returns:
+            ``{file_path: {"causing_proposal_id": ..., "causing_commit_sha": ...}}``
+            with an entry for every path in ``file_paths``. Both values are
+            ``None`` where nothing matched.
+        """
+        from body.services.service_registry import ServiceRegistry
+
+        causes: dict[str, dict[str, str | None]] = {
+            path: {"causing_proposal_id": None, "causing_commit_sha": None}
+            for path in file_paths
+        }
+        if not causes:
+            return causes
+
+        async with ServiceRegistry.session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT p.file_path, c.proposal_id, c.post_execution_sha "
+                    "FROM unnest(cast(:file_paths as text[])) AS p(file_path) "
+                    "CROSS JOIN LATERAL ("
+                    "SELECT proposal_id, post_execution_sha, recorded_at "
+                    "FROM core.proposal_consequences "
+                    "WHERE files_changed @> jsonb_build_array("
+                    "jsonb_build_object('path', p.file_path)) "
+                    "AND recorded_at >= NOW() - "
+                    "make_interval(secs => :lookback_seconds) "
+                    "ORDER BY recorded_at DESC LIMIT 1) AS c"
+                ).bindparams(bindparam("lookback_seconds", type_=Integer)),
+                {
+                    "file_paths": list(causes),
+                    "lookback_seconds": lookback_seconds,
+                },
+            )
+            rows = result.fetchall()
+
+        for row in rows:
+            causes[row.file_path] = {
+                "causing_proposal_id": row.proposal_id,
+                "causing_commit_sha": row.post_execution_sha,
+            }
+        return causes
+
     # ID: a2f610da-3b85-4c67-9d12-8e7f5a4b3c21
     async def get_recent_for_audit(self, lookback_days: int = 7) -> list[dict]:
         """
@@ -173,165 +173,151 @@ class CrawlService:
     # repo_artifacts
     # ------------------------------------------------------------------
 
-    # ID: 8729f486-acb0-46b1-a69a-404257979ec8
-    async def upsert_python_artifact(
+    # ID: 2b62b158-aa6b-442a-b66d-f140b7c17543
+    async def upsert_artifacts_bulk(
         self,
-        file_path: str,
-        content_hash: str,
-        qdrant_collection: str,
+        artifacts: list[tuple[str, str, str, str | None]],
         crawl_run_id: str,
-    ) -> None:
+    ) -> dict[str, str]:
         """
-        Upsert a Python source file into core.repo_artifacts.
-        Resets chunk_count to 0 only when the content hash changed,
-        signalling RepoEmbedderWorker to re-embed the file.
+        Upsert a batch of files into core.repo_artifacts in one statement.
 
-        Covers:
-          - RepoCrawlerWorker._process_python_file — repo_artifacts upsert
-        """
-        from body.services.service_registry import ServiceRegistry
+        Each artifact is (file_path, artifact_type, content_hash,
+        qdrant_collection); file paths must be unique within the batch.
+        chunk_count resets to 0 only when the content hash or the collection
+        changed, signalling RepoEmbedderWorker to re-embed the file.
 
-        async with ServiceRegistry.session() as session:
-            await session.execute(
-                text(
-                    """
-                    INSERT INTO core.repo_artifacts
-                        (id, file_path, artifact_type, content_hash,
-                         qdrant_collection, chunk_count, last_crawled_at, crawl_run_id)
-                    VALUES
-                        (gen_random_uuid(), :file_path, :artifact_type, :content_hash,
-                         :qdrant_collection, 0, now(), cast(:crawl_run_id as uuid))
-                    ON CONFLICT (file_path) DO UPDATE SET
-                        content_hash      = EXCLUDED.content_hash,
-                        artifact_type     = EXCLUDED.artifact_type,
-                        qdrant_collection = EXCLUDED.qdrant_collection,
-                        chunk_count       = CASE
-                            WHEN repo_artifacts.content_hash != EXCLUDED.content_hash
-                              OR repo_artifacts.qdrant_collection
-                                 IS DISTINCT FROM EXCLUDED.qdrant_collection
-                            THEN 0
-                            ELSE repo_artifacts.chunk_count
-                        END,
-                        last_crawled_at   = EXCLUDED.last_crawled_at,
-                        crawl_run_id      = EXCLUDED.crawl_run_id
-                    -- #786: also fire on registry-driven reclassification, not
-                    -- only content drift. artifact_type / qdrant_collection are
-                    -- registry facts, not content-derived — a changed glob
-                    -- precedence or vector_collection must reclassify a frozen
-                    -- row even when the file's bytes are unchanged. chunk_count
-                    -- resets on a collection change so vectors follow the move.
-                    WHERE repo_artifacts.content_hash != EXCLUDED.content_hash
-                       OR repo_artifacts.artifact_type != EXCLUDED.artifact_type
-                       OR repo_artifacts.qdrant_collection
-                          IS DISTINCT FROM EXCLUDED.qdrant_collection
-                    """
-                ),
-                {
-                    "file_path": file_path,
-                    "artifact_type": "python",
-                    "content_hash": content_hash,
-                    "qdrant_collection": qdrant_collection,
-                    "crawl_run_id": crawl_run_id,
-                },
-            )
-            await session.commit()
-
-    # ID: e40bf578-0c6f-4f7f-8c00-84ffb706cb39
-    async def upsert_artifact(
-        self,
-        file_path: str,
-        artifact_type: str,
-        content_hash: str,
-        qdrant_collection: str | None,
-        crawl_run_id: str,
-    ) -> None:
-        """
-        Upsert a non-Python artifact into core.repo_artifacts.
+        Returns file_path → id for the rows actually written (inserted, or
+        updated because their content or classification changed).
 
         Covers:
-          - RepoCrawlerWorker._process_artifact_file — repo_artifacts upsert
+          - CrawlOrchestrator.run_crawl — repo_artifacts upsert flush
         """
+        if not artifacts:
+            return {}
+
         from body.services.service_registry import ServiceRegistry
 
+        paths, types, hashes, collections = (list(col) for col in zip(*artifacts))
         async with ServiceRegistry.session() as session:
-            await session.execute(
-                text(
-                    """
-                    INSERT INTO core.repo_artifacts
-                        (id, file_path, artifact_type, content_hash,
-                         qdrant_collection, chunk_count, last_crawled_at, crawl_run_id)
-                    VALUES
-                        (gen_random_uuid(), :file_path, :artifact_type, :content_hash,
-                         :qdrant_collection, 0, now(), cast(:crawl_run_id as uuid))
-                    ON CONFLICT (file_path) DO UPDATE SET
-                        content_hash      = EXCLUDED.content_hash,
-                        artifact_type     = EXCLUDED.artifact_type,
-                        qdrant_collection = EXCLUDED.qdrant_collection,
-                        chunk_count       = CASE
-                            WHEN repo_artifacts.content_hash != EXCLUDED.content_hash
-                              OR repo_artifacts.qdrant_collection
-                                 IS DISTINCT FROM EXCLUDED.qdrant_collection
-                            THEN 0
-                            ELSE repo_artifacts.chunk_count
-                        END,
-                        last_crawled_at   = EXCLUDED.last_crawled_at,
-                        crawl_run_id      = EXCLUDED.crawl_run_id
-                    -- #786: also fire on registry-driven reclassification, not
-                    -- only content drift. artifact_type / qdrant_collection are
-                    -- registry facts, not content-derived — a changed glob
-                    -- precedence or vector_collection must reclassify a frozen
-                    -- row even when the file's bytes are unchanged. chunk_count
-                    -- resets on a collection change so vectors follow the move.
-                    WHERE repo_artifacts.content_hash != EXCLUDED.content_hash
-                       OR repo_artifacts.artifact_type != EXCLUDED.artifact_type
-                       OR repo_artifacts.qdrant_collection
-                          IS DISTINCT FROM EXCLUDED.qdrant_collection
-                    """
-                ),
-                {
-                    "file_path": file_path,
-                    "artifact_type": artifact_type,
-                    "content_hash": content_hash,
-                    "qdrant_collection": qdrant_collection,
-                    "crawl_run_id": crawl_run_id,
-                },
-            )
-            await session.commit()
+            async with session.begin():
+                result = await session.execute(
+                    text(
+                        """
+                        INSERT INTO core.repo_artifacts
+                            (id, file_path, artifact_type, content_hash,
+                             qdrant_collection, chunk_count, last_crawled_at,
+                             crawl_run_id)
+                        SELECT gen_random_uuid(), r.file_path, r.artifact_type,
+                               r.content_hash, r.qdrant_collection, 0, now(),
+                               cast(:crawl_run_id as uuid)
+                        FROM unnest(
+                            cast(:paths as text[]),
+                            cast(:types as text[]),
+                            cast(:hashes as text[]),
+                            cast(:collections as text[])
+                        ) AS r(file_path, artifact_type, content_hash,
+                               qdrant_collection)
+                        ON CONFLICT (file_path) DO UPDATE SET
+                            content_hash      = EXCLUDED.content_hash,
+                            artifact_type     = EXCLUDED.artifact_type,
+                            qdrant_collection = EXCLUDED.qdrant_collection,
+                            chunk_count       = CASE
+                                WHEN repo_artifacts.content_hash
+                                     != EXCLUDED.content_hash
+                                  OR repo_artifacts.qdrant_collection
+                                     IS DISTINCT FROM EXCLUDED.qdrant_collection
+                                THEN 0
+                                ELSE repo_artifacts.chunk_count
+                            END,
+                            last_crawled_at   = EXCLUDED.last_crawled_at,
+                            crawl_run_id      = EXCLUDED.crawl_run_id
+                        -- #786: also fire on registry-driven reclassification,
+                        -- not only content drift. artifact_type /
+                        -- qdrant_collection are registry facts, not
+                        -- content-derived — a changed glob precedence or
+                        -- vector_collection must reclassify a frozen row even
+                        -- when the file's bytes are unchanged. chunk_count
+                        -- resets on a collection change so vectors follow the
+                        -- move.
+                        WHERE repo_artifacts.content_hash != EXCLUDED.content_hash
+                           OR repo_artifacts.artifact_type
+                              != EXCLUDED.artifact_type
+                           OR repo_artifacts.qdrant_collection
+                              IS DISTINCT FROM EXCLUDED.qdrant_collection
+                        RETURNING id, file_path
+                        """
+                    ),
+                    {
+                        "paths": paths,
+                        "types": types,
+                        "hashes": hashes,
+                        "collections": collections,
+                        "crawl_run_id": crawl_run_id,
+                    },
+                )
+                return {row[1]: str(row[0]) for row in result.fetchall()}
 
-    # ID: f0cfa2b8-53fb-4b42-90d4-233e952a26e6
-    async def fetch_artifact_id(self, file_path: str) -> str | None:
+    # ID: 49b1afb5-1ca4-4535-9c4d-290e49a761f5
+    async def touch_crawled_artifacts(
+        self, file_paths: list[str], crawl_run_id: str
+    ) -> int:
         """
-        Return the UUID of a repo_artifact by file_path, or None if absent.
+        Stamp last_crawled_at / crawl_run_id on artifacts whose content and
+        classification this crawl pass confirmed unchanged, in one statement.
+
+        last_crawled_at is the freshness bound llm_gate applies before it
+        trusts the stored content_hash, so verified-unchanged rows are kept
+        fresh without rewriting them through the upsert.
+
+        Returns the count of rows touched.
 
         Covers:
-          - RepoCrawlerWorker._process_artifact_file — SELECT id FROM core.repo_artifacts
+          - CrawlOrchestrator.run_crawl — last_crawled_at flush
         """
+        if not file_paths:
+            return 0
+
         from body.services.service_registry import ServiceRegistry
 
         async with ServiceRegistry.session() as session:
-            result = await session.execute(
-                text("SELECT id FROM core.repo_artifacts WHERE file_path = :fp"),
-                {"fp": file_path},
-            )
-            row = result.fetchone()
-            return str(row[0]) if row else None
+            async with session.begin():
+                result = await session.execute(
+                    text(
+                        """
+                        UPDATE core.repo_artifacts
+                        SET last_crawled_at = now(),
+                            crawl_run_id    = cast(:crawl_run_id as uuid)
+                        WHERE file_path = ANY(cast(:paths as text[]))
+                        """
+                    ),
+                    {"paths": file_paths, "crawl_run_id": crawl_run_id},
+                )
+                return result.rowcount or 0
 
-    # ID: 588ffa06-2c09-4fa3-9eff-4ed94428ae87
-    async def load_artifact_hashes(self) -> dict[str, str]:
+    # ID: 7912213a-2887-4d5f-99ee-988ddaeb01aa
+    async def load_artifact_states(self) -> dict[str, tuple[str, str, str | None]]:
         """
-        Return file_path → content_hash for all registered artifacts.
-        Used for skip-if-unchanged logic during crawl.
+        Return file_path → (content_hash, artifact_type, qdrant_collection)
+        for all registered artifacts. Used to decide, per crawled file,
+        between an upsert (content or classification changed) and a
+        last_crawled_at touch.
 
         Covers:
-          - RepoCrawlerWorker._load_artifact_hashes
+          - CrawlOrchestrator.run_crawl — change detection
         """
         from body.services.service_registry import ServiceRegistry
 
         async with ServiceRegistry.session() as session:
             result = await session.execute(
-                text("SELECT file_path, content_hash FROM core.repo_artifacts")
+                text(
+                    """
+                    SELECT file_path, content_hash, artifact_type, qdrant_collection
+                    FROM core.repo_artifacts
+                    """
+                )
             )
-            return {row[0]: row[1] for row in result.fetchall()}
+            return {row[0]: (row[1], row[2], row[3]) for row in result.fetchall()}
 
     # ------------------------------------------------------------------
     # symbol_calls
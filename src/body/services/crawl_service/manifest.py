@@ -0,0 +1,82 @@
+# src/body/services/crawl_service/manifest.py
+"""Stat-keyed content-hash manifest for the crawl pipeline.
+
+Every crawl pass used to SHA-256 every file in every crawl scope only to find
+that almost none of them had changed. The manifest remembers the hash of each
+file under the file's stat identity — (mtime_ns, size, inode) — so a file
+whose stat is unchanged since it was last hashed reuses that hash instead of
+being read again.
+
+Racily-clean guard: a file modified within _RACY_WINDOW_NS of being
+stat'ed could be rewritten again in the same timestamp tick with the same
+size, leaving its stat unchanged. Such hashes are not recorded, so those
+files are simply re-hashed on the next pass.
+
+The manifest is process-local. The first pass after a restart hashes
+everything, as every pass did before; the hash comparison against
+core.repo_artifacts stays the authority on what changed, so a cold manifest
+costs time, never correctness.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+
+# Files modified this recently are not trusted by stat alone.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+# ID: e9d06348-4ca8-4c91-a60f-966f996b820d
+class CrawlManifest:
+    """repo-relative path → content hash, valid while the file's stat holds."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, int, int, str]] = {}
+
+    # ID: 6ddf1207-bdd9-4000-914c-e1415b9973b9
+    def lookup(self, rel_path: str, st: os.stat_result) -> str | None:
+        """The recorded hash of ``rel_path`` if its stat is unchanged."""
+        entry = self._entries.get(rel_path)
+        if entry is None or entry[:3] != (st.st_mtime_ns, st.st_size, st.st_ino):
+            return None
+        return entry[3]
+
+    # ID: 0ed59b5b-c02e-4d5f-9647-0cc89aa0b7b8
+    def record(self, rel_path: str, st: os.stat_result, content_hash: str) -> None:
+        """Remember ``content_hash`` for ``rel_path`` under ``st``."""
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            self._entries.pop(rel_path, None)
+            return
+        self._entries[rel_path] = (
+            st.st_mtime_ns,
+            st.st_size,
+            st.st_ino,
+            content_hash,
+        )
+
+    # ID: 3c8e1f47-9a2d-4b65-8e70-d1f4a6c9b253
+    def retain(self, rel_paths: Iterable[str]) -> None:
+        """Forget every file not in ``rel_paths`` (removed since last pass)."""
+        keep = set(rel_paths)
+        for rel_path in self._entries.keys() - keep:
+            del self._entries[rel_path]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_MANIFESTS: dict[Path, CrawlManifest] = {}
+
+
+# ID: 8d2b5e91-4f7c-4a36-b0e8-c7a3f9d1e524
+def get_crawl_manifest(repo_root: Path) -> CrawlManifest:
+    """The manifest shared by every crawl of ``repo_root`` in this process."""
+    key = repo_root.resolve()
+    manifest = _MANIFESTS.get(key)
+    if manifest is None:
+        manifest = _MANIFESTS[key] = CrawlManifest()
+    return manifest
@@ -10,12 +10,16 @@ delegates run_crawl() to this class.
 from __future__ import annotations
 
 import ast
+import os
+import re
+import stat
 import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from shared.logger import getLogger
 
+from .manifest import get_crawl_manifest
 from .symbol_processing import (
     _CallGraphExtractor,
     _detect_layer,
@@ -85,6 +89,118 @@ def _glob_specificity(glob_pattern: str) -> int:
     return len(glob_pattern)
 
 
+def _glob_regex(glob_pattern: str) -> re.Pattern[str]:
+    """Compile a discovery glob to a regex over repo-relative POSIX paths.
+
+    Same semantics as ``repo_root.glob(glob_pattern)``: a ``**`` segment
+    spans zero or more directories, and ``*``, ``?`` and ``[...]`` never
+    cross a ``/``. A trailing ``**`` matches directories only, so no files.
+    """
+    parts: list[str] = []
+    segments = glob_pattern.split("/")
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            parts.append("(?:[^/]+/)*")
+            continue
+        for token in re.split(r"(\*|\?|\[[^\]]*\])", segment):
+            if token == "*":
+                parts.append("[^/]*")
+            elif token == "?":
+                parts.append("[^/]")
+            elif len(token) > 1 and token[0] == "[" and token[-1] == "]":
+                body = token[1:-1].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+            else:
+                parts.append(re.escape(token))
+        if i < len(segments) - 1:
+            parts.append("/")
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _walk_roots(glob_patterns: list[str]) -> list[str]:
+    """The fewest repo-relative directories whose walk covers every glob.
+
+    Each glob contributes its literal directory prefix (the segments before
+    the first wildcard segment); prefixes nested under another are dropped,
+    so every directory is visited once.
+    """
+    prefixes: set[str] = set()
+    for glob_pattern in glob_patterns:
+        literal: list[str] = []
+        for segment in glob_pattern.split("/")[:-1]:
+            if any(ch in segment for ch in "*?["):
+                break
+            literal.append(segment)
+        prefixes.add("/".join(literal))
+    roots: list[str] = []
+    for prefix in sorted(prefixes):
+        if not any(
+            root == "" or prefix == root or prefix.startswith(root + "/")
+            for root in roots
+        ):
+            roots.append(prefix)
+    return roots
+
+
+def _scan_crawl_scopes(
+    repo_root: Path, crawl_scopes: list[tuple[str, str]]
+) -> dict[Path, tuple[str, os.stat_result]]:
+    """One directory walk matched against every crawl scope.
+
+    Returns file_path -> (artifact_type, lstat result) for every regular
+    file some scope matches; the artifact_type follows the glob-precedence
+    rules of _resolve_file_artifact_types. Replaces one recursive
+    ``repo_root.glob`` per scope, which re-walked shared trees (``.intent/``
+    is covered by five globs) once per pattern. Only the scopes' literal
+    root directories are walked; symlinks are skipped and symlinked
+    directories are not descended.
+    """
+    compiled = [
+        (artifact_type, _glob_specificity(glob_pattern), _glob_regex(glob_pattern))
+        for glob_pattern, artifact_type in crawl_scopes
+    ]
+    root_str = str(repo_root)
+    prefix_len = len(root_str) + 1
+    scanned: dict[Path, tuple[str, os.stat_result]] = {}
+    for root in _walk_roots([glob_pattern for glob_pattern, _ in crawl_scopes]):
+        for dirpath, _dirnames, filenames in os.walk(os.path.join(root_str, root)):
+            rel_dir = dirpath[prefix_len:].replace(os.sep, "/")
+            for name in filenames:
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                matches = [
+                    (artifact_type, spec)
+                    for artifact_type, spec, regex in compiled
+                    if regex.match(rel_path)
+                ]
+                if not matches:
+                    continue
+                file_path = Path(dirpath, name)
+                try:
+                    st = file_path.lstat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                resolved, best_spec = matches[0]
+                for artifact_type, spec in matches[1:]:
+                    if spec > best_spec:
+                        resolved, best_spec = artifact_type, spec
+                    elif spec == best_spec and artifact_type != resolved:
+                        logger.warning(
+                            "CrawlOrchestrator: glob-precedence tie for %s — "
+                            "%r (kept) vs %r (ignored); equal specificity. "
+                            "Registry ambiguity — narrow one type's discovery "
+                            "glob.",
+                            file_path,
+                            resolved,
+                            artifact_type,
+                        )
+                scanned[file_path] = (resolved, st)
+    return scanned
+
+
 def _resolve_file_artifact_types(
     repo_root: Path, crawl_scopes: list[tuple[str, str]]
 ) -> dict[Path, str]:
@@ -98,27 +214,12 @@ def _resolve_file_artifact_types(
     Ties (equal specificity) keep the first-seen assignment and log a warning
     — a genuine tie is a registry ambiguity a human should resolve.
     """
-    resolved: dict[Path, str] = {}
-    best_spec: dict[Path, int] = {}
-    for glob_pattern, artifact_type in crawl_scopes:
-        spec = _glob_specificity(glob_pattern)
-        for file_path in repo_root.glob(glob_pattern):
-            if file_path.is_symlink() or not file_path.is_file():
-                continue
-            prior = best_spec.get(file_path)
-            if prior is None or spec > prior:
-                resolved[file_path] = artifact_type
-                best_spec[file_path] = spec
-            elif spec == prior and resolved[file_path] != artifact_type:
-                logger.warning(
-                    "CrawlOrchestrator: glob-precedence tie for %s — "
-                    "%r (kept) vs %r (ignored); equal specificity. Registry "
-                    "ambiguity — narrow one type's discovery glob.",
-                    file_path,
-                    resolved[file_path],
-                    artifact_type,
-                )
-    return resolved
+    return {
+        file_path: artifact_type
+        for file_path, (artifact_type, _st) in _scan_crawl_scopes(
+            repo_root, crawl_scopes
+        ).items()
+    }
 
 
 # Stale-running janitor threshold for the crawl_runs table (#179).
@@ -132,6 +233,9 @@ _STALE_CRAWL_THRESHOLD_SEC = 3600
 # crawl_runs row. Keeps error_message bounded for storage and readability.
 _MAX_ERROR_SAMPLES = 5
 
+# Rows per repo_artifacts upsert / last_crawled_at touch statement.
+_FLUSH_BATCH_SIZE = 1000
+
 # ADR-070 D8 safety rails. Bounds on the autonomous repo_artifacts reap
 # to prevent config-drift or partial-walk catastrophe. If any guard
 # trips the reap is skipped and an OPEN finding is posted for governor
@@ -183,7 +287,13 @@ class CrawlOrchestrator:
         embedding service.
 
         Returns stats dict with keys: files_scanned, files_changed,
-        symbols_linked, edges_created, chunks_upserted, verdicts_purged.
+        files_hashed, symbols_linked, edges_created, chunks_upserted,
+        verdicts_purged, orphans_reaped.
+
+        Files whose stat is unchanged since they were last hashed are not
+        read (crawl manifest), and repo_artifacts writes are flushed in
+        batches of _FLUSH_BATCH_SIZE, so a pass over an unchanged tree costs
+        a directory walk and a handful of statements.
 
         Terminal status (per #179): tri-state dispatch on per-file outcomes.
           - failures == 0                  → 'completed'
@@ -195,6 +305,7 @@ class CrawlOrchestrator:
         stats: dict[str, Any] = {
             "files_scanned": 0,
             "files_changed": 0,
+            "files_hashed": 0,
             "symbols_linked": 0,
             "edges_created": 0,
             "chunks_upserted": 0,
@@ -222,15 +333,15 @@ class CrawlOrchestrator:
 
         await svc.open_crawl_run(str(crawl_run_id))
 
-        # Per-file outcome tracking for tri-state status dispatch (#179)
-        successes = 0
-        failures = 0
-        error_samples: list[str] = []
+        # Per-file outcome tracking for tri-state status dispatch (#179):
+        # rel_path -> the exception that failed it.
+        failed: dict[str, Exception] = {}
 
         try:
             symbol_index = await svc.load_symbol_index()
-            existing_hashes = await svc.load_artifact_hashes()
+            existing_artifacts = await svc.load_artifact_states()
             seen_paths: set[str] = set()
+            manifest = get_crawl_manifest(repo_root)
 
             # F-41 ADR-090 D7: scopes + collection map derived from registry.
             crawl_scopes, qdrant_collection_map = _load_crawl_scopes_from_registry()
@@ -245,58 +356,111 @@ class CrawlOrchestrator:
             # file is assigned to exactly one artifact_type (most-specific
             # matching glob) and processed once, rather than once-per-matching-
             # scope with last-scope-wins (registry-iteration-order) semantics.
-            resolved_types = _resolve_file_artifact_types(repo_root, crawl_scopes)
-
-            for file_path in sorted(resolved_types):
-                artifact_type = resolved_types[file_path]
+            # One walk serves every scope and yields each file's stat.
+            scanned = _scan_crawl_scopes(repo_root, crawl_scopes)
+
+            # Classify every file before writing anything. Hashing is
+            # stat-gated by the manifest. A file whose hash, type and
+            # collection match its row only needs last_crawled_at touched;
+            # anything else is upserted, and files whose content changed
+            # are re-parsed / re-linked once their rows are written.
+            upserts: list[tuple[str, str, str, str | None]] = []
+            touches: list[str] = []
+            content_changed: list[tuple[Path, str, str]] = []
+            for file_path in sorted(scanned):
+                artifact_type, st = scanned[file_path]
                 rel_path = str(file_path.relative_to(repo_root))
                 seen_paths.add(rel_path)
                 stats["files_scanned"] += 1
                 try:
-                    content_hash = _sha256(file_path)
+                    content_hash = manifest.lookup(rel_path, st)
+                    if content_hash is None:
+                        content_hash = _sha256(file_path)
+                        manifest.record(rel_path, st, content_hash)
+                        stats["files_hashed"] += 1
+                except Exception as exc:
+                    failed[rel_path] = exc
+                    logger.warning(
+                        "CrawlOrchestrator.run_crawl: error processing %s: %s",
+                        rel_path,
+                        exc,
+                    )
+                    continue
+                collection = qdrant_collection_map.get(artifact_type)
+                prior = existing_artifacts.get(rel_path)
+                if prior == (content_hash, artifact_type, collection):
+                    touches.append(rel_path)
+                    continue
+                upserts.append((rel_path, artifact_type, content_hash, collection))
+                if prior is None or prior[0] != content_hash:
+                    content_changed.append((file_path, rel_path, artifact_type))
+            manifest.retain(seen_paths)
+
+            artifact_ids = await self._flush_upserts(upserts, crawl_run_id, failed)
+
+            for file_path, rel_path, artifact_type in content_changed:
+                if rel_path in failed:
+                    continue
+                try:
                     if artifact_type == "python":
-                        changed = await self._crawl_python_file(
+                        await self._extract_call_graph(
                             file_path=file_path,
                             rel_path=rel_path,
-                            content_hash=content_hash,
-                            existing_hashes=existing_hashes,
                             symbol_index=symbol_index,
                             crawl_run_id=crawl_run_id,
                             stats=stats,
-                            qdrant_collection_map=qdrant_collection_map,
                         )
                     else:
-                        changed = await self._crawl_artifact_file(
+                        await self._link_artifact_symbols(
                             file_path=file_path,
                             rel_path=rel_path,
-                            content_hash=content_hash,
                             artifact_type=artifact_type,
-                            existing_hashes=existing_hashes,
+                            artifact_id=artifact_ids.get(rel_path),
                             symbol_index=symbol_index,
-                            crawl_run_id=crawl_run_id,
                             stats=stats,
-                            qdrant_collection_map=qdrant_collection_map,
                         )
-                    if changed:
-                        stats["files_changed"] += 1
-                    successes += 1
+                    stats["files_changed"] += 1
                 except Exception as exc:
-                    failures += 1
-                    if len(error_samples) < _MAX_ERROR_SAMPLES:
-                        error_samples.append(
-                            f"{rel_path} ({type(exc).__name__}: {str(exc)[:80]})"
-                        )
+                    failed[rel_path] = exc
                     logger.warning(
                         "CrawlOrchestrator.run_crawl: error processing %s: %s",
                         rel_path,
                         exc,
                     )
 
+            for start in range(0, len(touches), _FLUSH_BATCH_SIZE):
+                batch = touches[start : start + _FLUSH_BATCH_SIZE]
+                try:
+                    await svc.touch_crawled_artifacts(batch, str(crawl_run_id))
+                except Exception as exc:
+                    failed.update(dict.fromkeys(batch, exc))
+                    logger.warning(
+                        "CrawlOrchestrator.run_crawl: last_crawled_at touch "
+                        "failed for %d file(s): %s",
+                        len(batch),
+                        exc,
+                    )
+
+            logger.info(
+                "CrawlOrchestrator.run_crawl: %d file(s) walked, %d hashed, "
+                "%d upserted, %d touched",
+                stats["files_scanned"],
+                stats["files_hashed"],
+                len(upserts),
+                len(touches),
+            )
+            failures = len(failed)
+            successes = stats["files_scanned"] - failures
+            error_samples = [
+                f"{rel_path} ({type(exc).__name__}: {str(exc)[:80]})"
+                for rel_path, exc in sorted(failed.items())[:_MAX_ERROR_SAMPLES]
+            ]
+
             # ADR-044: purge llm_gate verdicts for files that disappeared
             # from the crawl scope (deleted, moved, or renamed). Bounded by
-            # previously-crawled set (existing_hashes), so we never delete
+            # previously-crawled set (existing_artifacts), so we never delete
             # rows for files that were simply never crawled.
-            removed_paths = sorted(set(existing_hashes.keys()) - seen_paths)
+            removed_paths = sorted(existing_artifacts.keys() - seen_paths)
             if removed_paths:
                 purged = await svc.purge_verdicts_for_removed_files(removed_paths)
                 stats["verdicts_purged"] = purged
@@ -316,7 +480,7 @@ class CrawlOrchestrator:
                 # confirm the diff is within declared bounds.
                 guard_state = _evaluate_reap_safety(
                     removed_paths=removed_paths,
-                    total_known=len(existing_hashes),
+                    total_known=len(existing_artifacts),
                     total_walked=len(seen_paths),
                 )
                 stats["coherence_guard"] = guard_state
@@ -391,25 +555,59 @@ class CrawlOrchestrator:
         )
         return stats
 
-    async def _crawl_python_file(
+    async def _flush_upserts(
+        self,
+        upserts: list[tuple[str, str, str, str | None]],
+        crawl_run_id: uuid.UUID,
+        failed: dict[str, Exception],
+    ) -> dict[str, str]:
+        """Write ``upserts`` in batched statements; returns file_path → id of
+        the rows written.
+
+        A batch the database rejects is retried row by row, so one bad row
+        (e.g. an artifact_type outside repo_artifacts_type_check) fails only
+        its own file, as the per-file upserts did.
+        """
+        svc = self._service
+        artifact_ids: dict[str, str] = {}
+        for start in range(0, len(upserts), _FLUSH_BATCH_SIZE):
+            batch = upserts[start : start + _FLUSH_BATCH_SIZE]
+            try:
+                artifact_ids.update(
+                    await svc.upsert_artifacts_bulk(batch, str(crawl_run_id))
+                )
+                continue
+            except Exception as exc:
+                logger.warning(
+                    "CrawlOrchestrator.run_crawl: upsert of %d artifact(s) "
+                    "failed (%s); retrying row by row",
+                    len(batch),
+                    exc,
+                )
+            for artifact in batch:
+                try:
+                    artifact_ids.update(
+                        await svc.upsert_artifacts_bulk([artifact], str(crawl_run_id))
+                    )
+                except Exception as exc:
+                    failed[artifact[0]] = exc
+                    logger.warning(
+                        "CrawlOrchestrator.run_crawl: error processing %s: %s",
+                        artifact[0],
+                        exc,
+                    )
+        return artifact_ids
+
+    async def _extract_call_graph(
         self,
         file_path: Path,
         rel_path: str,
-        content_hash: str,
-        existing_hashes: dict[str, str],
         symbol_index: dict[str, str],
         crawl_run_id: uuid.UUID,
         stats: dict[str, int],
-        qdrant_collection_map: dict[str, str],
-    ) -> bool:
-        """Register a Python artifact and extract call-graph edges on change."""
+    ) -> None:
+        """Replace a changed Python file's call-graph edges."""
         svc = self._service
-        await svc.upsert_python_artifact(
-            rel_path, content_hash, qdrant_collection_map["python"], str(crawl_run_id)
-        )
-        if existing_hashes.get(rel_path) == content_hash:
-            return False
-
         source = file_path.read_text(encoding="utf-8", errors="replace")
         try:
             tree = ast.parse(source)
@@ -417,7 +615,7 @@ class CrawlOrchestrator:
             logger.warning(
                 "CrawlOrchestrator.run_crawl: syntax error in %s, skipping", rel_path
             )
-            return True  # registered in artifacts; no call graph
+            return  # registered in artifacts; no call graph
 
         extractor = _CallGraphExtractor(
             rel_path=rel_path,
@@ -430,42 +628,23 @@ class CrawlOrchestrator:
             await svc.delete_stale_symbol_calls(rel_path, str(crawl_run_id))
             await svc.insert_symbol_calls(edges)
             stats["edges_created"] += len(edges)
-        return True
 
-    async def _crawl_artifact_file(
+    async def _link_artifact_symbols(
         self,
         file_path: Path,
         rel_path: str,
-        content_hash: str,
         artifact_type: str,
-        existing_hashes: dict[str, str],
+        artifact_id: str | None,
         symbol_index: dict[str, str],
-        crawl_run_id: uuid.UUID,
         stats: dict[str, int],
-        qdrant_collection_map: dict[str, str],
-    ) -> bool:
-        """Register a non-Python artifact and cross-reference symbols on change."""
-        svc = self._service
-        changed = existing_hashes.get(rel_path) != content_hash
-        await svc.upsert_artifact(
-            rel_path,
-            artifact_type,
-            content_hash,
-            qdrant_collection_map.get(artifact_type),
-            str(crawl_run_id),
-        )
-        if not changed:
-            return False
-
-        artifact_id = await svc.fetch_artifact_id(rel_path)
-        if artifact_id:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-            links = _find_symbol_references(
-                content, symbol_index, rel_path, artifact_type
-            )
-            await svc.insert_artifact_symbol_links(artifact_id, links)
-            stats["symbols_linked"] += len(links)
-        return True
+    ) -> None:
+        """Cross-reference a changed non-Python artifact's symbol mentions."""
+        if not artifact_id:
+            return
+        content = file_path.read_text(encoding="utf-8", errors="replace")
+        links = _find_symbol_references(content, symbol_index, rel_path, artifact_type)
+        await self._service.insert_artifact_symbol_links(artifact_id, links)
+        stats["symbols_linked"] += len(links)
 
 
 # ID: 8c1f3a5e-7d9b-4e6c-a8f2-5b3d9c1e7a4f
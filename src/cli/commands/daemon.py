@@ -987,4 +987,12 @@ async def _run_daemon_locked(only: str | None = None) -> None:
     except asyncio.CancelledError:
         pass
 
+    # Release the LLM providers' pooled HTTP connections once no worker can
+    # issue another call.
+    if cog_svc is not None:
+        try:
+            await cog_svc.aclose()
+        except Exception as e:
+            logger.warning("CORE daemon: LLM client pool close failed: %s", e)
+
     logger.info("CORE daemon: stopped cleanly.")
@@ -8,7 +8,7 @@ renders the result and sets the exit code.
 
 Display-only options (`--severity`, `--verbose`, `--classify`) stay
 client-side. Audit-shaping options (`--rule`, `--policy`, `--files`,
-`--force-llm`) are forwarded to the server.
+`--force-llm`, `--no-cache`) are forwarded to the server.
 """
 
 from __future__ import annotations
@@ -41,6 +41,7 @@ from cli.utils.exit_codes import (
     EXIT_INTERNAL_ERROR,
     EXIT_OK,
 )
+from mind.governance.rule_executor import clear_eval_cache
 from mind.governance.stateless_audit import run_stateless_audit
 from shared.infrastructure.database.session_manager import get_session
 from shared.infrastructure.intent.intent_repository import (
@@ -91,6 +92,26 @@ async def audit_command(
             "Use after suspect cache state or to validate a model upgrade."
         ),
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help=(
+            "Drop the persisted per-file verdicts in var/cache/audit/ "
+            "before the run, so every (rule, file) pair is re-evaluated. "
+            "Use after an engine regression or to force a full re-audit."
+        ),
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=0,
+        help=(
+            "Shard CPU-bound engines (ast_gate, regex_gate, glob_gate) "
+            "across this many worker processes on the server. Defaults to "
+            "operational_config audit.parallel_workers; 0 or 1 = in-process."
+        ),
+    ),
     offline: bool = typer.Option(
         False,
         "--offline",
@@ -164,6 +185,7 @@ async def audit_command(
             min_severity_str=severity,
             output_format=output_format,
             target=target,
+            no_cache=no_cache,
         )
         return
 
@@ -173,7 +195,9 @@ async def audit_command(
         policy_ids=list(policy),
         files=list(files),
         force_llm=force_llm,
+        no_cache=no_cache,
         source="manual",
+        workers=workers,
     )
 
     raw_stats = result.get("stats", {}) or {}
@@ -243,6 +267,7 @@ async def _run_offline_audit(
     min_severity_str: str,
     output_format: str,
     target: str | None = None,
+    no_cache: bool = False,
 ) -> None:
     """F-10.1b / F-10.2 — execute the stateless audit + render per format.
 
@@ -267,6 +292,8 @@ async def _run_offline_audit(
 
     target: when set, audits the given directory instead of the cwd-derived
     repo (#688). Must be a path containing a .intent/ tree.
+
+    no_cache: drop the repo's persisted evaluation verdicts before the run.
     """
     structured = output_format in {"json", "github-annotations", "codeclimate"}
 
@@ -287,6 +314,9 @@ async def _run_offline_audit(
 
     min_severity = parse_min_severity(min_severity_str)
 
+    if no_cache:
+        clear_eval_cache(repo_path)
+
     try:
         result = await run_stateless_audit(
             intent_repo=intent_repo,
@@ -13,18 +13,20 @@ from __future__ import annotations
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from shared.infrastructure.intent.operational_config import load_operational_config
+
+if TYPE_CHECKING:
+    from shared.infrastructure.context.cache import ContextCache
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 _CACHE_DIR = "work/context_cache"
-_CFG = load_operational_config().context
 
 
 # ID: f58e6b83-332e-4b8a-bcf0-e51069ecfe1e
@@ -35,7 +37,7 @@ def cache(action: str = typer.Argument(..., help="Action: list, clear, stats"))
     Actions:
         list   - Show cached context queries
         clear  - Clear all cached contexts
-        stats  - Show cache statistics (size, hit rate, etc.)
+        stats  - Show cache statistics (size, hit/miss/eviction counts)
 
     Examples:
         core-admin context cache list
@@ -68,89 +70,101 @@ def _get_cache_dir() -> Path:
     return Path(_CACHE_DIR)
 
 
-def _list_cache() -> None:
-    """List all cached context queries."""
+def _open_cache() -> ContextCache | None:
+    """The cache with a writable index, or None when no cache exists."""
+    from body.infrastructure.storage.file_handler import FileHandler
+    from shared.config import settings
+    from shared.infrastructure.context.cache import ContextCache
+
     cache_dir = _get_cache_dir()
     if not cache_dir.exists():
+        return None
+    repo_root = Path(settings.REPO_PATH)
+    return ContextCache(
+        str(cache_dir), file_handler=FileHandler(str(repo_root)), repo_root=repo_root
+    )
+
+
+def _list_cache() -> None:
+    """List all cached context queries."""
+    cache = _open_cache()
+    if cache is None:
         console.print("[dim]Cache directory does not exist. No entries.[/dim]")
         return
-    files = sorted(
-        cache_dir.glob("*.yaml"), key=lambda f: f.stat().st_mtime, reverse=True
-    )
-    if not files:
+    entries = cache.entries()
+    if not entries:
         console.print("[dim]Cache is empty.[/dim]")
         return
     table = Table(
-        title=f"Context Cache ({len(files)} entries)", header_style="bold cyan"
+        title=f"Context Cache ({len(entries)} entries)", header_style="bold cyan"
     )
     table.add_column("Key (short)", style="cyan", no_wrap=True)
-    table.add_column("Modified", style="green")
+    table.add_column("Last used", style="green")
     table.add_column("Size", style="yellow", justify="right")
     table.add_column("Age (h)", style="magenta", justify="right")
+    table.add_column("Sources", style="blue", justify="right")
     now = datetime.now(UTC)
-    for f in files:
-        stat = f.stat()
-        mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-        age_h = (now - mtime).total_seconds() / 3600
-        size_kb = stat.st_size / 1024
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry["last_access"], tz=UTC)
+        created = datetime.fromtimestamp(entry["created"], tz=UTC)
         table.add_row(
-            f.stem[:16],
-            mtime.strftime("%Y-%m-%d %H:%M"),
-            f"{size_kb:.1f} KB",
-            f"{age_h:.1f}",
+            entry["key"][:16],
+            last_used.strftime("%Y-%m-%d %H:%M"),
+            f"{entry['size'] / 1024:.1f} KB",
+            f"{(now - created).total_seconds() / 3600:.1f}",
+            str(entry["dependencies"]),
         )
     console.print(table)
 
 
 def _clear_cache() -> None:
     """Clear all cached contexts."""
-    cache_dir = _get_cache_dir()
-    if not cache_dir.exists() or not list(cache_dir.glob("*.yaml")):
+    cache = _open_cache()
+    count = len(cache.entries()) if cache is not None else 0
+    if cache is None or not count:
         console.print("[dim]Cache is already empty.[/dim]")
         return
-    count = len(list(cache_dir.glob("*.yaml")))
     console.print(
         f"[yellow]⚠️  This will delete {count} cached context package(s).[/yellow]"
     )
     if not typer.confirm("Continue?"):
         console.print("[dim]Aborted.[/dim]")
         return
-    from shared.infrastructure.context.cache import ContextCache
 
-    removed = ContextCache(str(cache_dir)).clear_all()
+    removed = cache.clear_all()
     console.print(f"[green]✅ Cleared {removed} cache entries.[/green]")
 
 
 def _show_stats() -> None:
     """Show cache statistics."""
-    cache_dir = _get_cache_dir()
-    if not cache_dir.exists():
+    cache = _open_cache()
+    if cache is None:
         console.print("[dim]Cache directory does not exist.[/dim]")
         return
-    files = list(cache_dir.glob("*.yaml"))
-    ttl_hours = _CFG.cache_ttl_hours
-    now = datetime.now(UTC)
-    total_size = 0
-    expired = 0
-    oldest_dt = None
-    for f in files:
-        stat = f.stat()
-        total_size += stat.st_size
-        mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-        age_h = (now - mtime).total_seconds() / 3600
-        if age_h > ttl_hours:
-            expired += 1
-        if oldest_dt is None or mtime < oldest_dt:
-            oldest_dt = mtime
+    stats = cache.stats()
+    entries = cache.entries()
+    oldest = min((e["created"] for e in entries), default=None)
     table = Table(title="Context Cache Statistics", header_style="bold cyan")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
-    table.add_row("Total entries", str(len(files)))
-    table.add_row("Total size", f"{total_size / 1024:.1f} KB")
-    table.add_row("Expired entries", f"{expired} (TTL={ttl_hours}h)")
-    table.add_row("Active entries", str(len(files) - expired))
+    table.add_row("Total entries", str(stats["entries"]))
+    table.add_row(
+        "Total size",
+        f"{stats['total_bytes'] / 1024:.1f} KB / {stats['max_bytes'] / 1024:.0f} KB",
+    )
+    table.add_row("Hits", str(stats["hits"]))
+    table.add_row("Misses", str(stats["misses"]))
+    table.add_row("Hit rate", f"{stats['hit_rate']:.1%}")
+    table.add_row("Evictions (LRU)", str(stats["evictions"]))
+    table.add_row(
+        "Invalidations",
+        f"{stats['invalidations']} (sources changed or TTL={stats['ttl_hours']}h)",
+    )
     table.add_row(
-        "Oldest entry", oldest_dt.strftime("%Y-%m-%d %H:%M") if oldest_dt else "—"
+        "Oldest entry",
+        datetime.fromtimestamp(oldest, tz=UTC).strftime("%Y-%m-%d %H:%M")
+        if oldest is not None
+        else "—",
     )
-    table.add_row("Cache dir", str(cache_dir))
+    table.add_row("Cache dir", str(_get_cache_dir()))
     console.print(table)
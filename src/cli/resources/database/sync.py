@@ -44,11 +44,15 @@ async def sync_database(
     write: bool = typer.Option(
         False, "--write", help="Apply changes to database (default: dry-run)"
     ),
+    full: bool = typer.Option(
+        False, "--full", help="Re-parse every module, not only changed ones"
+    ),
 ) -> None:
     """
     Synchronize database with codebase symbols.
 
     Scans the codebase and syncs all symbols to the database knowledge graph.
+    Only modules changed since the last sync are re-parsed unless --full.
 
     Constitutional Compliance:
     - Enforces 'knowledge.database_ssot'
@@ -61,6 +65,9 @@ async def sync_database(
 
         # Apply changes
         core-admin database sync --write
+
+        # Re-parse every module
+        core-admin database sync --write --full
     """
     console.print("[bold cyan]📊 Database Synchronization[/bold cyan]")
     console.print(f"Mode: {'WRITE' if write else 'DRY-RUN'}")
@@ -72,7 +79,7 @@ async def sync_database(
             console.print("[yellow]DRY-RUN: Use --write to persist changes[/yellow]")
             return
         async with get_session() as session:
-            result = await run_sync_with_db(session)
+            result = await run_sync_with_db(session, full=full)
             if result.ok:
                 stats = result.data
                 console.print("[green]✅ Synchronization completed[/green]")
@@ -21,6 +21,7 @@ from rich.console import Console
 
 from shared.action_types import ActionResult
 from shared.infrastructure.database.session_manager import dispose_engine
+from shared.infrastructure.llm.exchange_log_writer import flush_exchange_log
 from shared.logger import getLogger
 
 from .display import _display_action_result
@@ -180,6 +181,7 @@ def core_command(
                             if hasattr(registry, "_instances"):
                                 registry._instances.clear()
                     await asyncio.sleep(0)
+                    await flush_exchange_log()
                     await dispose_engine()
 
             try:
@@ -14,8 +14,12 @@ Constitutional Alignment:
 Performance:
 - Module-level knowledge graph cache per repo_path
 - Single-pass filesystem scan with pattern memoization
+- Rule scopes compiled once into a ScopeIndex; per-path scope membership
+  is memoized across audit cycles
 - AST cache keyed by file content identity (ADR-039 Option E): reused across
   audit runs, re-parsed only when a file's bytes change
+- Per-audit CorpusSnapshot: context-level engines read, parse and search
+  the tree through one shared snapshot instead of walking it themselves
 """
 
 from __future__ import annotations
@@ -27,7 +31,9 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from mind.governance.corpus_snapshot import CorpusSnapshot
 from mind.governance.enforcement_loader import EnforcementMappingLoader
+from mind.governance.scope_index import ScopeIndex
 from shared.infrastructure.intent.intent_repository import (
     IntentRepository,
     get_intent_repository,
@@ -36,6 +42,13 @@ from shared.infrastructure.knowledge.knowledge_service import KnowledgeService
 from shared.logger import getLogger
 from shared.path_resolver import PathResolver
 from shared.protocols.knowledge import SessionProviderProtocol
+from shared.utils.ast_cache import (
+    AST_CACHE,
+    discard_ast,
+    file_content_key,
+    get_cached_ast,
+    store_ast,
+)
 
 
 if TYPE_CHECKING:
@@ -49,7 +62,9 @@ logger = getLogger(__name__)
 # ============================================================================
 # MODULE-LEVEL CACHE
 # ============================================================================
-# Cache structure: {repo_path_str: {knowledge_graph, symbols_map, symbols_list}}
+# Cache structure:
+# {repo_path_str: {version, knowledge_graph, symbols_map, symbols_list}}
+# keyed on the graph version of KnowledgeService's delta-refreshed cache.
 _KNOWLEDGE_GRAPH_CACHE: dict[str, dict[str, Any]] = {}
 # ADR-039 (Option E, 2026-06-15): the parse cache is keyed on file *content
 # identity* — (mtime_ns, size) — not path alone, so a changed file misses and
@@ -63,23 +78,9 @@ _KNOWLEDGE_GRAPH_CACHE: dict[str, dict[str, Any]] = {}
 # extends the same content-identity design one level deeper: engine.verify()
 # is skipped entirely for (rule_id, file, rule_content_hash, mtime_ns, size)
 # tuples seen in a prior cycle. See _EVAL_CACHE in rule_executor.py.
-_AST_CACHE: dict[Path, tuple[tuple[int, int], ast.AST]] = {}
-# Bound the cache so a long-lived daemon scanning a churning tree cannot grow
-# it without limit (~969 source files today; generous headroom). FIFO
-# eviction; dropping an entry is always safe — worst case the file is
-# re-parsed on next access.
-_AST_CACHE_MAX_ENTRIES: int = 5000
-
-
-def _store_ast(file_path: Path, content_key: tuple[int, int], tree: ast.AST) -> None:
-    """Store a parsed tree under its content key, evicting FIFO past the cap."""
-    if file_path in _AST_CACHE:
-        # Refresh in place — drop first so the re-insert lands at the
-        # most-recent position (keeps FIFO order meaningful).
-        del _AST_CACHE[file_path]
-    elif len(_AST_CACHE) >= _AST_CACHE_MAX_ENTRIES:
-        del _AST_CACHE[next(iter(_AST_CACHE))]
-    _AST_CACHE[file_path] = (content_key, tree)
+# The cache itself lives in shared.utils.ast_cache so ContextBuilder (shared
+# layer) reuses the same parses; the aliases keep this module's names.
+_AST_CACHE = AST_CACHE
 
 
 # ADR-076 D5: structural excludes are directory names whose contents are
@@ -117,7 +118,9 @@ def _include_matches(rel_posix: str, pattern: str) -> bool:
     pass during file-cache build AND the per-rule scope filter at dispatch
     consult the same matcher. Single source for "does this path satisfy
     this scope" — the walker and the dispatcher can never disagree about
-    whether a file is in scope.
+    whether a file is in scope. ``ScopeIndex`` (scope_index.py) compiles
+    these exact semantics for get_files(); a differential test keeps the
+    two byte-for-byte equivalent.
     """
     if fnmatch.fnmatch(rel_posix, pattern):
         return True
@@ -250,6 +253,13 @@ class AuditorContext:
         # ADR-076 D5: union of active per-file rule scopes, computed
         # lazily on first get_files() call and reset by invalidate_file_cache.
         self._per_file_scopes_cache: list[str] | None = None
+        # Compiled matcher over those scopes. Survives invalidate_file_cache
+        # and is reused while the scope union is unchanged, so its per-path
+        # membership memo carries across audit cycles.
+        self._scope_index: ScopeIndex | None = None
+        # Shared read/parse snapshot for context-level engines; built lazily
+        # and dropped by invalidate_file_cache, so it lives for one audit.
+        self._corpus: CorpusSnapshot | None = None
 
         # ADR-044: per-run knobs for the llm_gate verdict cache. The
         # rule_executor reads force_llm via getattr; engines that don't
@@ -258,6 +268,9 @@ class AuditorContext:
         # once per audit run.
         self.force_llm: bool = False
         self._llm_gate_cache_swept: bool = False
+        # Per-run worker-process override for rule_executor's parallel
+        # dispatch; None defers to operational_config.audit.parallel_workers.
+        self.audit_workers: int | None = None
 
         # Dynamic attrs injected by callers before specific audit paths.
         # Declared here so mypy sees them; None is the correct default.
@@ -276,6 +289,14 @@ class AuditorContext:
         """Canonical Mind runtime root."""
         return self.paths.mind_dir
 
+    @property
+    # ID: 0c5e8b27-4a1f-4d93-b6e2-f7a9c3d1e548
+    def corpus(self) -> CorpusSnapshot:
+        """This audit's CorpusSnapshot (see mind.governance.corpus_snapshot)."""
+        if self._corpus is None:
+            self._corpus = CorpusSnapshot()
+        return self._corpus
+
     # ID: 7d3e8c2a-9f4b-4c1d-8e6a-2b7f9d5c3a1e
     def invalidate_file_cache(self) -> None:
         """Clear cached filesystem scan and per-pattern subsets.
@@ -287,6 +308,7 @@ class AuditorContext:
         self._file_list_cache = None
         self._rel_path_map.clear()
         self._pattern_cache.clear()
+        self._corpus = None
         # ADR-076 D5: the cached scope union is derived from policies +
         # enforcement_loader; both can change on reload_governance, so
         # invalidate alongside the file cache.
@@ -435,6 +457,12 @@ class AuditorContext:
         self._per_file_scopes_cache = sorted(scopes)
         return self._per_file_scopes_cache
 
+    def _scope_index_for(self, scopes: list[str]) -> ScopeIndex:
+        """Compiled index for ``scopes``, rebuilt only when the union changes."""
+        if self._scope_index is None or self._scope_index.scopes != tuple(scopes):
+            self._scope_index = ScopeIndex(scopes)
+        return self._scope_index
+
     # ID: 4a2f2b3d-1a8a-4a1f-9a8e-2b6a0e7d9b3c
     def get_files(
         self,
@@ -461,7 +489,8 @@ class AuditorContext:
         - ``*`` matches any run of characters (fnmatch default, may cross ``/``).
         - ``**`` zero-directory semantics handled by ``_include_matches``
           (module-level), shared with the cache builder so dispatch and
-          retention agree byte-for-byte on scope membership.
+          retention agree byte-for-byte on scope membership. Both run
+          through ``ScopeIndex``, its compiled equivalent.
         """
         include_list = sorted(list(include))
         exclude_list = sorted(list(exclude or []))
@@ -477,12 +506,13 @@ class AuditorContext:
             # directories worth descending from those scopes' fixed prefixes and
             # prune everything else in-place during os.walk — so the ~500k-entry
             # repo (var/tmp sandboxes, .git objects, reports, …) is never
-            # traversed. Retention still uses _include_matches, so membership is
-            # byte-for-byte the prior rglob-and-filter result; only the mechanics
-            # change. Relative paths come from slicing the root prefix (no
+            # traversed. Retention uses _include_matches semantics (compiled
+            # once in ScopeIndex), so membership is byte-for-byte the prior
+            # rglob-and-filter result; only the mechanics change. Relative paths come from slicing the root prefix (no
             # per-file Path.relative_to), and a Path is built only for the files
             # a scope actually retains.
             per_file_scopes = self._active_per_file_rule_scopes()
+            scope_index = self._scope_index_for(per_file_scopes)
             prefixes, broad = _scope_fixed_prefixes(per_file_scopes)
             root_str = str(self.repo_path)
             prefix_len = len(root_str) + 1
@@ -503,7 +533,7 @@ class AuditorContext:
                 for fn in filenames:
                     rel_posix = f"{rel_dir}/{fn}" if rel_dir else fn
                     # Retain iff some active per-file rule scopes this path.
-                    if any(_include_matches(rel_posix, sc) for sc in per_file_scopes):
+                    if scope_index.matches_any(rel_posix):
                         p = Path(dirpath, fn)
                         self._file_list_cache.append(p)
                         self._rel_path_map[p] = rel_posix
@@ -518,16 +548,18 @@ class AuditorContext:
         # `**/` and `/**` zero-directory expansion correctly.
         exclude_patterns = {pat.replace("\\", "/") for pat in exclude_list}
 
-        def _is_excluded(rel_posix: str) -> bool:
-            return any(_include_matches(rel_posix, pat) for pat in exclude_patterns)
+        # Both sides resolve through the compiled index: rule includes are
+        # normally members of the scope union (a mask test on the memoized
+        # scope set); anything else is compiled once per pattern set.
+        scope_index = self._scope_index or ScopeIndex(())
+        is_included = scope_index.matcher(include_list)
+        is_excluded = scope_index.matcher(exclude_patterns)
 
         matched: set[Path] = set()
-        for inc_pattern in include_list:
-            for p in self._file_list_cache:
-                rel_posix = self._rel_path_map[p]
-                if _include_matches(rel_posix, inc_pattern):
-                    if not _is_excluded(rel_posix):
-                        matched.add(p)
+        for p in self._file_list_cache:
+            rel_posix = self._rel_path_map[p]
+            if is_included(rel_posix) and not is_excluded(rel_posix):
+                matched.add(p)
 
         result = sorted(matched)
         self._pattern_cache[cache_key] = result
@@ -544,16 +576,14 @@ class AuditorContext:
         construction, which is why ``invalidate_file_cache`` no longer wipes
         this cache every cycle.
         """
-        try:
-            stat = file_path.stat()
-            content_key = (stat.st_mtime_ns, stat.st_size)
-        except OSError as e:
-            logger.warning("Failed to stat %s: %s", file_path.name, e)
+        content_key = file_content_key(file_path)
+        if content_key is None:
+            logger.warning("Failed to stat %s", file_path.name)
             return None
 
-        cached = _AST_CACHE.get(file_path)
-        if cached is not None and cached[0] == content_key:
-            return cached[1]
+        cached = get_cached_ast(file_path, content_key)
+        if cached is not None:
+            return cached
 
         try:
             source = file_path.read_text(encoding="utf-8")
@@ -561,35 +591,45 @@ class AuditorContext:
         except Exception as e:
             logger.warning("Failed to parse %s: %s", file_path.name, e, exc_info=True)
             # Drop any now-stale entry so a later successful read repopulates.
-            _AST_CACHE.pop(file_path, None)
+            discard_ast(file_path)
             return None
 
-        _store_ast(file_path, content_key, tree)
+        store_ast(file_path, content_key, tree)
         return tree
 
     # ID: 3d1f1c34-fd1e-4bb8-8b4f-3f9a6c6dfd41
     async def load_knowledge_graph(self, force: bool = False) -> None:
-        """Load knowledge graph from the database (SSOT)."""
+        """Load knowledge graph from the database (SSOT).
+
+        Every call refreshes KnowledgeService's process-wide graph cache,
+        which re-reads only the symbols changed since the previous call, so
+        long-lived contexts audit a current graph. The map and list derived
+        from a graph version are reused until the version moves; ``force``
+        re-reads the whole view.
+        """
         # F-10.1a: stateless mode (CI gate) intentionally has no graph.
         # Rules requiring the graph are filtered out by stateless_audit
         # before dispatch and surfaced in skipped_rules.
         if self.stateless:
             return
         cache_key = str(self.repo_path)
-        if not force and cache_key in _KNOWLEDGE_GRAPH_CACHE:
-            cached = _KNOWLEDGE_GRAPH_CACHE[cache_key]
-            self.knowledge_graph = cached["knowledge_graph"]
-            self.symbols_map = cached["symbols_map"]
-            self.symbols_list = cached["symbols_list"]
-            return
-
-        logger.info("Loading knowledge graph from database (SSOT)...")
         try:
             knowledge_service = KnowledgeService(self.repo_path)
-            self.knowledge_graph = await knowledge_service.get_graph()
+            graph = await knowledge_service.get_graph(full_reload=force)
+            version = graph.get("metadata", {}).get("version")
+            cached = _KNOWLEDGE_GRAPH_CACHE.get(cache_key)
+            # No version: the database read failed. The last graph this
+            # process loaded beats an empty one.
+            if cached is not None and (version is None or cached["version"] == version):
+                self.knowledge_graph = cached["knowledge_graph"]
+                self.symbols_map = cached["symbols_map"]
+                self.symbols_list = cached["symbols_list"]
+                return
+            self.knowledge_graph = graph
             self.symbols_map = self.knowledge_graph.get("symbols", {})
             self.symbols_list = list(self.symbols_map.values())
             _KNOWLEDGE_GRAPH_CACHE[cache_key] = {
+                "version": version,
                 "knowledge_graph": self.knowledge_graph,
                 "symbols_map": self.symbols_map,
                 "symbols_list": self.symbols_list,
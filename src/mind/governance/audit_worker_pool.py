@@ -0,0 +1,180 @@
+# src/mind/governance/audit_worker_pool.py
+
+"""
+Process pool for CPU-bound per-file audit engines.
+
+Deterministic engines (ast_gate, regex_gate, glob_gate) spend their time
+parsing and walking Python in the interpreter, so inside one event loop an
+audit is bound to a single core. rule_executor.execute_rules_parallel shards
+their (file, rule) work across this pool instead.
+
+Workers are spawned — never forked from a process running an event loop and
+helper threads — and live across audit runs: each holds its own warm AST
+cache (shared.utils.ast_cache) and EngineRegistry, initialised once per
+worker for the repo being audited.
+
+Only the engine verdict crosses the process boundary. The main process keeps
+the evaluation cache, turns every EngineResult into findings and merges them
+in get_files() order, so parallel findings are identical to in-process ones.
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+from shared.logger import getLogger
+from shared.utils.ast_cache import (
+    discard_ast,
+    file_content_key,
+    get_cached_ast,
+    store_ast,
+)
+
+
+logger = getLogger(__name__)
+
+# (file_path, [(rule_index, engine_id, params), ...]) — one file's work.
+FileBatch = list[tuple[str, list[tuple[int, str, dict[str, Any]]]]]
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_KEY: tuple[str, int] | None = None
+_POOL_LOCK = threading.Lock()
+
+# Per-worker state, populated by _init_worker.
+_WORKER_CONTEXT: _WorkerContext | None = None
+
+
+class _WorkerContext:
+    """The slice of AuditorContext that process-safe engines use."""
+
+    def __init__(self, repo_path: Path) -> None:
+        self.repo_path = repo_path
+
+    def get_tree(self, file_path: Path) -> ast.AST | None:
+        """Content-identity cached parse, as AuditorContext.get_tree."""
+        content_key = file_content_key(file_path)
+        if content_key is None:
+            return None
+        cached = get_cached_ast(file_path, content_key)
+        if cached is not None:
+            return cached
+        try:
+            tree = ast.parse(
+                file_path.read_text(encoding="utf-8"), filename=str(file_path)
+            )
+        except Exception:
+            discard_ast(file_path)
+            return None
+        store_ast(file_path, content_key, tree)
+        return tree
+
+
+def _init_worker(repo_path: str) -> None:
+    """Prime the worker's EngineRegistry and context for ``repo_path``."""
+    from mind.logic.engines.registry import EngineRegistry
+    from shared.path_resolver import PathResolver
+
+    global _WORKER_CONTEXT
+    EngineRegistry.initialize(PathResolver(Path(repo_path)))
+    _WORKER_CONTEXT = _WorkerContext(Path(repo_path))
+
+
+def _verify_batch(batch: FileBatch) -> list[tuple[str, int, Any]]:
+    """Worker entry point: run every rule of every file in ``batch``.
+
+    Returns ``(file_path, rule_index, outcome)`` where outcome is the
+    EngineResult, or ``(exception_type, exception_message)`` when the engine
+    raised — exceptions may not pickle, their names always do.
+    """
+    return asyncio.run(_verify_batch_async(batch))
+
+
+async def _verify_batch_async(batch: FileBatch) -> list[tuple[str, int, Any]]:
+    from mind.logic.engines.registry import EngineRegistry
+
+    results: list[tuple[str, int, Any]] = []
+    for path_str, work in batch:
+        file_path = Path(path_str)
+        views: dict[int, Any] = {}
+        with ExitStack() as stack:
+            # Fused within the worker too: one view per file, told every
+            # rule's params before the first rule runs (see expect()).
+            for _rule_index, engine_id, params in work:
+                try:
+                    engine = EngineRegistry.get(engine_id)
+                    if getattr(engine, "supports_fused_dispatch", False):
+                        view = views.get(id(engine))
+                        if view is None:
+                            view = engine.file_view(file_path, _WORKER_CONTEXT)
+                            views[id(engine)] = view
+                            stack.enter_context(view.active())
+                        if hasattr(view, "expect"):
+                            view.expect(params)
+                except Exception:
+                    # The rule runs without a shared view; any error it
+                    # raises is reported by its own verify() below.
+                    continue
+            for rule_index, engine_id, params in work:
+                try:
+                    engine = EngineRegistry.get(engine_id)
+                    call_params = {**params, "_context": _WORKER_CONTEXT}
+                    view = views.get(id(engine))
+                    if view is not None:
+                        call_params["_file_view"] = view
+                    outcome: Any = await engine.verify(file_path, call_params)
+                except Exception as e:
+                    outcome = (type(e).__name__, str(e))
+                results.append((path_str, rule_index, outcome))
+    return results
+
+
+# ID: 8c4e1a73-5d9b-4f26-b0e8-a3f7c2d6e915
+def get_audit_pool(repo_path: Path, workers: int) -> ProcessPoolExecutor:
+    """The shared worker pool for ``repo_path``, (re)created on first use.
+
+    Reused across audit runs so workers keep their warm caches; a different
+    repo or worker count replaces it.
+    """
+    global _POOL, _POOL_KEY
+    key = (str(repo_path), workers)
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_KEY != key:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(str(repo_path),),
+            )
+            _POOL_KEY = key
+            logger.info("Audit worker pool started: %d worker(s)", workers)
+        return _POOL
+
+
+# ID: 2b7f9d46-1c3a-4e85-9f0d-e6a4b8c1d753
+def shutdown_audit_pool() -> None:
+    """Stop the worker pool (e.g. after it broke, or at process exit)."""
+    global _POOL, _POOL_KEY
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+        _POOL_KEY = None
+
+
+# ID: 6e1d3b58-9a4c-4f70-8b2e-d5c7f1a9e036
+async def verify_in_pool(
+    pool: ProcessPoolExecutor, batch: FileBatch
+) -> list[tuple[str, int, Any]]:
+    """Run one batch in ``pool`` without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, _verify_batch, batch)
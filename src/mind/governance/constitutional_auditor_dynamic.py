@@ -47,7 +47,11 @@ async def run_dynamic_rules(
             If None, an internal set is used (backward compat).
     """
     # DEFERRED IMPORT: Break circular loop
-    from mind.governance.rule_executor import execute_rule
+    from mind.governance.rule_executor import (
+        execute_rule,
+        precompute_rule_findings,
+        take_fused_findings,
+    )
     from mind.logic.engines.registry import EngineRegistry
 
     if crashed_rule_ids is None:
@@ -71,6 +75,12 @@ async def run_dynamic_rules(
     executed_count = 0
     skipped_stub_count = 0
 
+    # File-major pass: fusable per-file rules (ast_gate) are evaluated
+    # together — in worker processes when audit.parallel_workers is set —
+    # and the loop below picks up their findings in rule order, running
+    # everything else through execute_rule.
+    fused = await precompute_rule_findings(executable_rules, context)
+
     for rule in executable_rules:
         try:
             engine = EngineRegistry.get(rule.engine)
@@ -90,7 +100,11 @@ async def run_dynamic_rules(
             # topologically sorted by extract_executable_rules, so
             # preconditions are guaranteed to be in all_findings before
             # any dependent rule executes.
-            findings = await execute_rule(rule, context, prior_findings=all_findings)
+            findings = take_fused_findings(fused, rule.rule_id)
+            if findings is None:
+                findings = await execute_rule(
+                    rule, context, prior_findings=all_findings
+                )
             all_findings.extend(findings)
 
         except Exception as e:
@@ -0,0 +1,229 @@
+# src/mind/governance/corpus_snapshot.py
+
+"""
+CorpusSnapshot: one read of the repository shared by context-level engines.
+
+Context-level checks (taxonomy_gate, artifact_gate, contracts_gate) used to
+walk and parse the tree on their own: ``src/`` was rglob'd and re-parsed by
+each collector, every test file was re-read once per self_resolve subject
+prefix, and the same mapping YAML and contract JSON were parsed by several
+checks in the same audit. The snapshot is owned by AuditorContext, rebuilt
+at the entry of every audit run (``invalidate_file_cache``), and memoizes:
+
+- Directory listings: each directory is walked at most once; a listing
+  under an already-walked directory is filtered from it.
+- Text, decoded lazily on first access. A read or decode error is kept and
+  re-raised to every caller, so each engine keeps its own fail-soft policy.
+- Parsed Python, YAML and JSON. ASTs go through shared.utils.ast_cache, so
+  a file whose content identity — (mtime_ns, size) — is unchanged since an
+  earlier audit (or since get_tree() parsed it) is not re-parsed at all.
+- A token index for substring lookups over a listing (``files_containing``).
+
+Within an audit the snapshot is immutable: the first read of a file is what
+every engine sees. Parsed values are shared between engines and must be
+treated as read-only.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from shared.utils.ast_cache import file_content_key, get_cached_ast, store_ast
+
+
+# Tokens are maximal runs of word characters. A needle's inner runs (bounded
+# by non-word characters inside the needle) must occur in a file as whole
+# tokens; its edge runs only as a token suffix (leading run) or prefix
+# (trailing run).
+_TOKEN = re.compile(r"\w+")
+
+_MISSING = object()
+
+
+# ID: 7c2e9a51-4d8b-4f36-a1e0-b5d3f8c6e294
+class CorpusSnapshot:
+    """Per-audit, read-once view of the files context-level engines inspect."""
+
+    def __init__(self) -> None:
+        self._walks: dict[Path, list[Path]] = {}
+        self._listings: dict[tuple[Path, str, bool], list[Path]] = {}
+        self._texts: dict[Path, str | Exception] = {}
+        self._keys: dict[Path, tuple[int, int] | None] = {}
+        self._parsed: dict[tuple[str, Path], Any] = {}
+        self._indexes: dict[tuple[Path, str], _TokenIndex] = {}
+
+    # ID: 3f8b1d64-9a2c-4e75-b0d7-c6e1a4f9b382
+    def files(
+        self, directory: Path, suffix: str = "", recursive: bool = True
+    ) -> list[Path]:
+        """Sorted files under ``directory`` whose name ends with ``suffix``.
+
+        Matches ``sorted(directory.rglob("*" + suffix))`` restricted to
+        files (``directory.glob`` when not ``recursive``); empty when the
+        directory does not exist.
+        """
+        key = (directory, suffix, recursive)
+        listing = self._listings.get(key)
+        if listing is None:
+            listing = [
+                p
+                for p in self._walk(directory)
+                if p.name.endswith(suffix) and (recursive or p.parent == directory)
+            ]
+            self._listings[key] = listing
+        return listing
+
+    # ID: 9d4a2e73-1b6f-4c58-8e09-a7f3c5d1b846
+    def text(self, file_path: Path) -> str:
+        """The file's UTF-8 text; raises the read/decode error on failure."""
+        cached = self._texts.get(file_path)
+        if cached is None:
+            self._keys[file_path] = file_content_key(file_path)
+            try:
+                cached = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as exc:
+                cached = exc
+            self._texts[file_path] = cached
+        if isinstance(cached, Exception):
+            raise cached
+        return cached
+
+    # ID: 5b1e8c37-6d2a-4f94-a3c8-e0b9d7f4a615
+    def tree(self, file_path: Path) -> ast.AST:
+        """The file's parsed module; raises SyntaxError or the read error."""
+        return self._parse("ast", file_path)
+
+    # ID: 1a7d3f92-8e4b-4c06-b5f1-d9c2e6a8b473
+    def parse_yaml(self, file_path: Path) -> Any:
+        """``yaml.safe_load`` of the file; raises yaml.YAMLError or the read error."""
+        return self._parse("yaml", file_path)
+
+    # ID: 6e9c4b28-3f1d-4a87-9d2e-b8a5f1c7d039
+    def parse_json(self, file_path: Path) -> Any:
+        """``json.loads`` of the file; raises ValueError or the read error."""
+        return self._parse("json", file_path)
+
+    # ID: 8f3a6d15-2c7e-4b49-a0d8-c4e7b2f9a561
+    def files_containing(self, directory: Path, suffix: str, needle: str) -> list[Path]:
+        """Files of ``files(directory, suffix)`` whose text contains ``needle``.
+
+        Equivalent to testing ``needle in text`` for every file (unreadable
+        files never match), but candidate files come from the listing's
+        token index, so only files that can contain the needle are searched.
+        """
+        index_key = (directory, suffix)
+        index = self._indexes.get(index_key)
+        if index is None:
+            index = _TokenIndex()
+            for path in self.files(directory, suffix):
+                try:
+                    index.add(path, self.text(path))
+                except (OSError, UnicodeDecodeError):
+                    continue
+            self._indexes[index_key] = index
+        return [p for p in index.candidates(needle) if needle in self.text(p)]
+
+    def _walk(self, directory: Path) -> list[Path]:
+        for root, listing in self._walks.items():
+            if directory == root:
+                return listing
+            if directory.is_relative_to(root):
+                return [p for p in listing if p.is_relative_to(directory)]
+        listing: list[Path] = []
+        if directory.is_dir():
+            for dirpath, _dirnames, filenames in os.walk(directory):
+                listing.extend(Path(dirpath, fn) for fn in filenames)
+            listing.sort()
+        self._walks[directory] = listing
+        return listing
+
+    def _parse(self, kind: str, file_path: Path) -> Any:
+        key = (kind, file_path)
+        cached = self._parsed.get(key, _MISSING)
+        if cached is _MISSING:
+            try:
+                source = self.text(file_path)
+                if kind == "ast":
+                    cached = self._parse_python(file_path, source)
+                elif kind == "yaml":
+                    cached = yaml.safe_load(source)
+                else:
+                    cached = json.loads(source)
+            except Exception as exc:
+                cached = exc
+            self._parsed[key] = cached
+        if isinstance(cached, Exception):
+            raise cached
+        return cached
+
+    def _parse_python(self, file_path: Path, source: str) -> ast.AST:
+        content_key = self._keys.get(file_path)
+        if content_key is None:
+            return ast.parse(source, filename=str(file_path))
+        tree = get_cached_ast(file_path, content_key)
+        if tree is None:
+            tree = ast.parse(source, filename=str(file_path))
+            store_ast(file_path, content_key, tree)
+        return tree
+
+
+class _TokenIndex:
+    """token -> ids of the files containing it, for one directory listing."""
+
+    def __init__(self) -> None:
+        self._paths: list[Path] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def add(self, path: Path, content: str) -> None:
+        file_id = len(self._paths)
+        self._paths.append(path)
+        for token in set(_TOKEN.findall(content)):
+            self._postings.setdefault(token, []).append(file_id)
+
+    def candidates(self, needle: str) -> list[Path]:
+        runs = list(_TOKEN.finditer(needle))
+        if not runs:
+            return list(self._paths)
+        found: set[int] | None = None
+        for run in runs:
+            word = run.group()
+            open_left = run.start() == 0
+            open_right = run.end() == len(needle)
+            if not (open_left or open_right):
+                ids = set(self._postings.get(word, ()))
+            else:
+                ids = set()
+                for token, postings in self._postings.items():
+                    if (
+                        (open_left and open_right and word in token)
+                        or (open_left and not open_right and token.endswith(word))
+                        or (open_right and not open_left and token.startswith(word))
+                    ):
+                        ids.update(postings)
+            found = ids if found is None else found & ids
+            if not found:
+                return []
+        return [self._paths[i] for i in sorted(found)]
+
+
+# ID: 4c8e1b67-5a3f-4d92-b7e6-f2a9d0c3e158
+def corpus_for(context: Any) -> CorpusSnapshot:
+    """The audit's snapshot, or a private one for a context without it.
+
+    Unit tests drive engines with stand-in contexts (SimpleNamespace,
+    MagicMock); those get a snapshot that lives for the one call.
+    """
+    corpus = getattr(context, "corpus", None)
+    if isinstance(corpus, CorpusSnapshot):
+        return corpus
+    return CorpusSnapshot()
+
+
+__all__ = ["CorpusSnapshot", "corpus_for"]
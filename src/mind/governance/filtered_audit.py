@@ -110,6 +110,28 @@ def normalize_file_filter(
     return frozenset(normalized)
 
 
+# ID: 0a5e8c73-6f2d-4b91-9c4e-d7b3a1f6e528
+def select_rules(context: AuditorContext, rule_ids: list[str]) -> list[ExecutableRule]:
+    """
+    Executable rules for ``rule_ids`` under the context's loaded governance.
+
+    Does not reload governance — callers that need .intent/ edits to be
+    visible call context.reload_governance() first. Rule IDs without an
+    enforcement mapping have no executable rule and are absent from the
+    result.
+    """
+    from mind.governance.rule_extractor import extract_executable_rules
+
+    wanted = set(rule_ids)
+    return [
+        rule
+        for rule in extract_executable_rules(
+            context.policies, context.enforcement_loader
+        )
+        if rule.rule_id in wanted
+    ]
+
+
 # ID: d5383238-b6d4-48d9-880b-8f48df47d57e
 async def run_filtered_audit(
     context: AuditorContext,
@@ -137,7 +159,11 @@ async def run_filtered_audit(
     Returns:
         tuple(findings, executed_rules, stats)
     """
-    from mind.governance.rule_executor import execute_rule
+    from mind.governance.rule_executor import (
+        execute_rule,
+        precompute_rule_findings,
+        take_fused_findings,
+    )
     from mind.governance.rule_extractor import extract_executable_rules
 
     if executed_rule_ids is None:
@@ -206,6 +232,12 @@ async def run_filtered_audit(
     failed_rules = []
     skipped_context_level: list[str] = []
 
+    # File-major (optionally multi-process) pass over the fusable per-file
+    # rules; see rule_executor.precompute_rule_findings.
+    fused = await precompute_rule_findings(
+        filtered_rules, context, file_filter=file_filter
+    )
+
     for rule in filtered_rules:
         # ADR-081 Step 2b — cooperative yield at the per-rule boundary so
         # heavy audit cycles can reach a cancellation point between rules.
@@ -222,12 +254,14 @@ async def run_filtered_audit(
             skipped_context_level.append(rule.rule_id)
 
         try:
-            findings = await execute_rule(
-                rule,
-                context,
-                file_filter=file_filter,
-                prior_findings=all_findings,
-            )
+            findings = take_fused_findings(fused, rule.rule_id)
+            if findings is None:
+                findings = await execute_rule(
+                    rule,
+                    context,
+                    file_filter=file_filter,
+                    prior_findings=all_findings,
+                )
             all_findings.extend(findings)
             executed_rule_ids.add(rule.rule_id)
 
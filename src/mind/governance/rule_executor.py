@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import json
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from mind.logic.engines.base import (
@@ -9,8 +17,15 @@ from mind.logic.engines.base import (
     extract_line_number,
     normalize_violation,
 )
+from shared.infrastructure.storage.eval_store import (
+    DB_NAME,
+    EvalFindingsStore,
+    get_eval_store,
+    open_eval_stores,
+)
 from shared.logger import getLogger
 from shared.models import AuditFinding, AuditSeverity, EvidenceClass
+from shared.path_resolver import PathResolver
 
 
 # #306/#307: marker the llm_gate engine emits when an LLM call fails for
@@ -53,15 +68,140 @@ def _eval_cache_store(
     _EVAL_CACHE[key] = findings
 
 
+# Persistent layer under _EVAL_CACHE: the same verdicts, content-addressed
+# in var/cache/audit/ (shared.infrastructure.storage.eval_store) so a fresh
+# process — CLI audit, pre-commit hook, daemon restart — only re-evaluates
+# files that actually changed. Keyed by (rule_id, rule_content_hash, path,
+# file sha256, engine version); the engine version is a digest of the
+# engine's own source, so editing a check invalidates its verdicts too.
+_ENGINE_VERSIONS: dict[type, str] = {}
+# Dots in "mind.logic.engines.<module>"; engines nested deeper live in a
+# package (ast_gate/, cli_gate/, ...).
+_ENGINES_PACKAGE_DEPTH = 3
+
+
+def _engine_version(engine: Any) -> str:
+    """Digest of the engine's source: its module or its whole package.
+
+    A single-module engine also covers its private ``_<module>_*.py``
+    helpers (e.g. _regex_gate_scanner.py); every engine covers
+    engines/base.py, which all of them build on.
+    """
+    engine_cls = type(engine)
+    version = _ENGINE_VERSIONS.get(engine_cls)
+    if version is None:
+        digest = hashlib.sha256(engine_cls.__qualname__.encode())
+        try:
+            source = Path(inspect.getfile(engine_cls))
+            # Engines split into a package (ast_gate/engine.py + checks/)
+            # version over every module of that package.
+            if engine_cls.__module__.count(".") > _ENGINES_PACKAGE_DEPTH:
+                sources = sorted(source.parent.rglob("*.py"))
+            else:
+                sources = [
+                    source,
+                    *sorted(source.parent.glob(f"_{source.stem}_*.py")),
+                ]
+            # engines/base.py (EngineResult, BaseEngine, shared helpers).
+            sources.append(Path(inspect.getfile(EngineResult)))
+            for path in sources:
+                digest.update(path.read_bytes())
+        except (OSError, TypeError):
+            pass
+        version = digest.hexdigest()[:16]
+        _ENGINE_VERSIONS[engine_cls] = version
+    return version
+
+
+def _finding_payload(findings: list[AuditFinding]) -> str | None:
+    """JSON payload for the persistent store; None when not serializable."""
+    try:
+        return json.dumps(
+            [
+                [
+                    f.check_id,
+                    int(f.severity),
+                    f.message,
+                    f.file_path,
+                    f.line_number,
+                    f.context,
+                    f.evidence_class.value,
+                ]
+                for f in findings
+            ],
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _findings_from_payload(payload: str) -> list[AuditFinding]:
+    return [
+        AuditFinding(
+            check_id=check_id,
+            severity=AuditSeverity(severity),
+            message=message,
+            file_path=file_path,
+            line_number=line_number,
+            context=context,
+            evidence_class=EvidenceClass(evidence_class),
+        )
+        for (
+            check_id,
+            severity,
+            message,
+            file_path,
+            line_number,
+            context,
+            evidence_class,
+        ) in json.loads(payload)
+    ]
+
+
+def _eval_store(context: AuditorContext) -> EvalFindingsStore | None:
+    """The persistent verdict store for the audited repo, if enabled."""
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
+
+        cfg = load_operational_config().audit
+        if not cfg.persistent_eval_cache:
+            return None
+        cache_dir = PathResolver(Path(context.repo_path)).audit_cache_dir
+        return get_eval_store(cache_dir, cfg.eval_store_max_mb)
+    except Exception as exc:
+        logger.debug("rule_executor: persistent eval cache unavailable (%s)", exc)
+        return None
+
+
 # ID: 3f8a1d2e-9b7c-4e5f-a6d0-1c2b3e4f5a6b
-def clear_eval_cache() -> None:
-    """Discard all evaluation-level cache entries.
+def clear_eval_cache(repo_path: Path | None = None) -> None:
+    """Discard all evaluation-level cache entries, in memory and on disk.
 
     Intended for tests that need a cold-start guarantee and for
-    force-reaudit paths where the caller explicitly wants every file
-    re-evaluated regardless of content identity.
+    force-reaudit paths (``core-admin code audit --no-cache``) where the
+    caller explicitly wants every file re-evaluated regardless of content
+    identity. Stores this process opened are always cleared; with
+    ``repo_path`` that repo's on-disk store is opened and truncated too, so
+    a fresh process can drop verdicts persisted by earlier ones.
     """
     _EVAL_CACHE.clear()
+    if repo_path is not None:
+        try:
+            from shared.infrastructure.intent.operational_config import (
+                load_operational_config,
+            )
+
+            cache_dir = PathResolver(Path(repo_path)).audit_cache_dir
+            if (cache_dir / DB_NAME).exists():
+                get_eval_store(
+                    cache_dir, load_operational_config().audit.eval_store_max_mb
+                )
+        except Exception as exc:
+            logger.warning("rule_executor: could not open the eval store (%s)", exc)
+    for store in open_eval_stores():
+        store.clear()
 
 
 if TYPE_CHECKING:
@@ -210,6 +350,65 @@ def _empty_violation_finding(
     )
 
 
+def _verify_concurrency(engine_id: str) -> int:
+    """Return the per-file dispatch fan-out limit for ``engine_id``.
+
+    Read from operational_config.audit.verify_concurrency on every rule so a
+    governor edit lands on the next audit cycle. Any failure to read the
+    config degrades to 1 — the sequential dispatch — never to an unbounded
+    fan-out.
+    """
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
+
+        limits = load_operational_config().audit.verify_concurrency
+        return max(1, int(getattr(limits, engine_id, limits.default)))
+    except Exception as exc:
+        logger.debug(
+            "rule_executor: verify_concurrency unavailable for %s (%s); "
+            "dispatching sequentially",
+            engine_id,
+            exc,
+        )
+        return 1
+
+
+async def _prepare_rule(
+    engine: Any, rule: ExecutableRule, files: list[Path], params: dict[str, Any]
+) -> Any:
+    """Run the engine's rule-level prefetch; None when absent or failing."""
+    if not files or not hasattr(engine, "prepare_rule"):
+        return None
+    try:
+        return await engine.prepare_rule(files, params)
+    except Exception as exc:
+        logger.warning(
+            "rule_executor: prepare_rule failed for %s (%s); "
+            "falling back to per-file evaluation",
+            rule.rule_id,
+            exc,
+        )
+        return None
+
+
+async def _finalize_rule(
+    engine: Any, rule: ExecutableRule, params: dict[str, Any]
+) -> None:
+    """Run the engine's rule-level flush. Failures are logged, never raised."""
+    if params.get("_rule_state") is None or not hasattr(engine, "finalize_rule"):
+        return
+    try:
+        await engine.finalize_rule(params["_rule_state"], params)
+    except Exception as exc:
+        logger.warning(
+            "rule_executor: finalize_rule failed for %s (%s)",
+            rule.rule_id,
+            exc,
+        )
+
+
 def _map_enforcement_to_severity(enforcement: str) -> AuditSeverity:
     # #432: `reporting` is informational by intent — surfacing a fact, not
     # demanding action. It must not inflate the HIGH bucket alongside true
@@ -254,14 +453,110 @@ async def execute_rule(
             rules so preconditions execute first
             (rule_extractor._topologically_sort_rules).
     """
-    from mind.logic.engines.registry import EngineRegistry
+    engine, blocked = _resolve_engine(rule)
+    if blocked is not None:
+        return blocked
 
     findings: list[AuditFinding] = []
 
+    # ADR-113: the producing engine is the authority on how it establishes a
+    # verdict. Stamp its declared class onto every genuine-verdict finding
+    # below. Crash / unknown findings are NOT stamped — they keep the
+    # AuditFinding default (ATTESTED = "needs a human"), which is the honest
+    # label for a verdict we could not actually reach (D3 fail-closed).
+    engine_evidence_class = getattr(engine, "evidence_class", EvidenceClass.ATTESTED)
+
+    if rule.is_context_level:
+        # ADR-279 / #279: --files scopes per-file checks; context-level
+        # rules look at the whole repo and can't be meaningfully filtered
+        # to a subset, so skip with a warning when a file filter is
+        # active. This keeps pre-commit-hook output focused on the
+        # staged file set.
+        if file_filter is not None:
+            logger.info(
+                "Skipping context-level rule %s under --files scope "
+                "(engine=%s; cross-file check cannot be filtered)",
+                rule.rule_id,
+                rule.engine,
+            )
+            return findings
+        if hasattr(engine, "verify_context"):
+            severity = _map_enforcement_to_severity(rule.enforcement)
+            engine_findings = await engine.verify_context(
+                context,
+                {**rule.params, "_scope_excludes": rule.exclusions},
+            )
+            for f in engine_findings:
+                f.severity = severity
+                # ADR-113 D3 fail-closed: an engine can return a finding from
+                # inside verify_context() that represents "could not
+                # evaluate" rather than a genuine verdict (context-level
+                # engines have no early-return path for this — unlike the
+                # unsupported-check_type/vocabulary-unavailable guards above,
+                # which return before this loop and keep AuditFinding's
+                # ATTESTED default). Promoting such a finding to the engine's
+                # declared evidence_class would render an unevaluated source
+                # indistinguishable from a proven violation. Findings that
+                # self-identify via context["finding_type"] ==
+                # "ENFORCEMENT_FAILURE" keep the ATTESTED default; only
+                # genuine verdicts get stamped with the engine's class.
+                if f.context.get("finding_type") != "ENFORCEMENT_FAILURE":
+                    f.evidence_class = engine_evidence_class  # ADR-113
+                # Restore check_id == rule.rule_id invariant (#485). The per-file
+                # path at the bottom of this function constructs AuditFinding with
+                # check_id=rule.rule_id; the context-level path historically passed
+                # engine-set check_ids through unmodified, letting them drift to
+                # `<engine_id>.<check_type>` shapes (e.g. cli_gate.resource_first
+                # for rule cli.resource_first). That drift made AuditViolationSensor
+                # dedup work only by string-prefix coincidence. Engine identity is
+                # still recoverable via the rule's mapping in .intent/; per-finding
+                # engine attribution stays available through f.context if a check
+                # records it there.
+                f.check_id = rule.rule_id
+            findings.extend(engine_findings)
+        return findings
+
+    files = _rule_files(rule, context, file_filter, prior_findings)
+    run = await _start_per_file_run(rule, context, engine, files)
+
+    # Concurrent dispatch: with a limit above 1, up to that many files are
+    # in engine.verify() at once. Engines share one injected db_session
+    # (context.db_session), and an AsyncSession is not safe for concurrent
+    # use — _session_lock lets engines serialise their DB touches while the
+    # slow part (the LLM round-trip) overlaps.
+    concurrency = _verify_concurrency(rule.engine)
+    if concurrency > 1 and len(files) > 1:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(
+            file_path: Path,
+        ) -> tuple[list[AuditFinding], tuple[str, str] | None]:
+            async with semaphore:
+                return await run.evaluate(file_path)
+
+        # gather() returns outcomes in argument order, so the merge below
+        # sees files in get_files() order regardless of completion order.
+        outcomes = await asyncio.gather(*(_bounded(p) for p in files))
+    else:
+        outcomes = [await run.evaluate(p) for p in files]
+
+    return await run.finish(outcomes)
+
+
+def _resolve_engine(rule: ExecutableRule) -> tuple[Any, list[AuditFinding] | None]:
+    """Look up the rule's engine and apply the pre-dispatch contracts.
+
+    Returns ``(engine, None)`` when the rule may dispatch, or ``(None,
+    findings)`` when it must not: engine missing, llm_gate stub, or a
+    check_type the engine cannot dispatch. execute_rule and
+    execute_rules_fused share it so both paths enforce the same contracts.
+    """
+    from mind.logic.engines.registry import EngineRegistry
+
     try:
         engine = EngineRegistry.get(rule.engine)
     except ValueError as e:
-        return [
+        return None, [
             AuditFinding(
                 check_id=f"{rule.rule_id}.engine_missing",
                 severity=AuditSeverity.BLOCK,
@@ -280,7 +575,7 @@ async def execute_rule(
     from mind.logic.engines.llm_gate_stub import LLMGateStubEngine
 
     if isinstance(engine, LLMGateStubEngine):
-        return [
+        return None, [
             AuditFinding(
                 check_id=rule.rule_id,
                 severity=AuditSeverity.HIGH,
@@ -326,7 +621,7 @@ async def execute_rule(
             rule.engine,
             exc,
         )
-        return [_vocabulary_unavailable_finding(rule, exc)]
+        return None, [_vocabulary_unavailable_finding(rule, exc)]
 
     if declared is not None:
         rule_check_type = rule.params.get("check_type")
@@ -339,65 +634,20 @@ async def execute_rule(
                 rule.engine,
                 ", ".join(sorted(declared)),
             )
-            return [_unsupported_check_type_finding(rule, rule_check_type, declared)]
+            return None, [
+                _unsupported_check_type_finding(rule, rule_check_type, declared)
+            ]
 
-    # ADR-113: the producing engine is the authority on how it establishes a
-    # verdict. Stamp its declared class onto every genuine-verdict finding
-    # below. Crash / unknown findings are NOT stamped — they keep the
-    # AuditFinding default (ATTESTED = "needs a human"), which is the honest
-    # label for a verdict we could not actually reach (D3 fail-closed).
-    engine_evidence_class = getattr(engine, "evidence_class", EvidenceClass.ATTESTED)
+    return engine, None
 
-    if rule.is_context_level:
-        # ADR-279 / #279: --files scopes per-file checks; context-level
-        # rules look at the whole repo and can't be meaningfully filtered
-        # to a subset, so skip with a warning when a file filter is
-        # active. This keeps pre-commit-hook output focused on the
-        # staged file set.
-        if file_filter is not None:
-            logger.info(
-                "Skipping context-level rule %s under --files scope "
-                "(engine=%s; cross-file check cannot be filtered)",
-                rule.rule_id,
-                rule.engine,
-            )
-            return findings
-        if hasattr(engine, "verify_context"):
-            severity = _map_enforcement_to_severity(rule.enforcement)
-            engine_findings = await engine.verify_context(
-                context,
-                {**rule.params, "_scope_excludes": rule.exclusions},
-            )
-            for f in engine_findings:
-                f.severity = severity
-                # ADR-113 D3 fail-closed: an engine can return a finding from
-                # inside verify_context() that represents "could not
-                # evaluate" rather than a genuine verdict (context-level
-                # engines have no early-return path for this — unlike the
-                # unsupported-check_type/vocabulary-unavailable guards above,
-                # which return before this loop and keep AuditFinding's
-                # ATTESTED default). Promoting such a finding to the engine's
-                # declared evidence_class would render an unevaluated source
-                # indistinguishable from a proven violation. Findings that
-                # self-identify via context["finding_type"] ==
-                # "ENFORCEMENT_FAILURE" keep the ATTESTED default; only
-                # genuine verdicts get stamped with the engine's class.
-                if f.context.get("finding_type") != "ENFORCEMENT_FAILURE":
-                    f.evidence_class = engine_evidence_class  # ADR-113
-                # Restore check_id == rule.rule_id invariant (#485). The per-file
-                # path at the bottom of this function constructs AuditFinding with
-                # check_id=rule.rule_id; the context-level path historically passed
-                # engine-set check_ids through unmodified, letting them drift to
-                # `<engine_id>.<check_type>` shapes (e.g. cli_gate.resource_first
-                # for rule cli.resource_first). That drift made AuditViolationSensor
-                # dedup work only by string-prefix coincidence. Engine identity is
-                # still recoverable via the rule's mapping in .intent/; per-finding
-                # engine attribution stays available through f.context if a check
-                # records it there.
-                f.check_id = rule.rule_id
-            findings.extend(engine_findings)
-        return findings
 
+def _rule_files(
+    rule: ExecutableRule,
+    context: AuditorContext,
+    file_filter: frozenset[str] | None,
+    prior_findings: list[AuditFinding] | None,
+) -> list[Path]:
+    """The files a per-file rule evaluates, in get_files() order."""
     files = context.get_files(include=rule.scope, exclude=rule.exclusions)
     if file_filter is not None:
         # Intersect the rule's scope with the user's --files set. Empty
@@ -427,189 +677,667 @@ async def execute_rule(
             if str(p.relative_to(context.repo_path)).replace("\\", "/")
             in precondition_files
         ]
-    severity = _map_enforcement_to_severity(rule.enforcement)
-    # #309: store (rel_path, underlying_error_message) pairs so the
-    # aggregate finding preserves the engine's diagnostic string.
-    transient_llm_failures: list[tuple[str, str]] = []
+    return files
 
-    # ADR-039 Option F: evaluation cache is active when the engine's verdicts
-    # are content-deterministic and the rule has a non-empty content hash.
-    use_eval_cache = rule.engine not in _EVAL_CACHE_SKIP_ENGINES and bool(
-        rule.rule_content_hash
-    )
 
-    for file_path in files:
+@dataclass
+class _PerFileRun:
+    """One per-file rule's dispatch state.
+
+    Built by _start_per_file_run; evaluate() runs one file, finish() merges
+    the per-file outcomes in file order. Rule-major (execute_rule) and
+    file-major (execute_rules_fused) dispatch both drive it, so their
+    findings are identical by construction.
+    """
+
+    rule: ExecutableRule
+    context: AuditorContext
+    engine: Any
+    files: list[Path]
+    params: dict[str, Any]
+    severity: AuditSeverity
+    evidence_class: Any
+    use_eval_cache: bool
+    store: EvalFindingsStore | None = None
+    engine_version: str = ""
+
+    async def evaluate(
+        self, file_path: Path, file_view: Any = None
+    ) -> tuple[list[AuditFinding], tuple[str, str] | None]:
+        """Evaluate one file; return its findings and any transient LLM failure.
+
+        Pure with respect to the caller's accumulators — finish() merges
+        outcomes in file order, so findings and the transient
+        failure aggregate are identical whether files ran serially, fanned
+        out, or file-major under execute_rules_fused. ``file_view`` is the
+        engine's shared per-file view in fused dispatch.
+        """
+        params = (
+            self.params
+            if file_view is None
+            else {**self.params, "_file_view": file_view}
+        )
         try:
-            # ADR-039 Option F: stat the file for a content-identity cache
-            # lookup before dispatching engine.verify(). A hit means this
-            # (rule, file, rule-definition, file-content) combination was
-            # evaluated in a prior cycle and the result is still valid — skip
-            # the engine entirely and carry the cached findings forward.
-            if use_eval_cache:
-                try:
-                    st = file_path.stat()
-                    eval_key: tuple[str, str, str, int, int] | None = (
-                        rule.rule_id,
-                        str(file_path),
-                        rule.rule_content_hash,
-                        st.st_mtime_ns,
-                        st.st_size,
-                    )
-                except OSError:
-                    eval_key = None
-                else:
-                    if eval_key in _EVAL_CACHE:
-                        findings.extend(_EVAL_CACHE[eval_key])
-                        continue
-            else:
-                eval_key = None
-
-            # We add '_context' to the params so the Engine knows where to find the Cache.
-            # ADR-044: thread rule identity, content hash, and force-llm flag
-            # through so the llm_gate engine can perform DB-backed verdict
-            # caching. Underscored keys are engine-protocol fields, not rule
-            # params — engines ignore them if they don't care.
-            params_with_context = {
-                **rule.params,
-                "_context": context,
-                "_rule_id": rule.rule_id,
-                "_rule_content_hash": rule.rule_content_hash,
-                "_force_llm": getattr(context, "force_llm", False),
-            }
-            result = await engine.verify(file_path, params_with_context)
-            if not result.ok:
-                # #306/#307: transient LLM infrastructure failures are
-                # aggregated, not emitted per-file. The marker is set by
-                # LLMGateEngine when its LLM call fails for non-verdict
-                # reasons (timeout, connection error, etc.). Never cached —
-                # the infrastructure condition may clear next cycle.
-                marker_violation = next(
-                    (
-                        v
-                        for v in result.violations
-                        if _TRANSIENT_LLM_FAILURE_MARKER in str(v)
-                    ),
-                    None,
-                )
-                if marker_violation is not None:
-                    rel_path = str(file_path.relative_to(context.repo_path))
-                    err_msg, _ = normalize_violation(marker_violation)
-                    transient_llm_failures.append((rel_path, err_msg))
-                    continue
-                # #820 contract 2 — result truthfulness. Findings below are
-                # materialised solely by iterating result.violations, so an
-                # engine that says ok=False while naming nothing renders as a
-                # clean pass. Never cached: like a crash, this is an
-                # infrastructure signal that must re-evaluate each cycle.
-                if not result.violations:
-                    findings.append(
-                        _empty_violation_finding(
-                            rule,
-                            result,
-                            str(file_path.relative_to(context.repo_path)),
-                        )
-                    )
-                    continue
-                file_findings: list[AuditFinding] = []
-                for v in result.violations:
-                    # Normalize whether engine emitted a bare string or a
-                    # structured dict. Details (when present) flow into
-                    # AuditFinding.context, which as_dict() aliases back
-                    # to "details" in the JSON report.
-                    msg, details = normalize_violation(v)
-                    # #548: extract the line number from structured details
-                    # or from a "Line N" pattern in the message so GitHub
-                    # inline annotations land at the actual violation line
-                    # rather than the file-level fallback.
-                    line_number = extract_line_number(msg, details)
-                    file_findings.append(
-                        AuditFinding(
-                            check_id=rule.rule_id,
-                            severity=severity,
-                            message=msg,
-                            file_path=str(file_path.relative_to(context.repo_path)),
-                            line_number=line_number,
-                            context=details,
-                            evidence_class=engine_evidence_class,  # ADR-113
-                        )
-                    )
-                findings.extend(file_findings)
-                if eval_key is not None:
-                    _eval_cache_store(eval_key, file_findings)
-            else:
-                # Clean file — cache the empty result so the next cycle skips
-                # evaluation entirely for this (rule, file) pair.
-                if eval_key is not None:
-                    _eval_cache_store(eval_key, [])
+            eval_key, cached = self.cached(file_path)
+            if cached is not None:
+                return cached, None
+            result = await self.engine.verify(file_path, params)
+            return self.outcome(file_path, result, eval_key)
         except Exception as e:
             # HARDENING P0.1 (per-file): Engine crash on a single file →
             # ENFORCEMENT_FAILURE finding. A crashing per-file check is NOT
             # a passing check. Silent continue would make this rule
             # indistinguishable from a clean pass for this file.
-            # Never cached — the crash may be transient or the file in flux.
             logger.error(
                 "ENFORCEMENT_FAILURE: Rule %s crashed on file %s: %s",
-                rule.rule_id,
+                self.rule.rule_id,
                 file_path,
                 e,
                 exc_info=True,
             )
+            return self.crash_outcome(file_path, type(e).__name__, str(e)), None
+
+    def cached(
+        self, file_path: Path
+    ) -> tuple[tuple[str, str, str, int, int] | None, list[AuditFinding] | None]:
+        """Return ``(eval_key, cached_findings)``; findings are None on a miss.
+
+        ADR-039 Option F: stat the file for a content-identity cache lookup
+        before dispatching engine.verify(). A hit means this (rule, file,
+        rule-definition, file-content) combination was evaluated in a prior
+        cycle and the result is still valid — skip the engine entirely and
+        carry the cached findings forward. eval_key is None when the cache
+        does not apply.
+        """
+        if not self.use_eval_cache:
+            return None, None
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None, None
+        eval_key = (
+            self.rule.rule_id,
+            str(file_path),
+            self.rule.rule_content_hash,
+            st.st_mtime_ns,
+            st.st_size,
+        )
+        if eval_key in _EVAL_CACHE:
+            return eval_key, list(_EVAL_CACHE[eval_key])
+        store_key = self._store_key(file_path, st.st_mtime_ns, st.st_size)
+        if store_key is not None and self.store is not None:
+            payload = self.store.get(store_key)
+            if payload is not None:
+                findings = _findings_from_payload(payload)
+                _eval_cache_store(eval_key, findings)
+                return eval_key, list(findings)
+        return eval_key, None
+
+    def _store_key(
+        self, file_path: Path, mtime_ns: int, size: int
+    ) -> tuple[str, str, str, str, str] | None:
+        if self.store is None:
+            return None
+        content_hash = self.store.digest(file_path, mtime_ns, size)
+        if content_hash is None:
+            return None
+        try:
+            rel_path = str(file_path.relative_to(self.context.repo_path))
+        except ValueError:
+            rel_path = str(file_path)
+        return (
+            self.rule.rule_id,
+            self.rule.rule_content_hash,
+            rel_path,
+            content_hash,
+            self.engine_version,
+        )
+
+    def _remember(
+        self,
+        file_path: Path,
+        eval_key: tuple[str, str, str, int, int],
+        findings: list[AuditFinding],
+    ) -> None:
+        """Cache a verdict in memory and, when enabled, in the persistent store."""
+        _eval_cache_store(eval_key, findings)
+        store_key = self._store_key(file_path, eval_key[3], eval_key[4])
+        if store_key is not None and self.store is not None:
+            payload = _finding_payload(findings)
+            if payload is not None:
+                self.store.put(store_key, payload)
+
+    def outcome(
+        self,
+        file_path: Path,
+        result: EngineResult,
+        eval_key: tuple[str, str, str, int, int] | None,
+    ) -> tuple[list[AuditFinding], tuple[str, str] | None]:
+        """Turn one file's EngineResult into findings, caching clean verdicts."""
+        if not result.ok:
+            # #306/#307: transient LLM infrastructure failures are
+            # aggregated, not emitted per-file. The marker is set by
+            # LLMGateEngine when its LLM call fails for non-verdict
+            # reasons (timeout, connection error, etc.). Never cached —
+            # the infrastructure condition may clear next cycle.
+            marker_violation = next(
+                (
+                    v
+                    for v in result.violations
+                    if _TRANSIENT_LLM_FAILURE_MARKER in str(v)
+                ),
+                None,
+            )
+            if marker_violation is not None:
+                rel_path = str(file_path.relative_to(self.context.repo_path))
+                err_msg, _ = normalize_violation(marker_violation)
+                return [], (rel_path, err_msg)
+            # #820 contract 2 — result truthfulness. Findings below are
+            # materialised solely by iterating result.violations, so an
+            # engine that says ok=False while naming nothing renders as a
+            # clean pass. Never cached: like a crash, this is an
+            # infrastructure signal that must re-evaluate each cycle.
+            if not result.violations:
+                return [
+                    _empty_violation_finding(
+                        self.rule,
+                        result,
+                        str(file_path.relative_to(self.context.repo_path)),
+                    )
+                ], None
+            file_findings: list[AuditFinding] = []
+            for v in result.violations:
+                # Normalize whether engine emitted a bare string or a
+                # structured dict. Details (when present) flow into
+                # AuditFinding.context, which as_dict() aliases back
+                # to "details" in the JSON report.
+                msg, details = normalize_violation(v)
+                # #548: extract the line number from structured details
+                # or from a "Line N" pattern in the message so GitHub
+                # inline annotations land at the actual violation line
+                # rather than the file-level fallback.
+                line_number = extract_line_number(msg, details)
+                file_findings.append(
+                    AuditFinding(
+                        check_id=self.rule.rule_id,
+                        severity=self.severity,
+                        message=msg,
+                        file_path=str(file_path.relative_to(self.context.repo_path)),
+                        line_number=line_number,
+                        context=details,
+                        evidence_class=self.evidence_class,  # ADR-113
+                    )
+                )
+            if eval_key is not None:
+                self._remember(file_path, eval_key, file_findings)
+            return list(file_findings), None
+        # Clean file — cache the empty result so the next cycle skips
+        # evaluation entirely for this (rule, file) pair.
+        if eval_key is not None:
+            self._remember(file_path, eval_key, [])
+        return [], None
+
+    def crash_outcome(
+        self, file_path: Path, exception_type: str, exception_message: str
+    ) -> list[AuditFinding]:
+        """ENFORCEMENT_FAILURE finding for an engine crash on one file.
+
+        Never cached — the crash may be transient or the file in flux.
+        """
+        return [
+            AuditFinding(
+                check_id=f"{self.rule.rule_id}.enforcement_failure",
+                severity=AuditSeverity.BLOCK,
+                message=(
+                    f"ENFORCEMENT_FAILURE: Rule crashed on {file_path}: "
+                    f"{exception_message}. "
+                    f"Compliance status UNKNOWN — treat as non-compliant until fixed."
+                ),
+                file_path=str(file_path.relative_to(self.context.repo_path)),
+                context={
+                    "finding_type": "ENFORCEMENT_FAILURE",
+                    "engine": self.rule.engine,
+                    "policy_id": self.rule.policy_id,
+                    "exception_type": exception_type,
+                    "exception_message": exception_message,
+                },
+            )
+        ]
+
+    async def finish(
+        self, outcomes: list[tuple[list[AuditFinding], tuple[str, str] | None]]
+    ) -> list[AuditFinding]:
+        """Merge per-file outcomes, flush the engine and aggregate LLM failures."""
+        rule = self.rule
+        findings: list[AuditFinding] = []
+        # #309: store (rel_path, underlying_error_message) pairs so the
+        # aggregate finding preserves the engine's diagnostic string.
+        transient_llm_failures: list[tuple[str, str]] = []
+        for file_findings, transient in outcomes:
+            findings.extend(file_findings)
+            if transient is not None:
+                transient_llm_failures.append(transient)
+
+        await _finalize_rule(self.engine, rule, self.params)
+        if self.store is not None:
+            self.store.flush()
+
+        # #306/#307: emit one aggregate WARNING for transient LLM failures
+        # accumulated during this rule's run. Bounds Blackboard pollution —
+        # the autonomous remediation loop sees one finding per affected rule
+        # instead of one per file. sample_files preserves enough signal for
+        # the governor to investigate without churning the loop.
+        if transient_llm_failures:
+            # #309: deduplicate underlying error strings. A single root cause
+            # (e.g. the prompt-contract mismatch that made #308 look transient)
+            # shows up as one entry; a true intermittent shows many. Visible
+            # from the message without reading every per-file sample.
+            unique_errors = sorted({err for _, err in transient_llm_failures})
             findings.append(
                 AuditFinding(
-                    check_id=f"{rule.rule_id}.enforcement_failure",
-                    severity=AuditSeverity.BLOCK,
+                    check_id=rule.rule_id,
+                    severity=AuditSeverity.HIGH,
                     message=(
-                        f"ENFORCEMENT_FAILURE: Rule crashed on {file_path}: {e}. "
-                        f"Compliance status UNKNOWN — treat as non-compliant until fixed."
+                        f"Rule '{rule.rule_id}' LLM evaluation failed transiently "
+                        f"on {len(transient_llm_failures)} file(s) "
+                        f"({len(unique_errors)} unique error(s)). Verdict for "
+                        "those files is UNKNOWN until the LLM provider can keep "
+                        "up with audit-scale throughput — see follow-up issue on "
+                        "llm_gate concurrency/batching."
                     ),
-                    file_path=str(file_path.relative_to(context.repo_path)),
+                    file_path="none",
                     context={
-                        "finding_type": "ENFORCEMENT_FAILURE",
-                        "engine": rule.engine,
-                        "policy_id": rule.policy_id,
-                        "exception_type": type(e).__name__,
-                        "exception_message": str(e),
+                        "finding_type": "LLM_TRANSIENT_FAILURE",
+                        "engine_id": rule.engine,
+                        "failure_count": len(transient_llm_failures),
+                        "sample_files": [
+                            path for path, _ in transient_llm_failures[:5]
+                        ],
+                        "sample_errors": [
+                            {"file": path, "error": err}
+                            for path, err in transient_llm_failures[:5]
+                        ],
+                        "unique_error_messages": unique_errors[:5],
                     },
                 )
             )
+
+        return findings
+
+
+async def _start_per_file_run(
+    rule: ExecutableRule, context: AuditorContext, engine: Any, files: list[Path]
+) -> _PerFileRun:
+    """Build the rule's engine params and run its rule-level prefetch."""
+    # ADR-039 Option F: evaluation cache is active when the engine's verdicts
+    # are content-deterministic and the rule has a non-empty content hash.
+    use_eval_cache = rule.engine not in _EVAL_CACHE_SKIP_ENGINES and bool(
+        rule.rule_content_hash
+    )
+
+    # engine.verify() calls that overlap share _session_lock (see the
+    # concurrent dispatch note in execute_rule).
+    session_lock = asyncio.Lock()
+
+    # We add '_context' to the params so the Engine knows where to find the Cache.
+    # ADR-044: thread rule identity, content hash, and force-llm flag
+    # through so the llm_gate engine can perform DB-backed verdict
+    # caching. Underscored keys are engine-protocol fields, not rule
+    # params — engines ignore them if they don't care.
+    rule_params: dict[str, Any] = {
+        **rule.params,
+        "_context": context,
+        "_rule_id": rule.rule_id,
+        "_rule_content_hash": rule.rule_content_hash,
+        "_force_llm": getattr(context, "force_llm", False),
+        "_session_lock": session_lock,
+    }
+    # Rule-level prefetch: the engine may load whatever it needs for the
+    # whole file set in one go (llm_gate: every cached verdict in a single
+    # query). The returned state rides along to each verify() call. A
+    # failing prefetch degrades to the per-file path, never to a crash.
+    rule_params["_rule_state"] = await _prepare_rule(engine, rule, files, rule_params)
+    return _PerFileRun(
+        rule=rule,
+        context=context,
+        engine=engine,
+        files=files,
+        params=rule_params,
+        severity=_map_enforcement_to_severity(rule.enforcement),
+        evidence_class=getattr(engine, "evidence_class", EvidenceClass.ATTESTED),
+        use_eval_cache=use_eval_cache,
+        store=_eval_store(context) if use_eval_cache else None,
+        engine_version=_engine_version(engine) if use_eval_cache else "",
+    )
+
+
+# ID: 6a2f9d41-8c3e-4b75-a0d6-e5b1c7f4a239
+async def execute_rules_fused(
+    rules: list[ExecutableRule],
+    context: AuditorContext,
+    *,
+    file_filter: frozenset[str] | None = None,
+) -> dict[str, list[AuditFinding] | BaseException]:
+    """
+    Evaluate the fusable per-file rules file-major, one visit per file.
+
+    Rule-major dispatch (execute_rule) reads, fetches and walks every file
+    once per rule. Here the rules whose engine declares
+    ``supports_fused_dispatch`` are grouped by file instead: each file gets
+    one engine view (ast_gate: ASTFileView — one read, one parse-cache
+    lookup, one shared walk and node-type index; regex_gate: RegexFileView
+    — one read, one multi-pattern scan), and every applicable rule is
+    evaluated against it before moving on. Per-rule findings are
+    identical to execute_rule's — both drive the same _PerFileRun, and
+    finish() merges each rule's outcomes in its own get_files() order.
+
+    Rules are fusable when they are per-file, declare no
+    requires_findings_from (ADR-043 D2 narrowing needs the findings of
+    earlier rules), carry a unique rule_id and resolve to an engine that
+    supports fused dispatch. Anything else is absent from the result and
+    the caller runs it through execute_rule as before.
+
+    Returns:
+        rule_id -> findings, or the exception the rule raised (re-raised
+        by take_fused_findings so callers keep their per-rule handling).
+    """
+    results: dict[str, list[AuditFinding] | BaseException] = {}
+    runs = await _start_grouped_runs(
+        rules, context, file_filter, results, "supports_fused_dispatch"
+    )
+
+    by_file: dict[Path, list[int]] = {}
+    for index, run in enumerate(runs):
+        for file_path in run.files:
+            by_file.setdefault(file_path, []).append(index)
+
+    outcomes: list[dict[Path, tuple[list[AuditFinding], tuple[str, str] | None]]] = [
+        {} for _ in runs
+    ]
+    for file_path, indexes in by_file.items():
+        views: dict[int, Any] = {}
+        with ExitStack() as stack:
+            for index in indexes:
+                run = runs[index]
+                view = views.get(id(run.engine))
+                if view is None:
+                    view = run.engine.file_view(file_path, context)
+                    views[id(run.engine)] = view
+                    stack.enter_context(view.active())
+                # Views that scan for all their rules at once (regex_gate)
+                # learn every rule's params before the first evaluation.
+                if hasattr(view, "expect"):
+                    view.expect(run.params)
+            for index in indexes:
+                run = runs[index]
+                view = views[id(run.engine)]
+                outcomes[index][file_path] = await run.evaluate(file_path, view)
+        # ADR-081 Step 2b: cooperative yield between files.
+        await asyncio.sleep(0)
+
+    await _finish_grouped_runs(runs, outcomes, results)
+    return results
+
+
+async def _start_grouped_runs(
+    rules: list[ExecutableRule],
+    context: AuditorContext,
+    file_filter: frozenset[str] | None,
+    results: dict[str, list[AuditFinding] | BaseException],
+    capability: str,
+) -> list[_PerFileRun]:
+    """Start a _PerFileRun for every rule that may leave rule-major dispatch.
+
+    Eligible rules are per-file, declare no requires_findings_from (ADR-043
+    D2 narrowing needs the findings of earlier rules), carry a unique
+    rule_id and resolve to an engine whose ``capability`` flag is set. A
+    rule whose setup raises has the exception stored in ``results``.
+    """
+    id_counts: dict[str, int] = {}
+    for rule in rules:
+        id_counts[rule.rule_id] = id_counts.get(rule.rule_id, 0) + 1
+
+    runs: list[_PerFileRun] = []
+    for rule in rules:
+        if (
+            rule.is_context_level
+            or rule.requires_findings_from
+            or id_counts[rule.rule_id] > 1
+        ):
             continue
+        try:
+            engine, blocked = _resolve_engine(rule)
+            # Blocked rules are left to execute_rule, which reports them.
+            if blocked is not None or not getattr(engine, capability, False):
+                continue
+            files = _rule_files(rule, context, file_filter, None)
+            runs.append(await _start_per_file_run(rule, context, engine, files))
+        except Exception as e:
+            results[rule.rule_id] = e
+    return runs
 
-    # #306/#307: emit one aggregate WARNING for transient LLM failures
-    # accumulated during this rule's run. Bounds Blackboard pollution —
-    # the autonomous remediation loop sees one finding per affected rule
-    # instead of one per file. sample_files preserves enough signal for
-    # the governor to investigate without churning the loop.
-    if transient_llm_failures:
-        # #309: deduplicate underlying error strings. A single root cause
-        # (e.g. the prompt-contract mismatch that made #308 look transient)
-        # shows up as one entry; a true intermittent shows many. Visible
-        # from the message without reading every per-file sample.
-        unique_errors = sorted({err for _, err in transient_llm_failures})
-        findings.append(
-            AuditFinding(
-                check_id=rule.rule_id,
-                severity=AuditSeverity.HIGH,
-                message=(
-                    f"Rule '{rule.rule_id}' LLM evaluation failed transiently "
-                    f"on {len(transient_llm_failures)} file(s) "
-                    f"({len(unique_errors)} unique error(s)). Verdict for "
-                    "those files is UNKNOWN until the LLM provider can keep "
-                    "up with audit-scale throughput — see follow-up issue on "
-                    "llm_gate concurrency/batching."
-                ),
-                file_path="none",
-                context={
-                    "finding_type": "LLM_TRANSIENT_FAILURE",
-                    "engine_id": rule.engine,
-                    "failure_count": len(transient_llm_failures),
-                    "sample_files": [path for path, _ in transient_llm_failures[:5]],
-                    "sample_errors": [
-                        {"file": path, "error": err}
-                        for path, err in transient_llm_failures[:5]
+
+async def _finish_grouped_runs(
+    runs: list[_PerFileRun],
+    outcomes: list[dict[Path, tuple[list[AuditFinding], tuple[str, str] | None]]],
+    results: dict[str, list[AuditFinding] | BaseException],
+) -> None:
+    """Merge each run's outcomes in its own get_files() order into ``results``."""
+    for index, run in enumerate(runs):
+        try:
+            results[run.rule.rule_id] = await run.finish(
+                [outcomes[index][p] for p in run.files]
+            )
+        except Exception as e:
+            results[run.rule.rule_id] = e
+
+
+def _audit_workers(context: AuditorContext) -> int:
+    """Worker processes for execute_rules_parallel; 0 or 1 = in-process.
+
+    A per-run override on the context (``audit_workers``, set by the sync
+    audit API) wins over operational_config.audit.parallel_workers. Any
+    failure to read the config degrades to in-process dispatch.
+    """
+    override = getattr(context, "audit_workers", None)
+    if isinstance(override, int):
+        return max(0, override)
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
+
+        return max(0, int(load_operational_config().audit.parallel_workers))
+    except Exception as exc:
+        logger.debug("rule_executor: parallel_workers unavailable (%s)", exc)
+        return 0
+
+
+def _parallel_batch_files() -> int:
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
+
+        return max(1, int(load_operational_config().audit.parallel_batch_files))
+    except Exception:
+        return 32
+
+
+# ID: 4f8c2a67-1e9d-4b53-a6f0-c7d3e5b9a182
+async def execute_rules_parallel(
+    rules: list[ExecutableRule],
+    context: AuditorContext,
+    *,
+    workers: int,
+    file_filter: frozenset[str] | None = None,
+) -> dict[str, list[AuditFinding] | BaseException]:
+    """
+    Shard the per-file rules of CPU-bound engines across worker processes.
+
+    Eligible rules are those execute_rules_fused would take whose engine
+    also declares ``supports_process_dispatch`` (ast_gate, regex_gate,
+    glob_gate); everything else — context-level rules, llm_gate, engines
+    that need the DB session — is absent from the result and stays on the
+    main loop. Evaluation-cache hits are served here without a round trip;
+    the remaining (file, rule) pairs go to audit_worker_pool in file-major
+    batches. Workers return bare EngineResults, which this process turns
+    into findings through the same _PerFileRun as execute_rule, merged in
+    each rule's get_files() order — identical findings, deterministic
+    order.
+
+    A batch that fails in the pool (worker died, unpicklable params) is
+    re-evaluated in-process, so a broken pool degrades to the fused path
+    instead of failing the audit.
+
+    Returns:
+        rule_id -> findings or exception, as execute_rules_fused.
+    """
+    from mind.governance.audit_worker_pool import (
+        get_audit_pool,
+        shutdown_audit_pool,
+        verify_in_pool,
+    )
+
+    results: dict[str, list[AuditFinding] | BaseException] = {}
+    runs = await _start_grouped_runs(
+        rules, context, file_filter, results, "supports_process_dispatch"
+    )
+    outcomes: list[dict[Path, tuple[list[AuditFinding], tuple[str, str] | None]]] = [
+        {} for _ in runs
+    ]
+
+    # Protocol params that cannot cross the process boundary; workers
+    # supply their own _context.
+    local_keys = ("_context", "_session_lock")
+    worker_params = [
+        {k: v for k, v in run.params.items() if k not in local_keys} for run in runs
+    ]
+
+    pending: dict[Path, list[tuple[int, Any]]] = {}
+    for index, run in enumerate(runs):
+        for file_path in run.files:
+            eval_key, cached = run.cached(file_path)
+            if cached is not None:
+                outcomes[index][file_path] = (cached, None)
+            else:
+                pending.setdefault(file_path, []).append((index, eval_key))
+
+    batch_size = _parallel_batch_files()
+    paths = list(pending)
+    batches = [paths[i : i + batch_size] for i in range(0, len(paths), batch_size)]
+    if batches:
+        pool = get_audit_pool(context.repo_path, workers)
+        replies = await asyncio.gather(
+            *(
+                verify_in_pool(
+                    pool,
+                    [
+                        (
+                            str(p),
+                            [
+                                (i, runs[i].rule.engine, worker_params[i])
+                                for i, _ in pending[p]
+                            ],
+                        )
+                        for p in batch
                     ],
-                    "unique_error_messages": unique_errors[:5],
-                },
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+        if any(isinstance(reply, BrokenProcessPool) for reply in replies):
+            # A dead worker breaks the whole executor; drop it so the next
+            # run starts a fresh pool instead of failing every batch again.
+            shutdown_audit_pool()
+        for batch, reply in zip(batches, replies):
+            if isinstance(reply, BaseException):
+                logger.warning(
+                    "Audit worker batch failed (%s: %s); evaluating %d file(s) "
+                    "in-process",
+                    type(reply).__name__,
+                    reply,
+                    len(batch),
+                )
+                for file_path in batch:
+                    for index, _ in pending[file_path]:
+                        outcomes[index][file_path] = await runs[index].evaluate(
+                            file_path
+                        )
+                continue
+            eval_keys = {(str(p), i): key for p in batch for i, key in pending[p]}
+            for path_str, index, outcome in reply:
+                file_path = Path(path_str)
+                run = runs[index]
+                if isinstance(outcome, EngineResult):
+                    outcomes[index][file_path] = run.outcome(
+                        file_path, outcome, eval_keys[(path_str, index)]
+                    )
+                else:
+                    exception_type, exception_message = outcome
+                    logger.error(
+                        "ENFORCEMENT_FAILURE: Rule %s crashed on file %s: %s: %s",
+                        run.rule.rule_id,
+                        file_path,
+                        exception_type,
+                        exception_message,
+                    )
+                    outcomes[index][file_path] = (
+                        run.crash_outcome(file_path, exception_type, exception_message),
+                        None,
+                    )
+
+    await _finish_grouped_runs(runs, outcomes, results)
+    return results
+
+
+# ID: 0c5a8e93-7d2b-4f16-b4e1-9a6f3d8c2e57
+async def precompute_rule_findings(
+    rules: list[ExecutableRule],
+    context: AuditorContext,
+    *,
+    file_filter: frozenset[str] | None = None,
+) -> dict[str, list[AuditFinding] | BaseException]:
+    """Evaluate the per-file rules that need not run rule-major, up front.
+
+    With ``audit.parallel_workers`` (or the context's ``audit_workers``
+    override) above 1, CPU-bound engines run in worker processes
+    (execute_rules_parallel); with ``audit.fused_dispatch`` the remaining
+    fusable rules run file-major in-process (execute_rules_fused). The
+    audit drivers pick each rule's result up in rule order through
+    take_fused_findings and run everything else through execute_rule.
+    """
+    from shared.infrastructure.intent.operational_config import (
+        load_operational_config,
+    )
+
+    results: dict[str, list[AuditFinding] | BaseException] = {}
+    workers = _audit_workers(context)
+    if workers > 1:
+        results.update(
+            await execute_rules_parallel(
+                rules, context, workers=workers, file_filter=file_filter
             )
         )
+    if load_operational_config().audit.fused_dispatch:
+        remaining = [r for r in rules if r.rule_id not in results]
+        results.update(
+            await execute_rules_fused(remaining, context, file_filter=file_filter)
+        )
+    return results
+
 
-    return findings
+# ID: 9d4b7e12-3f6a-4c58-b1e9-a7c2f0d5e864
+def take_fused_findings(
+    fused: dict[str, list[AuditFinding] | BaseException], rule_id: str
+) -> list[AuditFinding] | None:
+    """Pop a rule's execute_rules_fused outcome; None when it was not fused.
+
+    Re-raises the exception the rule raised, so it surfaces at the same
+    point a direct execute_rule call would have raised it.
+    """
+    outcome = fused.pop(rule_id, None)
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
@@ -0,0 +1,122 @@
+# src/mind/governance/scope_index.py
+
+"""
+ScopeIndex: compiled rule-scope matcher for AuditorContext.get_files.
+
+``_include_matches`` (audit_context) tries up to three fnmatch calls per
+(path, pattern); the walker ran it for every candidate against every active
+per-file scope, and every get_files() call re-ran it for each include and
+exclude pattern against every cached file — O(rules x patterns x files)
+fnmatch calls per cycle.
+
+The index translates every scope once, with exactly the variants
+``_include_matches`` tries (the pattern itself, plus its ``**/``- and
+``/**``-collapsed forms), into a single regex. Each scope contributes an
+optional lookahead that captures an empty named group when the scope
+matches, so one ``match()`` yields the full set of matching scopes as a
+bitmask. Masks are memoized per path; scope membership is a pure function
+of the path string, so the memo stays valid across cycles for as long as
+the scope set is unchanged.
+
+Semantics are pinned to ``_include_matches`` by a differential test
+(tests/mind/governance/test_scope_index__ScopeIndex.py).
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from collections.abc import Callable, Iterable
+
+
+def _scope_variants(pattern: str) -> list[str]:
+    """The fnmatch patterns ``_include_matches`` tries for ``pattern``."""
+    variants = [pattern]
+    if "**/" in pattern:
+        variants.append(pattern.replace("**/", ""))
+    if "/**" in pattern:
+        variants.append(pattern.replace("/**", ""))
+    return variants
+
+
+def _scope_regex(pattern: str) -> str:
+    """Anchored regex source equivalent to ``_include_matches(path, pattern)``.
+
+    fnmatch.fnmatch normcases both sides before matching; patterns are
+    normcased here and paths at lookup.
+    """
+    return "|".join(
+        fnmatch.translate(os.path.normcase(v)) for v in _scope_variants(pattern)
+    )
+
+
+# ID: 3d8a5f21-6c4e-4b97-a0d2-e9f7b1c5a384
+class ScopeIndex:
+    """One-pass matcher for a fixed set of glob scopes, memoized per path."""
+
+    def __init__(self, scopes: Iterable[str]) -> None:
+        self.scopes: tuple[str, ...] = tuple(dict.fromkeys(scopes))
+        self._bits: dict[str, int] = {s: 1 << i for i, s in enumerate(self.scopes)}
+        self._set_regex = re.compile(
+            "".join(
+                f"(?:(?=(?:{_scope_regex(s)}))(?P<s{i}>))?"
+                for i, s in enumerate(self.scopes)
+            )
+        )
+        self._masks: dict[str, int] = {}
+        self._matchers: dict[tuple[str, ...], Callable[[str], bool]] = {}
+
+    # ID: 8b2e6c94-1f7a-4d53-b8e0-c4a9d3f2e716
+    def scope_mask(self, rel_posix: str) -> int:
+        """Bitmask of the scopes matching ``rel_posix`` (bit i = scopes[i])."""
+        mask = self._masks.get(rel_posix)
+        if mask is None:
+            m = self._set_regex.match(os.path.normcase(rel_posix))
+            mask = 0
+            if m is not None:
+                for name, value in m.groupdict().items():
+                    if value is not None:
+                        mask |= 1 << int(name[1:])
+            self._masks[rel_posix] = mask
+        return mask
+
+    # ID: 5f9c1a37-4e2b-4c80-9d6a-b7e3f0a2c158
+    def matches_any(self, rel_posix: str) -> bool:
+        """True iff some indexed scope matches ``rel_posix``."""
+        return self.scope_mask(rel_posix) != 0
+
+    # ID: 1a7d4e82-9c3b-4f65-a2e0-d8b6c5f3e927
+    def matcher(self, patterns: Iterable[str]) -> Callable[[str], bool]:
+        """Predicate: does any of ``patterns`` match a path?
+
+        Indexed patterns resolve to a mask test against the memoized scope
+        set; any others are compiled once into a combined regex. Matchers
+        are cached per pattern tuple.
+        """
+        key = tuple(sorted(set(patterns)))
+        cached = self._matchers.get(key)
+        if cached is not None:
+            return cached
+
+        wanted = 0
+        others: list[str] = []
+        for pat in key:
+            bit = self._bits.get(pat)
+            if bit is None:
+                others.append(pat)
+            else:
+                wanted |= bit
+        extra = (
+            re.compile("|".join(f"(?:{_scope_regex(p)})" for p in others)).match
+            if others
+            else None
+        )
+
+        def _matches(rel_posix: str) -> bool:
+            if wanted and self.scope_mask(rel_posix) & wanted:
+                return True
+            return extra is not None and extra(os.path.normcase(rel_posix)) is not None
+
+        self._matchers[key] = _matches
+        return _matches
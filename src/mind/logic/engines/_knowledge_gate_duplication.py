@@ -25,6 +25,22 @@ from shared.models import AuditFinding, AuditSeverity
 if TYPE_CHECKING:
     from mind.governance.audit_context import AuditorContext
 
+# Reported semantic-duplication findings per audit, most similar first.
+_MAX_SEMANTIC_FINDINGS = 50
+# Similarities computed per tile: 16M float32 values, 64 MiB.
+_TILE_ELEMENTS = 1 << 24
+
+# A chunk's identity: (file_path, section, point id). Point ids are derived
+# from the chunk's content hash, so an edited chunk gets a new key.
+_ChunkKey = tuple[str, str, str]
+
+# (collection, threshold, excludes) -> (chunk keys, pairs at or above the
+# threshold) from the last semantic-duplication run, for incremental mode.
+_SEMANTIC_PAIR_MEMO: dict[
+    tuple[str, float, tuple[str, ...]],
+    tuple[frozenset[_ChunkKey], dict[tuple[_ChunkKey, _ChunkKey], float]],
+] = {}
+
 
 def _resolve_symbol_path(sym: dict[str, Any]) -> str | None:
     """Return the symbol's file_path, falling back to a path synthesized
@@ -109,8 +125,14 @@ async def _check_semantic_duplication(
     across different source files using pre-stored Qdrant vectors.
 
     Makes no AI calls — all embeddings come from the 'core-code' Qdrant collection
-    written by RepoEmbedderWorker. Similarity is computed via numpy matrix multiply
-    (one BLAS call), not per-pair Qdrant queries.
+    written by RepoEmbedderWorker. Similarity is computed in float32 row tiles
+    (see _similar_pairs), never as a full n x n matrix, so every chunk in the
+    collection is compared. Findings are ranked by similarity, highest first.
+
+    With ``params["incremental"]``, pairs found by the previous run of the
+    same rule in this process are reused: only chunks that are new since
+    then (a changed chunk has a new content-hash point id) are compared
+    against the whole index.
     """
     findings: list[AuditFinding] = []
     qdrant = getattr(context, "qdrant_service", None)
@@ -119,8 +141,7 @@ async def _check_semantic_duplication(
 
     threshold: float = float(params.get("threshold", 0.85))
     exclude_patterns: list[str] = params.get("_scope_excludes", []) or []
-    _MAX_FINDINGS = 50
-    _MAX_CHUNKS = 2000  # guard against very large repos
+    incremental = bool(params.get("incremental", False))
 
     def _chunk_excluded(fp: str) -> bool:
         if not fp:
@@ -163,47 +184,110 @@ async def _check_semantic_duplication(
         vec = getattr(point, "vector", None)
         if not vec or not isinstance(vec, (list, tuple)):
             continue
+        section = payload.get("section", "")
         chunks.append(
-            {"file_path": fp, "section": payload.get("section", ""), "vector": vec}
+            {
+                "key": (fp, section, str(point.id)),
+                "file_path": fp,
+                "section": section,
+                "vector": vec,
+            }
         )
-        if len(chunks) >= _MAX_CHUNKS:
-            break
 
+    memo_key = (collection, threshold, tuple(exclude_patterns))
     if len(chunks) < 2:
+        _SEMANTIC_PAIR_MEMO.pop(memo_key, None)
         return findings
 
-    # Pairwise cosine similarity via numpy (single BLAS matrix multiply)
     import numpy as np  # lazy import; numpy is a declared project dependency
 
-    mat = np.array([c["vector"] for c in chunks], dtype=np.float32)
+    # Sorted so that pair order, and therefore tie-breaking, is independent
+    # of scroll order.
+    chunks.sort(key=lambda c: c["key"])
+    keys = [c["key"] for c in chunks]
+    mat = np.asarray([c["vector"] for c in chunks], dtype=np.float32)
     norms = np.linalg.norm(mat, axis=1, keepdims=True)
     norms[norms == 0.0] = 1.0
     unit = mat / norms
-    sim = (unit @ unit.T).astype(float)  # (n, n) symmetric similarity matrix
-
-    n = len(chunks)
-    for i in range(n):
-        if len(findings) >= _MAX_FINDINGS:
-            break
-        for j in range(i + 1, n):
-            if sim[i, j] < threshold:
-                continue
-            if chunks[i]["file_path"] == chunks[j]["file_path"]:
-                continue
-            findings.append(
-                _create_duplication_finding(
-                    _sym_from_chunk(chunks[i]),
-                    _sym_from_chunk(chunks[j]),
-                    float(sim[i, j]),
-                    "semantic",
-                )
+    _, file_codes = np.unique([c["file_path"] for c in chunks], return_inverse=True)
+
+    previous = _SEMANTIC_PAIR_MEMO.get(memo_key) if incremental else None
+    if previous is not None:
+        prev_keys, prev_pairs = previous
+        new_rows = [i for i, key in enumerate(keys) if key not in prev_keys]
+        if len(new_rows) * 2 > len(keys):
+            previous = None
+    if previous is None:
+        pairs = {
+            (keys[i], keys[j]): score
+            for i, j, score in _similar_pairs(unit, threshold, file_codes)
+        }
+    else:
+        current = set(keys)
+        pairs = {
+            pair: score
+            for pair, score in prev_pairs.items()
+            if pair[0] in current and pair[1] in current
+        }
+        for i, j, score in _similar_pairs(unit, threshold, file_codes, new_rows):
+            pairs[(keys[i], keys[j])] = score
+    _SEMANTIC_PAIR_MEMO[memo_key] = (frozenset(keys), pairs)
+
+    by_key = {c["key"]: c for c in chunks}
+    ranked = sorted(pairs.items(), key=lambda item: (-item[1], item[0]))
+    for (key_a, key_b), score in ranked[:_MAX_SEMANTIC_FINDINGS]:
+        findings.append(
+            _create_duplication_finding(
+                _sym_from_chunk(by_key[key_a]),
+                _sym_from_chunk(by_key[key_b]),
+                score,
+                "semantic",
             )
-            if len(findings) >= _MAX_FINDINGS:
-                break
+        )
 
     return findings
 
 
+def _similar_pairs(
+    unit: Any,
+    threshold: float,
+    file_codes: Any,
+    rows: list[int] | None = None,
+) -> list[tuple[int, int, float]]:
+    """Cross-file pairs (i, j), i < j, of rows of ``unit`` with cosine >= threshold.
+
+    ``rows`` None compares every row with every later row; otherwise only the
+    given rows are compared, against all rows. The products are computed a
+    tile of rows at a time, so at most _TILE_ELEMENTS similarities are held
+    in memory, and each tile's hits are extracted with one argwhere.
+    """
+    import numpy as np
+
+    n = unit.shape[0]
+    tile = max(1, _TILE_ELEMENTS // n)
+    found: dict[tuple[int, int], float] = {}
+    if rows is None:
+        for start in range(0, n, tile):
+            stop = min(start + tile, n)
+            block = unit[start:stop] @ unit[start:].T
+            hits = np.argwhere(np.triu(block >= threshold, k=1))
+            for r, c in hits:
+                i, j = start + int(r), start + int(c)
+                if file_codes[i] != file_codes[j]:
+                    found[(i, j)] = float(block[r, c])
+    else:
+        picked = np.asarray(sorted(rows), dtype=np.intp)
+        for start in range(0, len(picked), tile):
+            ids = picked[start : start + tile]
+            block = unit[ids] @ unit.T
+            hits = np.argwhere(block >= threshold)
+            for r, c in hits:
+                i, j = int(ids[r]), int(c)
+                if file_codes[i] != file_codes[j]:
+                    found[(min(i, j), max(i, j))] = float(block[r, c])
+    return [(i, j, score) for (i, j), score in found.items()]
+
+
 def _create_duplication_finding(a, b, score, dtype) -> AuditFinding:
     name_a = a.get("qualname") or a.get("name") or "?"
     name_b = b.get("qualname") or b.get("name") or "?"
@@ -0,0 +1,227 @@
+# src/mind/logic/engines/_regex_gate_scanner.py
+
+"""
+RegexFileView - one file's content, scanned once for every regex_gate rule.
+
+Fused dispatch (rule_executor.execute_rules_fused, and the audit worker
+pool) builds one view per file and announces each applicable rule's
+patterns through expect() before the first rule is evaluated. The first
+rule that asks for results triggers a single pass of one compiled
+alternation over the content, covering every announced pattern.
+
+The alternation is a prefilter, not the answer. Each pattern sits in its
+own named group inside one lookahead, so the pass stops at every position
+where any pattern matches. Python's re reports only the first alternative
+that matches at a position, so a later pattern can be hidden at a position
+an earlier one won. Each pattern is therefore re-tried with match() at the
+hit positions. Only the patterns that match somewhere are then run with
+their own finditer. A pattern's matches are exactly what re.finditer would
+return stand-alone, including non-overlap. A file where nothing matches,
+the common case for forbidden patterns, costs one pass. Required patterns
+only need to be found once: unless some rule also forbids them, they get a
+search() that stops at the first match instead of a full finditer.
+
+Line numbers come from a newline-offset index with bisect. Patterns that
+cannot share the alternation (backreferences, verbose mode, mid-pattern
+global flags) are scanned on their own. An invalid pattern raises its
+re.error only for the rule that uses it.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+
+_FLAGS = re.MULTILINE
+# Backreferences are numbered/named relative to their own pattern and would
+# point elsewhere inside the alternation.
+_BACKREF = re.compile(r"\\[1-9]|\\g<|\(\?P=")
+# A leading global-flags group, e.g. "(?i)"; only legal at the very start of
+# a pattern, so it is rewritten to a scoped group inside the alternation.
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+# ID: 2b9e4d71-6a3c-4f58-8d07-c1e5a9f3b264
+def rule_patterns(params: dict[str, Any]) -> tuple[list[Any], list[Any]]:
+    """A regex_gate rule's (forbidden, required) patterns, as lists."""
+    forbidden = params.get("forbidden_patterns") or params.get("patterns", [])
+    if isinstance(forbidden, str):
+        forbidden = [forbidden]
+    required = params.get("required_patterns", [])
+    if isinstance(required, str):
+        required = [required]
+    return list(forbidden), list(required)
+
+
+def _alternative(pattern: str) -> str | None:
+    """``pattern`` rewritten to sit inside the alternation, or None."""
+    if _BACKREF.search(pattern):
+        return None
+    flags = _LEADING_FLAGS.match(pattern)
+    if flags is not None:
+        if "x" in flags.group(1):
+            # A verbose-mode comment would swallow the rest of the alternation.
+            return None
+        pattern = f"(?{flags.group(1)}:{pattern[flags.end() :]})"
+    try:
+        re.compile(f"(?=(?:{pattern}))", _FLAGS)
+    except re.error:
+        return None
+    return pattern
+
+
+# ID: 8c4f1a36-9e2d-4b75-a0c8-d3f6b7e1a592
+class RegexFileView:
+    """Content, newline index and per-pattern match offsets for one file.
+
+    Loading is lazy: a file whose every rule is served from the evaluation
+    cache is never read.
+    """
+
+    def __init__(self, file_path: Path, context: Any = None) -> None:
+        self.file_path = file_path
+        self.content: str = ""
+        self.error: Exception | None = None
+        self._loaded: bool | None = None
+        self._expected: dict[Any, None] = {}
+        self._starts: dict[Any, list[int]] = {}
+        # Patterns some rule needs every match of (forbidden), and the
+        # found/not-found answer for the rest (required only).
+        self._full: set[Any] = set()
+        self._present: dict[Any, bool] = {}
+        self._errors: dict[Any, Exception] = {}
+        self._newlines: list[int] | None = None
+
+    # ID: 5d1a8e47-3b6f-4c92-9e0d-a7c2f4b8e135
+    def expect(self, params: dict[str, Any]) -> None:
+        """Include a rule's patterns in the next scan."""
+        try:
+            forbidden, required = rule_patterns(params)
+        except TypeError:
+            # Malformed params fail in the rule's own verify(), not here.
+            return
+        for pattern in (*forbidden, *required):
+            if not isinstance(pattern, str):
+                continue
+            if pattern not in self._starts and pattern not in self._errors:
+                if pattern not in self._present:
+                    self._expected[pattern] = None
+        self._full.update(p for p in forbidden if isinstance(p, str))
+
+    # ID: 9a3e6c18-4d7b-4f25-b1e9-e6d0c3a5f471
+    def load(self) -> bool:
+        """Read the file once; False (with ``error`` set) when it cannot be read."""
+        if self._loaded is None:
+            try:
+                self.content = self.file_path.read_text(encoding="utf-8")
+            except Exception as e:
+                self.error = e
+                self._loaded = False
+            else:
+                self._loaded = True
+        return self._loaded
+
+    # ID: 0e7b2d95-8c4a-4e61-a3f7-b5d9c1e8f026
+    def matches(self, pattern: Any) -> list[int]:
+        """Start offsets of ``pattern``'s matches, as re.finditer finds them."""
+        if pattern not in self._starts and pattern not in self._errors:
+            self._full.add(pattern)
+            present = self._present.get(pattern)
+            if present is None:
+                self._expected[pattern] = None
+                self._scan()
+            elif present:
+                regex = re.compile(pattern, _FLAGS)
+                self._starts[pattern] = [
+                    m.start() for m in regex.finditer(self.content)
+                ]
+            else:
+                self._starts[pattern] = []
+        error = self._errors.get(pattern)
+        if error is not None:
+            raise error
+        return self._starts[pattern]
+
+    # ID: 4a7e2c91-5b3d-4f68-9c1e-e8d6b2a4f705
+    def has_match(self, pattern: Any) -> bool:
+        """Whether ``pattern`` matches anywhere, as re.search would find it."""
+        if pattern in self._starts:
+            return bool(self._starts[pattern])
+        if pattern not in self._present and pattern not in self._errors:
+            self._expected[pattern] = None
+            self._scan()
+            if pattern in self._starts:
+                return bool(self._starts[pattern])
+        error = self._errors.get(pattern)
+        if error is not None:
+            raise error
+        return self._present[pattern]
+
+    # ID: 6f2c9a53-1e8d-4b47-8a0e-d4b7f3c6e918
+    def line_of(self, offset: int) -> int:
+        """1-based line number of ``offset`` in the content."""
+        if self._newlines is None:
+            self._newlines = [m.start() for m in re.finditer("\n", self.content)]
+        return bisect_left(self._newlines, offset) + 1
+
+    @contextmanager
+    # ID: 3c8d5f21-7a9e-4d06-b2c4-f1e6a8d9b357
+    def active(self) -> Iterator[RegexFileView]:
+        """Fused-dispatch protocol; a regex view has nothing to publish."""
+        yield self
+
+    def _scan(self) -> None:
+        pending = list(self._expected)
+        self._expected.clear()
+        compiled: dict[Any, re.Pattern[str]] = {}
+        for pattern in pending:
+            try:
+                compiled[pattern] = re.compile(pattern, _FLAGS)
+            except Exception as e:
+                self._errors[pattern] = e
+
+        content = self.content
+        shared = [
+            (p, alt)
+            for p in compiled
+            if isinstance(p, str) and (alt := _alternative(p)) is not None
+        ]
+        hit = set(compiled)
+        if len(shared) > 1:
+            alternation = "|".join(
+                f"(?P<_rg{i}>{alt})" for i, (_, alt) in enumerate(shared)
+            )
+            try:
+                prefilter = re.compile(f"(?=(?:{alternation}))", _FLAGS)
+            except re.error:
+                prefilter = None
+            if prefilter is not None:
+                positions: list[int] = []
+                winners: set[str] = set()
+                for m in prefilter.finditer(content):
+                    positions.append(m.start())
+                    if m.lastgroup is not None:
+                        winners.add(m.lastgroup)
+                for i, (pattern, _) in enumerate(shared):
+                    if f"_rg{i}" in winners:
+                        continue
+                    regex = compiled[pattern]
+                    if not any(regex.match(content, pos) for pos in positions):
+                        hit.discard(pattern)
+
+        for pattern, regex in compiled.items():
+            if pattern in self._full:
+                self._starts[pattern] = (
+                    [m.start() for m in regex.finditer(content)]
+                    if pattern in hit
+                    else []
+                )
+            else:
+                self._present[pattern] = (
+                    pattern in hit and regex.search(content) is not None
+                )
@@ -26,7 +26,6 @@ import ast
 import builtins
 import importlib
 import inspect
-import json
 import re
 import sys
 from pathlib import Path
@@ -34,6 +33,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 import yaml
 
+from mind.governance.corpus_snapshot import CorpusSnapshot, corpus_for
 from shared.infrastructure.intent.cognitive_roles import load_cognitive_roles
 from shared.infrastructure.intent.errors import GovernanceError
 from shared.infrastructure.intent.filesystem_operations import (
@@ -419,7 +419,9 @@ def _check_authoritative_paths(repo_root: Path, check: str) -> EngineResult:
 
 
 # ID: 7d1a2c8e-4b3f-4d52-a6e1-9c2b8d4e1f7a
-def _check_all_rules_mapped(repo_root: Path, check: str) -> EngineResult:
+def _check_all_rules_mapped(
+    repo_root: Path, check: str, corpus: CorpusSnapshot | None = None
+) -> EngineResult:
     """Verify every active reporting rule has an entry in auto_remediation.yaml.
 
     ADR-066: rules with no remediation-map entry produce a silent
@@ -432,6 +434,7 @@ def _check_all_rules_mapped(repo_root: Path, check: str) -> EngineResult:
     consumer forks could not exercise the check against their own .intent/
     tree. Direct filesystem walk via `repo_root` honours the parameter.
     """
+    corpus = corpus or CorpusSnapshot()
     map_file = repo_root / _AUTO_REMEDIATION_REL
     rules_dir = repo_root / _RULES_DIR_REL
 
@@ -450,14 +453,12 @@ def _check_all_rules_mapped(repo_root: Path, check: str) -> EngineResult:
             engine_id=_ENGINE_ID,
         )
 
-    mapped_ids: set[str] = set(
-        _MAPPING_KEY_RE.findall(map_file.read_text(encoding="utf-8"))
-    )
+    mapped_ids: set[str] = set(_MAPPING_KEY_RE.findall(corpus.text(map_file)))
 
     unmapped: list[str] = []
-    for rule_path in sorted(rules_dir.rglob("*.json")):
+    for rule_path in corpus.files(rules_dir, ".json"):
         try:
-            doc = json.loads(rule_path.read_text(encoding="utf-8"))
+            doc = corpus.parse_json(rule_path)
         except (OSError, ValueError):
             # Defensive: a malformed rule document is a separate failure mode,
             # not this rule's concern. Skip silently — other validators flag it.
@@ -489,7 +490,7 @@ def _check_all_rules_mapped(repo_root: Path, check: str) -> EngineResult:
 
 
 def _extract_register_action_remediates(
-    atomic_dir: Path,
+    atomic_dir: Path, corpus: CorpusSnapshot
 ) -> dict[str, set[str]]:
     """Walk src/body/atomic/**/*.py AST-only and extract
     ``{action_id → set(remediates)}`` from every ``@register_action(...)`` call.
@@ -502,9 +503,9 @@ def _extract_register_action_remediates(
     signal (no such alias exists in the tree at the time of writing).
     """
     out: dict[str, set[str]] = {}
-    for py in sorted(atomic_dir.rglob("*.py")):
+    for py in corpus.files(atomic_dir, ".py"):
         try:
-            tree = ast.parse(py.read_text(encoding="utf-8"))
+            tree = corpus.tree(py)
         except (OSError, SyntaxError):
             continue
         for node in ast.walk(tree):
@@ -542,7 +543,7 @@ def _extract_register_action_remediates(
 
 # ID: 4b0a3793-7764-49ee-8b4c-792bfac236e9
 def _check_active_routing_claimed_by_action(
-    repo_root: Path, check: str
+    repo_root: Path, check: str, corpus: CorpusSnapshot | None = None
 ) -> EngineResult:
     """Verify every ACTIVE auto_remediation.yaml entry's action declares the rule.
 
@@ -555,6 +556,7 @@ def _check_active_routing_claimed_by_action(
     ensures every reporting rule has SOME entry; this rule ensures every
     ACTIVE entry is honored by its action (issue #580, ADR-095 D5).
     """
+    corpus = corpus or CorpusSnapshot()
     map_file = repo_root / _AUTO_REMEDIATION_REL
     atomic_dir = repo_root / _BODY_ATOMIC_REL
 
@@ -574,7 +576,7 @@ def _check_active_routing_claimed_by_action(
         )
 
     try:
-        doc = yaml.safe_load(map_file.read_text(encoding="utf-8"))
+        doc = corpus.parse_yaml(map_file)
     except (OSError, yaml.YAMLError) as exc:
         return EngineResult(
             ok=False,
@@ -594,7 +596,7 @@ def _check_active_routing_claimed_by_action(
             engine_id=_ENGINE_ID,
         )
 
-    remediates_by_action = _extract_register_action_remediates(atomic_dir)
+    remediates_by_action = _extract_register_action_remediates(atomic_dir, corpus)
 
     violations: list[str] = []
     for rule_id, entry in mappings.items():
@@ -749,7 +751,9 @@ async def _check_namespace_has_drainer(
 
 
 # ID: 742276f9-7865-4073-a345-1256089d91c8
-def _check_namespace_manifest_completeness(repo_root: Path, check: str) -> EngineResult:
+def _check_namespace_manifest_completeness(
+    repo_root: Path, check: str, corpus: CorpusSnapshot | None = None
+) -> EngineResult:
     """Verify every file under .intent/ and .specs/ has a manifest entry.
 
     ADR-075 D7. The check is a structural set-difference between the
@@ -758,6 +762,7 @@ def _check_namespace_manifest_completeness(repo_root: Path, check: str) -> Engin
     ``classifications`` list. A file present on disk with no manifest
     entry is unclassified and surfaces as a violation under this rule.
     """
+    corpus = corpus or CorpusSnapshot()
     manifest_file = repo_root / _NAMESPACE_MANIFEST_REL
     if not manifest_file.exists():
         return EngineResult(
@@ -771,7 +776,7 @@ def _check_namespace_manifest_completeness(repo_root: Path, check: str) -> Engin
         )
 
     try:
-        manifest_doc = yaml.safe_load(manifest_file.read_text(encoding="utf-8")) or {}
+        manifest_doc = corpus.parse_yaml(manifest_file) or {}
     except yaml.YAMLError as exc:
         return EngineResult(
             ok=False,
@@ -801,12 +806,8 @@ def _check_namespace_manifest_completeness(repo_root: Path, check: str) -> Engin
 
     fs_paths: set[str] = set()
     for root_name in _NAMESPACE_GOVERNED_ROOTS:
-        root_dir = repo_root / root_name
-        if not root_dir.is_dir():
-            continue
-        for p in root_dir.rglob("*"):
-            if p.is_file():
-                fs_paths.add(str(p.relative_to(repo_root)))
+        for p in corpus.files(repo_root / root_name):
+            fs_paths.add(str(p.relative_to(repo_root)))
 
     unclassified = sorted(fs_paths - classified)
     if not unclassified:
@@ -955,6 +956,16 @@ _GOVERNANCE_SYNC_DISPATCH: dict[str, Any] = {
     "fs_operations_completeness": _check_fs_operations_completeness,
 }
 
+# Handlers that read the repository through a CorpusSnapshot; verify_context
+# hands them the audit's shared one.
+_CORPUS_CHECK_TYPES = frozenset(
+    {
+        "all_rules_mapped",
+        "active_routing_claimed_by_action",
+        "namespace_manifest_completeness",
+    }
+)
+
 
 # ID: 69841a82-0920-480c-94cb-d5e4b6cb50dd
 class ArtifactGateEngine(BaseEngine):
@@ -1337,6 +1348,10 @@ class ArtifactGateEngine(BaseEngine):
 
         if check_type in _VOCAB_DISPATCH:
             result = _VOCAB_DISPATCH[check_type](repo_root, check_type)
+        elif check_type in _CORPUS_CHECK_TYPES:
+            result = _GOVERNANCE_SYNC_DISPATCH[check_type](
+                repo_root, check_type, corpus_for(context)
+            )
         elif check_type in _GOVERNANCE_SYNC_DISPATCH:
             result = _GOVERNANCE_SYNC_DISPATCH[check_type](repo_root, check_type)
         elif check_type == "namespace_has_drainer":
@@ -7,6 +7,8 @@ Provides common helpers for traversing and analyzing Python AST nodes.
 CONSTITUTIONAL FIX (V2.3.0):
 - Added 'extract_domain_from_path' to centralize architectural layout knowledge.
 - Added 'domain_matches' to support trust-zone based enforcement.
+- 'walk' / 'nodes_of_type' reuse the traversal of an active ASTFileView
+  (fused dispatch), falling back to ast.walk().
 """
 
 from __future__ import annotations
@@ -14,6 +16,12 @@ from __future__ import annotations
 import ast
 from collections.abc import Iterable
 from pathlib import Path
+from typing import TypeVar
+
+from mind.logic.engines.ast_gate.file_view import active_view
+
+
+_N = TypeVar("_N", bound=ast.AST)
 
 
 # ID: f75299d7-84aa-4254-8a2d-0e17da174d45
@@ -24,6 +32,26 @@ class ASTHelpers:
     Used by all AST check implementations to avoid duplication.
     """
 
+    @staticmethod
+    # ID: 0c8e5a27-4f1b-4d93-b6a2-e9d3c7f1a460
+    def walk(tree: ast.AST) -> Iterable[ast.AST]:
+        """ast.walk(tree), shared with every check while a file view is active."""
+        view = active_view(tree)
+        if view is not None:
+            return view.nodes
+        return ast.walk(tree)
+
+    @staticmethod
+    # ID: 7b2f4d96-1e8a-4c53-a0f7-d5c9e3b2a184
+    def nodes_of_type(
+        tree: ast.AST, node_type: type[_N] | tuple[type[_N], ...]
+    ) -> list[_N]:
+        """Nodes of ``node_type`` in walk order; built once per active view."""
+        view = active_view(tree)
+        if view is not None:
+            return view.of_type(node_type)
+        return [n for n in ast.walk(tree) if isinstance(n, node_type)]
+
     @staticmethod
     # ID: b338ca12-adb5-482c-8399-a691192ee7ae
     def lineno(node: ast.AST) -> int:
@@ -75,7 +103,7 @@ class ASTHelpers:
         - Dynamic / `__import__` / `importlib` patterns.
         """
         alias_map: dict[str, str] = {}
-        for node in ast.walk(tree):
+        for node in ASTHelpers.nodes_of_type(tree, (ast.Import, ast.ImportFrom)):
             if isinstance(node, ast.ImportFrom):
                 if not node.module or node.level > 0:
                     continue
@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import ast
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
+
 
 # ID: ac64bdfa-2c71-4c06-9cdc-cdcf2d30f474
 class ApiAuthChecks:
@@ -118,7 +120,7 @@ class ApiAuthChecks:
         unguarded_route_names: set[str] = set()
 
         findings: list[str] = []
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if not isinstance(node, ast.AsyncFunctionDef | ast.FunctionDef):
                 continue
             route_deco = _find_mutation_route_decorator(node)
@@ -160,7 +162,7 @@ class ApiAuthChecks:
 # ID: a906415b-311a-42d5-8df8-8a8db0b856fe
 def _find_router_exposure(tree: ast.AST) -> str | None:
     """Return the string value of ROUTER_EXPOSURE if declared, else None."""
-    for node in ast.walk(tree):
+    for node in ASTHelpers.walk(tree):
         if (
             isinstance(node, ast.Assign)
             and len(node.targets) == 1
@@ -183,7 +185,7 @@ def _find_intentionally_ungated(tree: ast.AST) -> dict[str, str]:
     Only literal string keys/values are recognised — anything computed is
     silently ignored."""
     result: dict[str, str] = {}
-    for node in ast.walk(tree):
+    for node in ASTHelpers.walk(tree):
         target: ast.expr | None
         value: ast.expr | None
         if isinstance(node, ast.Assign):
@@ -220,7 +222,7 @@ def _find_all_router_gates(tree: ast.AST) -> dict[str, bool]:
     routers (e.g. 'actions_router', 'admin_router') invisible to the checker.
     """
     result: dict[str, bool] = {}
-    for node in ast.walk(tree):
+    for node in ASTHelpers.walk(tree):
         if not (
             isinstance(node, ast.Assign)
             and len(node.targets) == 1
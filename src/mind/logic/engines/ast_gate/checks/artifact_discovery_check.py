@@ -36,6 +36,8 @@ import re
 from pathlib import Path
 from typing import ClassVar
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
+
 
 # ID: 3cf25eee-a8a6-42f0-ac0a-c0554f6afe46
 class ArtifactDiscoveryCheck:
@@ -120,7 +122,7 @@ class ArtifactDiscoveryCheck:
 
         # Inspect every Call node for the suspect shape.
         findings: list[str] = []
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.Call):
                 violation = cls._inspect_call(node)
                 if violation:
@@ -138,7 +140,7 @@ class ArtifactDiscoveryCheck:
         rule's spirit: a file that knows the registry exists is presumed
         to be using it.
         """
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.Name) and node.id in cls._REGISTRY_API_NAMES:
                 return True
             if isinstance(node, ast.Attribute) and node.attr in cls._REGISTRY_API_NAMES:
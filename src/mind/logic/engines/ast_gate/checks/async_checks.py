@@ -36,13 +36,11 @@ class AsyncChecks:
 
         # Build parent map for context analysis
         parent_map = {}
-        for parent in ast.walk(tree):
+        for parent in ASTHelpers.walk(tree):
             for child in ast.iter_child_nodes(parent):
                 parent_map[child] = parent
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             fn = ASTHelpers.full_attr_name(node.func)
             if not fn:
                 continue
@@ -251,10 +249,7 @@ class AsyncChecks:
         """Forbid returning asyncio Tasks/Futures from sync functions."""
         findings: list[str] = []
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.FunctionDef):
-                continue
-
+        for node in ASTHelpers.nodes_of_type(tree, ast.FunctionDef):
             for inner in ast.walk(node):
                 if not isinstance(inner, ast.Return):
                     continue
@@ -25,6 +25,8 @@ from __future__ import annotations
 import ast
 import re
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
+
 
 # Matches `UPDATE ... blackboard_entries ... SET ... status = 'awaiting_reaudit'`.
 # Case-insensitive (SQL is conventionally case-insensitive even when the
@@ -72,9 +74,7 @@ class AwaitingReauditChecks:
         independently.
         """
         violations: list[str] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             func_name = _resolve_call_name(node.func)
             if func_name != "text":
                 continue
@@ -133,7 +133,7 @@ def _extract_public_symbols(tree: ast.AST) -> list[tuple[str, int]]:
     """
     symbols: list[tuple[str, int]] = []
 
-    for node in ast.walk(tree):
+    for node in ASTHelpers.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
             name = node.name
 
@@ -31,7 +31,7 @@ class ImportChecks:
         # First pass: find all TYPE_CHECKING blocks
         type_checking_nodes = ImportChecks._find_type_checking_blocks(tree)
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             # Skip imports inside TYPE_CHECKING blocks
             if node in type_checking_nodes:
                 continue
@@ -62,7 +62,7 @@ class ImportChecks:
         """Find all nodes inside TYPE_CHECKING blocks."""
         type_checking_nodes: set[ast.stmt] = set()  # ← Added explicit type annotation
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.If):
                 if ASTHelpers.is_type_checking_condition(node.test):
                     for stmt in node.body:
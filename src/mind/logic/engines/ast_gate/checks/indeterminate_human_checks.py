@@ -35,6 +35,8 @@ from __future__ import annotations
 import ast
 import re
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
+
 
 # Matches `UPDATE ... blackboard_entries ... SET <setbody>` and captures the
 # SET body up to (but not including) the WHERE clause, via the same tempered
@@ -77,9 +79,7 @@ class IndeterminateHumanChecks:
         standard injection hygiene, flagged independently.
         """
         violations: list[str] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             if _resolve_call_name(node.func) != "text":
                 continue
             sql_literal = _extract_first_string_literal(node)
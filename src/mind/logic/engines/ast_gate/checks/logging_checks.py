@@ -18,10 +18,7 @@ class LoggingChecks:
         """Enforce logging.single_logging_system: forbid print() calls."""
         findings: list[str] = []
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             func_name = ASTHelpers.full_attr_name(node.func)
             if func_name == "print":
                 findings.append(
@@ -99,10 +96,7 @@ class LoggingChecks:
             "bold white",
         }
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             func_name = ASTHelpers.full_attr_name(node.func)
 
             # Only inspect logger.* calls
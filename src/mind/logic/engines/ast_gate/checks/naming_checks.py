@@ -26,10 +26,7 @@ class NamingChecks:
         """
         findings: list[str] = []
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.AsyncFunctionDef):
-                continue
-
+        for node in ASTHelpers.nodes_of_type(tree, ast.AsyncFunctionDef):
             if node.name.startswith("_"):
                 continue
 
@@ -74,7 +71,7 @@ class NamingChecks:
         """
         # Count lines in the source
         line_count = 0
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if hasattr(node, "lineno"):
                 line_count = max(line_count, node.lineno)
 
@@ -99,7 +96,7 @@ class NamingChecks:
         """
         findings: list[str] = []
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
 
@@ -124,7 +121,7 @@ class NamingChecks:
     def check_type_annotations(tree: ast.AST) -> list[str]:
         """Detect public functions missing return type annotations."""
         findings: list[str] = []
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
             if node.name.startswith("_"):
@@ -59,10 +59,7 @@ class PromptModelChecks:
 
         violations: list[str] = []
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
-
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             # Resolve the full dotted name of the call target
             name = ASTHelpers.full_attr_name(node.func)
             if name is None:
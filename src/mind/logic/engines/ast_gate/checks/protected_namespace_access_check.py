@@ -105,11 +105,11 @@ class ProtectedNamespaceAccessCheck:
         # Pass 1 — collect tainted variables across plain, annotated, and
         # augmented assignments. The growing tainted_names set is threaded
         # through so multi-hop derivations propagate (issue #119, gap 1).
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
                 tainted_names |= cls._collect_tainted_assignments(node, tainted_names)
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.Call):
                 findings.extend(cls._check_call(node, tainted_names, alias_map))
 
@@ -43,13 +43,17 @@ class PurityChecks:
 
     @staticmethod
     # ID: d0d9b1d6-5849-486a-9f77-8333f4fd75a4
-    def check_stable_id_anchor(source: str) -> list[str]:
-        """Ensures all PUBLIC symbols have an '# ID:' anchor above them."""
+    def check_stable_id_anchor(source: str, tree: ast.AST | None = None) -> list[str]:
+        """Ensures all PUBLIC symbols have an '# ID:' anchor above them.
+
+        ``tree`` may be passed when the caller already parsed ``source``.
+        """
         violations = []
         try:
-            tree = ast.parse(source)
+            if tree is None:
+                tree = ast.parse(source)
             lines = source.splitlines()
-            for node in ast.walk(tree):
+            for node in ASTHelpers.walk(tree):
                 if isinstance(
                     node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
                 ):
@@ -72,12 +76,12 @@ class PurityChecks:
     # ID: 4bd29d4a-63e7-4132-8ab2-16865c9d500c
     def check_docstrings_present(tree: ast.AST) -> list[str]:
         """Flags public functions and classes whose body lacks a docstring."""
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             for child in ast.iter_child_nodes(node):
                 child._parent = node  # type: ignore[attr-defined]
 
         violations: list[str] = []
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if not isinstance(
                 node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
             ):
@@ -100,7 +104,7 @@ class PurityChecks:
     def check_forbidden_decorators(tree: ast.AST, forbidden: list[str]) -> list[str]:
         """Prevents use of obsolete metadata decorators in source code."""
         violations, forbidden_set = [], {d.strip() for d in forbidden if d.strip()}
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 for dec in node.decorator_list:
                     name = ASTHelpers.full_attr_name(dec)
@@ -135,7 +139,7 @@ class PurityChecks:
                 return []
 
         alias_map = ASTHelpers.build_import_alias_map(tree)
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             name = None
             if isinstance(node, ast.Name):
                 if node.id in forbidden_set:
@@ -184,7 +188,7 @@ class PurityChecks:
             return []
 
         violations: list[str] = []
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name) and target.id in forbidden_set:
@@ -208,7 +212,7 @@ class PurityChecks:
         """Enforces standard logging over print()."""
         return [
             f"Line {ASTHelpers.lineno(n)}: Replace print() with logger."
-            for n in ast.walk(tree)
+            for n in ASTHelpers.walk(tree)
             if isinstance(n, ast.Call) and ASTHelpers.full_attr_name(n.func) == "print"
         ]
 
@@ -246,7 +250,7 @@ class PurityChecks:
             "update",
         }
 
-        for fn in ast.walk(tree):
+        for fn in ASTHelpers.walk(tree):
             if not isinstance(
                 fn, (ast.FunctionDef, ast.AsyncFunctionDef)
             ) or fn.name.startswith(("_", "test_")):
@@ -282,7 +286,7 @@ class PurityChecks:
     ) -> list[str]:
         """Validates that specific decorators are called with mandatory keyword arguments."""
         violations, required_set = [], {a.strip() for a in required_args if a.strip()}
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 for dec in node.decorator_list:
                     if isinstance(dec, ast.Call):
@@ -335,7 +339,7 @@ class PurityChecks:
             file_path and "src/body/atomic" in str(file_path).replace("\\", "/")
         )
 
-        for fn in ast.walk(tree):
+        for fn in ASTHelpers.walk(tree):
             if not isinstance(fn, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
             if fn.name.startswith("_"):
@@ -476,10 +480,7 @@ class PurityChecks:
         alias_map = ASTHelpers.build_import_alias_map(tree)
         violations: list[str] = []
 
-        for n in ast.walk(tree):
-            if not isinstance(n, ast.Call):
-                continue
-
+        for n in ASTHelpers.nodes_of_type(tree, ast.Call):
             attr_leaf = n.func.attr if isinstance(n.func, ast.Attribute) else None
             qualified = ASTHelpers.resolve_qualified_name(n.func, alias_map)
 
@@ -521,7 +522,7 @@ class PurityChecks:
         forbidden_import_set = {m.strip() for m in forbidden_imports if m.strip()}
         forbidden_call_set = {c.strip() for c in forbidden_calls if c.strip()}
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             # Check imports: `import rich.console` or `from rich.console import ...`
             if isinstance(node, ast.Import):
                 for alias in node.names:
@@ -576,9 +577,7 @@ class PurityChecks:
         """
         violations: list[str] = []
         alias_map = ASTHelpers.build_import_alias_map(tree)
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+        for node in ASTHelpers.nodes_of_type(tree, ast.Call):
             callee = ASTHelpers.full_attr_name(node.func)
             resolved = ASTHelpers.resolve_qualified_name(node.func, alias_map) or callee
             if resolved in PurityChecks._TEMPFILE_FORBIDDEN:
@@ -601,7 +600,7 @@ class PurityChecks:
     # ID: 3edb55a9-492f-4c64-ba5b-48d8ec65a8af
     def check_future_annotations(tree: ast.AST) -> list[str]:
         """Detect Python files missing `from __future__ import annotations` (PEP 563)."""
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if (
                 isinstance(node, ast.ImportFrom)
                 and node.module == "__future__"
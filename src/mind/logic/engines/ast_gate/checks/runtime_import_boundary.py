@@ -89,7 +89,7 @@ class RuntimeImportBoundaryCheck:
 
         violations: list[str | dict[str, Any]] = []
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if node in type_checking_nodes:
                 continue
 
@@ -128,7 +128,7 @@ class RuntimeImportBoundaryCheck:
         """Return the set of AST nodes inside ``if TYPE_CHECKING:`` blocks."""
         type_checking_nodes: set[ast.AST] = set()
 
-        for node in ast.walk(tree):
+        for node in ASTHelpers.walk(tree):
             if isinstance(node, ast.If) and ASTHelpers.is_type_checking_condition(
                 node.test
             ):
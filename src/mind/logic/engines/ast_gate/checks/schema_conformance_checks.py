@@ -80,7 +80,9 @@ class SchemaConformanceChecks:
         required_fields = set(contract.get("required") or [])
 
         class_nodes: dict[str, ast.ClassDef] = {
-            node.name: node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+            node.name: node
+            for node in ASTHelpers.walk(tree)
+            if isinstance(node, ast.ClassDef)
         }
 
         findings: list[str] = []
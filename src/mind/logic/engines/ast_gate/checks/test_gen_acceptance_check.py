@@ -25,6 +25,8 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
+
 
 _COMPOSITE_NAME = "CompositeAcceptanceCondition"
 _PYTEST_GATE_NAME = "PytestAcceptanceCondition"
@@ -46,7 +48,7 @@ class TestGenAcceptanceCheck:
         """
         composite_calls = [
             node
-            for node in ast.walk(tree)
+            for node in ASTHelpers.walk(tree)
             if isinstance(node, ast.Call) and cls._call_name(node) == _COMPOSITE_NAME
         ]
 
@@ -6,6 +6,7 @@ import ast
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from mind.logic.engines.ast_gate.base import ASTHelpers
 from mind.logic.engines.ast_gate.checks import (
     AsyncChecks,
     AwaitingReauditChecks,
@@ -37,6 +38,7 @@ from mind.logic.engines.ast_gate.checks.runtime_import_boundary import (
 from mind.logic.engines.ast_gate.checks.test_gen_acceptance_check import (
     TestGenAcceptanceCheck,
 )
+from mind.logic.engines.ast_gate.file_view import ASTFileView
 from mind.logic.engines.base import BaseEngine, EngineResult, EvidenceClass
 from shared.infrastructure.intent.filesystem_operations import (
     FsOperationTaxonomy,
@@ -142,6 +144,12 @@ class ASTGateEngine(BaseEngine):
         }
     )
 
+    # Per-file rules of this engine may run file-major: rule_executor's
+    # execute_rules_fused builds one ASTFileView per file (file_view())
+    # and passes it to verify() for every applicable rule.
+    supports_fused_dispatch: ClassVar[bool] = True
+    supports_process_dispatch: ClassVar[bool] = True
+
     # duplicate_ids is corpus-level (it must see every file at once to detect
     # a UUID collision), so it dispatches through verify_context, not the
     # per-file verify() below. BaseEngine.is_context_level_for consults this.
@@ -169,6 +177,11 @@ class ASTGateEngine(BaseEngine):
             )
         ]
 
+    # ID: 3e7b1c59-8d2f-4a06-b9c4-f1a5d8e2c673
+    def file_view(self, file_path: Path, context: Any = None) -> ASTFileView:
+        """Shared, lazily loaded view of ``file_path`` for fused dispatch."""
+        return ASTFileView(file_path, context)
+
     # ID: d730e583-f41d-482e-ad42-b5ec368775cf
     async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
         check_type = params.get("check_type")
@@ -183,21 +196,26 @@ class ASTGateEngine(BaseEngine):
                 engine_id=self.engine_id,
             )
 
-        # 2. SENSATION: Load source and tree
-        try:
-            source = file_path.read_text(encoding="utf-8")
-        except Exception as e:
-            return EngineResult(False, f"Read Error: {e}", [], self.engine_id)
-
-        tree = None
-        if context and hasattr(context, "get_tree"):
-            tree = context.get_tree(file_path)
-
-        if tree is None:
+        # 2. SENSATION: Load source and tree. Fused dispatch hands in the
+        # file's shared view so the source is read once for all rules.
+        view: ASTFileView | None = params.get("_file_view")
+        if view is not None and view.file_path == file_path and view.load():
+            source, tree = view.source, view.tree
+        else:
             try:
-                tree = ast.parse(source, filename=str(file_path))
+                source = file_path.read_text(encoding="utf-8")
             except Exception as e:
-                return EngineResult(False, f"Parse Error: {e}", [], self.engine_id)
+                return EngineResult(False, f"Read Error: {e}", [], self.engine_id)
+
+            tree = None
+            if context and hasattr(context, "get_tree"):
+                tree = context.get_tree(file_path)
+
+            if tree is None:
+                try:
+                    tree = ast.parse(source, filename=str(file_path))
+                except Exception as e:
+                    return EngineResult(False, f"Parse Error: {e}", [], self.engine_id)
 
         violations: list[str | dict[str, Any]] = []
 
@@ -205,7 +223,7 @@ class ASTGateEngine(BaseEngine):
 
         # --- Purity & Integrity ---
         if check_type in ("stable_id_anchor", "id_anchor"):
-            violations.extend(PurityChecks.check_stable_id_anchor(source))
+            violations.extend(PurityChecks.check_stable_id_anchor(source, tree))
 
         elif check_type == "docstrings_present":
             violations.extend(PurityChecks.check_docstrings_present(tree))
@@ -431,7 +449,7 @@ class ASTGateEngine(BaseEngine):
             requirement = params.get(
                 "requirement", params
             )  # Fallback to params for flat rules
-            for node in ast.walk(tree):
+            for node in ASTHelpers.walk(tree):
                 if GenericASTChecks.is_selected(node, selector):
                     err = GenericASTChecks.validate_requirement(node, requirement)
                     if err:
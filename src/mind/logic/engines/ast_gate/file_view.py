@@ -0,0 +1,134 @@
+# src/mind/logic/engines/ast_gate/file_view.py
+
+"""
+ASTFileView - one file's source, tree and shared traversal.
+
+Fused ast_gate dispatch (rule_executor.execute_rules_fused) visits each file
+once and runs every applicable ast_gate rule against the same view: the
+source is read at most once, the tree comes from the AuditorContext parse cache, and
+the first check to walk the tree materializes the walk for all the others.
+Type-filtered node lists (calls, imports, defs, ...) are built once from that
+walk and shared too.
+
+Checks reach the shared traversal through ASTHelpers.walk() and
+ASTHelpers.nodes_of_type(), which consult the views active on the current
+tree and fall back to ast.walk() otherwise — so a check returns the same
+nodes in the same order whether it runs fused or stand-alone.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
+
+
+# Views currently being dispatched, keyed by their tree. Entries exist only
+# while a view is active, so memory is bounded by the files in flight.
+_ACTIVE_VIEWS: WeakKeyDictionary[ast.AST, ASTFileView] = WeakKeyDictionary()
+
+
+# ID: 7c3e9a51-2d8f-4b64-a1e7-5f0b8c4d2e93
+class ASTFileView:
+    """Source text, parsed tree and memoized traversals for one file.
+
+    Loading is lazy: a file whose every rule is served from the evaluation
+    cache is never read.
+    """
+
+    def __init__(self, file_path: Path, context: Any = None) -> None:
+        self.file_path = file_path
+        self.source: str = ""
+        self.tree: ast.AST = ast.Module(body=[], type_ignores=[])
+        self._context = context
+        self._loaded: bool | None = None
+        self._active = False
+        self._nodes: list[ast.AST] | None = None
+        self._by_type: dict[Any, list[Any]] = {}
+
+    # ID: 2f8b6d14-9a3c-4e70-b5d2-c1e7a9f3b048
+    def load(self) -> bool:
+        """Read and parse the file once; the tree comes from the context cache.
+
+        Returns False when the file cannot be read or parsed — the caller
+        then takes its own path, which reports the error as it always has.
+        """
+        if self._loaded is None:
+            try:
+                source = self.file_path.read_text(encoding="utf-8")
+                tree = None
+                if self._context is not None and hasattr(self._context, "get_tree"):
+                    tree = self._context.get_tree(self.file_path)
+                if tree is None:
+                    tree = ast.parse(source, filename=str(self.file_path))
+            except Exception:
+                self._loaded = False
+            else:
+                self.source, self.tree = source, tree
+                self._loaded = True
+                if self._active:
+                    _ACTIVE_VIEWS[tree] = self
+        return self._loaded
+
+    @property
+    # ID: 5a1d7e38-4c9b-4f26-8e0a-b3f6c2d9a715
+    def nodes(self) -> list[ast.AST]:
+        """Every node of the tree in ast.walk() order, walked once."""
+        if self._nodes is None:
+            self._nodes = list(ast.walk(self.tree))
+        return self._nodes
+
+    # ID: 9e4f2b67-1a8d-4c35-b7e0-d6a3f5c8e129
+    def of_type(self, node_type: Any) -> list[Any]:
+        """Nodes that are instances of ``node_type`` (a type or tuple), in walk order."""
+        cached = self._by_type.get(node_type)
+        if cached is None:
+            cached = [n for n in self.nodes if isinstance(n, node_type)]
+            self._by_type[node_type] = cached
+        return cached
+
+    @property
+    # ID: 3b7c1e94-6d2a-4f58-9c0b-a8e5d4f1b236
+    def calls(self) -> list[ast.Call]:
+        """Call nodes, in walk order."""
+        return self.of_type(ast.Call)
+
+    @property
+    # ID: 8d5a3f16-2b9e-4c47-a0d1-e7c4b6f2a953
+    def imports(self) -> list[ast.Import | ast.ImportFrom]:
+        """Import and ImportFrom nodes, in walk order."""
+        return self.of_type((ast.Import, ast.ImportFrom))
+
+    @property
+    # ID: 1f6e8c42-7a3b-4d95-b2e0-c9d5a1f7e384
+    def defs(self) -> list[ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef]:
+        """Function, async function and class definitions, in walk order."""
+        return self.of_type((ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+
+    @property
+    # ID: 6c2d9b75-3e1f-4a08-8b6c-f4a7e2d1c590
+    def decorators(self) -> list[ast.expr]:
+        """Decorator expressions of every def, in walk order."""
+        return [dec for node in self.defs for dec in node.decorator_list]
+
+    @contextmanager
+    # ID: 4e9a2c83-5b7d-4f16-a3e8-d0c6b1f5a742
+    def active(self) -> Iterator[ASTFileView]:
+        """Share this view's traversals with every check walking its tree."""
+        self._active = True
+        if self._loaded:
+            _ACTIVE_VIEWS[self.tree] = self
+        try:
+            yield self
+        finally:
+            self._active = False
+            _ACTIVE_VIEWS.pop(self.tree, None)
+
+
+# ID: a5f3d8e1-6c2b-4d79-b0e4-7e1c9a3f2d56
+def active_view(tree: ast.AST) -> ASTFileView | None:
+    """The view currently dispatching ``tree``, if any."""
+    return _ACTIVE_VIEWS.get(tree)
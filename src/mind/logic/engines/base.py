@@ -160,6 +160,17 @@ class BaseEngine(ABC):
     # update the pre-patch DB graph, so a subprocess verdict would be stale.
     requires_knowledge_graph: ClassVar[bool] = False
 
+    # rule_executor dispatch capabilities for per-file rules:
+    # - supports_fused_dispatch: verify() accepts a shared per-file view
+    #   (params["_file_view"], built by file_view()) so several rules can be
+    #   evaluated against one read of the file (execute_rules_fused).
+    # - supports_process_dispatch: verify() is CPU-bound, deterministic and
+    #   needs nothing from the main process beyond the file and picklable
+    #   params, so it may run in an audit worker process
+    #   (execute_rules_parallel). Never set for DB- or LLM-backed engines.
+    supports_fused_dispatch: ClassVar[bool] = False
+    supports_process_dispatch: ClassVar[bool] = False
+
     @abstractmethod
     # ID: db4c48d2-4ccc-4182-bb37-29973471b8bb
     async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
@@ -175,6 +186,29 @@ class BaseEngine(ABC):
         """
         pass
 
+    # ID: 3d8a1f52-6b4e-4c9a-9e07-5f2c8b6d1a34
+    async def prepare_rule(self, files: list[Path], params: dict[str, Any]) -> Any:
+        """
+        Rule-level hook run once before per-file dispatch.
+
+        Engines that can amortise per-file I/O across a rule (e.g. one bulk
+        cache read instead of one query per file) override this. Whatever
+        is returned is threaded to every verify() call of the rule as
+        ``params["_rule_state"]`` and handed back to finalize_rule().
+        The default does nothing and returns None.
+        """
+        return None
+
+    # ID: 8e4c2b71-0f3d-4a65-b9d8-2c7e1a5f6b90
+    async def finalize_rule(self, state: Any, params: dict[str, Any]) -> None:
+        """
+        Rule-level hook run once after every file of the rule was verified.
+
+        Receives the value prepare_rule() returned. Used to flush work the
+        engine deferred during verify() (e.g. bulk cache writes).
+        """
+        return None
+
     @classmethod
     # ID: 17cb7c7f-94f3-4d61-8a2c-3a0b9d1e4c2d
     def is_context_level_for(cls, check_type: str | None) -> bool:
@@ -50,6 +50,10 @@ AuditFinding.json fires 0) is what triggered ADR-102; the three rules
 together catch the bind-error pattern from static, asymmetric, and
 iceberg angles.
 
+Every check reads contracts, mappings and src/ through the audit's
+CorpusSnapshot, so the tree is walked and each file parsed at most once
+per audit however many of the five checks run.
+
 LAYER: mind.logic.engines — read-only verification. No file writes.
 DB access (asymmetric / iceberg checks) is via the audit context's
 injected session per architecture.boundary.database_session_access —
@@ -67,6 +71,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 import yaml
 from sqlalchemy import text
 
+from mind.governance.corpus_snapshot import CorpusSnapshot, corpus_for
 from shared.logger import getLogger
 from shared.models import AuditFinding, AuditSeverity
 
@@ -221,6 +226,7 @@ def _check_layer_scope_coherence(context: AuditorContext) -> list[AuditFinding]:
     repo_root: Path = context.paths.repo_root
     contracts_dir = repo_root / ".intent" / "enforcement" / "contracts"
     src_root = repo_root / "src"
+    corpus = corpus_for(context)
 
     if not contracts_dir.is_dir():
         logger.warning("contracts_gate: contracts directory missing: %s", contracts_dir)
@@ -228,9 +234,9 @@ def _check_layer_scope_coherence(context: AuditorContext) -> list[AuditFinding]:
 
     classes_of_interest: set[str] = set()
     contract_data: dict[Path, dict[str, Any]] = {}
-    for contract_path in sorted(contracts_dir.glob("*.json")):
+    for contract_path in corpus.files(contracts_dir, ".json", recursive=False):
         try:
-            data = json.loads(contract_path.read_text(encoding="utf-8"))
+            data = corpus.parse_json(contract_path)
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(
                 "contracts_gate: skipping malformed %s: %s", contract_path, e
@@ -248,7 +254,9 @@ def _check_layer_scope_coherence(context: AuditorContext) -> list[AuditFinding]:
     if not classes_of_interest:
         return findings
 
-    instantiation_layers = _index_instantiation_layers(classes_of_interest, src_root)
+    instantiation_layers = _index_instantiation_layers(
+        classes_of_interest, src_root, corpus
+    )
 
     for contract_path, data in contract_data.items():
         contract_id = (data.get("metadata") or {}).get("id", contract_path.stem)
@@ -293,20 +301,22 @@ _CLASS_CALL_PATTERN = re.compile(r"\b([A-Z][A-Za-z0-9_]*)\s*\(")
 
 # ID: bf7c2602-441b-47bd-97b9-ab8e4e466a5d
 def _index_instantiation_layers(
-    classes: set[str], src_root: Path
+    classes: set[str], src_root: Path, corpus: CorpusSnapshot
 ) -> dict[str, set[str]]:
     """Single-pass src/ walk; returns {ClassName: {layer, layer, ...}}.
 
     A class's own definition line (`class ClassName(...)`) is intentionally
     NOT counted as an instantiation site — it tells us where the class
-    LIVES, not where it's USED. Walks .py files only.
+    LIVES, not where it's USED. Walks .py files only; only files naming
+    one of ``classes`` (per the snapshot's token index) are scanned.
     """
     layers_by_class: dict[str, set[str]] = {c: set() for c in classes}
-    if not src_root.is_dir():
-        return layers_by_class
+    candidates: set[Path] = set()
+    for class_name in classes:
+        candidates.update(corpus.files_containing(src_root, ".py", class_name))
 
     class_def_pattern = re.compile(r"\bclass\s+$")
-    for py_file in src_root.rglob("*.py"):
+    for py_file in sorted(candidates):
         try:
             rel = py_file.relative_to(src_root)
         except ValueError:
@@ -316,12 +326,7 @@ def _index_instantiation_layers(
         layer = rel.parts[0]
         if layer not in _LAYER_NAMES:
             continue
-        try:
-            content = py_file.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            continue
-        if not any(c in content for c in classes):
-            continue
+        content = corpus.text(py_file)
         for match in _CLASS_CALL_PATTERN.finditer(content):
             name = match.group(1)
             if name not in classes:
@@ -366,13 +371,14 @@ async def _check_asymmetric_contract_findings(
         repo_root / ".intent" / "enforcement" / "mappings" / "data" / "governance.yaml"
     )
     contracts_dir = repo_root / ".intent" / "enforcement" / "contracts"
+    corpus = corpus_for(context)
 
     if not mappings_path.exists():
         logger.warning("contracts_gate: mappings not found: %s", mappings_path)
         return findings
 
     try:
-        mappings_doc = yaml.safe_load(mappings_path.read_text(encoding="utf-8")) or {}
+        mappings_doc = corpus.parse_yaml(mappings_path) or {}
     except yaml.YAMLError as e:
         logger.warning("contracts_gate: malformed mappings: %s", e)
         return findings
@@ -400,7 +406,7 @@ async def _check_asymmetric_contract_findings(
         if not contract_path.exists():
             continue
         try:
-            data = json.loads(contract_path.read_text(encoding="utf-8"))
+            data = corpus.parse_json(contract_path)
         except (json.JSONDecodeError, OSError):
             continue
         governed = set(data.get("governed_classes") or [])
@@ -617,15 +623,16 @@ def _check_persistence_reach_coherence(context: AuditorContext) -> list[AuditFin
     repo_root: Path = context.paths.repo_root
     contracts_dir = repo_root / ".intent" / "enforcement" / "contracts"
     src_root = repo_root / "src"
+    corpus = corpus_for(context)
 
     if not contracts_dir.is_dir():
         return findings
 
     classes_of_interest: set[str] = set()
     contract_data: dict[Path, dict[str, Any]] = {}
-    for contract_path in sorted(contracts_dir.glob("*.json")):
+    for contract_path in corpus.files(contracts_dir, ".json", recursive=False):
         try:
-            data = json.loads(contract_path.read_text(encoding="utf-8"))
+            data = corpus.parse_json(contract_path)
         except (json.JSONDecodeError, OSError) as exc:
             logger.warning(
                 "contracts_gate.persistence_reach: skipping %s: %s",
@@ -645,7 +652,7 @@ def _check_persistence_reach_coherence(context: AuditorContext) -> list[AuditFin
     if not classes_of_interest:
         return findings
 
-    reached = _find_persistence_reach(classes_of_interest, src_root)
+    reached = _find_persistence_reach(classes_of_interest, src_root, corpus)
 
     for contract_path, data in contract_data.items():
         contract_id = (data.get("metadata") or {}).get("id", contract_path.stem)
@@ -683,7 +690,9 @@ def _check_persistence_reach_coherence(context: AuditorContext) -> list[AuditFin
 
 
 # ID: 7b1e5d2a-f8c4-4b9e-a3f6-0c2d5e8f1a7b
-def _find_persistence_reach(classes: set[str], src_root: Path) -> set[str]:
+def _find_persistence_reach(
+    classes: set[str], src_root: Path, corpus: CorpusSnapshot
+) -> set[str]:
     """Return the subset of classes that co-occur with a persistence write method.
 
     Walks src/ .py files. For each function (def or async def), checks whether
@@ -698,18 +707,13 @@ def _find_persistence_reach(classes: set[str], src_root: Path) -> set[str]:
     heuristic; full dataflow is deferred per issue #619.
     """
     reached: set[str] = set()
-    if not classes or not src_root.is_dir():
-        return reached
+    candidates: set[Path] = set()
+    for class_name in classes:
+        candidates.update(corpus.files_containing(src_root, ".py", class_name))
 
-    for py_file in src_root.rglob("*.py"):
-        try:
-            source = py_file.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-        if not any(c in source for c in classes):
-            continue
+    for py_file in sorted(candidates):
         try:
-            tree = ast.parse(source)
+            tree = corpus.tree(py_file)
         except SyntaxError:
             continue
 
@@ -764,6 +768,7 @@ def _check_passive_gate_symbol_attestation(
     src_root_param = params.get("src_root", "src")
     mappings_root = repo_root / mappings_root_param
     src_root = repo_root / src_root_param
+    corpus = corpus_for(context)
 
     if not mappings_root.is_dir():
         logger.warning(
@@ -772,9 +777,9 @@ def _check_passive_gate_symbol_attestation(
         )
         return findings
 
-    for yaml_file in sorted(mappings_root.rglob("*.yaml")):
+    for yaml_file in corpus.files(mappings_root, ".yaml"):
         try:
-            content = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+            content = corpus.parse_yaml(yaml_file)
         except (yaml.YAMLError, OSError) as e:
             logger.warning(
                 "contracts_gate: skipping malformed %s: %s", yaml_file.name, e
@@ -799,7 +804,7 @@ def _check_passive_gate_symbol_attestation(
             # Strip trailing documentation suffixes like " enum"
             enforced_by_clean = enforced_by.split(" ")[0]
 
-            resolved = _resolve_enforced_by_symbol(enforced_by_clean, src_root)
+            resolved = _resolve_enforced_by_symbol(enforced_by_clean, src_root, corpus)
             if resolved is None:
                 rel_yaml = str(yaml_file.relative_to(repo_root))
                 findings.append(
@@ -837,7 +842,9 @@ def _check_passive_gate_symbol_attestation(
 
 
 # ID: 3828ee62-edbe-452a-bf0b-33d75edeb6b6
-def _resolve_enforced_by_symbol(dotted_path: str, src_root: Path) -> str | None:
+def _resolve_enforced_by_symbol(
+    dotted_path: str, src_root: Path, corpus: CorpusSnapshot | None = None
+) -> str | None:
     """Resolve a dotted Python path to a (file_path, symbol_name) pair.
 
     Returns a short description string on success, None on failure. The
@@ -870,22 +877,23 @@ def _resolve_enforced_by_symbol(dotted_path: str, src_root: Path) -> str | None:
             return None
 
         symbol_name = parts[symbol_idx]
-        if _symbol_defined_in_file(symbol_name, matched):
+        if _symbol_defined_in_file(symbol_name, matched, corpus):
             return f"{matched}::{symbol_name}"
 
     return None
 
 
 # ID: bc5675d9-d36d-4438-bc06-935940e16846
-def _symbol_defined_in_file(symbol_name: str, file_path: Path) -> bool:
+def _symbol_defined_in_file(
+    symbol_name: str, file_path: Path, corpus: CorpusSnapshot | None = None
+) -> bool:
     """Return True if symbol_name is defined as a class or function in file_path.
 
     Checks module-level and one level of nesting (methods inside classes).
     Uses AST parse — no imports, no runtime execution.
     """
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
+        tree = (corpus or CorpusSnapshot()).tree(file_path)
     except (SyntaxError, UnicodeDecodeError, OSError):
         return False
 
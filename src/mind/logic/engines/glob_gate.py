@@ -36,6 +36,7 @@ class GlobGateEngine(BaseEngine):
 
     engine_id = "glob_gate"
     evidence_class = EvidenceClass.PROVEN  # ADR-113: deterministic verdict
+    supports_process_dispatch = True
 
     # ID: 6576f3e8-c1f6-4180-bcd2-076f7cd7a491
     async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
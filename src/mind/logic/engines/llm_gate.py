@@ -25,13 +25,29 @@ ADR-044 — Incremental LLM-gate verdict cache:
   otherwise recomputed inline from file bytes.
 - The previous in-process LRU cache (ADR-043 D5) is subsumed: the DB cache
   provides the same dedup with cross-process and cross-run scope.
+- Rule-level prefetch: when rule_executor runs the prepare_rule() hook,
+  every verdict row and crawler content hash for the rule's file set is
+  loaded in one query; verify() serves hits from memory and queues misses,
+  which finalize_rule() writes back in a single bulk upsert. A mostly-
+  cached rule costs O(1) queries instead of O(files).
+
+Multi-file batching:
+- prepare_rule() also packs the rule's small cache-miss files into
+  llm_gate_batch_audit_prompt calls up to audit.llm_gate_batch_token_budget.
+  The first verify() of a batch member runs the batch; the others read
+  their verdict from it. Files an unparseable or incomplete batch response
+  does not answer fall back to the single-file llm_gate_audit_prompt. A
+  failed LLM call (transport, timeout) is not retried per file: every
+  member gets the ENFORCEMENT_UNAVAILABLE outcome.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import json
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -54,6 +70,48 @@ logger = getLogger(__name__)
 _DEFAULT_STALENESS_THRESHOLD_SECONDS = 3600
 
 
+@dataclass
+# ID: 7c3a9e14-2d58-4b61-8f0a-b5e6d2c9a173
+class _VerdictBatch:
+    """One multi-file llm_gate prompt, evaluated once on first demand.
+
+    ``members`` maps rel_path → content in prompt order. The first verify()
+    call for any member runs the batch under ``lock``; the rest await it and
+    read their verdict from ``results``. A member absent from ``results``
+    (unparseable batch response, missing entry) falls back to the
+    single-file prompt; a failed call answers every member as unavailable.
+    """
+
+    members: dict[str, str]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    results: dict[str, tuple[EngineResult, str]] | None = None
+
+
+@dataclass
+# ID: 2f6e9a0c-8d14-4b3e-a7c5-61b9e4d02f18
+class _RuleVerdictPrefetch:
+    """Rule-scoped llm_gate state built by LLMGateEngine.prepare_rule().
+
+    - cache_loaded: the ADR-044 prefetch query succeeded; verify() serves
+      the cache from memory and defers writes. False keeps the per-file
+      DB path (batching may still be active).
+    - artifact_hashes: rel_path → crawler content_hash, only for rows fresher
+      than the staleness threshold (stale/missing rows hash inline).
+    - verdicts: (rel_path, file_content_hash) → cached EngineResult.
+    - pending: verdict rows queued by verify() for finalize_rule()'s bulk
+      upsert, keyed by (rel_path, file_content_hash) so a repeat wins.
+    - batches: rel_path → the multi-file batch that file belongs to.
+    """
+
+    rule_id: str
+    rule_content_hash: str
+    cache_loaded: bool = False
+    artifact_hashes: dict[str, str] = field(default_factory=dict)
+    verdicts: dict[tuple[str, str], EngineResult] = field(default_factory=dict)
+    pending: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+    batches: dict[str, _VerdictBatch] = field(default_factory=dict)
+
+
 # ID: 8df9b4cd-934a-4115-8e51-2a57833a77d2
 class LLMGateEngine(BaseEngine):
     """
@@ -76,6 +134,218 @@ class LLMGateEngine(BaseEngine):
         self.llm = llm_client
         self._prompt_model = PromptModel.load("llm_gate")
         self._audit_prompt_model = PromptModel.load("llm_gate_audit_prompt")
+        self._batch_prompt_model = PromptModel.load("llm_gate_batch_audit_prompt")
+
+    # ID: 0b7d3e95-1c62-4f8a-bd40-93e5a7c1f2d6
+    async def prepare_rule(
+        self, files: list[Path], params: dict[str, Any]
+    ) -> _RuleVerdictPrefetch | None:
+        """Prefetch the ADR-044 cache and plan multi-file batches for a rule.
+
+        The cache for every file is loaded in one query when verify() would
+        be cache-eligible (rule identity plus an injected session). Batches
+        are planned over the remaining cache misses when
+        audit.llm_gate_batch_token_budget is positive. Returns None (plain
+        per-file path) when neither applies.
+        """
+        rule_id: str | None = params.get("_rule_id")
+        rule_content_hash: str = params.get("_rule_content_hash") or ""
+        force_llm: bool = bool(params.get("_force_llm"))
+        session = getattr(params.get("_context"), "db_session", None)
+        cache_eligible = bool(rule_id and rule_content_hash and session is not None)
+        budget, max_files, max_file_tokens = _batch_limits()
+        batching = budget > 0 and max_files > 1 and len(files) > 1
+        if not (cache_eligible or batching):
+            return None
+
+        prefetch = _RuleVerdictPrefetch(
+            rule_id=rule_id or "", rule_content_hash=rule_content_hash
+        )
+        if cache_eligible:
+            assert rule_id is not None
+            rows = await _prefetch_rule_cache(
+                session,
+                rule_id=rule_id,
+                rule_content_hash=rule_content_hash,
+                file_paths=[self._rel_path(p) for p in files],
+            )
+            if rows is None and not batching:
+                return None
+            threshold = _staleness_threshold_seconds()
+            for (
+                file_path,
+                content_hash,
+                age_seconds,
+                verdict_hash,
+                verdict,
+                findings_json,
+            ) in rows or []:
+                if (
+                    content_hash
+                    and age_seconds is not None
+                    and age_seconds <= threshold
+                ):
+                    prefetch.artifact_hashes[file_path] = content_hash
+                if verdict_hash is not None and verdict is not None:
+                    prefetch.verdicts[(file_path, verdict_hash)] = _verdict_to_result(
+                        verdict, findings_json
+                    )
+            prefetch.cache_loaded = rows is not None
+
+        if batching:
+            contents = await asyncio.to_thread(_read_texts, files)
+            candidates: list[tuple[str, str]] = []
+            for file_path in files:
+                content = contents.get(file_path)
+                if content is None or _estimate_tokens(content) > max_file_tokens:
+                    continue
+                rel_path = self._rel_path(file_path)
+                if prefetch.cache_loaded and not force_llm:
+                    fch = (
+                        prefetch.artifact_hashes.get(rel_path)
+                        or hashlib.sha256(content.encode("utf-8")).hexdigest()
+                    )
+                    if (rel_path, fch) in prefetch.verdicts:
+                        continue
+                candidates.append((rel_path, content))
+            for batch in _pack_batches(candidates, budget, max_files):
+                for rel_path in batch.members:
+                    prefetch.batches[rel_path] = batch
+        return prefetch
+
+    # ID: 6a1c8f37-e2b9-4d05-9a74-c3f0b8e52d19
+    async def finalize_rule(self, state: Any, params: dict[str, Any]) -> None:
+        """Flush the verdicts verify() queued during the rule in one upsert."""
+        if not isinstance(state, _RuleVerdictPrefetch) or not state.pending:
+            return
+        session = getattr(params.get("_context"), "db_session", None)
+        await _bulk_write_cached_verdicts(
+            session,
+            rule_id=state.rule_id,
+            rule_content_hash=state.rule_content_hash,
+            rows=list(state.pending.values()),
+        )
+        state.pending.clear()
+
+    def _rel_path(self, file_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(self._paths.repo_root))
+        except ValueError:
+            return str(file_path)
+
+    def _parse_verdict(self, result_data: dict[str, Any]) -> tuple[EngineResult, str]:
+        """Turn one ``{violation, reasoning, finding}`` object into a result."""
+        is_ok = not result_data.get("violation", False)
+
+        message = (
+            "Semantic adherence verified."
+            if is_ok
+            else f"Semantic Violation: {result_data.get('reasoning')}"
+        )
+
+        violations = (
+            [result_data.get("finding")]
+            if not is_ok and result_data.get("finding")
+            else []
+        )
+
+        final_result = EngineResult(
+            ok=is_ok,
+            message=message,
+            violations=violations,
+            engine_id=self.engine_id,
+        )
+        return final_result, "PASS" if is_ok else "FAIL"
+
+    def _unavailable(self, error: Exception) -> tuple[EngineResult, str]:
+        # P1.3 HARDENING:
+        # If the AI fails, enforcement is unavailable (truthful audit result)
+        return (
+            EngineResult(
+                ok=False,
+                message=f"ENFORCEMENT_UNAVAILABLE: LLM Reasoning Failed: {error}",
+                violations=["SYSTEM_ERROR_AI_OFFLINE"],
+                engine_id=self.engine_id,
+            ),
+            "ERROR",
+        )
+
+    async def _batched_verdict(
+        self,
+        batch: _VerdictBatch,
+        rel_path: str,
+        instruction: Any,
+        rationale: Any,
+    ) -> tuple[EngineResult, str] | None:
+        """Return rel_path's verdict from its batch, evaluating it if needed."""
+        async with batch.lock:
+            if batch.results is None:
+                batch.results = await self._evaluate_batch(
+                    batch, instruction, rationale
+                )
+        return batch.results.get(rel_path)
+
+    async def _evaluate_batch(
+        self, batch: _VerdictBatch, instruction: Any, rationale: Any
+    ) -> dict[str, tuple[EngineResult, str]]:
+        """Run one multi-file prompt; members left out fall back per file.
+
+        Only a response that cannot be used (invalid JSON or the wrong shape,
+        including PromptModel's output validation) falls back. A failed call
+        answers every member as unavailable, so one outage is one
+        transient failure per file rather than another call per file.
+        """
+        files_block = "\n\n".join(
+            f"FILE: {rel_path}\n---\n{content}\n---"
+            for rel_path, content in batch.members.items()
+        )
+        try:
+            response_text = await self._batch_prompt_model.invoke(
+                context={
+                    "instruction": instruction,
+                    "rationale": rationale,
+                    "files": files_block,
+                },
+                client=self.llm,
+                user_id="llm_gate_engine",
+            )
+            data = json.loads(response_text)
+            entries = data.get("verdicts") if isinstance(data, dict) else data
+            if not isinstance(entries, list):
+                raise ValueError("batch response has no 'verdicts' array")
+        except ValueError as exc:
+            logger.info(
+                "llm_gate: batch of %d file(s) unusable (%s); "
+                "falling back to single-file prompts",
+                len(batch.members),
+                exc,
+            )
+            return {}
+        except Exception as exc:
+            logger.warning(
+                "llm_gate: batch of %d file(s) failed (%s); reporting them unavailable",
+                len(batch.members),
+                exc,
+            )
+            outcome = self._unavailable(exc)
+            return dict.fromkeys(batch.members, outcome)
+
+        results: dict[str, tuple[EngineResult, str]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            rel_path = entry.get("file")
+            if rel_path in batch.members and rel_path not in results:
+                results[rel_path] = self._parse_verdict(entry)
+        missing = len(batch.members) - len(results)
+        if missing:
+            logger.info(
+                "llm_gate: batch response omitted %d of %d file(s); "
+                "re-evaluating those singly",
+                missing,
+                len(batch.members),
+            )
+        return results
 
     # ID: 66b7f4b7-72a8-43b9-af11-787c58e20524
     async def verify(
@@ -109,10 +379,7 @@ class LLMGateEngine(BaseEngine):
                 engine_id=self.engine_id,
             )
 
-        try:
-            rel_path = str(file_path.relative_to(self._paths.repo_root))
-        except ValueError:
-            rel_path = str(file_path)
+        rel_path = self._rel_path(file_path)
 
         # ADR-044: cache layer. Skipped when rule identity isn't plumbed
         # (defensive — keeps the engine functional even if a caller bypasses
@@ -123,93 +390,176 @@ class LLMGateEngine(BaseEngine):
         session = getattr(auditor_context, "db_session", None)
         cache_eligible = bool(rule_id and rule_content_hash and session is not None)
         file_content_hash: str | None = None
-
-        if cache_eligible:
+        # rule_executor may run several files through verify() at once
+        # (audit.verify_concurrency). They share the injected session, so
+        # every DB touch holds the dispatcher's lock; the LLM call does not.
+        session_lock = params.get("_session_lock") or contextlib.nullcontext()
+        prefetch = params.get("_rule_state")
+        if not isinstance(prefetch, _RuleVerdictPrefetch):
+            prefetch = None
+        cache_prefetched = prefetch is not None and prefetch.cache_loaded
+
+        if cache_eligible and cache_prefetched:
+            assert prefetch is not None
+            # Rule-level prefetch: hash and verdict are already in memory.
+            file_content_hash = (
+                prefetch.artifact_hashes.get(rel_path)
+                or hashlib.sha256(content.encode("utf-8")).hexdigest()
+            )
+            cached = (
+                None
+                if force_llm
+                else prefetch.verdicts.get((rel_path, file_content_hash))
+            )
+            if cached is not None:
+                logger.info("llm_gate cache hit: %s %s", rule_id, rel_path)
+                return cached
+        elif cache_eligible:
             assert (
                 rule_id is not None
             )  # guaranteed by cache_eligible = bool(rule_id and ...)
-            file_content_hash = await _resolve_file_content_hash(
-                session, rel_path, content
-            )
+            async with session_lock:
+                file_content_hash = await _resolve_file_content_hash(
+                    session, rel_path, content
+                )
+                cached = (
+                    None
+                    if force_llm
+                    else await _read_cached_verdict(
+                        session,
+                        rule_id=rule_id,
+                        file_path=rel_path,
+                        file_content_hash=file_content_hash,
+                        rule_content_hash=rule_content_hash,
+                    )
+                )
+            if cached is not None:
+                logger.info("llm_gate cache hit: %s %s", rule_id, rel_path)
+                return cached
+
+        # 2. Invoke via PromptModel (cache miss or cache-disabled path).
+        # A file planned into a multi-file batch takes its verdict from the
+        # batch response; anything the batch could not answer falls through
+        # to the single-file prompt.
+        batch = prefetch.batches.get(rel_path) if prefetch is not None else None
+        batched = (
+            await self._batched_verdict(batch, rel_path, instruction, rationale)
+            if batch is not None
+            else None
+        )
+        if batched is not None:
+            final_result, verdict_label = batched
+        else:
+            try:
+                response_text = await self._audit_prompt_model.invoke(
+                    context={
+                        "instruction": instruction,
+                        "rationale": rationale,
+                        "content": content,
+                    },
+                    client=self.llm,
+                    user_id="llm_gate_engine",
+                )
+
+                result_data = json.loads(response_text)
+                final_result, verdict_label = self._parse_verdict(result_data)
 
-            if not force_llm:
-                cached = await _read_cached_verdict(
+            except Exception as e:
+                final_result, verdict_label = self._unavailable(e)
+
+        # 3. Persist verdict to the ADR-044 DB cache. Skipped for ERROR
+        # verdicts (transient infra failures, not a stable judgement) and
+        # when rule identity / session aren't plumbed.
+        if cache_eligible and verdict_label != "ERROR":
+            assert (
+                rule_id is not None
+            )  # guaranteed by cache_eligible = bool(rule_id and ...)
+            assert file_content_hash is not None
+            if cache_prefetched:
+                assert prefetch is not None
+                # Deferred to finalize_rule()'s single bulk upsert.
+                prefetch.pending[(rel_path, file_content_hash)] = {
+                    "file_path": rel_path,
+                    "fch": file_content_hash,
+                    "verdict": verdict_label,
+                    "findings": final_result.violations,
+                }
+                return final_result
+            async with session_lock:
+                await _write_cached_verdict(
                     session,
                     rule_id=rule_id,
                     file_path=rel_path,
                     file_content_hash=file_content_hash,
                     rule_content_hash=rule_content_hash,
+                    verdict=verdict_label,
+                    findings=final_result.violations,
                 )
-                if cached is not None:
-                    logger.info("llm_gate cache hit: %s %s", rule_id, rel_path)
-                    return cached
 
-        # 2. Invoke via PromptModel (cache miss or cache-disabled path)
-        try:
-            response_text = await self._audit_prompt_model.invoke(
-                context={
-                    "instruction": instruction,
-                    "rationale": rationale,
-                    "content": content,
-                },
-                client=self.llm,
-                user_id="llm_gate_engine",
-            )
+        return final_result
 
-            result_data = json.loads(response_text)
 
-            is_ok = not result_data.get("violation", False)
+# ----------------------------------------------------------------------
+# Multi-file batching helpers — planning only; evaluation lives on the
+# engine so it can share _parse_verdict with the single-file path.
+# ----------------------------------------------------------------------
 
-            message = (
-                "Semantic adherence verified."
-                if is_ok
-                else f"Semantic Violation: {result_data.get('reasoning')}"
-            )
 
-            violations = (
-                [result_data.get("finding")]
-                if not is_ok and result_data.get("finding")
-                else []
-            )
+def _batch_limits() -> tuple[int, int, int]:
+    """(token budget, max files, max per-file tokens); budget 0 = batching off."""
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
 
-            final_result = EngineResult(
-                ok=is_ok,
-                message=message,
-                violations=violations,
-                engine_id=self.engine_id,
-            )
-            verdict_label = "PASS" if is_ok else "FAIL"
+        audit = load_operational_config().audit
+        return (
+            int(audit.llm_gate_batch_token_budget),
+            int(audit.llm_gate_batch_max_files),
+            int(audit.llm_gate_batch_max_file_tokens),
+        )
+    except Exception:
+        return 0, 0, 0
 
-        except Exception as e:
-            # P1.3 HARDENING:
-            # If the AI fails, enforcement is unavailable (truthful audit result)
-            final_result = EngineResult(
-                ok=False,
-                message=f"ENFORCEMENT_UNAVAILABLE: LLM Reasoning Failed: {e}",
-                violations=["SYSTEM_ERROR_AI_OFFLINE"],
-                engine_id=self.engine_id,
-            )
-            verdict_label = "ERROR"
 
-        # 3. Persist verdict to the ADR-044 DB cache. Skipped for ERROR
-        # verdicts (transient infra failures, not a stable judgement) and
-        # when rule identity / session aren't plumbed.
-        if cache_eligible and verdict_label != "ERROR":
-            assert (
-                rule_id is not None
-            )  # guaranteed by cache_eligible = bool(rule_id and ...)
-            assert file_content_hash is not None
-            await _write_cached_verdict(
-                session,
-                rule_id=rule_id,
-                file_path=rel_path,
-                file_content_hash=file_content_hash,
-                rule_content_hash=rule_content_hash,
-                verdict=verdict_label,
-                findings=final_result.violations,
-            )
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (4 chars/token) — enough to size a batch."""
+    return len(text) // 4
 
-        return final_result
+
+def _read_texts(files: list[Path]) -> dict[Path, str]:
+    """Read every readable file; unreadable ones are simply left out."""
+    contents: dict[Path, str] = {}
+    for file_path in files:
+        try:
+            contents[file_path] = file_path.read_text(encoding="utf-8")
+        except Exception:
+            continue
+    return contents
+
+
+def _pack_batches(
+    candidates: list[tuple[str, str]], budget: int, max_files: int
+) -> list[_VerdictBatch]:
+    """Greedily pack (rel_path, content) pairs into batches, in order.
+
+    A batch closes when the next file would exceed ``budget`` tokens or the
+    batch already holds ``max_files``. Single-member batches are dropped —
+    that file is better served by the single-file prompt.
+    """
+    batches: list[_VerdictBatch] = []
+    current: dict[str, str] = {}
+    used = 0
+    for rel_path, content in candidates:
+        tokens = _estimate_tokens(content)
+        if current and (used + tokens > budget or len(current) >= max_files):
+            batches.append(_VerdictBatch(members=current))
+            current, used = {}, 0
+        current[rel_path] = content
+        used += tokens
+    if current:
+        batches.append(_VerdictBatch(members=current))
+    return [b for b in batches if len(b.members) > 1]
 
 
 # ----------------------------------------------------------------------
@@ -219,6 +569,44 @@ class LLMGateEngine(BaseEngine):
 # ----------------------------------------------------------------------
 
 
+def _staleness_threshold_seconds() -> int:
+    """Crawler-hash freshness bound from operational_config (ADR-044)."""
+    threshold = _DEFAULT_STALENESS_THRESHOLD_SECONDS
+    try:
+        from shared.infrastructure.intent.operational_config import (
+            load_operational_config,
+        )
+
+        cfg = load_operational_config()
+        threshold = int(
+            getattr(
+                getattr(cfg, "audit", object()),
+                "llm_gate_cache_staleness_threshold_seconds",
+                threshold,
+            )
+        )
+    except Exception:
+        pass
+    return threshold
+
+
+def _verdict_to_result(verdict: str, findings_json: Any) -> EngineResult:
+    """Rebuild the EngineResult a cached verdict row stands for."""
+    findings = findings_json if isinstance(findings_json, list) else []
+    ok = verdict == "PASS"
+    message = (
+        "Semantic adherence verified (cached)."
+        if ok
+        else "Semantic Violation (cached)."
+    )
+    return EngineResult(
+        ok=ok,
+        message=message,
+        violations=findings,
+        engine_id="llm_gate",
+    )
+
+
 # ID: 5a8e3f4d-7c1b-49a2-b603-9d2f8a1c4e5f
 async def _resolve_file_content_hash(session: Any, rel_path: str, content: str) -> str:
     """Return SHA-256 of file content for cache keying.
@@ -238,22 +626,7 @@ async def _resolve_file_content_hash(session: Any, rel_path: str, content: str)
     if session is None:
         return inline
 
-    threshold = _DEFAULT_STALENESS_THRESHOLD_SECONDS
-    try:
-        from shared.infrastructure.intent.operational_config import (
-            load_operational_config,
-        )
-
-        cfg = load_operational_config()
-        threshold = int(
-            getattr(
-                getattr(cfg, "audit", object()),
-                "llm_gate_cache_staleness_threshold_seconds",
-                threshold,
-            )
-        )
-    except Exception:
-        pass
+    threshold = _staleness_threshold_seconds()
 
     try:
         from sqlalchemy import text
@@ -329,20 +702,7 @@ async def _read_cached_verdict(
         row = result.fetchone()
         if row is None:
             return None
-        verdict, findings_json = row[0], row[1]
-        findings = findings_json if isinstance(findings_json, list) else []
-        ok = verdict == "PASS"
-        message = (
-            "Semantic adherence verified (cached)."
-            if ok
-            else "Semantic Violation (cached)."
-        )
-        return EngineResult(
-            ok=ok,
-            message=message,
-            violations=findings,
-            engine_id="llm_gate",
-        )
+        return _verdict_to_result(row[0], row[1])
     except Exception as exc:
         logger.debug(
             "llm_gate: cache read failed for %s/%s (%s)",
@@ -412,3 +772,106 @@ async def _write_cached_verdict(
             file_path,
             exc,
         )
+
+
+# ID: 9c4e7b21-5a3f-4d86-b0e2-7f1a6c8d3e45
+async def _prefetch_rule_cache(
+    session: Any,
+    *,
+    rule_id: str,
+    rule_content_hash: str,
+    file_paths: list[str],
+) -> list[tuple[Any, ...]] | None:
+    """Load crawler hashes and cached verdicts for a rule's file set.
+
+    One row per (file, cached verdict) — a file with no verdict row still
+    yields one row so its crawler hash is visible. Returns None on any DB
+    failure; the engine then falls back to the per-file lookups.
+    """
+    if session is None or not file_paths:
+        return None
+    try:
+        from sqlalchemy import text
+
+        result = await session.execute(
+            text(
+                """
+                SELECT p.file_path,
+                       a.content_hash,
+                       EXTRACT(EPOCH FROM (NOW() - a.last_crawled_at))::int
+                            AS age_seconds,
+                       v.file_content_hash,
+                       v.verdict,
+                       v.findings_json
+                FROM unnest(CAST(:paths AS text[])) AS p(file_path)
+                LEFT JOIN core.repo_artifacts a
+                       ON a.file_path = p.file_path
+                LEFT JOIN core.llm_gate_verdicts v
+                       ON v.file_path = p.file_path
+                      AND v.rule_id = :rule_id
+                      AND v.rule_content_hash = :rch
+                """
+            ),
+            {"paths": file_paths, "rule_id": rule_id, "rch": rule_content_hash},
+        )
+        return [tuple(row) for row in result.fetchall()]
+    except Exception as exc:
+        logger.debug(
+            "llm_gate: rule-level cache prefetch failed for %s (%s); "
+            "using per-file lookups",
+            rule_id,
+            exc,
+        )
+        return None
+
+
+# ID: e5b0d6a8-3f7c-4e19-8b25-d4a9c1f07e63
+async def _bulk_write_cached_verdicts(
+    session: Any,
+    *,
+    rule_id: str,
+    rule_content_hash: str,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Upsert many verdict rows in one statement. Failures are logged and swallowed.
+
+    Same ON CONFLICT contract as _write_cached_verdict. Rows must be unique
+    on (file_path, fch) — Postgres refuses to update one row twice in a
+    single INSERT ... ON CONFLICT.
+    """
+    if session is None or not rows:
+        return
+    try:
+        from sqlalchemy import text
+
+        await session.execute(
+            text(
+                """
+                INSERT INTO core.llm_gate_verdicts
+                    (rule_id, file_path, file_content_hash,
+                     rule_content_hash, verdict, findings_json,
+                     evaluated_at)
+                SELECT :rule_id, r.file_path, r.fch, :rch, r.verdict,
+                       r.findings, now()
+                FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+                     AS r(file_path text, fch text, verdict text,
+                          findings jsonb)
+                ON CONFLICT (rule_id, file_path, file_content_hash,
+                             rule_content_hash)
+                DO UPDATE SET
+                    verdict = EXCLUDED.verdict,
+                    findings_json = EXCLUDED.findings_json,
+                    evaluated_at = EXCLUDED.evaluated_at
+                """
+            ),
+            {"rule_id": rule_id, "rch": rule_content_hash, "rows": json.dumps(rows)},
+        )
+        await session.commit()
+    except Exception as exc:
+        logger.warning(
+            "llm_gate: bulk cache write failed for %s (%d verdicts, %s) — "
+            "verdicts not persisted",
+            rule_id,
+            len(rows),
+            exc,
+        )
@@ -16,6 +16,7 @@ import re
 from pathlib import Path
 from typing import Any
 
+from ._regex_gate_scanner import RegexFileView, rule_patterns
 from .base import BaseEngine, EngineResult, EvidenceClass
 
 
@@ -28,6 +29,16 @@ class RegexGateEngine(BaseEngine):
 
     engine_id = "regex_gate"
     evidence_class = EvidenceClass.PROVEN  # ADR-113: deterministic verdict
+    # Per-file rules may run file-major: execute_rules_fused builds one
+    # RegexFileView per file (file_view()) and announces every applicable
+    # rule's patterns to it, so the file is read and scanned once.
+    supports_fused_dispatch = True
+    supports_process_dispatch = True
+
+    # ID: 4a7d2e69-0c5b-4f83-9e16-b8f3c1d7a524
+    def file_view(self, file_path: Path, context: Any = None) -> RegexFileView:
+        """Shared, lazily loaded view of ``file_path`` for fused dispatch."""
+        return RegexFileView(file_path, context)
 
     # ID: 53cc3e25-0d0c-41a7-8ad3-32f8e6963a1a
     async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
@@ -45,39 +56,35 @@ class RegexGateEngine(BaseEngine):
                     f"Naming Violation: File '{file_path.name}' does not match pattern '{name_pattern}'"
                 )
 
-        # FACT 2: Check Content
-        try:
-            # Use to_thread to prevent blocking the event loop during file I/O.
-            content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
-        except Exception as e:
+        # FACT 2: Check Content. Fused dispatch hands in the file's shared
+        # view, scanned once for the patterns of every regex_gate rule.
+        view: RegexFileView | None = params.get("_file_view")
+        if view is None or view.file_path != file_path:
+            view = RegexFileView(file_path)
+            view.expect(params)
+        # Use to_thread to prevent blocking the event loop during file I/O.
+        if not await asyncio.to_thread(view.load):
             return EngineResult(
                 ok=False,
-                message=f"IO Error: {e}",
+                message=f"IO Error: {view.error}",
                 violations=[],
                 engine_id=self.engine_id,
             )
 
-        # 2a: Forbidden Patterns (Negative Check - e.g., Secrets/PII)
-        forbidden = params.get("forbidden_patterns") or params.get("patterns", [])
-        if isinstance(forbidden, str):
-            forbidden = [forbidden]
+        forbidden, required = rule_patterns(params)
 
+        # 2a: Forbidden Patterns (Negative Check - e.g., Secrets/PII)
         for pattern in forbidden:
-            matches = re.finditer(pattern, content, re.MULTILINE)
-            for match in matches:
+            for start in view.matches(pattern):
                 # Find line number for evidence
-                line_no = content.count("\n", 0, match.start()) + 1
+                line_no = view.line_of(start)
                 violations.append(
                     f"Forbidden Content [Line {line_no}]: Matched restricted regex '{pattern}'"
                 )
 
         # 2b: Required Patterns (Positive Check - e.g., File Headers)
-        required = params.get("required_patterns", [])
-        if isinstance(required, str):
-            required = [required]
-
         for pattern in required:
-            if not re.search(pattern, content, re.MULTILINE):
+            if not view.has_match(pattern):
                 violations.append(
                     f"Missing Required Content: Could not find pattern '{pattern}' in file."
                 )
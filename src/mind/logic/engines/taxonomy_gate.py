@@ -39,6 +39,7 @@ from typing import TYPE_CHECKING, Any
 
 from jsonschema import Draft202012Validator
 
+from mind.governance.corpus_snapshot import CorpusSnapshot, corpus_for
 from mind.governance.specs_doc_validator import parse_frontmatter
 from shared.infrastructure.intent.intent_repository import get_intent_repository
 from shared.infrastructure.intent.operational_capabilities import (
@@ -48,7 +49,6 @@ from shared.infrastructure.intent.operational_capabilities import (
 from shared.logger import getLogger
 from shared.models import AuditFinding, AuditSeverity
 from shared.path_resolver import PathResolver
-from shared.processors.yaml_processor import strict_yaml_processor
 
 from .base import BaseEngine, EngineResult, EvidenceClass
 
@@ -167,16 +167,19 @@ class TaxonomyGateEngine(BaseEngine):
         signal.
         """
         check_type = params.get("check_type")
+        # Every check reads the tree through the audit's shared snapshot:
+        # src/ is walked and parsed once across all five checks.
+        corpus = corpus_for(context)
         if check_type == _DECORATOR_BACKING_CHECK:
-            return self._build_decorator_backing_findings(context.repo_path)
+            return self._build_decorator_backing_findings(context.repo_path, corpus)
         if check_type == _SENSOR_SUPPORT_CHECK:
-            return self._build_sensor_support_findings(context.repo_path)
+            return self._build_sensor_support_findings(context.repo_path, corpus)
         if check_type == _SELF_RESOLVE_RESOLVER_OWNED_CHECK:
-            return self._build_self_resolve_findings(context.repo_path)
+            return self._build_self_resolve_findings(context.repo_path, corpus)
         if check_type == _ACTION_SUPPORT_CHECK:
-            return self._build_action_support_findings(context.repo_path)
+            return self._build_action_support_findings(context.repo_path, corpus)
         if check_type == _EXEMPTION_DEBT_CHECK:
-            return self._build_exemption_debt_findings(context.repo_path)
+            return self._build_exemption_debt_findings(context.repo_path, corpus)
         return [
             AuditFinding(
                 check_id="taxonomy_gate.unknown_check_type",
@@ -193,7 +196,9 @@ class TaxonomyGateEngine(BaseEngine):
             )
         ]
 
-    def _build_decorator_backing_findings(self, repo_root: Path) -> list[AuditFinding]:
+    def _build_decorator_backing_findings(
+        self, repo_root: Path, corpus: CorpusSnapshot
+    ) -> list[AuditFinding]:
         """Compute YAML-vs-decoration set difference; one finding per phantom."""
         try:
             capabilities = load_operational_capabilities(repo_root)
@@ -214,7 +219,7 @@ class TaxonomyGateEngine(BaseEngine):
             ]
 
         yaml_ids = {cap.id for cap in capabilities}
-        decoration_ids = _collect_atomic_action_ids(repo_root / "src")
+        decoration_ids = _collect_atomic_action_ids(repo_root / "src", corpus)
         phantoms = sorted(yaml_ids - decoration_ids)
 
         return [
@@ -237,7 +242,9 @@ class TaxonomyGateEngine(BaseEngine):
             for cap_id in phantoms
         ]
 
-    def _build_sensor_support_findings(self, repo_root: Path) -> list[AuditFinding]:
+    def _build_sensor_support_findings(
+        self, repo_root: Path, corpus: CorpusSnapshot
+    ) -> list[AuditFinding]:
         """Compute sensor↔artifact_type set difference; one finding per asymmetry.
 
         Per ADR-091 D4: the introspected set ``{(artifact_type_id, sensor_id)}``
@@ -276,7 +283,9 @@ class TaxonomyGateEngine(BaseEngine):
                 if isinstance(sensor_id, str) and sensor_id.strip():
                     authored.add((ref.id, sensor_id))
 
-        introspected = _collect_sensor_artifact_pairs(repo_root / _WORKERS_REL_DIR)
+        introspected = _collect_sensor_artifact_pairs(
+            repo_root / _WORKERS_REL_DIR, corpus
+        )
 
         findings: list[AuditFinding] = []
         for artifact_type_id, sensor_id in sorted(introspected - authored):
@@ -325,7 +334,9 @@ class TaxonomyGateEngine(BaseEngine):
             )
         return findings
 
-    def _build_action_support_findings(self, repo_root: Path) -> list[AuditFinding]:
+    def _build_action_support_findings(
+        self, repo_root: Path, corpus: CorpusSnapshot
+    ) -> list[AuditFinding]:
         """Compute action↔artifact_type set difference; one finding per asymmetry.
 
         Per ADR-092-A (triggered by ADR-121 T5b): the introspected set
@@ -365,7 +376,7 @@ class TaxonomyGateEngine(BaseEngine):
         action_risk_path = (
             repo_root / ".intent" / "enforcement" / "config" / "action_risk.yaml"
         )
-        introspected = _collect_action_artifact_pairs(action_risk_path)
+        introspected = _collect_action_artifact_pairs(action_risk_path, corpus)
 
         findings: list[AuditFinding] = []
         for artifact_type_id, action_id in sorted(introspected - authored):
@@ -412,7 +423,9 @@ class TaxonomyGateEngine(BaseEngine):
             )
         return findings
 
-    def _build_self_resolve_findings(self, repo_root: Path) -> list[AuditFinding]:
+    def _build_self_resolve_findings(
+        self, repo_root: Path, corpus: CorpusSnapshot
+    ) -> list[AuditFinding]:
         """Compute the ADR-091 D2 Revision B (d) resolver-ownership findings.
 
         Every distinct subject prefix appearing on a
@@ -435,15 +448,16 @@ class TaxonomyGateEngine(BaseEngine):
 
         Emits one AuditFinding per uncovered prefix.
         """
-        site_map = _collect_self_resolve_call_sites(repo_root / "src")
+        site_map = _collect_self_resolve_call_sites(repo_root / "src", corpus)
         tests_root = repo_root / _TESTS_REL_DIR
 
         findings: list[AuditFinding] = []
         for prefix, emitting_modules in sorted(site_map.items()):
             has_docstring = any(
-                _module_docstring_has_canonical_block(mod) for mod in emitting_modules
+                _module_docstring_has_canonical_block(mod, corpus)
+                for mod in emitting_modules
             )
-            has_test = _prefix_appears_in_tests(prefix, tests_root)
+            has_test = _prefix_appears_in_tests(prefix, tests_root, corpus)
             if has_docstring and has_test:
                 continue
             rep_module = sorted(emitting_modules)[0]
@@ -486,7 +500,9 @@ class TaxonomyGateEngine(BaseEngine):
         return findings
 
     # ID: 5f8e6b21-3c4a-4e97-8f0d-9a6c2b7e4d15
-    def _build_exemption_debt_findings(self, repo_root: Path) -> list[AuditFinding]:
+    def _build_exemption_debt_findings(
+        self, repo_root: Path, corpus: CorpusSnapshot
+    ) -> list[AuditFinding]:
         """Compute ADR-152 structural and temporal findings for every
         ``governed_exclusions`` entry across ``.intent/enforcement/mappings/**``.
 
@@ -517,7 +533,7 @@ class TaxonomyGateEngine(BaseEngine):
         pass.
         """
         schema_path = repo_root / _ENFORCEMENT_MAPPING_SCHEMA_REL_PATH
-        item_schema = _load_governed_exclusions_item_schema(schema_path)
+        item_schema = _load_governed_exclusions_item_schema(schema_path, corpus)
         if item_schema is None:
             return [
                 AuditFinding(
@@ -538,7 +554,7 @@ class TaxonomyGateEngine(BaseEngine):
         findings: list[AuditFinding] = []
 
         for yaml_path, rule_id, entry, index in _iter_governed_exclusions_entries(
-            mappings_dir
+            mappings_dir, corpus
         ):
             try:
                 rel_path = yaml_path.relative_to(repo_root)
@@ -645,7 +661,9 @@ class TaxonomyGateEngine(BaseEngine):
         return findings
 
 
-def _collect_sensor_artifact_pairs(workers_dir: Path) -> set[tuple[str, str]]:
+def _collect_sensor_artifact_pairs(
+    workers_dir: Path, corpus: CorpusSnapshot
+) -> set[tuple[str, str]]:
     """Walk .intent/workers/*.yaml; emit (artifact_type_id, sensor_id) pairs.
 
     Sensor id is the YAML filename stem (e.g. ``audit_sensor_purity``) —
@@ -654,11 +672,9 @@ def _collect_sensor_artifact_pairs(workers_dir: Path) -> set[tuple[str, str]]:
     contribute nothing (Phase 1 transition allowance for #570).
     """
     pairs: set[tuple[str, str]] = set()
-    if not workers_dir.is_dir():
-        return pairs
-    for yaml_path in sorted(workers_dir.glob("*.yaml")):
+    for yaml_path in corpus.files(workers_dir, ".yaml", recursive=False):
         try:
-            data = strict_yaml_processor.load_strict(yaml_path)
+            data = corpus.parse_yaml(yaml_path)
         except Exception as exc:
             logger.debug("taxonomy_gate: cannot load %s: %s", yaml_path, exc)
             continue
@@ -678,7 +694,9 @@ def _collect_sensor_artifact_pairs(workers_dir: Path) -> set[tuple[str, str]]:
     return pairs
 
 
-def _collect_action_artifact_pairs(action_risk_path: Path) -> set[tuple[str, str]]:
+def _collect_action_artifact_pairs(
+    action_risk_path: Path, corpus: CorpusSnapshot
+) -> set[tuple[str, str]]:
     """Read action_risk.yaml; emit (artifact_type_id, action_id) pairs.
 
     Only entries that carry a non-empty ``artifact_types`` list contribute.
@@ -689,7 +707,7 @@ def _collect_action_artifact_pairs(action_risk_path: Path) -> set[tuple[str, str
     if not action_risk_path.is_file():
         return pairs
     try:
-        data = strict_yaml_processor.load_strict(action_risk_path)
+        data = corpus.parse_yaml(action_risk_path)
     except Exception as exc:
         logger.debug("taxonomy_gate: cannot load %s: %s", action_risk_path, exc)
         return pairs
@@ -707,7 +725,7 @@ def _collect_action_artifact_pairs(action_risk_path: Path) -> set[tuple[str, str
     return pairs
 
 
-def _collect_atomic_action_ids(src_root: Path) -> set[str]:
+def _collect_atomic_action_ids(src_root: Path, corpus: CorpusSnapshot) -> set[str]:
     """AST-walk ``src/`` collecting action_id string-literal values from
     every ``@atomic_action(action_id=...)`` decoration.
 
@@ -718,17 +736,10 @@ def _collect_atomic_action_ids(src_root: Path) -> set[str]:
     finding's resolution prompt clarifies the path forward.
     """
     found: set[str] = set()
-    if not src_root.is_dir():
-        return found
-    for py in src_root.rglob("*.py"):
+    for py in corpus.files(src_root, ".py"):
         try:
-            source = py.read_text(encoding="utf-8")
-        except OSError as exc:
-            logger.debug("taxonomy_gate: cannot read %s: %s", py, exc)
-            continue
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as exc:
+            tree = corpus.tree(py)
+        except (OSError, UnicodeDecodeError, SyntaxError) as exc:
             logger.debug("taxonomy_gate: cannot parse %s: %s", py, exc)
             continue
         for node in ast.walk(tree):
@@ -770,7 +781,9 @@ def _extract_action_id(decorator: ast.expr) -> str | None:
     return None
 
 
-def _collect_self_resolve_call_sites(src_root: Path) -> dict[str, set[Path]]:
+def _collect_self_resolve_call_sites(
+    src_root: Path, corpus: CorpusSnapshot
+) -> dict[str, set[Path]]:
     """AST-walk src/ collecting post_finding(..., resolution_mechanism='self_resolve')
     call sites; for each, trace the subject prefix and map it to the emitting
     module path.
@@ -791,17 +804,10 @@ def _collect_self_resolve_call_sites(src_root: Path) -> dict[str, set[Path]]:
     can promote untraceable sites to their own finding class.
     """
     site_map: dict[str, set[Path]] = {}
-    if not src_root.is_dir():
-        return site_map
-    for py in src_root.rglob("*.py"):
-        try:
-            source = py.read_text(encoding="utf-8")
-        except OSError as exc:
-            logger.debug("taxonomy_gate: cannot read %s: %s", py, exc)
-            continue
+    for py in corpus.files(src_root, ".py"):
         try:
-            tree = ast.parse(source)
-        except SyntaxError as exc:
+            tree = corpus.tree(py)
+        except (OSError, UnicodeDecodeError, SyntaxError) as exc:
             logger.debug("taxonomy_gate: cannot parse %s: %s", py, exc)
             continue
 
@@ -969,19 +975,17 @@ def _prefix_from_expr(expr: ast.expr, module_constants: dict[str, str]) -> str |
     return None
 
 
-def _module_docstring_has_canonical_block(module_path: Path) -> bool:
+def _module_docstring_has_canonical_block(
+    module_path: Path, corpus: CorpusSnapshot
+) -> bool:
     """True iff ``module_path``'s top-level docstring (the first string
     literal at the module body's head) contains the canonical
     ``ADR-091 D2 Revision B resolution classification:`` block. Read-only;
     parse failures and IO errors return False (treated as missing).
     """
     try:
-        source = module_path.read_text(encoding="utf-8")
-    except OSError:
-        return False
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+        tree = corpus.tree(module_path)
+    except (OSError, UnicodeDecodeError, SyntaxError):
         return False
     docstring = ast.get_docstring(tree)
     if docstring is None:
@@ -989,7 +993,9 @@ def _module_docstring_has_canonical_block(module_path: Path) -> bool:
     return _RESOLVER_DOCSTRING_BLOCK in docstring
 
 
-def _prefix_appears_in_tests(prefix: str, tests_root: Path) -> bool:
+def _prefix_appears_in_tests(
+    prefix: str, tests_root: Path, corpus: CorpusSnapshot
+) -> bool:
     """True iff ``prefix`` appears anywhere in any ``*.py`` source file
     under ``tests_root``. Generous signal per Revision B (h)'s scope-
     decision tolerance: a test referencing the prefix as a string (in an
@@ -1001,20 +1007,16 @@ def _prefix_appears_in_tests(prefix: str, tests_root: Path) -> bool:
     positive on legitimate posting-only tests like
     ``tests/will/workers/test_resolution_mechanism_classification.py``,
     which is the exemption shape Revision B (h) explicitly permits.
+
+    The test tree is read once per audit and answered from the snapshot's
+    token index, not re-read for every prefix.
     """
-    if not tests_root.is_dir():
-        return False
-    for py in tests_root.rglob("*.py"):
-        try:
-            source = py.read_text(encoding="utf-8")
-        except OSError:
-            continue
-        if prefix in source:
-            return True
-    return False
+    return bool(corpus.files_containing(tests_root, ".py", prefix))
 
 
-def _load_governed_exclusions_item_schema(schema_path: Path) -> dict[str, Any] | None:
+def _load_governed_exclusions_item_schema(
+    schema_path: Path, corpus: CorpusSnapshot
+) -> dict[str, Any] | None:
     """Load enforcement_mapping.schema.json and return the
     governed_exclusions.items sub-schema — ADR-152 D4 validates each
     governed_exclusions entry against this sub-schema specifically, not
@@ -1027,8 +1029,8 @@ def _load_governed_exclusions_item_schema(schema_path: Path) -> dict[str, Any] |
     if not schema_path.is_file():
         return None
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        schema = corpus.parse_json(schema_path)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
         return None
     try:
         return schema["properties"]["governed_exclusions"]["items"]
@@ -1037,7 +1039,7 @@ def _load_governed_exclusions_item_schema(schema_path: Path) -> dict[str, Any] |
 
 
 def _iter_governed_exclusions_entries(
-    mappings_dir: Path,
+    mappings_dir: Path, corpus: CorpusSnapshot
 ) -> Iterator[tuple[Path, str, dict[str, Any], int]]:
     """Walk every .intent/enforcement/mappings/**/*.yaml file; yield
     (yaml_path, rule_id, entry, index) for every governed_exclusions item
@@ -1046,11 +1048,9 @@ def _iter_governed_exclusions_entries(
     Fail-soft per file — a single unparseable mapping file must not crash
     the audit cycle (mirrors _collect_sensor_artifact_pairs's contract).
     """
-    if not mappings_dir.is_dir():
-        return
-    for yaml_path in sorted(mappings_dir.rglob("*.yaml")):
+    for yaml_path in corpus.files(mappings_dir, ".yaml"):
         try:
-            data = strict_yaml_processor.load_strict(yaml_path)
+            data = corpus.parse_yaml(yaml_path)
         except Exception as exc:
             logger.debug("taxonomy_gate: cannot load %s: %s", yaml_path, exc)
             continue
@@ -182,10 +182,14 @@ class QdrantService:
         with_vectors: bool = False,
         page_size: int = 10_000,
         collection_name: str | None = None,
+        scroll_filter: qm.Filter | None = None,
     ) -> list[qm.Record]:
         """
         Scroll through ALL points in the collection with proper pagination.
         The ONLY method allowed to call client.scroll in a loop.
+
+        ``scroll_filter`` narrows the scroll server-side (e.g. to the points
+        of a few files) instead of paging the whole collection.
         """
         target_collection = collection_name or self.collection_name
         all_points: list[qm.Record] = []
@@ -199,6 +203,7 @@ class QdrantService:
                     offset=offset,
                     with_payload=with_payload,
                     with_vectors=with_vectors,
+                    scroll_filter=scroll_filter,
                 )
 
                 if not points:
@@ -10,8 +10,10 @@ Build contract:
 from __future__ import annotations
 
 import ast
+import asyncio
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from shared.config import settings
@@ -19,6 +21,12 @@ from shared.infrastructure.intent.intent_repository import get_intent_repository
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.infrastructure.knowledge.knowledge_service import KnowledgeService
 from shared.logger import getLogger
+from shared.utils.ast_cache import (
+    AST_CACHE_MAX_ENTRIES,
+    file_content_key,
+    get_cached_ast,
+    store_ast,
+)
 
 from .models import ContextBuildRequest
 from .serializers import ContextSerializer
@@ -37,6 +45,11 @@ CORE_ROLE = "algorithm"  # ADR-095 D3
 
 _CFG = load_operational_config().context
 
+# ScopeTracker output per on-disk file, keyed on the same content identity
+# (mtime_ns, size) as shared.utils.ast_cache: an unscoped build over the
+# whole graph re-extracts only files that changed since the last build.
+_SYMBOL_CACHE: dict[Path, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+
 
 LAYER_POLICY_IDS: dict[str, list[str]] = {
     "mind": ["layer_separation", "privileged_boundaries"],
@@ -172,13 +185,19 @@ class ContextBuilder:
         policy = self._build_policy_context(request)
         constraints = self._build_constraints(request, constitution, policy)
 
-        evidence: list[dict[str, Any]] = []
+        # Providers are independent: run them concurrently and concatenate
+        # in the fixed ast → vectors → db order so packets stay deterministic.
+        gatherers = []
         if "ast" in selected_providers:
-            evidence.extend(await self._gather_ast_evidence(request, graph))
+            gatherers.append(self._gather_ast_evidence(request, graph))
         if "vectors" in selected_providers:
-            evidence.extend(await self._gather_vector_evidence(request))
+            gatherers.append(self._gather_vector_evidence(request))
         if "db" in selected_providers:
-            evidence.extend(await self._gather_db_evidence(request))
+            gatherers.append(self._gather_db_evidence(request))
+
+        evidence: list[dict[str, Any]] = []
+        for items in await asyncio.gather(*gatherers):
+            evidence.extend(items)
 
         evidence = self._finalize_evidence(evidence, request)
 
@@ -453,19 +472,14 @@ class ContextBuilder:
         candidate_files = self._resolve_candidate_files(request, graph)
         requested_symbols = set(request.target_symbols)
 
-        for rel_path in sorted(candidate_files):
-            source = self._read_source(rel_path)
-            if not source:
-                continue
-
-            tracker = ScopeTracker(source)
-            try:
-                tracker.visit(ast.parse(source))
-            except Exception as e:
-                logger.debug("AST parse failed for %s: %s", rel_path, e)
-                continue
+        # Parsing is CPU-bound: keep it off the event loop so the vector and
+        # DB providers make progress meanwhile.
+        extracted = await asyncio.to_thread(
+            self._extract_symbols_for_files, sorted(candidate_files)
+        )
 
-            for symbol in tracker.symbols:
+        for rel_path, symbols in extracted:
+            for symbol in symbols:
                 if requested_symbols and not self._symbol_matches(
                     symbol,
                     requested_symbols,
@@ -509,16 +523,32 @@ class ContextBuilder:
             ("core_specs", 3),
         ]
 
-        seen_ids: set[str] = set()
+        # Embed the goal once and search the collections concurrently; the
+        # vector comes from the shared query-embedding cache when warm.
+        try:
+            goal_vector = await self.vectors.embed_query(request.goal)
+        except Exception as e:
+            logger.warning("Goal embedding failed: %s", e)
+            return evidence
+        if not goal_vector:
+            return evidence
 
-        for collection, top_k in collections:
-            try:
-                results = await self.vectors.search_similar(
-                    request.goal, top_k=top_k, collection=collection
+        outcomes = await asyncio.gather(
+            *(
+                self.vectors.search_by_embedding(
+                    goal_vector, top_k=top_k, collection=collection
                 )
-            except Exception as e:
+                for collection, top_k in collections
+            ),
+            return_exceptions=True,
+        )
+
+        seen_ids: set[str] = set()
+
+        for (collection, _), results in zip(collections, outcomes):
+            if isinstance(results, BaseException):
                 logger.warning(
-                    "Vector search failed for collection %s: %s", collection, e
+                    "Vector search failed for collection %s: %s", collection, results
                 )
                 continue
 
@@ -613,6 +643,78 @@ class ContextBuilder:
 
         return files
 
+    def _extract_symbols_for_files(
+        self, rel_paths: list[str]
+    ) -> list[tuple[str, list[dict[str, Any]]]]:
+        """Extract ScopeTracker symbols for each file, skipping unparseable ones.
+
+        On-disk files go through the content-identity caches (symbols here,
+        trees in shared.utils.ast_cache, shared with AuditorContext), so an
+        unchanged file is never re-parsed. Files the workspace overlays with
+        in-flight content are parsed fresh every time.
+        """
+        crate: set[str] = set()
+        root: Path | None = settings.REPO_PATH
+        if self.workspace is not None:
+            get_crate = getattr(self.workspace, "get_crate_content", None)
+            repo_root = getattr(self.workspace, "repo_root", None)
+            if get_crate is None or repo_root is None:
+                root = None
+            else:
+                crate = set(get_crate())
+                root = Path(repo_root)
+
+        extracted: list[tuple[str, list[dict[str, Any]]]] = []
+        for rel_path in rel_paths:
+            if root is not None and rel_path not in crate:
+                symbols = self._cached_file_symbols(root / rel_path)
+            else:
+                symbols = self._parse_symbols(rel_path, self._read_source(rel_path))
+            if symbols is not None:
+                extracted.append((rel_path, symbols))
+        return extracted
+
+    def _cached_file_symbols(self, abs_path: Path) -> list[dict[str, Any]] | None:
+        content_key = file_content_key(abs_path)
+        if content_key is None:
+            return None
+        cached = _SYMBOL_CACHE.get(abs_path)
+        if cached is not None and cached[0] == content_key:
+            return cached[1]
+
+        try:
+            source = abs_path.read_text(encoding="utf-8")
+            tree = get_cached_ast(abs_path, content_key)
+            if tree is None:
+                tree = ast.parse(source, filename=str(abs_path))
+                store_ast(abs_path, content_key, tree)
+            tracker = ScopeTracker(source)
+            tracker.visit(tree)
+        except Exception as e:
+            logger.debug("AST parse failed for %s: %s", abs_path, e)
+            return None
+
+        if (
+            abs_path not in _SYMBOL_CACHE
+            and len(_SYMBOL_CACHE) >= AST_CACHE_MAX_ENTRIES
+        ):
+            _SYMBOL_CACHE.pop(next(iter(_SYMBOL_CACHE)), None)
+        _SYMBOL_CACHE[abs_path] = (content_key, tracker.symbols)
+        return tracker.symbols
+
+    def _parse_symbols(
+        self, rel_path: str, source: str | None
+    ) -> list[dict[str, Any]] | None:
+        if not source:
+            return None
+        tracker = ScopeTracker(source)
+        try:
+            tracker.visit(ast.parse(source))
+        except Exception as e:
+            logger.debug("AST parse failed for %s: %s", rel_path, e)
+            return None
+        return tracker.symbols
+
     def _read_source(self, rel_path: str) -> str | None:
         try:
             if self.workspace and self.workspace.exists(rel_path):
@@ -1,17 +1,45 @@
 # src/shared/infrastructure/context/cache.py
 
-"""ContextCache - hash-based ContextPacket caching."""
+"""ContextCache - content-aware, indexed ContextPacket caching.
+
+Layout under ``cache_dir``:
+- ``<cache_key>.msgpack`` — the packet, msgpack-encoded (compact and far
+  faster to load/dump than YAML for large evidence lists).
+- ``index.json`` — per-entry size, timestamps and dependency fingerprints,
+  plus persistent hit/miss/eviction/invalidation counters.
+
+A packet is served only while every file its evidence quotes is unchanged:
+each dependency is recorded as (mtime_ns, size, sha256) and re-checked on
+get() — stat first, hashing only when the stat differs. The cache is
+bounded by ``context.cache_max_mb`` with least-recently-used eviction;
+``context.cache_ttl_hours`` still caps a packet's age.
+
+Several processes (the daemon, core-admin) share one cache directory, so
+the index is never written blind: every save re-reads index.json and merges
+this instance's changes (entries stored, touched or dropped, counter deltas)
+into it, and entries whose packet file is gone are pruned. Plain hits and
+misses only update memory; they are saved with the next store or drop, at
+most once per _INDEX_SAVE_INTERVAL otherwise, or on flush().
+
+Writes go through the injected FileHandler (IntentGuard); without one the
+cache is read-only, matching ContextSerializer.to_yaml.
+"""
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import hashlib
+import json
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import msgpack
+
+from shared.config import settings
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.logger import getLogger
 
-from .serializers import ContextSerializer
+from .serializers import _to_repo_relative_path
 
 
 if TYPE_CHECKING:
@@ -22,6 +50,22 @@ logger = getLogger(__name__)
 
 _CFG = load_operational_config().context
 
+_INDEX_NAME = "index.json"
+_PACKET_SUFFIX = ".msgpack"
+_STAT_NAMES = ("hits", "misses", "evictions", "invalidations")
+# Seconds between index saves caused by lookups alone.
+_INDEX_SAVE_INTERVAL = 30.0
+
+
+def _fingerprint(path: Path) -> list[Any] | None:
+    """[mtime_ns, size, sha256] for a dependency, or None if it is missing."""
+    try:
+        stat = path.stat()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, digest]
+
 
 # ID: 53829663-9f4a-40ff-b425-837b872e5c45
 class ContextCache:
@@ -31,41 +75,91 @@ class ContextCache:
         self,
         cache_dir: str = "work/context_cache",
         file_handler: FileHandler | None = None,
+        repo_root: Path | None = None,
     ) -> None:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_hours = _CFG.cache_ttl_hours
+        self.max_bytes = _CFG.cache_max_mb * 1024 * 1024
+        self.repo_root = Path(repo_root or settings.REPO_PATH)
         self._file_handler = file_handler
+        self._index = self._load_index()
+        # Changes not yet merged into index.json.
+        self._touched: set[str] = set()
+        self._dropped: set[str] = set()
+        self._cleared = False
+        self._pending_stats = dict.fromkeys(_STAT_NAMES, 0)
+        self._last_save = 0.0
 
     # ID: c2612fcd-1454-4d75-9061-ad89275709ae
     def get(self, cache_key: str) -> dict[str, Any] | None:
-        cache_file = self.cache_dir / f"{cache_key}.yaml"
-        if not cache_file.exists():
+        entry = self._index["entries"].get(cache_key)
+        cache_file = self._packet_path(cache_key)
+        if entry is None or not cache_file.exists():
             logger.debug("Cache miss: %s", cache_key[:8])
+            self._count("misses")
+            self._save_index_batched()
             return None
 
-        age_hours = self._get_age_hours(cache_file)
+        age_hours = (time.time() - entry["created"]) / 3600
         if age_hours > self.ttl_hours:
             logger.debug("Cache expired: %s (%sh old)", cache_key[:8], age_hours)
-            cache_file.unlink()
+            self._drop(cache_key, "invalidations")
+            self._count("misses")
+            self._save_index()
+            return None
+
+        if not self._dependencies_current(entry):
+            logger.debug("Cache stale (sources changed): %s", cache_key[:8])
+            self._drop(cache_key, "invalidations")
+            self._count("misses")
+            self._save_index()
             return None
 
         try:
-            packet = ContextSerializer.from_yaml(str(cache_file))
-            logger.debug("Cache hit: %s", cache_key[:8])
-            return packet
+            packet = msgpack.unpackb(cache_file.read_bytes(), raw=False)
         except Exception as e:
             logger.error("Failed to load cache: %s", e)
+            self._drop(cache_key, "invalidations")
+            self._count("misses")
+            self._save_index()
             return None
 
+        entry["last_access"] = time.time()
+        self._touched.add(cache_key)
+        self._count("hits")
+        self._save_index_batched()
+        logger.debug("Cache hit: %s", cache_key[:8])
+        return packet
+
     # ID: 7943de7d-89dc-423b-9cf5-4dfe0e6592a4
     def set(self, cache_key: str, packet: dict[str, Any]) -> None:
-        cache_file = self.cache_dir / f"{cache_key}.yaml"
+        if self._file_handler is None:
+            logger.debug("Cache write skipped: no FileHandler for %s", cache_key[:8])
+            return
         try:
-            ContextSerializer.to_yaml(packet, str(cache_file), self._file_handler)
-            logger.debug("Cached packet: %s", cache_key[:8])
+            data = msgpack.packb(packet, default=str, use_bin_type=True)
+            self._file_handler.write_runtime_bytes(
+                self._rel(self._packet_path(cache_key)), data
+            )
         except Exception as e:
             logger.error("Failed to cache packet: %s", e)
+            return
+
+        # Budget the merged view, so packets other processes stored count.
+        self._index = self._merged_index()
+        now = time.time()
+        self._touched.add(cache_key)
+        self._dropped.discard(cache_key)
+        self._index["entries"][cache_key] = {
+            "size": len(data),
+            "created": now,
+            "last_access": now,
+            "deps": self._collect_dependencies(packet),
+        }
+        self._evict_to_budget(keep=cache_key)
+        self._save_index()
+        logger.debug("Cached packet: %s", cache_key[:8])
 
     # ID: 90fa3e32-096c-431e-8c5f-e49df45ce2c7
     def put(self, cache_key: str, packet: dict[str, Any]) -> None:
@@ -74,37 +168,200 @@ class ContextCache:
 
     # ID: be37327c-36a7-41a6-b456-545b4db732ce
     def invalidate(self, cache_key: str) -> None:
-        cache_file = self.cache_dir / f"{cache_key}.yaml"
-        if cache_file.exists():
-            cache_file.unlink()
+        if cache_key in self._index["entries"] or self._packet_path(cache_key).exists():
+            self._drop(cache_key, "invalidations")
+            self._save_index()
             logger.debug("Invalidated cache: %s", cache_key[:8])
 
     # ID: 1c41c3f4-a188-4544-af77-12dc0c593f74
     def clear_expired(self) -> int:
-        removed = 0
-        for cache_file in self.cache_dir.glob("*.yaml"):
-            age_hours = self._get_age_hours(cache_file)
-            if age_hours > self.ttl_hours:
-                cache_file.unlink()
-                removed += 1
-                logger.debug("Removed expired cache: %s", cache_file.stem)
+        cutoff = time.time() - self.ttl_hours * 3600
+        expired = [
+            key
+            for key, entry in self._index["entries"].items()
+            if entry["created"] < cutoff
+        ]
+        for key in expired:
+            self._drop(key, "invalidations")
+            logger.debug("Removed expired cache: %s", key)
+        # Packets from the YAML backend are never read again.
+        removed = len(expired) + self._remove_files("*.yaml")
 
         if removed > 0:
+            self._save_index()
             logger.info("Cleared %s expired cache entries", removed)
         return removed
 
     # ID: f5553609-0d49-41fd-aec4-eb3175b0b08e
     def clear_all(self) -> int:
-        removed = 0
-        for cache_file in self.cache_dir.glob("*.yaml"):
-            cache_file.unlink()
-            removed += 1
+        removed = self._remove_files(f"*{_PACKET_SUFFIX}") + self._remove_files(
+            "*.yaml"
+        )
+        self._index["entries"].clear()
+        self._touched.clear()
+        self._dropped.clear()
+        self._cleared = True
+        self._save_index()
 
         logger.info("Cleared all %s cache entries", removed)
         return removed
 
-    def _get_age_hours(self, file_path: Path) -> float:
-        mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC)
-        now = datetime.now(UTC)
-        age = now - mtime
-        return age.total_seconds() / 3600
+    # ID: 5d2b8e61-3f4a-4c97-a0e8-b6c1f9d3a724
+    def flush(self) -> None:
+        """Save lookups (hit/miss counters, recency) not yet in index.json."""
+        self._save_index()
+
+    # ID: 0b6e4d92-7c1a-4f35-a8e3-d2f9b5c1e746
+    def entries(self) -> list[dict[str, Any]]:
+        """Indexed entries, most recently used first."""
+        rows = [
+            {"key": key, "dependencies": len(entry["deps"]), **entry}
+            for key, entry in self._index["entries"].items()
+        ]
+        return sorted(rows, key=lambda row: row["last_access"], reverse=True)
+
+    # ID: 4a8c2f17-9e3b-4d60-b1f5-c7e0a3d6b928
+    def stats(self) -> dict[str, Any]:
+        """Entry/size totals and lifetime hit/miss/eviction counters."""
+        counters = self._index["stats"]
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "entries": len(self._index["entries"]),
+            "total_bytes": sum(e["size"] for e in self._index["entries"].values()),
+            "max_bytes": self.max_bytes,
+            "ttl_hours": self.ttl_hours,
+            **counters,
+            "hit_rate": (counters["hits"] / lookups) if lookups else 0.0,
+        }
+
+    def _collect_dependencies(self, packet: dict[str, Any]) -> dict[str, Any]:
+        """Fingerprint every repo file the packet's evidence quotes."""
+        paths = {
+            str(item.get("path"))
+            for item in packet.get("evidence", []) or []
+            if isinstance(item, dict) and item.get("path")
+        }
+        return {rel: _fingerprint(self.repo_root / rel) for rel in sorted(paths)}
+
+    def _dependencies_current(self, entry: dict[str, Any]) -> bool:
+        for rel, recorded in entry["deps"].items():
+            path = self.repo_root / rel
+            try:
+                stat = path.stat()
+            except OSError:
+                if recorded is None:
+                    continue
+                return False
+            if recorded is None:
+                return False
+            if [stat.st_mtime_ns, stat.st_size] == recorded[:2]:
+                continue
+            current = _fingerprint(path)
+            if current is None or current[2] != recorded[2]:
+                return False
+            # Same bytes, new stat (e.g. touched): refresh the fast path.
+            entry["deps"][rel] = current
+        return True
+
+    def _evict_to_budget(self, keep: str) -> None:
+        entries = self._index["entries"]
+        total = sum(e["size"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries[key]["size"]
+            self._drop(key, "evictions")
+
+    def _drop(self, cache_key: str, reason: str) -> None:
+        self._index["entries"].pop(cache_key, None)
+        self._touched.discard(cache_key)
+        self._dropped.add(cache_key)
+        self._count(reason)
+        self._remove_path(self._packet_path(cache_key))
+
+    def _remove_files(self, pattern: str) -> int:
+        removed = 0
+        for path in self.cache_dir.glob(pattern):
+            self._remove_path(path)
+            removed += 1
+        return removed
+
+    def _remove_path(self, path: Path) -> None:
+        try:
+            if self._file_handler is not None:
+                self._file_handler.remove_file(self._rel(path))
+            else:
+                path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug("Failed to remove cache file %s: %s", path.name, e)
+
+    def _count(self, name: str) -> None:
+        self._index["stats"][name] += 1
+        self._pending_stats[name] += 1
+
+    def _load_index(self) -> dict[str, Any]:
+        index: dict[str, Any] = {
+            "entries": {},
+            "stats": dict.fromkeys(_STAT_NAMES, 0),
+        }
+        path = self.cache_dir / _INDEX_NAME
+        if not path.exists():
+            return index
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            index["entries"] = {
+                key: entry
+                for key, entry in dict(raw.get("entries", {})).items()
+                if self._packet_path(key).exists()
+            }
+            index["stats"].update(
+                {k: int(v) for k, v in raw.get("stats", {}).items() if k in _STAT_NAMES}
+            )
+        except Exception as e:
+            logger.warning("Context cache index unreadable, starting empty: %s", e)
+        return index
+
+    def _merged_index(self) -> dict[str, Any]:
+        """index.json as on disk now, with this instance's changes applied."""
+        index = self._load_index()
+        if self._cleared:
+            index["entries"].clear()
+        for key in self._dropped:
+            index["entries"].pop(key, None)
+        for key in self._touched:
+            entry = self._index["entries"].get(key)
+            if entry is not None:
+                index["entries"][key] = entry
+        for name, delta in self._pending_stats.items():
+            index["stats"][name] += delta
+        return index
+
+    def _save_index_batched(self) -> None:
+        if time.monotonic() - self._last_save >= _INDEX_SAVE_INTERVAL:
+            self._save_index()
+
+    def _save_index(self) -> None:
+        if self._file_handler is None:
+            return
+        merged = self._merged_index()
+        try:
+            self._file_handler.write_runtime_json(
+                self._rel(self.cache_dir / _INDEX_NAME), merged
+            )
+        except Exception as e:
+            logger.debug("Failed to write context cache index: %s", e)
+            return
+        self._index = merged
+        self._touched.clear()
+        self._dropped.clear()
+        self._cleared = False
+        self._pending_stats = dict.fromkeys(_STAT_NAMES, 0)
+        self._last_save = time.monotonic()
+
+    def _packet_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}{_PACKET_SUFFIX}"
+
+    def _rel(self, path: Path) -> str:
+        return _to_repo_relative_path(str(path))
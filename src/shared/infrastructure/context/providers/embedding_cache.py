@@ -0,0 +1,103 @@
+# src/shared/infrastructure/context/providers/embedding_cache.py
+
+"""
+QueryEmbeddingCache - process-wide memo of query embeddings.
+
+Context builds embed the same goal text for every collection they search,
+and consecutive builds in a workflow often repeat goals. Entries are keyed
+by (embed model revision, normalized text), so bumping
+``embed_model.revision`` invalidates every cached vector without a flush.
+Bounded by size (LRU eviction) and age (TTL); hit/miss counters are exposed
+through stats().
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from shared.infrastructure.intent.operational_config import load_operational_config
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace runs; case is kept (code embeddings are case-aware)."""
+    return " ".join(text.split())
+
+
+# ID: 4c7e2a91-6b3d-4f58-9a0e-1d8b5f3c7e26
+class QueryEmbeddingCache:
+    """LRU + TTL map from (revision, normalized text) to an embedding vector."""
+
+    def __init__(self, max_entries: int, ttl_sec: float) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_sec = ttl_sec
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ID: 8a1f5d37-2c9e-4b60-b7d4-e3f6a0c2918b
+    def get(self, revision: str, text: str) -> list[float] | None:
+        """Return the cached vector, refreshing its LRU position; None on miss."""
+        key = (revision, _normalize(text))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_sec:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    # ID: 2e9b6c14-7f0a-4d83-a5e1-c4b8d7f3a602
+    def put(self, revision: str, text: str, vector: list[float]) -> None:
+        """Store a vector, evicting the least recently used entry when full."""
+        key = (revision, _normalize(text))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ID: 6d3a8f52-1b7c-4e09-8c2f-a5e9d1b4f370
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # ID: 9f4b2e68-3a1d-4c75-b0e8-7c6d2a5f1e93
+    def stats(self) -> dict[str, float]:
+        """Entry count, hit/miss counters and hit rate since the last clear()."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+_CACHE: QueryEmbeddingCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+# ID: 1b8e4d73-5c2a-4f96-a3d0-e7f1c9b6a548
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the process-wide cache, sized from operational_config.context."""
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                cfg = load_operational_config().context
+                _CACHE = QueryEmbeddingCache(
+                    max_entries=cfg.query_embedding_cache_size,
+                    ttl_sec=cfg.query_embedding_cache_ttl_sec,
+                )
+    return _CACHE
@@ -2,15 +2,21 @@
 
 """
 VectorProvider - semantic evidence retrieval via Qdrant.
+
+Query texts are embedded through embed_query(), which memoizes vectors in
+the process-wide QueryEmbeddingCache keyed by embed model revision.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+from shared.config import settings
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.logger import getLogger
 
+from .embedding_cache import get_query_embedding_cache
+
 
 logger = getLogger(__name__)
 
@@ -29,6 +35,35 @@ class VectorProvider:
         self.qdrant = qdrant_client
         self.cognitive_service = cognitive_service
 
+    # ID: 7b3e9d41-2a6c-4f18-b5e0-c8d4a1f6e273
+    async def embed_query(self, query: str) -> list[float] | None:
+        """Embed a query text, served from the shared memo cache when possible.
+
+        Raises whatever the cognitive service raises; returns None when it
+        yields no vector. Failed or empty results are not cached.
+        """
+        if not self.cognitive_service:
+            return None
+        revision = await self._embedding_revision()
+        cache = get_query_embedding_cache()
+        vector = cache.get(revision, query)
+        if vector is not None:
+            return vector
+        vector = await self.cognitive_service.get_embedding_for_code(query)
+        if vector:
+            vector = vector.tolist() if hasattr(vector, "tolist") else list(vector)
+            cache.put(revision, query, vector)
+        return vector or None
+
+    async def _embedding_revision(self) -> str:
+        getter = getattr(self.cognitive_service, "get_embedding_revision", None)
+        if getter is not None:
+            try:
+                return str(await getter())
+            except Exception as e:
+                logger.debug("Embedding revision lookup failed: %s", e)
+        return settings.EMBED_MODEL_REVISION
+
     # ID: 5c869ad3-729e-4279-b8b1-2d2cc8b21549
     async def search_similar(
         self,
@@ -44,7 +79,7 @@ class VectorProvider:
             return []
 
         try:
-            query_vector = await self.cognitive_service.get_embedding_for_code(query)
+            query_vector = await self.embed_query(query)
             if not query_vector:
                 logger.warning("Failed to generate embedding for query: %s", query)
                 return []
@@ -108,9 +143,7 @@ class VectorProvider:
             return []
 
         try:
-            anchor_vec = await self.cognitive_service.get_embedding_for_code(
-                symbol_name
-            )
+            anchor_vec = await self.embed_query(symbol_name)
             if not anchor_vec:
                 return []
         except Exception as e:
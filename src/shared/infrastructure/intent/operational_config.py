@@ -125,22 +125,54 @@ def _get_str_tuple(
 @dataclass(frozen=True)
 # ID: d077c23b-94b9-48eb-966c-92ade3d25d5c
 class LLMConfig:
+    """LLM call defaults and the providers' pooled HTTP transport.
+
+    http_* fields size the long-lived httpx.AsyncClient each AIProvider
+    keeps for its lifetime (one TCP/TLS connection pool per provider).
+    http2 is honoured only when the optional ``h2`` package is installed.
+
+    exchange_log_* fields drive the buffered core.llm_exchange_log writer:
+    rows are queued off the request path and flushed in one multi-row
+    insert once flush_rows accumulate or flush_interval_sec elapses.
+    max_queue bounds memory (oldest rows are dropped when full);
+    rate_cache_ttl_sec is how long an llm_resource_rates lookup is reused.
+    stats_interval_sec rate-limits the writer's queue/drop/failure log line.
+    """
+
     default_max_tokens: int = 4096
     default_max_length: int = 4096
     http_timeout_sec: int = 60
     request_timeout_sec: int = 300
     provider_timeout_sec: int = 180
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry_sec: float = 30.0
+    http2: bool = True
+    exchange_log_flush_rows: int = 50
+    exchange_log_flush_interval_sec: float = 2.0
+    exchange_log_max_queue: int = 5000
+    exchange_log_rate_cache_ttl_sec: float = 300.0
+    exchange_log_stats_interval_sec: float = 60.0
 
 
 @dataclass(frozen=True)
 # ID: 570aadb4-d174-4abc-bb31-dbb578c80401
 class EmbeddingConfig:
+    """Embedding provider limits and the RepoEmbedderWorker batch pipeline.
+
+    batch_* fields bound each get_embeddings_batch call (chunk count and
+    total characters, across artifacts) and how many run concurrently.
+    """
+
     chunk_size: int = 512
     chunk_overlap: int = 50
     max_chars: int = 20000
     provider_request_timeout_sec: float = 120.0
     provider_connect_timeout_sec: float = 10.0
     utils_request_timeout_sec: float = 30.0
+    batch_max_chunks: int = 32
+    batch_max_chars: int = 48000
+    batch_concurrency: int = 2
 
 
 @dataclass(frozen=True)
@@ -288,6 +320,22 @@ class LogMaintenanceConfig:
     default_retention_months: int = 24
 
 
+@dataclass(frozen=True)
+# ID: 9be5cf61-c039-4c16-92b4-0db49f93fccc
+class AuditVerifyConcurrencyConfig:
+    """Per-engine bound on in-flight engine.verify() calls within one rule.
+
+    Keyed by engine_id; an engine without its own field uses ``default``.
+    A limit of 1 is the sequential per-file dispatch. Only engines whose
+    verify() awaits slow I/O (LLM round-trips) gain from a higher value —
+    deterministic engines are CPU-bound on the event loop and stay at 1.
+    """
+
+    default: int = 1
+    llm_gate: int = 4
+    grc_judge: int = 4
+
+
 @dataclass(frozen=True)
 # ID: 8b3c6f4e-2a91-43d7-b582-7e1d4a9c0f6b
 class AuditConfig:
@@ -301,10 +349,44 @@ class AuditConfig:
       recomputes file_content_hash inline rather than trusting the
       stored value. Bounds the window in which a stale crawler hash
       could produce an incorrect cache hit.
+    - verify_concurrency: per-engine fan-out limit for rule_executor's
+      per-file dispatch (see AuditVerifyConcurrencyConfig).
+    - llm_gate_batch_token_budget: estimated-token ceiling for one
+      multi-file llm_gate prompt. 0 disables batching (one call per file).
+    - llm_gate_batch_max_files: upper bound on files packed into one batch.
+    - llm_gate_batch_max_file_tokens: files estimated above this size are
+      never batched — they keep the single-file prompt.
+    - fused_dispatch: evaluate per-file rules of engines that support it
+      (ast_gate) file-major — each file read and walked once for all of
+      them (rule_executor.execute_rules_fused). False = rule-major only.
+    - parallel_workers: worker processes for CPU-bound per-file engines
+      (rule_executor.execute_rules_parallel). 0 or 1 = in-process.
+    - parallel_batch_files: files per worker task.
+    - persistent_eval_cache: keep per-file verdicts across processes in
+      var/cache/audit/ (shared.infrastructure.storage.eval_store).
+    - eval_store_max_mb: size budget of that store (LRU eviction).
+    - incremental_sensors: audit sensors re-evaluate only the (rule, file)
+      pairs changed since their last cycle (will.audit_violation.change_feed).
+      False = a full namespace audit every cycle.
+    - sensor_full_sweep_sec: an incremental sensor still audits its whole
+      namespace at least this often (safety net).
     """
 
     llm_gate_verdict_cache_ttl_days: int = 30
     llm_gate_cache_staleness_threshold_seconds: int = 3600
+    llm_gate_batch_token_budget: int = 6000
+    llm_gate_batch_max_files: int = 8
+    llm_gate_batch_max_file_tokens: int = 1500
+    fused_dispatch: bool = True
+    parallel_workers: int = 0
+    parallel_batch_files: int = 32
+    persistent_eval_cache: bool = True
+    eval_store_max_mb: int = 256
+    incremental_sensors: bool = True
+    sensor_full_sweep_sec: int = 3600
+    verify_concurrency: AuditVerifyConcurrencyConfig = field(
+        default_factory=AuditVerifyConcurrencyConfig
+    )
 
 
 @dataclass(frozen=True)
@@ -336,6 +418,14 @@ class WorkflowGateConfig:
 @dataclass(frozen=True)
 # ID: e37c8ce2-6a3a-45d7-a63e-f9b3ec810b14
 class ContextConfig:
+    """Context builder scoring, limits and caches.
+
+    query_embedding_cache_* size the process-wide memo of query embeddings
+    shared by every VectorProvider (keyed by embed model revision + text).
+    cache_max_mb bounds the on-disk packet cache (LRU eviction);
+    cache_ttl_hours remains an upper bound on any packet's age.
+    """
+
     score_target_file: int = 100
     score_target_path: int = 80
     score_target_symbol: int = 120
@@ -344,7 +434,10 @@ class ContextConfig:
     db_provider_max_items: int = 100
     token_estimate_overhead: int = 300
     cache_ttl_hours: int = 24
+    cache_max_mb: int = 64
     db_recent_packets_limit: int = 10
+    query_embedding_cache_size: int = 512
+    query_embedding_cache_ttl_sec: int = 3600
 
 
 @dataclass(frozen=True)
@@ -546,6 +639,7 @@ class SyncConfig:
     policy_index_batch_size: int = 10
     pattern_index_batch_size: int = 10
     specs_index_batch_size: int = 10
+    symbol_scan_workers: int = 0
 
 
 @dataclass(frozen=True)
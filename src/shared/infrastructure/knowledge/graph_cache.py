@@ -0,0 +1,258 @@
+# src/shared/infrastructure/knowledge/graph_cache.py
+
+"""
+Versioned, delta-refreshed process cache of the `core.knowledge_graph` view.
+
+A full read of the view runs one capability subquery per symbol. Long-lived
+processes (the audit daemon, core-api) used to either pay that read on every
+cycle or keep auditing a graph loaded once at startup. This cache reloads
+only what changed:
+
+- One state query per refresh: core.symbols (count, max(updated_at),
+  checksum over id and updated_at) and order-independent checksums of the
+  link tables and core.capabilities. An unchanged state skips the refresh.
+- Changed symbols are re-read from the view: rows whose updated_at is past
+  the previous high-water mark (minus _DELTA_OVERLAP, for writers whose
+  NOW() predates a commit that landed after the last refresh), plus
+  symbols with links created since the previous refresh.
+- Deleted symbols are pruned when the symbol count drops. Link deletions,
+  link rewrites and capability edits cannot be attributed to symbols
+  cheaply, and reload the whole view, as does any cache older than
+  _FULL_RELOAD_INTERVAL.
+
+Snapshots are copy-on-write: a refresh that changes anything builds a new
+symbols dict, so a dict handed out earlier is never mutated underneath its
+reader. Row values that repeat across symbols (module, kind, domain, state,
+capability names) are interned.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
+
+_DELTA_OVERLAP = timedelta(minutes=5)
+_FULL_RELOAD_INTERVAL = 3600.0
+
+_INTERNED_FIELDS = ("module", "kind", "domain", "state", "health_status", "capability")
+
+_STATE_SQL = text(
+    """
+    SELECT s.symbol_count, s.symbol_hwm, s.symbol_sum,
+           l.link_count, l.link_sum, l.link_new_count, l.link_new_sum, l.link_hwm,
+           v.vector_count, v.vector_sum, v.vector_new_count, v.vector_new_sum,
+           v.vector_hwm,
+           c.capability_count, c.capability_sum
+    FROM (
+        SELECT count(*) AS symbol_count,
+               max(updated_at) AS symbol_hwm,
+               coalesce(sum(hashtext(id::text || updated_at::text)), 0) AS symbol_sum
+        FROM core.symbols
+    ) s,
+    (
+        SELECT count(*) AS link_count,
+               coalesce(sum(hashtext(symbol_id::text || capability_id::text)), 0)
+                   AS link_sum,
+               count(*) FILTER (WHERE created_at > :link_since) AS link_new_count,
+               coalesce(sum(hashtext(symbol_id::text || capability_id::text))
+                   FILTER (WHERE created_at > :link_since), 0) AS link_new_sum,
+               max(created_at) AS link_hwm
+        FROM core.symbol_capability_links
+    ) l,
+    (
+        SELECT count(*) AS vector_count,
+               coalesce(sum(hashtext(symbol_id::text || vector_id::text)), 0)
+                   AS vector_sum,
+               count(*) FILTER (WHERE created_at > :vector_since) AS vector_new_count,
+               coalesce(sum(hashtext(symbol_id::text || vector_id::text))
+                   FILTER (WHERE created_at > :vector_since), 0) AS vector_new_sum,
+               max(created_at) AS vector_hwm
+        FROM core.symbol_vector_links
+    ) v,
+    (
+        SELECT count(*) AS capability_count,
+               coalesce(sum(hashtext(id::text || name)), 0) AS capability_sum
+        FROM core.capabilities
+    ) c
+    """
+)
+
+_FULL_SQL = text("SELECT * FROM core.knowledge_graph ORDER BY symbol_path")
+
+_DELTA_SQL = text(
+    """
+    SELECT kg.* FROM core.knowledge_graph kg
+    WHERE kg.uuid IN (
+        SELECT id FROM core.symbols WHERE updated_at > :symbol_since
+        UNION
+        SELECT symbol_id FROM core.symbol_capability_links
+        WHERE created_at > :link_since
+        UNION
+        SELECT symbol_id FROM core.symbol_vector_links
+        WHERE created_at > :vector_since
+    )
+    ORDER BY kg.symbol_path
+    """
+)
+
+_PATHS_SQL = text("SELECT symbol_path FROM core.symbols")
+
+
+@dataclass(frozen=True)
+class _GraphState:
+    symbol_count: int
+    symbol_hwm: datetime | None
+    symbol_sum: int
+    link_count: int
+    link_sum: int
+    link_hwm: datetime | None
+    vector_count: int
+    vector_sum: int
+    vector_hwm: datetime | None
+    capability_count: int
+    capability_sum: int
+
+
+@dataclass
+# ID: 6e2b9d41-8c7a-4f35-b1e0-d4a7c3f9e258
+class KnowledgeGraphCache:
+    """The process's copy of core.knowledge_graph, keyed by symbol_path.
+
+    ``version`` increases whenever ``symbols`` is replaced, so a caller can
+    keep structures derived from a snapshot until the version moves.
+    """
+
+    symbols: dict[str, dict[str, Any]] = field(default_factory=dict)
+    version: int = 0
+    _state: _GraphState | None = None
+    _loaded_at: float = 0.0
+
+    # ID: 0b7f4c92-3e8d-4a61-9d25-f6c1e8a3b704
+    async def refresh(self, session: AsyncSession, full: bool = False) -> bool:
+        """Bring ``symbols`` up to date; True if it changed."""
+        previous = self._state
+        if (
+            previous is None
+            or time.monotonic() - self._loaded_at > _FULL_RELOAD_INTERVAL
+        ):
+            full = True
+        row = (
+            await session.execute(
+                _STATE_SQL,
+                {
+                    "link_since": None if previous is None else previous.link_hwm,
+                    "vector_since": None if previous is None else previous.vector_hwm,
+                },
+            )
+        ).one()
+        state = _GraphState(
+            symbol_count=row.symbol_count,
+            symbol_hwm=row.symbol_hwm,
+            symbol_sum=int(row.symbol_sum),
+            link_count=row.link_count,
+            link_sum=int(row.link_sum),
+            link_hwm=row.link_hwm,
+            vector_count=row.vector_count,
+            vector_sum=int(row.vector_sum),
+            vector_hwm=row.vector_hwm,
+            capability_count=row.capability_count,
+            capability_sum=int(row.capability_sum),
+        )
+
+        if not full and state == previous:
+            return False
+        if not full:
+            # Links are only ever appended on the delta path; anything else
+            # (a deletion, a rewritten vector id, a link committed with an
+            # older created_at) cannot be traced to its symbols.
+            full = (
+                state.capability_count != previous.capability_count
+                or state.capability_sum != previous.capability_sum
+                or state.link_count != previous.link_count + row.link_new_count
+                or state.link_sum != previous.link_sum + int(row.link_new_sum)
+                or state.vector_count != previous.vector_count + row.vector_new_count
+                or state.vector_sum != previous.vector_sum + int(row.vector_new_sum)
+            )
+
+        if full:
+            rows = (await session.execute(_FULL_SQL)).mappings().all()
+            symbols: dict[str, dict[str, Any]] = {}
+            _apply_rows(symbols, rows)
+            self._loaded_at = time.monotonic()
+            logger.info("Knowledge graph cache: loaded %s symbols", len(symbols))
+        else:
+            since = previous.symbol_hwm
+            params = {
+                "symbol_since": None if since is None else since - _DELTA_OVERLAP,
+                "link_since": previous.link_hwm,
+                "vector_since": previous.vector_hwm,
+            }
+            rows = (await session.execute(_DELTA_SQL, params)).mappings().all()
+            symbols = dict(self.symbols)
+            _apply_rows(symbols, rows)
+            if len(symbols) > state.symbol_count:
+                live = set((await session.execute(_PATHS_SQL)).scalars().all())
+                for path in symbols.keys() - live:
+                    del symbols[path]
+            if len(symbols) != state.symbol_count or (
+                not rows
+                and state.symbol_count == previous.symbol_count
+                and state.symbol_sum != previous.symbol_sum
+            ):
+                # A symbol changed with an updated_at older than the overlap
+                # window; only a full read can find it.
+                self._state = None
+                return await self.refresh(session, full=True)
+            logger.debug(
+                "Knowledge graph cache: %s changed rows, %s symbols",
+                len(rows),
+                len(symbols),
+            )
+
+        self.symbols = symbols
+        self._state = state
+        self.version += 1
+        return True
+
+
+def _apply_rows(symbols: dict[str, dict[str, Any]], rows: Any) -> None:
+    for row in rows:
+        row_dict = dict(row)
+        symbol_path = row_dict.get("symbol_path")
+        if not symbol_path:
+            continue
+        if "uuid" in row_dict and row_dict["uuid"] is not None:
+            row_dict["uuid"] = str(row_dict["uuid"])
+        if "vector_id" in row_dict and row_dict["vector_id"] is not None:
+            row_dict["vector_id"] = str(row_dict["vector_id"])
+        for key in _INTERNED_FIELDS:
+            value = row_dict.get(key)
+            if isinstance(value, str):
+                row_dict[key] = sys.intern(value)
+        capabilities = row_dict.get("capabilities_array") or []
+        capabilities = [
+            sys.intern(c) if isinstance(c, str) else c for c in capabilities
+        ]
+        row_dict["capabilities_array"] = capabilities
+        row_dict["capabilities"] = capabilities
+        symbols[sys.intern(symbol_path)] = row_dict
+
+
+_GRAPH_CACHE = KnowledgeGraphCache()
+
+
+# ID: 9a4d1e76-2f3b-4c58-8e07-b5c9d3a1f642
+def get_knowledge_graph_cache() -> KnowledgeGraphCache:
+    """The process-wide knowledge graph cache."""
+    return _GRAPH_CACHE
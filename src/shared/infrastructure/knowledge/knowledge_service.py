@@ -5,7 +5,8 @@ Centralized access to CORE's knowledge graph and declared capabilities.
 
 CONSTITUTIONAL COMPLIANCE:
 - Treated as the read-only interface to the system state.
-- Sourced from the operational database view `core.knowledge_graph`.
+- Sourced from the operational database view `core.knowledge_graph`,
+  through the delta-refreshed process cache in graph_cache.py.
 
 HEALED (V2.3.0):
 - Shadow Sensation: Now accepts an optional LimbWorkspace.
@@ -21,6 +22,7 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import text
 
 from shared.infrastructure.database.session_manager import get_session
+from shared.infrastructure.knowledge.graph_cache import get_knowledge_graph_cache
 from shared.logger import getLogger
 
 
@@ -71,12 +73,15 @@ class KnowledgeService:
         self.workspace = workspace
 
     # ID: f508b9a0-3ddd-4e36-9c72-f5a19820b769
-    async def get_graph(self) -> dict[str, Any]:
+    async def get_graph(self, full_reload: bool = False) -> dict[str, Any]:
         """
         Loads the knowledge graph.
 
         HEALED: If a workspace is present, it returns a 'Shadow Graph' representing
-        the future state of the code. Otherwise, it queries the database SSOT.
+        the future state of the code. Otherwise, it queries the database SSOT
+        through the process-wide KnowledgeGraphCache, which re-reads only the
+        symbols changed since the previous call (``full_reload`` re-reads the
+        whole view). The returned symbols map is shared: treat it as read-only.
         """
         # SENSATION: Check the virtual overlay first
         if self.workspace:
@@ -92,38 +97,14 @@ class KnowledgeService:
                 )
                 return {"metadata": {"mode": "SHADOW_FALLBACK"}, "symbols": {}}
 
-        logger.info("Loading knowledge graph from database view...")
-        symbols_map = {}
         try:
-
-            async def _fetch_data(s):
-                result = await s.execute(
-                    text("SELECT * FROM core.knowledge_graph ORDER BY symbol_path")
-                )
-                return result.mappings().all()
-
+            cache = get_knowledge_graph_cache()
             if self._session:
-                rows = await _fetch_data(self._session)
+                await cache.refresh(self._session, full=full_reload)
             else:
                 async with get_session() as session:
-                    rows = await _fetch_data(session)
-
-            for row in rows:
-                row_dict = dict(row)
-                symbol_path = row_dict.get("symbol_path")
-                if symbol_path:
-                    if "uuid" in row_dict and row_dict["uuid"] is not None:
-                        row_dict["uuid"] = str(row_dict["uuid"])
-                    if "vector_id" in row_dict and row_dict["vector_id"] is not None:
-                        row_dict["vector_id"] = str(row_dict["vector_id"])
-                    row_dict["capabilities"] = row_dict.get("capabilities_array", [])
-                    symbols_map[symbol_path] = row_dict
-
-            knowledge_graph = {"symbols": symbols_map}
-            logger.info(
-                "Successfully loaded %s symbols from the database.", len(symbols_map)
-            )
-            return knowledge_graph
+                    await cache.refresh(session, full=full_reload)
+            return {"symbols": cache.symbols, "metadata": {"version": cache.version}}
         except Exception as e:
             logger.error(
                 "Failed to load knowledge graph from database: %s", e, exc_info=True
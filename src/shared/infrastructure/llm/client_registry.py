@@ -20,6 +20,7 @@ from shared.infrastructure.config_service import ConfigService, LLMResourceConfi
 from shared.infrastructure.database.models import LlmResource
 from shared.infrastructure.database.session_manager import get_session
 from shared.infrastructure.llm.client import LLMClient
+from shared.infrastructure.llm.exchange_log_writer import flush_exchange_log
 from shared.logger import getLogger
 
 
@@ -61,6 +62,8 @@ class LLMClientRegistry:
     - Cache client instances by resource name
     - Create new clients using provided factory functions
     - Thread-safe client access via asyncio.Lock
+    - Close the clients' pooled HTTP transports on shutdown (aclose)
+    - Flush queued llm_exchange_log rows on shutdown (aclose)
 
     Does NOT:
     - Decide which resource to use (that's Will's job)
@@ -143,6 +146,28 @@ class LLMClientRegistry:
         logger.info("Clearing %s cached clients", len(self._clients))
         self._clients.clear()
 
+    # ID: 2b7f4e91-6c3a-4d58-9e1f-a0c5d8b3e762
+    async def aclose(self) -> None:
+        """
+        Close every cached client's pooled HTTP transport and drop the cache.
+
+        Called on daemon / API shutdown so provider keep-alive connections
+        are released cleanly instead of being torn down with the process,
+        and so buffered llm_exchange_log rows are written first.
+        A provider that fails to close is logged and skipped.
+        """
+        await flush_exchange_log()
+        async with self._init_lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for name, client in clients:
+            try:
+                await client.provider.aclose()
+            except Exception as exc:
+                logger.warning("Failed to close HTTP pool for %s: %s", name, exc)
+        if clients:
+            logger.info("Closed %s cached LLM client(s)", len(clients))
+
     # ID: 3ed4248a-f3cb-4388-ad1e-d65511e13fc8
     def get_cached_resource_names(self) -> list[str]:
         """
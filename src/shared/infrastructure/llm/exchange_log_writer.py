@@ -0,0 +1,357 @@
+# src/shared/infrastructure/llm/exchange_log_writer.py
+
+"""
+Buffered, off-request-path writer for core.llm_exchange_log.
+
+LLMClient used to open a session, look up the model's rate in
+core.llm_resource_rates, insert one LlmExchangeLog row and commit before
+returning every LLM result. Under audit fan-out that was two DB round-trips
+per call and a pool connection held just to log.
+
+The writer queues exchange records in memory and a background task flushes
+them in one multi-row insert per batch — when exchange_log_flush_rows
+records are waiting or exchange_log_flush_interval_sec has elapsed. Rate
+rows are cached per model for exchange_log_rate_cache_ttl_sec. At most once
+per exchange_log_stats_interval_sec the flusher logs its stats() line when
+rows are still queued or records were dropped / flushes failed since the
+last one, so a backed-up or lossy writer shows up in the process log.
+
+Like the DB engine in session_manager, the writer is loop-local: its queue
+and flush task belong to the event loop that created them. Shutdown paths
+(LLMClientRegistry.aclose, the CLI loop owner) call flush_exchange_log()
+so queued rows are written before the loop and its engine go away.
+
+Telemetry semantics are unchanged: failures are logged and swallowed, never
+surfaced to the LLM caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.infrastructure.intent.operational_config import load_operational_config
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
+
+# Cost-estimate precision matches core.llm_exchange_log.cost_estimate (Numeric(10, 6)).
+_COST_QUANTUM = Decimal("0.000001")
+
+
+def _compute_cost_estimate(
+    prompt_tokens: int | None,
+    completion_tokens: int | None,
+    input_per_mtok: Decimal,
+    output_per_mtok: Decimal,
+) -> Decimal:
+    """Pure USD cost from token counts and per-million-token rates (#620).
+
+    None token counts are treated as 0. The result is quantized to the six
+    decimal places of the cost_estimate column. Unit-tested directly.
+    """
+    pt = Decimal(prompt_tokens or 0)
+    ct = Decimal(completion_tokens or 0)
+    cost = (pt * input_per_mtok + ct * output_per_mtok) / Decimal(1_000_000)
+    return cost.quantize(_COST_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+async def _lookup_model_rate(
+    session: AsyncSession, model_snapshot: str
+) -> tuple[Decimal, Decimal] | None:
+    """Most-recent (input, output) per-Mtok rate effective now for a model.
+
+    Selects the rate row with the greatest `effective_from <= now()`.
+    Returns None when no rate row covers the model — the caller leaves
+    cost_estimate NULL and logs the gap (#620).
+    """
+    from shared.infrastructure.database.models.llm_config import LlmResourceRate
+
+    stmt = (
+        select(LlmResourceRate.input_per_mtok, LlmResourceRate.output_per_mtok)
+        .where(LlmResourceRate.model_snapshot == model_snapshot)
+        .where(LlmResourceRate.effective_from <= func.now())
+        .order_by(LlmResourceRate.effective_from.desc())
+        .limit(1)
+    )
+    row = (await session.execute(stmt)).first()
+    return (row.input_per_mtok, row.output_per_mtok) if row else None
+
+
+@dataclass(frozen=True)
+# ID: 0d6f2b7e-93a1-4c5d-8e42-7b1f9c3a6d58
+class ExchangeRecord:
+    """One LLM exchange awaiting its core.llm_exchange_log row."""
+
+    resource_name: str
+    cognitive_role: str
+    model_snapshot: str
+    prompt_tokens: int | None
+    completion_tokens: int | None
+    duration_ms: int
+    privacy_level: str
+
+
+# ID: 6a2c8e14-5f7b-4d93-a1e0-3c9b7d5f2e86
+class ExchangeLogWriter:
+    """
+    Loop-local queue + background flusher for core.llm_exchange_log rows.
+
+    enqueue() is synchronous and never touches the database; flush() drains
+    the queue in one session: one rate lookup per uncached model, one
+    multi-row insert, one commit. stats() exposes queue depth and counters;
+    the flusher logs them every stats_interval_sec while there is something
+    worth reporting.
+    """
+
+    def __init__(
+        self,
+        flush_rows: int,
+        flush_interval_sec: float,
+        max_queue: int,
+        rate_cache_ttl_sec: float,
+        stats_interval_sec: float = 60.0,
+    ) -> None:
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval_sec = max(0.01, flush_interval_sec)
+        self.max_queue = max(1, max_queue)
+        self.rate_cache_ttl_sec = rate_cache_ttl_sec
+        self.stats_interval_sec = stats_interval_sec
+        self._queue: deque[ExchangeRecord] = deque()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._rates: dict[str, tuple[float, tuple[Decimal, Decimal] | None]] = {}
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+        self._last_report = float("-inf")
+        self._reported_losses = (0, 0)
+
+    @classmethod
+    # ID: 1e7b4c92-8d3f-4a65-b0c1-5f2a9e6d3b74
+    def from_config(cls) -> ExchangeLogWriter:
+        """Build a writer sized from operational_config.llm."""
+        cfg = load_operational_config().llm
+        return cls(
+            flush_rows=cfg.exchange_log_flush_rows,
+            flush_interval_sec=cfg.exchange_log_flush_interval_sec,
+            max_queue=cfg.exchange_log_max_queue,
+            rate_cache_ttl_sec=cfg.exchange_log_rate_cache_ttl_sec,
+            stats_interval_sec=cfg.exchange_log_stats_interval_sec,
+        )
+
+    # ID: 9c4f1a83-2e6d-4b07-8f5a-d1b3e7c9a240
+    def enqueue(self, record: ExchangeRecord) -> None:
+        """Queue one record and make sure the flusher is running.
+
+        When the queue is full the oldest record is dropped (and counted)
+        so a stalled database cannot grow memory without bound.
+        """
+        if len(self._queue) >= self.max_queue:
+            self._queue.popleft()
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(
+                    "llm_exchange_log queue full (max=%s); %s record(s) dropped",
+                    self.max_queue,
+                    self._dropped,
+                )
+        self._queue.append(record)
+        self._enqueued += 1
+        if len(self._queue) >= self.flush_rows:
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    # ID: 4b8d2f61-7a3e-4c19-9e05-a6f1c8d3b27e
+    def stats(self) -> dict[str, int]:
+        """Queue depth and lifetime counters for this loop's writer."""
+        return {
+            "queue_depth": len(self._queue),
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+        }
+
+    async def _run(self) -> None:
+        """Flush on size (wakeup event) or time (interval), until idle."""
+        while self._queue:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.flush_interval_sec
+                )
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            self._report_stats()
+        self._report_stats()
+
+    def _report_stats(self) -> None:
+        """Log stats() when rows are backing up or records were lost.
+
+        Rate-limited to one line per stats_interval_sec; a quiet, healthy
+        writer stays silent. New drops or failed flushes log at WARNING.
+        """
+        now = time.monotonic()
+        if now - self._last_report < self.stats_interval_sec:
+            return
+        losses = (self._dropped, self._failed_flushes)
+        lossy = losses != self._reported_losses
+        if not self._queue and not lossy:
+            return
+        self._last_report = now
+        self._reported_losses = losses
+        stats = self.stats()
+        logger.log(
+            logging.WARNING if lossy else logging.INFO,
+            "llm_exchange_log stats: queue_depth=%s enqueued=%s written=%s "
+            "dropped=%s failed_flushes=%s",
+            stats["queue_depth"],
+            stats["enqueued"],
+            stats["written"],
+            stats["dropped"],
+            stats["failed_flushes"],
+        )
+
+    # ID: 7f3a9d05-c2b8-4e61-a4d7-0b5e2c8f1a93
+    async def flush(self) -> int:
+        """Write every queued record now. Returns the number of rows written."""
+        async with self._flush_lock:
+            if not self._queue:
+                return 0
+            batch = list(self._queue)
+            self._queue.clear()
+            try:
+                written = await self._write(batch)
+            except Exception as e:
+                self._failed_flushes += 1
+                logger.warning(
+                    "llm_exchange_log flush failed; %s record(s) not persisted: %s",
+                    len(batch),
+                    e,
+                )
+                return 0
+            self._written += written
+            logger.debug(
+                "llm_exchange_log flushed %s row(s); queue_depth=%s",
+                written,
+                len(self._queue),
+            )
+            return written
+
+    # ID: 2d6e8b13-9f4a-4c70-b5e2-8a1d3f7c6e49
+    async def aclose(self) -> None:
+        """Stop the background flusher and write whatever is still queued."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def _write(self, batch: list[ExchangeRecord]) -> int:
+        from shared.infrastructure.database.models.llm_config import (
+            LlmExchangeLog,
+        )
+        from shared.infrastructure.database.session_manager import get_session
+
+        async with get_session() as session:
+            rows: list[dict[str, Any]] = []
+            for rec in batch:
+                rate = await self._rate_for(session, rec)
+                rows.append(
+                    {
+                        "resource_name": rec.resource_name,
+                        "cognitive_role": rec.cognitive_role,
+                        "prompt_tokens": rec.prompt_tokens,
+                        "completion_tokens": rec.completion_tokens,
+                        "duration_ms": rec.duration_ms,
+                        "model_snapshot": rec.model_snapshot,
+                        "cost_estimate": (
+                            None
+                            if rate is None
+                            else _compute_cost_estimate(
+                                rec.prompt_tokens,
+                                rec.completion_tokens,
+                                rate[0],
+                                rate[1],
+                            )
+                        ),
+                        "privacy_level": rec.privacy_level,
+                    }
+                )
+            await session.execute(insert(LlmExchangeLog), rows)
+            await session.commit()
+        return len(rows)
+
+    async def _rate_for(
+        self, session: AsyncSession, rec: ExchangeRecord
+    ) -> tuple[Decimal, Decimal] | None:
+        """Cached per-model rate; one lookup per model per TTL window."""
+        now = time.monotonic()
+        cached = self._rates.get(rec.model_snapshot)
+        if cached is not None and now - cached[0] < self.rate_cache_ttl_sec:
+            return cached[1]
+        rate = await _lookup_model_rate(session, rec.model_snapshot)
+        self._rates[rec.model_snapshot] = (now, rate)
+        if rate is None:
+            logger.warning(
+                "no llm_resource_rates entry for model=%s; "
+                "cost_estimate left NULL (role=%s resource=%s)",
+                rec.model_snapshot,
+                rec.cognitive_role,
+                rec.resource_name,
+            )
+        return rate
+
+
+_WRITER_BY_LOOP: WeakKeyDictionary[asyncio.AbstractEventLoop, ExchangeLogWriter] = (
+    WeakKeyDictionary()
+)
+
+
+# ID: 8e1c5a27-4b9d-4f36-a0e8-c7d2f5b1a364
+def get_exchange_log_writer() -> ExchangeLogWriter:
+    """Return the running loop's writer, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    writer = _WRITER_BY_LOOP.get(loop)
+    if writer is None:
+        writer = ExchangeLogWriter.from_config()
+        _WRITER_BY_LOOP[loop] = writer
+    return writer
+
+
+# ID: 5a9f3e72-1c8b-4d04-b6a3-e2f7d9c4b815
+async def flush_exchange_log() -> None:
+    """Drain and close the running loop's writer, if one was ever created.
+
+    Safe to call from any shutdown path; a later enqueue on the same loop
+    simply starts a fresh flusher.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    writer = _WRITER_BY_LOOP.get(loop)
+    if writer is None:
+        return
+    try:
+        await writer.aclose()
+    except Exception as e:
+        logger.warning("llm_exchange_log shutdown flush failed: %s", e)
@@ -9,8 +9,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.logger import getLogger
 
@@ -88,17 +86,17 @@ class AnthropicProvider(AIProvider):
             ],
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            if usage_sink is not None:
-                usage = data.get("usage") or {}
-                if "input_tokens" in usage:
-                    usage_sink["prompt_tokens"] = int(usage["input_tokens"])
-                if "output_tokens" in usage:
-                    usage_sink["completion_tokens"] = int(usage["output_tokens"])
-            return data["content"][0]["text"]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        if usage_sink is not None:
+            usage = data.get("usage") or {}
+            if "input_tokens" in usage:
+                usage_sink["prompt_tokens"] = int(usage["input_tokens"])
+            if "output_tokens" in usage:
+                usage_sink["completion_tokens"] = int(usage["output_tokens"])
+        return data["content"][0]["text"]
 
     # ID: eb185ea3-e901-46c7-94ca-725a6ece1c25
     async def get_embedding(
@@ -2,16 +2,33 @@
 
 """
 Defines the abstract base class for all AI provider strategies.
+
+Each provider owns one long-lived, connection-pooled httpx.AsyncClient
+(see AIProvider.http_client) so consecutive calls reuse TCP/TLS
+connections instead of paying a handshake per request. The pool is
+loop-local — like the DB engine in session_manager — and is closed via
+AIProvider.aclose() when the owning LLMClientRegistry shuts down.
 """
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 from abc import ABC, abstractmethod
 from typing import Any
 
 import httpx
 
 from shared.infrastructure.intent.operational_config import load_operational_config
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """True when the optional ``h2`` package httpx needs for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
 
 
 # ID: 32b9740b-010f-4fd0-8886-f17093aa855f
@@ -34,6 +51,52 @@ class AIProvider(ABC):
         self.api_key = api_key
         self.timeout = httpx.Timeout(timeout)
         self.headers = self._prepare_headers()
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    # ID: 5c1e8b4f-27d3-4a96-b0e5-9f3a6d2c7e18
+    def http_client(self) -> httpx.AsyncClient:
+        """Return this provider's pooled client, creating it on first use.
+
+        The client is bound to the running event loop. A call from a
+        different loop (e.g. successive asyncio.run() in CLI code) builds a
+        fresh pool — the old one cannot be awaited closed from here and is
+        left to garbage collection with its dead loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            cfg = load_operational_config().llm
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                http2=cfg.http2 and _http2_available(),
+                limits=httpx.Limits(
+                    max_connections=cfg.http_max_connections,
+                    max_keepalive_connections=cfg.http_max_keepalive_connections,
+                    keepalive_expiry=cfg.http_keepalive_expiry_sec,
+                ),
+            )
+            self._http_loop = loop
+            logger.debug(
+                "%s: opened pooled HTTP client for %s",
+                type(self).__name__,
+                self.api_url,
+            )
+        return self._http
+
+    # ID: 8a3d6f21-c94b-4e07-a5d8-1b7e2c9f0a64
+    async def aclose(self) -> None:
+        """Close the pooled client. Safe to call repeatedly or before first use."""
+        client, self._http, self._http_loop = self._http, None, None
+        if client is None or client.is_closed:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as exc:
+            # Pool bound to an event loop that is already gone.
+            logger.debug(
+                "%s: pooled client close skipped (%s)", type(self).__name__, exc
+            )
 
     @abstractmethod
     def _prepare_headers(self) -> dict[str, str]:
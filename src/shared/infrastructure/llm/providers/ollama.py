@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.logger import getLogger
 
@@ -116,16 +114,16 @@ class OllamaProvider(AIProvider):
                     format_type,
                 )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            if usage_sink is not None:
-                if "prompt_eval_count" in data:
-                    usage_sink["prompt_tokens"] = int(data["prompt_eval_count"])
-                if "eval_count" in data:
-                    usage_sink["completion_tokens"] = int(data["eval_count"])
-            return data["message"]["content"]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        if usage_sink is not None:
+            if "prompt_eval_count" in data:
+                usage_sink["prompt_tokens"] = int(data["prompt_eval_count"])
+            if "eval_count" in data:
+                usage_sink["completion_tokens"] = int(data["eval_count"])
+        return data["message"]["content"]
 
     # ID: fcc3342d-746d-4bb4-b153-8eef9465c0f0
     async def get_embedding(
@@ -167,24 +165,24 @@ class OllamaProvider(AIProvider):
             "options": {"num_ctx": 8192},
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            vec = data["embeddings"][0]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        vec = data["embeddings"][0]
 
-            if len(vec) > 3:
-                is_ghost = all(
-                    abs(a - b) < 0.001 for a, b in zip(vec[:3], GHOST_VECTOR_START)
+        if len(vec) > 3:
+            is_ghost = all(
+                abs(a - b) < 0.001 for a, b in zip(vec[:3], GHOST_VECTOR_START)
+            )
+            if is_ghost:
+                logger.error(
+                    "Ollama returned Ghost Vector (Model Failure) for input length %s",
+                    len(text),
                 )
-                if is_ghost:
-                    logger.error(
-                        "Ollama returned Ghost Vector (Model Failure) for input length %s",
-                        len(text),
-                    )
-                    raise RuntimeError("Embedding model failed (Ghost Vector returned)")
+                raise RuntimeError("Embedding model failed (Ghost Vector returned)")
 
-            return vec
+        return vec
 
     # ID: 9e2c4f81-3a6d-4b85-b4f7-c8d3a1e09f72
     async def get_embeddings_batch(
@@ -230,36 +228,36 @@ class OllamaProvider(AIProvider):
             "options": {"num_ctx": 8192},
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            vectors = data["embeddings"]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        vectors = data["embeddings"]
 
-            if len(vectors) != len(prepared):
-                raise RuntimeError(
-                    f"Ollama returned {len(vectors)} embeddings for {len(prepared)} "
-                    "inputs — batch response misalignment"
-                )
+        if len(vectors) != len(prepared):
+            raise RuntimeError(
+                f"Ollama returned {len(vectors)} embeddings for {len(prepared)} "
+                "inputs — batch response misalignment"
+            )
 
-            for i, vec in enumerate(vectors):
-                if len(vec) > 3:
-                    is_ghost = all(
-                        abs(a - b) < 0.001 for a, b in zip(vec[:3], GHOST_VECTOR_START)
+        for i, vec in enumerate(vectors):
+            if len(vec) > 3:
+                is_ghost = all(
+                    abs(a - b) < 0.001 for a, b in zip(vec[:3], GHOST_VECTOR_START)
+                )
+                if is_ghost:
+                    logger.error(
+                        "Ollama returned Ghost Vector (Model Failure) for batch "
+                        "input %d/%d (length %s)",
+                        i,
+                        len(prepared),
+                        len(prepared[i]),
                     )
-                    if is_ghost:
-                        logger.error(
-                            "Ollama returned Ghost Vector (Model Failure) for batch "
-                            "input %d/%d (length %s)",
-                            i,
-                            len(prepared),
-                            len(prepared[i]),
-                        )
-                        raise RuntimeError(
-                            "Embedding model failed (Ghost Vector returned in batch)"
-                        )
-
-            if usage_sink is not None and "prompt_eval_count" in data:
-                usage_sink["prompt_tokens"] = int(data["prompt_eval_count"])
+                    raise RuntimeError(
+                        "Embedding model failed (Ghost Vector returned in batch)"
+                    )
+
+        if usage_sink is not None and "prompt_eval_count" in data:
+            usage_sink["prompt_tokens"] = int(data["prompt_eval_count"])
 
-            return vectors
+        return vectors
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-
 from shared.infrastructure.intent.operational_config import load_operational_config
 from shared.logger import getLogger
 
@@ -89,17 +87,17 @@ class OpenAIProvider(AIProvider):
                 self.model_name,
             )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            if usage_sink is not None:
-                usage = data.get("usage") or {}
-                if "prompt_tokens" in usage:
-                    usage_sink["prompt_tokens"] = int(usage["prompt_tokens"])
-                if "completion_tokens" in usage:
-                    usage_sink["completion_tokens"] = int(usage["completion_tokens"])
-            return data["choices"][0]["message"]["content"]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        if usage_sink is not None:
+            usage = data.get("usage") or {}
+            if "prompt_tokens" in usage:
+                usage_sink["prompt_tokens"] = int(usage["prompt_tokens"])
+            if "completion_tokens" in usage:
+                usage_sink["completion_tokens"] = int(usage["completion_tokens"])
+        return data["choices"][0]["message"]["content"]
 
     @staticmethod
     def _map_response_format(
@@ -157,12 +155,12 @@ class OpenAIProvider(AIProvider):
         endpoint = f"{self.api_url}/embeddings"
         payload = {"model": self.model_name, "input": [text]}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            if usage_sink is not None:
-                usage = data.get("usage") or {}
-                if "prompt_tokens" in usage:
-                    usage_sink["prompt_tokens"] = int(usage["prompt_tokens"])
-            return data["data"][0]["embedding"]
+        client = self.http_client()
+        response = await client.post(endpoint, headers=self.headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+        if usage_sink is not None:
+            usage = data.get("usage") or {}
+            if "prompt_tokens" in usage:
+                usage_sink["prompt_tokens"] = int(usage["prompt_tokens"])
+        return data["data"][0]["embedding"]
@@ -0,0 +1,307 @@
+# src/shared/infrastructure/storage/eval_store.py
+
+"""EvalFindingsStore - persistent, content-addressed per-file audit verdicts.
+
+rule_executor's in-memory evaluation cache (ADR-039 Option F) dies with the
+process, so every CLI audit, pre-commit run and daemon restart re-evaluated
+the whole repo. This SQLite store under ``var/cache/audit/`` carries verdicts
+across processes. An entry is keyed by
+
+    (rule_id, rule_content_hash, file path, file sha256, engine version)
+
+so an edited file, an edited rule, or an edited engine misses by
+construction; nothing is ever invalidated by time. Hashing a file costs a
+full read, so file digests are memoized by (mtime_ns, size) in the same
+database — a cold process stats the repo instead of re-hashing it. A file
+modified within _RACY_WINDOW_NS of the lookup could be rewritten again in
+the same timestamp tick with the same size (racily clean), so its digest is
+neither reused nor recorded; it is re-hashed until it settles.
+
+Writes are buffered and committed by flush(). The store is bounded by
+``audit.eval_store_max_mb`` with least-recently-used eviction. Any SQLite
+failure disables the store for the rest of the process: a cache must never
+fail an audit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
+
+DB_NAME = "eval_findings.sqlite3"
+
+StoreKey = tuple[str, str, str, str, str]
+
+# Files modified this recently are not trusted by stat alone.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS findings (
+        rule_id TEXT NOT NULL,
+        rule_hash TEXT NOT NULL,
+        path TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        engine_version TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        last_used REAL NOT NULL,
+        PRIMARY KEY (rule_id, rule_hash, path, content_hash, engine_version)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS findings_last_used ON findings (last_used)",
+    """
+    CREATE TABLE IF NOT EXISTS file_digests (
+        path TEXT PRIMARY KEY,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        sha256 TEXT NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+# ID: 7b3e9f14-2c6a-4d58-a1e0-c8f5d2b7a963
+class EvalFindingsStore:
+    """SQLite-backed map from a StoreKey to serialized per-file findings."""
+
+    def __init__(self, db_path: Path, max_bytes: int) -> None:
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._pending_rows: dict[StoreKey, tuple[str, float]] = {}
+        self._pending_touch: dict[StoreKey, float] = {}
+        self._pending_digests: dict[str, tuple[int, int, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ID: 3a8d6c51-9f2e-4b07-b4d1-e6c9a2f5b830
+    def digest(self, file_path: Path, mtime_ns: int, size: int) -> str | None:
+        """sha256 of ``file_path``'s bytes, re-hashed only when its stat changed."""
+        key = str(file_path)
+        racy = time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+        with self._lock:
+            known = None if racy else self._digests.get(key)
+            if known is None and not racy and (conn := self._connect()) is not None:
+                row = self._query(
+                    conn,
+                    "SELECT mtime_ns, size, sha256 FROM file_digests WHERE path = ?",
+                    (key,),
+                )
+                if row:
+                    known = (row[0][0], row[0][1], row[0][2])
+                    self._digests[key] = known
+            if known is not None and known[:2] == (mtime_ns, size):
+                return known[2]
+        try:
+            sha = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        with self._lock:
+            if racy:
+                self._digests.pop(key, None)
+                self._pending_digests.pop(key, None)
+            else:
+                self._digests[key] = (mtime_ns, size, sha)
+                self._pending_digests[key] = (mtime_ns, size, sha)
+        return sha
+
+    # ID: 5e1b8d27-4c9a-4f63-a0e5-d7b2f9c4e186
+    def get(self, key: StoreKey) -> str | None:
+        """The stored payload for ``key``, or None."""
+        with self._lock:
+            pending = self._pending_rows.get(key)
+            if pending is not None:
+                self.hits += 1
+                return pending[0]
+            conn = self._connect()
+            if conn is None:
+                return None
+            rows = self._query(
+                conn,
+                "SELECT payload FROM findings WHERE rule_id = ? AND rule_hash = ? "
+                "AND path = ? AND content_hash = ? AND engine_version = ?",
+                key,
+            )
+            if not rows:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._pending_touch[key] = time.time()
+            return rows[0][0]
+
+    # ID: 9c4f2a68-1d7e-4b35-8e0b-a5f3c7d1e924
+    def put(self, key: StoreKey, payload: str) -> None:
+        """Buffer ``payload`` under ``key``; written on the next flush()."""
+        with self._lock:
+            self._pending_rows[key] = (payload, time.time())
+
+    # ID: 2d6a9e35-8b1c-4f74-b3e2-c9d5f0a8b617
+    def flush(self) -> None:
+        """Commit buffered writes and evict past the size budget."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None or not (
+                self._pending_rows or self._pending_touch or self._pending_digests
+            ):
+                return
+            rows, self._pending_rows = self._pending_rows, {}
+            touch, self._pending_touch = self._pending_touch, {}
+            digests, self._pending_digests = self._pending_digests, {}
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (*key, payload, len(payload), used)
+                            for key, (payload, used) in rows.items()
+                        ],
+                    )
+                    conn.executemany(
+                        "UPDATE findings SET last_used = ? WHERE rule_id = ? "
+                        "AND rule_hash = ? AND path = ? AND content_hash = ? "
+                        "AND engine_version = ?",
+                        [(used, *key) for key, used in touch.items()],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO file_digests VALUES (?, ?, ?, ?)",
+                        [(path, *digest) for path, digest in digests.items()],
+                    )
+                    self._evict(conn)
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    # ID: 6f8b3c92-5a4d-4e19-9c7f-b1e6d4a2f058
+    def clear(self) -> None:
+        """Drop every stored verdict and digest."""
+        with self._lock:
+            self._digests.clear()
+            self._pending_rows.clear()
+            self._pending_touch.clear()
+            self._pending_digests.clear()
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("DELETE FROM findings")
+                    conn.execute("DELETE FROM file_digests")
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    # ID: 1e7c4b86-3f2a-4d90-a8b5-e2d9f6c1a743
+    def stats(self) -> dict[str, Any]:
+        """Entry count, stored bytes and this process's hit/miss counters."""
+        with self._lock:
+            conn = self._connect()
+            rows = (
+                self._query(conn, "SELECT COUNT(*), TOTAL(size) FROM findings", ())
+                if conn is not None
+                else None
+            )
+            entries, total = rows[0] if rows else (0, 0)
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "total_bytes": int(total),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT TOTAL(size) FROM findings").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% of the budget so eviction is not paid per flush.
+        excess = total - int(self.max_bytes * 0.9)
+        victims = []
+        for row in conn.execute(
+            "SELECT rule_id, rule_hash, path, content_hash, engine_version, size "
+            "FROM findings ORDER BY last_used"
+        ):
+            victims.append(row[:5])
+            excess -= row[5]
+            if excess <= 0:
+                break
+        conn.executemany(
+            "DELETE FROM findings WHERE rule_id = ? AND rule_hash = ? AND path = ? "
+            "AND content_hash = ? AND engine_version = ?",
+            victims,
+        )
+        logger.debug("Eval store evicted %d entries", len(victims))
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    str(self.db_path), timeout=5.0, check_same_thread=False
+                )
+                # WAL: the daemon and CLI/pre-commit audits share the file.
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                self._disable(e)
+        return self._conn
+
+    def _query(
+        self, conn: sqlite3.Connection, sql: str, params: tuple
+    ) -> list[tuple] | None:
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning(
+            "Eval store disabled for this process (%s): %s", self.db_path, error
+        )
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+        self._disabled = True
+
+
+_STORES: dict[Path, EvalFindingsStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+# ID: 4b9d1e73-6c8f-4a25-b0d3-f7a1c5e9b264
+def get_eval_store(cache_dir: Path, max_mb: int) -> EvalFindingsStore:
+    """The process-wide store for ``cache_dir``, opened on first use."""
+    db_path = cache_dir / DB_NAME
+    with _STORES_LOCK:
+        store = _STORES.get(db_path)
+        if store is None:
+            store = EvalFindingsStore(db_path, max_mb * 1024 * 1024)
+            _STORES[db_path] = store
+        return store
+
+
+# ID: 8a2c5f19-7e4b-4d63-9b1a-c6e8d3f0a572
+def open_eval_stores() -> list[EvalFindingsStore]:
+    """Every store opened by this process (for cache-wide resets)."""
+    with _STORES_LOCK:
+        return list(_STORES.values())
@@ -0,0 +1,43 @@
+# src/shared/infrastructure/vector/point_ids.py
+
+"""
+Stored-point lookup shared by the code-chunk writers.
+
+Both ``sync.vectors_code`` and RepoEmbedderWorker key chunk points on the
+chunk's content hash and need to know which points a file already holds,
+so they can skip re-embedding unchanged chunks and delete orphans.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+# ID: 6f0d2c1e-8a47-4b93-9e5d-3c2a71b8e4f0
+async def load_point_ids_by_file(
+    qdrant: Any, collection: str, file_paths: Iterable[str]
+) -> dict[str, set[str]]:
+    """Map each of ``file_paths`` to the ids of its points in ``collection``.
+
+    One filtered scroll on the ``file_path`` payload key; paths with no
+    stored points map to an empty set. Errors from Qdrant propagate so
+    each caller can decide how to degrade.
+    """
+    from qdrant_client import models as qm
+
+    paths = sorted(set(file_paths))
+    records = await qdrant.scroll_all_points(
+        collection_name=collection,
+        with_payload=True,
+        with_vectors=False,
+        scroll_filter=qm.Filter(
+            must=[qm.FieldCondition(key="file_path", match=qm.MatchAny(any=paths))]
+        ),
+    )
+    by_path: dict[str, set[str]] = {path: set() for path in paths}
+    for record in records:
+        path = (record.payload or {}).get("file_path")
+        if path in by_path:
+            by_path[path].add(str(record.id))
+    return by_path
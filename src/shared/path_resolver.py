@@ -55,6 +55,7 @@ class PathResolver:
         "cache",
         "context",
     )
+    _DEFAULT_AUDIT_CACHE_SUBDIR: ClassVar[tuple[str, ...]] = ("var", "cache", "audit")
     _DEFAULT_KNOWLEDGE_SUBDIR: ClassVar[tuple[str, ...]] = ("var", "mind", "knowledge")
     _DEFAULT_EXPORTS_SUBDIR: ClassVar[tuple[str, ...]] = ("var", "exports")
     _DEFAULT_LOGS_SUBDIR: ClassVar[tuple[str, ...]] = ("var", "logs")
@@ -176,6 +177,12 @@ class PathResolver:
     def context_schema_path(self) -> Path:
         return self.context_dir / "schema.yaml"
 
+    @property
+    # ID: 5c9e2d47-8a1f-4b63-b7d0-e4f8a3c6b915
+    def audit_cache_dir(self) -> Path:
+        """Persistent audit verdict store (rule_executor evaluation cache)."""
+        return self._repo_root.joinpath(*self._DEFAULT_AUDIT_CACHE_SUBDIR)
+
     @property
     # ID: da01c682-35df-48d5-af6c-2a68a031b582
     def knowledge_dir(self) -> Path:
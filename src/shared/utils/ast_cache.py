@@ -0,0 +1,66 @@
+# src/shared/utils/ast_cache.py
+
+"""
+Process-wide, content-identity keyed cache of parsed Python ASTs.
+
+Owned here (shared) so every layer reuses one parse per unchanged file:
+AuditorContext.get_tree() for the audit engines, ContextBuilder for AST
+evidence. Entries are keyed by path and validated against the file's
+content identity — (mtime_ns, size) — per ADR-039 Option E: different
+bytes yield a different key and force a re-parse, so a stale tree is
+impossible by construction. Bounded with FIFO eviction; dropping an entry
+is always safe.
+"""
+
+from __future__ import annotations
+
+import ast
+import threading
+from pathlib import Path
+
+
+AST_CACHE: dict[Path, tuple[tuple[int, int], ast.AST]] = {}
+AST_CACHE_MAX_ENTRIES: int = 5000
+
+# Context builds parse in a worker thread while audits parse on the loop
+# thread; the lock keeps FIFO eviction consistent between them.
+_LOCK = threading.Lock()
+
+
+# ID: 5e2b8c71-4a9d-4f36-b0e7-c3d1a6f9e284
+def file_content_key(file_path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) for a file, or None when it cannot be stat'ed."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# ID: 9a4d1f63-7b2e-4c58-8e0a-d5f7b3c1a926
+def get_cached_ast(file_path: Path, content_key: tuple[int, int]) -> ast.AST | None:
+    """Return the cached tree only when it was parsed from identical bytes."""
+    cached = AST_CACHE.get(file_path)
+    if cached is not None and cached[0] == content_key:
+        return cached[1]
+    return None
+
+
+# ID: 2c7f5a98-3e1b-4d64-a9f2-b8e6d0c4f157
+def store_ast(file_path: Path, content_key: tuple[int, int], tree: ast.AST) -> None:
+    """Store a parsed tree under its content key, evicting FIFO past the cap."""
+    with _LOCK:
+        if file_path in AST_CACHE:
+            # Refresh in place — drop first so the re-insert lands at the
+            # most-recent position (keeps FIFO order meaningful).
+            del AST_CACHE[file_path]
+        elif len(AST_CACHE) >= AST_CACHE_MAX_ENTRIES:
+            del AST_CACHE[next(iter(AST_CACHE))]
+        AST_CACHE[file_path] = (content_key, tree)
+
+
+# ID: 6f1e3b45-8c2a-4d97-b5e0-a7c9d2f4e803
+def discard_ast(file_path: Path) -> None:
+    """Drop a file's entry (e.g. after a failed re-parse)."""
+    with _LOCK:
+        AST_CACHE.pop(file_path, None)
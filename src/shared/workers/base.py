@@ -362,6 +362,40 @@ class Worker(ABC):
             artifact_type, sub_namespace, identity_key_value, payload
         )
 
+    # ID: 832a61dc-9482-4a4e-9a38-7cdea759f6dd
+    async def post_findings_bulk(
+        self,
+        findings: list[tuple[str, dict[str, Any]]],
+        *,
+        resolution_mechanism: str,
+    ) -> list[uuid.UUID]:
+        """Post many (subject, payload) findings in one write. Returns their
+        entry IDs, in input order.
+
+        See BlackboardPublisher.post_findings_bulk for the full contract.
+        """
+        self._cycle_post_count += len(findings)
+        return await self._blackboard.post_findings_bulk(
+            findings, resolution_mechanism=resolution_mechanism
+        )
+
+    # ID: 66efd21d-0bd6-4325-b14f-6d911af70c9f
+    async def post_artifact_findings_bulk(
+        self,
+        artifact_type: str,
+        findings: list[tuple[str, str, dict[str, Any]]],
+    ) -> list[uuid.UUID]:
+        """Post many (sub_namespace, identity_key_value, payload) findings
+        under the ADR-091 D2 canonical subject format in one write.
+
+        See BlackboardPublisher.post_artifact_findings_bulk for the full
+        contract.
+        """
+        self._cycle_post_count += len(findings)
+        return await self._blackboard.post_artifact_findings_bulk(
+            artifact_type, findings
+        )
+
     # ID: 1b5d39a0-8d4c-475c-bcf5-5d50af2c6c2e
     async def post_report(self, subject: str, payload: dict[str, Any]) -> uuid.UUID:
         """Post a completion report to the blackboard."""
@@ -6,7 +6,9 @@ Holds the six public methods (post_finding, post_artifact_finding,
 post_report, post_heartbeat, post_observation, _post_entry) and their
 supporting helpers that were previously inlined on Worker.  Worker
 constructs one at __init__ time and thin-wraps all six methods so the
-subclass API is unchanged.
+subclass API is unchanged.  post_findings_bulk and
+post_artifact_findings_bulk write a whole batch of findings in one
+statement, for sensors that post hundreds per cycle.
 
 Testing benefit: workers can be tested by injecting a FakePublisher
 (or unittest.mock.AsyncMock) instead of requiring a live DB session.
@@ -122,6 +124,128 @@ class BlackboardPublisher:
 
         See Worker.post_artifact_finding for the full contract description.
         """
+        return await self.post_finding(
+            subject=self._artifact_subject(
+                artifact_type, sub_namespace, identity_key_value
+            ),
+            payload=payload,
+            resolution_mechanism="reaudit",
+        )
+
+    # ID: 10a5105e-ba3a-44c5-8fa2-27d7ae6ce87e
+    async def post_findings_bulk(
+        self,
+        findings: list[tuple[str, dict[str, Any]]],
+        *,
+        resolution_mechanism: str,
+    ) -> list[uuid.UUID]:
+        """Post many (subject, payload) findings at once. Returns their entry
+        IDs, in input order.
+
+        One multi-row dedup upsert in one transaction, with the same
+        semantics as posting each finding through post_finding. Repeats of a
+        subject within the batch are collapsed first, because Postgres will
+        not let one ON CONFLICT DO UPDATE touch a row twice. The collapsed row
+        carries the first payload as first_payload, the last as payload and
+        the repeat count as occurrences, which is what sequential posts would
+        have left behind.
+        """
+        from sqlalchemy import text
+
+        if not findings:
+            return []
+
+        batch: dict[str, list[Any]] = {}
+        for subject, payload in findings:
+            payload_json = json.dumps(_sanitize_payload(payload))
+            row = batch.get(subject)
+            if row is None:
+                batch[subject] = [uuid.uuid4(), payload_json, payload_json, 1]
+            else:
+                row[2] = payload_json
+                row[3] += 1
+
+        async with get_session() as session:
+            async with session.begin():
+                result = await session.execute(
+                    text(
+                        """
+                        insert into core.blackboard_entries
+                            (id, worker_uuid, entry_type, phase, status, subject,
+                             payload, first_payload, resolution_mechanism, resolved_at,
+                             last_seen_at, occurrence_count)
+                        select b.id, :worker_uuid, 'finding', :phase, 'open', b.subject,
+                               cast(b.payload as jsonb), cast(b.first_payload as jsonb),
+                               :resolution_mechanism, null, now(), b.occurrences
+                        from unnest(
+                            cast(:ids as uuid[]),
+                            cast(:subjects as text[]),
+                            cast(:payloads as text[]),
+                            cast(:first_payloads as text[]),
+                            cast(:occurrences as integer[])
+                        ) as b(id, subject, payload, first_payload, occurrences)
+                        on conflict (subject, resolution_mechanism)
+                            where entry_type = 'finding'
+                              and status in ('open', 'claimed', 'awaiting_reaudit')
+                        do update set
+                            occurrence_count = core.blackboard_entries.occurrence_count
+                                + excluded.occurrence_count,
+                            payload = excluded.payload,
+                            last_seen_at = now(),
+                            updated_at = now()
+                        returning id, subject
+                        """
+                    ),
+                    {
+                        "worker_uuid": self._worker_uuid,
+                        "phase": self._phase,
+                        "resolution_mechanism": resolution_mechanism,
+                        "ids": [row[0] for row in batch.values()],
+                        "subjects": list(batch),
+                        "first_payloads": [row[1] for row in batch.values()],
+                        "payloads": [row[2] for row in batch.values()],
+                        "occurrences": [row[3] for row in batch.values()],
+                    },
+                )
+                for entry_id, subject in result.all():
+                    batch[subject][0] = entry_id
+
+        logger.debug(
+            "Blackboard findings posted in bulk: %d finding(s), %d row(s)",
+            len(findings),
+            len(batch),
+        )
+        return [batch[subject][0] for subject, _ in findings]
+
+    # ID: c94f5151-b628-46c8-aa5d-f67311b443fd
+    async def post_artifact_findings_bulk(
+        self,
+        artifact_type: str,
+        findings: list[tuple[str, str, dict[str, Any]]],
+    ) -> list[uuid.UUID]:
+        """post_artifact_finding for many (sub_namespace, identity_key_value,
+        payload) findings, through post_findings_bulk.
+
+        Every finding is checked against the declared scope before anything
+        is written, so a bad one rejects the whole batch.
+        """
+        return await self.post_findings_bulk(
+            [
+                (
+                    self._artifact_subject(
+                        artifact_type, sub_namespace, identity_key_value
+                    ),
+                    payload,
+                )
+                for sub_namespace, identity_key_value, payload in findings
+            ],
+            resolution_mechanism="reaudit",
+        )
+
+    def _artifact_subject(
+        self, artifact_type: str, sub_namespace: str, identity_key_value: str
+    ) -> str:
+        """The ADR-091 D2 subject, after checking it against the declared scope."""
         scope = self._declaration["mandate"].get("scope") or {}
         declared_types = scope.get("artifact_type") or []
         declared_namespace = scope.get("rule_namespace")
@@ -158,12 +282,7 @@ class BlackboardPublisher:
                 self._worker_name,
             )
 
-        subject = f"{artifact_type}::{sub_namespace}::{identity_key_value}"
-        return await self.post_finding(
-            subject=subject,
-            payload=payload,
-            resolution_mechanism="reaudit",
-        )
+        return f"{artifact_type}::{sub_namespace}::{identity_key_value}"
 
     # ID: 9ca752ac-d9df-47b0-9314-0925f6963b00
     async def post_report(self, subject: str, payload: dict[str, Any]) -> uuid.UUID:
@@ -105,6 +105,11 @@ class CognitiveOrchestrator:
             self._system_operating_mode,
         )
 
+    # ID: 4e9c2a71-8b5d-4f36-a1e0-7d3b6c9f2e58
+    async def aclose(self) -> None:
+        """Release every LLM client's pooled HTTP transport (Body registry)."""
+        await self._client_registry.aclose()
+
     # ID: a16f98de-17d6-4787-9d94-ab4bf63bc96f
     async def get_client_for_role(
         self, role_name: str, high_reasoning: bool = False
@@ -0,0 +1,139 @@
+# src/will/audit_violation/change_feed.py
+"""
+Change feed for AuditViolationSensor.
+
+Every sensor cycle used to reload governance, drop the file cache and
+re-audit its whole namespace, although on a quiet repo nothing had changed
+since the previous cycle. This module tells the sensor what did change.
+
+It keeps a stat snapshot — (mtime_ns, size) per file — of the sensor's
+artifact universe and of the .intent/ tree. poll() diffs the current
+snapshot against the baseline of the last successful cycle and returns the
+dirty file set, whether governance changed, and whether the periodic full
+sweep is due. commit() adopts the polled snapshot as the new baseline; a
+cycle that fails before commit() leaves the baseline alone, so its changes
+are reported again on the next poll.
+
+A stat walk needs no watcher thread and no git subprocess, survives daemon
+restarts (the first poll is a full sweep) and sees uncommitted edits the
+same as committed ones.
+
+LAYER: will/audit_violation — collaborator of AuditViolationSensor. Reads
+file metadata only. No writes, no DB, no LLM.
+"""
+
+from __future__ import annotations
+
+import stat
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# repo-relative POSIX path -> (mtime_ns, size)
+Snapshot = dict[str, tuple[int, int]]
+
+
+@dataclass(frozen=True)
+# ID: 4e7a2c91-8b3d-4f56-a0e9-d1c6b5f8a273
+class AuditChangeSet:
+    """What changed since the last committed cycle.
+
+    - file_count: files in the artifact universe now.
+    - changed_files: added or modified files (repo-relative).
+    - removed_files: files that disappeared (repo-relative).
+    - governance_changed: any file under .intent/ changed.
+    - full_sweep: first cycle, or the periodic safety-net sweep is due.
+    """
+
+    file_count: int
+    changed_files: frozenset[str]
+    removed_files: frozenset[str]
+    governance_changed: bool
+    full_sweep: bool
+
+    @property
+    # ID: 9c1f5d38-2a6e-4b07-b8d4-e3a7f0c2b195
+    def dirty_files(self) -> frozenset[str]:
+        """Changed and removed files together."""
+        return self.changed_files | self.removed_files
+
+    @property
+    # ID: 2b8e6f14-7c3a-4d92-a5b1-f0d9c4e7a368
+    def quiet(self) -> bool:
+        """Nothing to re-evaluate this cycle."""
+        return not (self.dirty_files or self.governance_changed or self.full_sweep)
+
+
+# ID: 6d3b9a57-1e4f-4c28-b7a0-c5e8d2f1a946
+class AuditChangeFeed:
+    """Stat-snapshot change feed over one sensor's files and .intent/."""
+
+    def __init__(
+        self, repo_path: Path, intent_root: Path, full_sweep_sec: float
+    ) -> None:
+        self._repo_path = repo_path
+        self._intent_root = intent_root
+        self._full_sweep_sec = full_sweep_sec
+        self._files: Snapshot | None = None
+        self._governance: Snapshot | None = None
+        self._last_sweep: float | None = None
+        self._polled: tuple[Snapshot, Snapshot, float | None] | None = None
+
+    # ID: 8f2c7e41-5b9d-4a63-9e0f-a4d1b6c3e857
+    def poll(self, globs: Iterable[str]) -> AuditChangeSet:
+        """Snapshot the universe matched by ``globs`` and diff it."""
+        files = _snapshot(
+            self._repo_path,
+            (path for pattern in globs for path in self._repo_path.glob(pattern)),
+        )
+        governance = _snapshot(self._intent_root, self._intent_root.rglob("*"))
+
+        now = time.monotonic()
+        full_sweep = (
+            self._files is None
+            or self._last_sweep is None
+            or now - self._last_sweep >= self._full_sweep_sec
+        )
+        if self._files is None:
+            changed: frozenset[str] = frozenset(files)
+            removed: frozenset[str] = frozenset()
+        else:
+            changed = frozenset(
+                path for path, key in files.items() if self._files.get(path) != key
+            )
+            removed = frozenset(self._files.keys() - files.keys())
+
+        self._polled = (files, governance, now if full_sweep else self._last_sweep)
+        return AuditChangeSet(
+            file_count=len(files),
+            changed_files=changed,
+            removed_files=removed,
+            governance_changed=governance != self._governance,
+            full_sweep=full_sweep,
+        )
+
+    # ID: 3a6d1f92-4c8e-4b75-a2e0-b9f7c5d3e614
+    def commit(self) -> None:
+        """Adopt the last poll() as the baseline (after a successful cycle)."""
+        if self._polled is not None:
+            self._files, self._governance, self._last_sweep = self._polled
+            self._polled = None
+
+
+def _snapshot(root: Path, paths: Iterable[Path]) -> Snapshot:
+    snapshot: Snapshot = {}
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        try:
+            rel = path.relative_to(root).as_posix()
+        except ValueError:
+            rel = path.as_posix()
+        snapshot[rel] = (st.st_mtime_ns, st.st_size)
+    return snapshot
@@ -0,0 +1,306 @@
+# src/will/audit_violation/coordinator.py
+"""
+Shared audit pass for the AuditViolationSensor population.
+
+The audit_sensor_* workers (architecture, cli, governance, layout, linkage,
+logic, modularity, purity, style) each ran their own audit on their own
+schedule. They re-walked the same files, re-stat'ed them for the evaluation
+cache and reloaded the same .intent/ index, once per namespace.
+
+One AuditCoordinator per (auditor context, artifact type) now does that
+work for every sensor in the process:
+
+- refresh() polls a single AuditChangeFeed and reloads governance or drops
+  the file cache only when the feed says they changed.
+- audit(namespace, rule_ids) registers the namespace and, when its verdicts
+  are not current, runs one evaluation pass over the union of every
+  registered namespace's rules. The pass is full, incremental or skipped,
+  as described on _run_pass.
+- Each sensor gets back its own slice of that pass: the violations whose
+  rule belongs to its namespace. Posting, deduplication and adjudication
+  stay per-namespace in the sensor, so blackboard semantics do not change.
+
+The first sensor to wake after a change pays for the whole population. The
+others find the pass current and only slice it. Passes are serialized by a
+lock, so sensors that wake together wait for one pass and do not start
+their own.
+
+With audit.incremental_sensors off there is no shared baseline: every
+refresh() reloads governance and drops the file cache, and audit() runs a
+full audit of the caller's namespace only — the per-sensor cycle from
+before the coordinator.
+
+LAYER: will/audit_violation — collaborator of AuditViolationSensor. No file
+writes, no LLM. The audit itself goes through normalize_audit_findings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from shared.infrastructure.intent.operational_config import load_operational_config
+from shared.logger import getLogger
+from shared.path_resolver import PathResolver
+from will.audit_violation.change_feed import AuditChangeFeed, AuditChangeSet
+from will.audit_violation.normalizer import normalize_audit_findings
+
+
+if TYPE_CHECKING:
+    from mind.governance.executable_rule import ExecutableRule
+
+logger = getLogger(__name__)
+
+
+# ID: 5f2a8d63-1c7e-4b94-a3d0-e6b9c4f1a782
+class AuditCoordinator:
+    """One change feed, one baseline and one audit pass for many namespaces."""
+
+    def __init__(
+        self, core_context: Any, full_sweep_sec: float, incremental: bool = True
+    ) -> None:
+        self._core_context = core_context
+        self._full_sweep_sec = full_sweep_sec
+        self._incremental = incremental
+        self._lock = asyncio.Lock()
+        self._feed: AuditChangeFeed | None = None
+        self._pending: AuditChangeSet | None = None
+        self._namespaces: dict[str, list[str]] = {}
+        self._baseline_rule_ids: list[str] = []
+        self._baseline_rules: dict[str, ExecutableRule] | None = None
+        self._baseline_violations: list[dict[str, Any]] = []
+
+    # ID: 9b4e1c75-3d8a-4f26-b0e7-c2a5f8d3e619
+    async def refresh(self, globs: Iterable[str]) -> AuditChangeSet:
+        """
+        Poll the artifact universe and .intent/ for changes since the last
+        pass, refreshing the shared auditor inputs that changed.
+
+        ADR-039: content committed since the previous cycle must be visible
+        without a daemon restart. Governance is reloaded when .intent/
+        changed (or a full sweep is due), and the file cache is dropped when
+        anything changed. A quiet poll touches neither.
+        """
+        auditor_context = self._core_context.auditor_context
+        async with self._lock:
+            if self._feed is None:
+                self._feed = AuditChangeFeed(
+                    auditor_context.repo_path,
+                    PathResolver(auditor_context.repo_path).intent_root,
+                    self._full_sweep_sec,
+                )
+            changes = self._feed.poll(globs)
+            if changes.governance_changed or changes.full_sweep:
+                auditor_context.reload_governance()
+            if not changes.quiet:
+                auditor_context.invalidate_file_cache()
+            self._pending = changes
+            return changes
+
+    # ID: 2e7c9a41-6b3f-4d58-8a1e-f4d0b7c2e936
+    async def audit(
+        self, namespace: str, rule_ids: list[str]
+    ) -> tuple[list[dict[str, Any]], str]:
+        """
+        ``namespace``'s raw violations and how the pass that produced them
+        ran ("full", "incremental" or "quiet").
+
+        Runs a pass over every registered namespace when there are unaudited
+        changes or ``namespace``'s rules are not in the baseline yet;
+        otherwise slices the current baseline.
+        """
+        async with self._lock:
+            if not self._incremental:
+                raw = await normalize_audit_findings(
+                    self._core_context, namespace, list(rule_ids)
+                )
+                if self._feed is not None:
+                    self._feed.commit()
+                self._pending = None
+                return raw, "full"
+            self._namespaces[namespace] = list(rule_ids)
+            union = sorted({rid for ids in self._namespaces.values() for rid in ids})
+            if self._pending is None and union == self._baseline_rule_ids:
+                mode = "quiet"
+            else:
+                mode = await self._run_pass(union, self._pending)
+            wanted = set(rule_ids)
+            return [
+                v
+                for v in self._baseline_violations
+                if _owning_rule(str(v.get("rule_id") or ""), wanted) is not None
+            ], mode
+
+    async def _run_pass(
+        self, rule_ids: list[str], changes: AuditChangeSet | None
+    ) -> str:
+        """
+        Bring the baseline up to date for ``rule_ids``; returns the pass mode.
+
+        - "full": first pass or periodic sweep — every rule is evaluated on
+          the whole repo.
+        - "quiet": nothing changed — the baseline stands.
+        - "incremental": see _audit_changes.
+
+        The feed's baseline advances only when the pass succeeds, so a
+        failed pass's changes are picked up again by the next one.
+        """
+        if changes is None:
+            # Already-audited changes; only the rule set differs.
+            changes = AuditChangeSet(
+                file_count=0,
+                changed_files=frozenset(),
+                removed_files=frozenset(),
+                governance_changed=False,
+                full_sweep=False,
+            )
+        baseline = self._baseline_rules
+        if changes.full_sweep or baseline is None:
+            raw = await normalize_audit_findings(self._core_context, "", rule_ids)
+            rules = self._select_rules(rule_ids)
+            mode = "full"
+        elif changes.quiet and rule_ids == self._baseline_rule_ids:
+            raw = list(self._baseline_violations)
+            rules = baseline
+            mode = "quiet"
+        else:
+            rules = (
+                self._select_rules(rule_ids)
+                if changes.governance_changed or rule_ids != self._baseline_rule_ids
+                else baseline
+            )
+            raw = await self._audit_changes(rule_ids, rules, baseline, changes)
+            mode = "incremental"
+
+        self._baseline_rule_ids = list(rule_ids)
+        self._baseline_rules = rules
+        self._baseline_violations = list(raw)
+        if self._feed is not None:
+            self._feed.commit()
+        self._pending = None
+        logger.info(
+            "AuditCoordinator: %s pass over %d rule(s) in %d namespace(s), "
+            "%d violation(s).",
+            mode,
+            len(rule_ids),
+            len(self._namespaces),
+            len(raw),
+        )
+        return mode
+
+    async def _audit_changes(
+        self,
+        rule_ids: list[str],
+        rules: dict[str, ExecutableRule],
+        baseline: dict[str, ExecutableRule],
+        changes: AuditChangeSet,
+    ) -> list[dict[str, Any]]:
+        """
+        Re-evaluate only the (rule, file) pairs touched since the baseline.
+
+        - Per-file rules whose content hash is unchanged run on the changed
+          files only.
+        - New or edited rules run on the whole repo, as do context-level and
+          requires_findings_from rules when any file changed (their verdict
+          on one file depends on others), together with the rules they read
+          findings from.
+        - Every other baseline violation carries over, except those on a
+          changed or removed file and those of rules that were re-run or
+          are gone.
+        """
+        rerun = {
+            rule_id
+            for rule_id, rule in rules.items()
+            if rule_id not in baseline
+            or baseline[rule_id].rule_content_hash != rule.rule_content_hash
+        }
+        if changes.dirty_files:
+            rerun |= {
+                rule_id
+                for rule_id, rule in rules.items()
+                if rule.is_context_level or rule.requires_findings_from
+            }
+        # A dependent rule reads its dependencies' findings from the same run.
+        pending = list(rerun)
+        while pending:
+            for dependency in rules[pending.pop()].requires_findings_from:
+                if dependency in rules and dependency not in rerun:
+                    rerun.add(dependency)
+                    pending.append(dependency)
+        scoped = [
+            rule_id for rule_id in rule_ids if rule_id in rules and rule_id not in rerun
+        ]
+
+        known = set(baseline) | set(rules)
+        scoped_set = set(scoped)
+        violations = []
+        for v in self._baseline_violations:
+            if v["file_path"] in changes.dirty_files:
+                continue
+            owner = _owning_rule(str(v.get("rule_id") or ""), known)
+            if owner is None or owner in scoped_set:
+                violations.append(v)
+
+        changed_files = sorted(changes.changed_files)
+        if scoped and changed_files:
+            violations.extend(
+                await normalize_audit_findings(
+                    self._core_context, "", scoped, files=changed_files
+                )
+            )
+        if rerun:
+            violations.extend(
+                await normalize_audit_findings(
+                    self._core_context,
+                    "",
+                    [rule_id for rule_id in rule_ids if rule_id in rerun],
+                )
+            )
+        logger.info(
+            "AuditCoordinator: incremental pass — %d rule(s) on %d changed "
+            "file(s), %d rule(s) re-run in full, %d violation(s) carried over.",
+            len(scoped) if changed_files else 0,
+            len(changed_files),
+            len(rerun),
+            len(violations),
+        )
+        return violations
+
+    def _select_rules(self, rule_ids: list[str]) -> dict[str, ExecutableRule]:
+        from mind.governance.filtered_audit import select_rules
+
+        auditor_context = self._core_context.auditor_context
+        return {rule.rule_id: rule for rule in select_rules(auditor_context, rule_ids)}
+
+
+_COORDINATORS: dict[tuple[int, str], tuple[Any, AuditCoordinator]] = {}
+
+
+# ID: 7d1f4b38-9e2c-4a65-b8d3-a0e6c5f9b247
+def get_audit_coordinator(core_context: Any, artifact_type: str) -> AuditCoordinator:
+    """The coordinator shared by every sensor of ``artifact_type`` that audits
+    through ``core_context``'s auditor context."""
+    auditor_context = core_context.auditor_context
+    key = (id(auditor_context), artifact_type)
+    entry = _COORDINATORS.get(key)
+    if entry is None or entry[0] is not auditor_context:
+        audit_cfg = load_operational_config().audit
+        incremental = audit_cfg.incremental_sensors
+        full_sweep_sec = audit_cfg.sensor_full_sweep_sec if incremental else 0
+        entry = (
+            auditor_context,
+            AuditCoordinator(core_context, full_sweep_sec, incremental=incremental),
+        )
+        _COORDINATORS[key] = entry
+    return entry[1]
+
+
+def _owning_rule(check_id: str, rule_ids: set[str]) -> str | None:
+    """The rule a finding's check_id belongs to (``<rule_id>[.<suffix>]``)."""
+    candidate = check_id
+    while candidate:
+        if candidate in rule_ids:
+            return candidate
+        candidate = candidate.rpartition(".")[0]
+    return None
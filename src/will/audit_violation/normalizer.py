@@ -33,6 +33,7 @@ async def normalize_audit_findings(
     core_context: Any,
     rule_namespace: str,
     rule_ids: list[str],
+    files: list[str] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Run a filtered constitutional audit for the resolved rule IDs and
@@ -45,6 +46,9 @@ async def normalize_audit_findings(
     auditor_context.symbols_map; if no path can be recovered, it
     synthesizes a sentinel of the form "__symbol_pair__<symbol>" that
     the downstream filter recognises as unactionable.
+
+    ``files`` (repo-relative) scopes per-file rules to those files; the
+    auditor skips context-level rules under a file scope.
     """
     from body.services.service_registry import service_registry
     from mind.governance.filtered_audit import run_filtered_audit
@@ -54,9 +58,10 @@ async def normalize_audit_findings(
     async with service_registry.session() as session:
         auditor_context.db_session = session
         await auditor_context.load_knowledge_graph()
-        raw_findings, _, _ = await run_filtered_audit(
-            auditor_context, rule_ids=rule_ids
-        )
+        scope: dict[str, Any] = {"rule_ids": rule_ids}
+        if files is not None:
+            scope["files"] = files
+        raw_findings, _, _ = await run_filtered_audit(auditor_context, **scope)
         auditor_context.db_session = None
 
     violations = []
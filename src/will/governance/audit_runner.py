@@ -45,6 +45,7 @@ from mind.governance.audit_postprocessor import apply_entry_point_downgrade
 from mind.governance.audit_report_writer import build_auto_ignored_markdown
 from mind.governance.auditor import AuditVerdict, ConstitutionalAuditor
 from mind.governance.filtered_audit import run_filtered_audit
+from mind.governance.rule_executor import clear_eval_cache
 from shared.context import CoreContext
 from shared.logger import getLogger
 from shared.path_resolver import PathResolver
@@ -184,6 +185,8 @@ async def run_sync_audit(
     policy_ids: list[str] | None = None,
     files: list[str] | None = None,
     force_llm: bool = False,
+    no_cache: bool = False,
+    workers: int | None = None,
     source: str = "api",
 ) -> dict:
     """Run the audit synchronously and return the full result.
@@ -199,8 +202,13 @@ async def run_sync_audit(
       `core.audit_runs` row, and write the report-file set
       (findings.json, auto_ignored.{md,json}, evidence ledger).
 
-    Daemon coexistence: this sets `context.auditor_context.db_session`
-    and `force_llm` directly, matching the legacy CLI pattern. The
+    ``workers`` overrides operational_config.audit.parallel_workers for
+    this run (CPU-bound engines sharded across worker processes).
+    ``no_cache`` drops the persisted per-file verdicts first, so every
+    (rule, file) pair is re-evaluated.
+
+    Daemon coexistence: this sets `context.auditor_context.db_session`,
+    `force_llm` and `audit_workers` directly, matching the legacy CLI pattern. The
     daemon's AuditViolationSensor uses the same shared context, so a
     long-running sync API call overlapping a sensor cycle could race
     on those attributes. The race window matches the legacy CLI's
@@ -223,6 +231,9 @@ async def run_sync_audit(
 
     context.auditor_context.db_session = session
     context.auditor_context.force_llm = force_llm
+    context.auditor_context.audit_workers = workers
+    if no_cache:
+        clear_eval_cache(context.auditor_context.repo_path)
 
     start_time = time.perf_counter()
     try:
@@ -246,6 +257,7 @@ async def run_sync_audit(
             results = await auditor.run_full_audit_async()
     finally:
         context.auditor_context.db_session = None
+        context.auditor_context.audit_workers = None
 
     duration = time.perf_counter() - start_time
 
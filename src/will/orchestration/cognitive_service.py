@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from body.services.mind_state_service import MindStateService
+from shared.config import settings
 from shared.exceptions import SecretNotFoundError
 from shared.infrastructure.config_service import ConfigService
 from shared.infrastructure.database.models import LlmResource
@@ -86,6 +87,12 @@ class CognitiveService:
             self._loaded = True
             logger.info("CognitiveService initialized and connections detached.")
 
+    # ID: 7f1b3d59-e2a8-4c64-b9d0-5a8e1c7f3b26
+    async def aclose(self) -> None:
+        """Close pooled provider connections. Safe before initialize()."""
+        if self._orch is not None:
+            await self._orch.aclose()
+
     def _require_ready(self) -> None:
         if not self._loaded or not self._orch or not self._config:
             raise RuntimeError("CognitiveService is not initialized.")
@@ -160,6 +167,20 @@ class CognitiveService:
         client = await self.aget_client_for_role("Vectorizer")
         return await client.get_embedding(source_code)
 
+    # ID: 3d9c6a18-4e2b-4f75-8a07-b1e5c2d9f463
+    async def get_embedding_revision(self) -> str:
+        """Active embed model revision (``embed_model.revision`` config key).
+
+        Falls back to settings.EMBED_MODEL_REVISION when the service is not
+        initialized or core.system_config leaves the revision unset. Used
+        to key (and so invalidate) cached embeddings.
+        """
+        if self._config is not None:
+            revision = await self._config.get("embed_model.revision")
+            if revision:
+                return revision
+        return settings.EMBED_MODEL_REVISION
+
     # ID: 7c4e9a35-1f8b-4d62-a591-2e0f6b8c7a39
     async def get_embeddings_for_code_batch(
         self, source_texts: list[str]
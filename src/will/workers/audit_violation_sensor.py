@@ -21,6 +21,19 @@ Design:
   IntentRepository._rule_index at runtime — no hardcoding.
 - Adding a rule to an existing namespace automatically brings it into scope.
 
+Shared, change-driven audit:
+- Sensors do not audit on their own. An AuditCoordinator shared by every
+  sensor in the process (will.audit_violation.coordinator) runs one change
+  poll and one evaluation pass over the union of all registered namespaces.
+  Each sensor posts and adjudicates only its own slice of that pass.
+- The pass is change-driven. An AuditChangeFeed (a stat snapshot of the
+  artifact universe and .intent/) reports what changed since the last pass.
+  A quiet repo is not re-audited. Otherwise only the (rule, file) pairs
+  touched by the change are re-evaluated and the rest carry over.
+- audit.sensor_full_sweep_sec bounds how long an incremental baseline may
+  live; audit.incremental_sensors=false makes every cycle a full audit of
+  the sensor's own namespace, with no shared pass.
+
 Deduplication contract:
 - Dedup is by subject string across ALL workers, not per-worker-UUID.
 - This prevents different instances of the same logical sensor (e.g. old
@@ -42,6 +55,10 @@ Cause attribution (ADR-015 D5):
   window. On match, the payload carries causing_proposal_id and
   causing_commit_sha; on no match, those keys are None and cause_attribution
   is the explicit string "untracked" (URS Q6 / issue #148 acceptance).
+- Attribution for all of a cycle's findings is one set-based lookup, and
+  the findings are then written in one bulk upsert
+  (post_artifact_findings_bulk), so a cycle costs a fixed number of
+  round-trips however many files a rule trips on.
 
 LAYER: will/workers — sensing worker. Receives CoreContext via constructor
 injection. No file writes. No LLM. Pure perception. DB access is delegated
@@ -56,8 +73,8 @@ from typing import Any
 from shared.infrastructure.intent.intent_repository import get_intent_repository
 from shared.logger import getLogger
 from shared.workers.base import Worker
+from will.audit_violation.coordinator import get_audit_coordinator
 from will.audit_violation.filter import filter_actionable_violations
-from will.audit_violation.normalizer import normalize_audit_findings
 
 
 logger = getLogger(__name__)
@@ -141,15 +158,8 @@ class AuditViolationSensor(Worker):
         """
         await self.post_heartbeat()
 
-        # ADR-039: refresh governance and filesystem inputs before
-        # resolving rules so content committed since the previous cycle
-        # is visible without daemon restart.
         intent_repo = get_intent_repository()
 
-        auditor_context = self._core_context.auditor_context
-        auditor_context.reload_governance()
-        auditor_context.invalidate_file_cache()
-
         # ADR-091 D5 Phase 3: discovery globs come from the artifact_type
         # declared on this sensor's worker YAML, not a hardcoded "python".
         # Single-element list is the common case; multi-element joint
@@ -158,17 +168,23 @@ class AuditViolationSensor(Worker):
         artifact_globs = intent_repo.get_artifact_type(artifact_type_id).content[
             "discovery"
         ]
-        file_count = sum(
-            1
-            for pattern in artifact_globs
-            for _ in auditor_context.repo_path.glob(pattern)
-        )
+        coordinator = get_audit_coordinator(self._core_context, artifact_type_id)
+        # ADR-039: governance and filesystem inputs are refreshed before
+        # resolving rules so content committed since the previous cycle is
+        # visible without daemon restart — by the coordinator, once for all
+        # sensors, and only when they changed.
+        changes = await coordinator.refresh(artifact_globs)
+
+        file_count = changes.file_count
         rule_count = len(intent_repo._rule_index or {})
         logger.info(
-            "audit_sensor_%s: rescanned %d files, %d rules loaded",
+            "audit_sensor_%s: %d files (%d changed, %d removed), %d rules loaded%s",
             self._rule_namespace,
             file_count,
+            len(changes.changed_files),
+            len(changes.removed_files),
             rule_count,
+            ", full sweep" if changes.full_sweep else "",
         )
 
         # ADR-137 D1: no-data guard — zero files is a distinct verdict, not a
@@ -221,8 +237,8 @@ class AuditViolationSensor(Worker):
             rule_ids,
         )
 
-        raw_violations = await normalize_audit_findings(
-            self._core_context, self._rule_namespace, rule_ids
+        raw_violations, audit_mode = await coordinator.audit(
+            self._rule_namespace, rule_ids
         )
         violations = filter_actionable_violations(raw_violations)
 
@@ -316,6 +332,7 @@ class AuditViolationSensor(Worker):
                     "rule_ids_resolved": len(rule_ids),
                     "violations_found": 0,
                     "filtered_unactionable": filtered_out,
+                    "audit_mode": audit_mode,
                     "dry_run": self._dry_run,
                     "message": (
                         f"No actionable violations in namespace '{self._rule_namespace}'."
@@ -350,16 +367,8 @@ class AuditViolationSensor(Worker):
         # violation when the sensor restarts with a new UUID.
         existing = await self._fetch_existing_subjects()
 
-        # ADR-015 D5: heuristic cause attribution via Body's ConsequenceLogService.
-        # Resolved once before the loop; lookback is sensor-config-tunable.
-        consequence_svc = (
-            await self._core_context.registry.get_consequence_log_service()
-        )
-        lookback = getattr(self, "_config", {}).get("cause_lookback_seconds", 3600)
-
-        posted = 0
         skipped = 0
-
+        to_post: list[tuple[str, dict[str, Any]]] = []
         for v in violations:
             rule_id = v.get("rule_id", self._rule_namespace)
             subject = f"{artifact_type_id}::{rule_id}::{v['file_path']}"
@@ -370,11 +379,26 @@ class AuditViolationSensor(Worker):
                     "AuditViolationSensor: skipping already-posted %s", subject
                 )
                 continue
+            to_post.append((rule_id, v))
 
-            cause = await consequence_svc.find_cause_for_file(
-                v["file_path"], lookback_seconds=lookback
+        # ADR-015 D5: heuristic cause attribution via Body's ConsequenceLogService.
+        # One set-based lookup for every file about to be posted; lookback is
+        # sensor-config-tunable.
+        causes: dict[str, dict[str, str | None]] = {}
+        if to_post:
+            consequence_svc = (
+                await self._core_context.registry.get_consequence_log_service()
+            )
+            lookback = getattr(self, "_config", {}).get("cause_lookback_seconds", 3600)
+            causes = await consequence_svc.find_causes_for_files(
+                sorted({v["file_path"] for _, v in to_post}),
+                lookback_seconds=lookback,
             )
 
+        findings: list[tuple[str, str, dict[str, Any]]] = []
+        for rule_id, v in to_post:
+            cause = causes.get(v["file_path"]) or {}
+            causing_proposal_id = cause.get("causing_proposal_id")
             payload: dict[str, Any] = {
                 "rule_namespace": self._rule_namespace,
                 "rule": rule_id,
@@ -384,23 +408,22 @@ class AuditViolationSensor(Worker):
                 "severity": v["severity"],
                 "dry_run": self._dry_run,
                 "status": "unprocessed",
-                "causing_proposal_id": cause["causing_proposal_id"],
-                "causing_commit_sha": cause["causing_commit_sha"],
+                "causing_proposal_id": causing_proposal_id,
+                "causing_commit_sha": cause.get("causing_commit_sha"),
                 "cause_attribution": (
-                    "heuristic" if cause["causing_proposal_id"] else "untracked"
+                    "heuristic" if causing_proposal_id else "untracked"
                 ),
             }
             if rule_id in _ARCHITECTURAL_JUDGMENT_RULES:
                 payload["resolution_authority"] = "principal.governor"
+            findings.append((rule_id, v["file_path"], payload))
 
-            await self.post_artifact_finding(
-                artifact_type=artifact_type_id,
-                sub_namespace=rule_id,
-                identity_key_value=v["file_path"],
-                payload=payload,
-            )
-            posted += 1
-            logger.debug("AuditViolationSensor: posted finding for %s", v["file_path"])
+        # One multi-row upsert for the whole cycle instead of a transaction
+        # per finding; dedup semantics are those of post_artifact_finding.
+        if findings:
+            await self.post_artifact_findings_bulk(artifact_type_id, findings)
+        posted = len(findings)
+        logger.debug("AuditViolationSensor: posted %d finding(s)", posted)
 
         await self.post_report(
             subject="audit_violation_sensor.run.complete",
@@ -411,6 +434,7 @@ class AuditViolationSensor(Worker):
                 "filtered_unactionable": filtered_out,
                 "posted": posted,
                 "skipped_duplicates": skipped,
+                "audit_mode": audit_mode,
                 "dry_run": self._dry_run,
                 "message": (
                     f"Run complete. {posted} findings posted, "
@@ -13,6 +13,8 @@ from .helpers import (
     _chunk_file,
     _chunk_whole,
     _embed_and_upsert,
+    _embed_artifacts,
+    _EmbedJob,
     _split_large,
 )
 from .repo_embedder_workers import RepoEmbedderWorker, logger
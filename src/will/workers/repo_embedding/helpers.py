@@ -4,10 +4,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from shared.infrastructure.intent.operational_config import load_operational_config
+from shared.infrastructure.vector.point_ids import load_point_ids_by_file
+from shared.logger import getLogger
+
+
+logger = getLogger(__name__)
 
 
 _CFG_CHK = load_operational_config().chunking
@@ -193,53 +201,253 @@ def _split_large(
     return chunks
 
 
-async def _embed_and_upsert(
-    chunks: list[dict[str, Any]],
-    collection: str,
-    file_path: str,
-    artifact_type: str,
+@dataclass
+# ID: 3f8a1c6d-92e4-4b57-a0d3-7e5c9b2f1a48
+class _EmbedJob:
+    """One artifact's chunks moving through the batched embed pipeline.
+
+    Chunk identity is the sha256 of the chunk text, so a point keeps its id
+    when unrelated parts of the file change. ``existing`` holds the ids the
+    collection already has for this file (None when they could not be read);
+    chunks found there are skipped and ids not re-derived become orphans.
+    """
+
+    file_path: str
+    artifact_type: str
+    collection: str
+    chunks: list[dict[str, Any]]
+    vectors: dict[int, list[float]] = field(default_factory=dict)
+    error: Exception | None = None
+    existing: set[str] | None = None
+    point_ids: dict[int, str] = field(default_factory=dict)
+    hashes: dict[int, str] = field(default_factory=dict)
+    skip: set[int] = field(default_factory=set)
+    reused: int = 0
+
+
+def _chunk_point_id(file_path: str, content_sha256: str) -> str:
+    """Deterministic point id for a chunk, keyed on its content, not position."""
+    from shared.universal import get_deterministic_id
+
+    return str(get_deterministic_id(f"{file_path}::chunk::{content_sha256}"))
+
+
+def _mark_unchanged(job: _EmbedJob) -> None:
+    """Hash each chunk and flag those that need no embedding call.
+
+    Skipped: empty texts, repeats of an identical chunk earlier in the same
+    file (they share one point), and chunks already stored in the collection.
+    """
+    job.point_ids.clear()
+    job.hashes.clear()
+    job.skip.clear()
+    job.reused = 0
+    seen: set[str] = set()
+    for c, chunk in enumerate(job.chunks):
+        text = chunk["text"]
+        if not text:
+            job.skip.add(c)
+            continue
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        pid = _chunk_point_id(job.file_path, digest)
+        if pid in seen:
+            job.skip.add(c)
+            continue
+        seen.add(pid)
+        job.point_ids[c] = pid
+        job.hashes[c] = digest
+        if job.existing is not None and pid in job.existing:
+            job.skip.add(c)
+            job.reused += 1
+
+
+def _plan_embed_batches(
+    jobs: list[_EmbedJob], max_chunks: int, max_chars: int
+) -> list[list[tuple[int, int]]]:
+    """Pack (job, chunk) refs into batches bounded by count and characters.
+
+    Batches span artifacts. Empty chunk texts and chunks flagged in
+    ``job.skip`` are left out. A chunk larger than max_chars still gets a
+    batch of its own.
+    """
+    batches: list[list[tuple[int, int]]] = []
+    current: list[tuple[int, int]] = []
+    chars = 0
+    for j, job in enumerate(jobs):
+        for c, chunk in enumerate(job.chunks):
+            size = len(chunk["text"])
+            if not size or c in job.skip:
+                continue
+            if current and (len(current) >= max_chunks or chars + size > max_chars):
+                batches.append(current)
+                current, chars = [], 0
+            current.append((j, c))
+            chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _load_existing_point_ids(
+    qdrant: Any, collection: str, members: list[_EmbedJob]
+) -> None:
+    """Fill ``job.existing`` from one filtered scroll over the members' files.
+
+    On failure ``existing`` stays None: every chunk is re-embedded and no
+    orphan is deleted, which is the pre-dedup behaviour.
+    """
+    try:
+        by_path = await load_point_ids_by_file(
+            qdrant, collection, (job.file_path for job in members)
+        )
+    except Exception as exc:
+        logger.warning(
+            "RepoEmbedder: could not read stored chunks from %s (%s); "
+            "re-embedding all chunks",
+            collection,
+            exc,
+        )
+        return
+    for job in members:
+        job.existing = by_path[job.file_path]
+
+
+async def _embed_artifacts(
+    jobs: list[_EmbedJob],
     qdrant: Any,
     cognitive: Any,
-) -> int:
-    """Embed chunks and upsert to Qdrant. Returns number of chunks upserted."""
+    ensured_collections: set[str],
+) -> list[int | Exception]:
+    """Embed many artifacts' changed chunks in batches; sync each collection.
+
+    Per collection: ensure it once (names are remembered in
+    ``ensured_collections``), read the members' stored point ids in one
+    scroll, and skip chunks whose content-hash point already exists. The
+    remaining chunks from all jobs are packed into size-bounded batches for
+    cognitive.get_embeddings_for_code_batch, with at most
+    embedding.batch_concurrency batches in flight. Each collection then gets
+    one upsert for its new points and one delete for its orphaned points.
+
+    Returns, aligned with ``jobs``, the artifact's chunk count (reused plus
+    newly embedded points) or the exception that failed it. A failed batch
+    fails only the artifacts with chunks in it; a failed collection step
+    fails that collection's artifacts.
+    """
     from qdrant_client import models as qm
 
-    from shared.universal import get_deterministic_id
+    by_collection: dict[str, list[int]] = {}
+    for j, job in enumerate(jobs):
+        by_collection.setdefault(job.collection, []).append(j)
+
+    for collection, members in by_collection.items():
+        try:
+            if collection not in ensured_collections:
+                await qdrant.ensure_collection(collection_name=collection)
+                ensured_collections.add(collection)
+        except Exception as exc:
+            for j in members:
+                jobs[j].error = exc
+            continue
+        await _load_existing_point_ids(qdrant, collection, [jobs[j] for j in members])
+
+    for job in jobs:
+        if job.error is None:
+            _mark_unchanged(job)
+
+    cfg = load_operational_config().embedding
+    batches = _plan_embed_batches(
+        [job for job in jobs if job.error is None],
+        max(1, cfg.batch_max_chunks),
+        max(1, cfg.batch_max_chars),
+    )
+    live = [j for j, job in enumerate(jobs) if job.error is None]
+    batches = [[(live[j], c) for j, c in refs] for refs in batches]
+    sem = asyncio.Semaphore(max(1, cfg.batch_concurrency))
+
+    async def _run_batch(refs: list[tuple[int, int]]) -> None:
+        texts = [jobs[j].chunks[c]["text"] for j, c in refs]
+        try:
+            async with sem:
+                vectors = await cognitive.get_embeddings_for_code_batch(texts)
+            if len(vectors) != len(refs):
+                raise ValueError(
+                    f"embedding batch returned {len(vectors)} vectors "
+                    f"for {len(refs)} texts"
+                )
+        except Exception as exc:
+            for j, _ in refs:
+                jobs[j].error = jobs[j].error or exc
+            return
+        for (j, c), vec in zip(refs, vectors):
+            if vec is not None:
+                jobs[j].vectors[c] = (
+                    vec.tolist() if hasattr(vec, "tolist") else list(vec)
+                )
 
-    await qdrant.ensure_collection(collection_name=collection)
+    await asyncio.gather(*(_run_batch(refs) for refs in batches))
 
-    points = []
-    for i, chunk in enumerate(chunks):
-        text = chunk["text"]
-        embedding = await cognitive.get_embedding_for_code(text)
-        if embedding is None:
+    for collection, members in by_collection.items():
+        done = [j for j in members if jobs[j].error is None]
+        if not done:
             continue
+        points = []
+        orphans: list[str] = []
+        for j in done:
+            job = jobs[j]
+            for i in sorted(job.vectors):
+                points.append(
+                    qm.PointStruct(
+                        id=job.point_ids[i],
+                        vector=job.vectors[i],
+                        payload={
+                            **job.chunks[i]["metadata"],
+                            "item_id": f"{job.file_path}::chunk::{job.hashes[i]}",
+                            "content_sha256": job.hashes[i],
+                            "artifact_type": job.artifact_type,
+                            "file_path": job.file_path,
+                        },
+                    )
+                )
+            if job.existing is not None:
+                orphans.extend(sorted(job.existing - set(job.point_ids.values())))
+        try:
+            if points:
+                await qdrant.upsert_points(
+                    collection_name=collection, points=points, wait=True
+                )
+            if orphans:
+                await qdrant.delete_points(
+                    orphans, wait=True, collection_name=collection
+                )
+        except Exception as exc:
+            for j in done:
+                jobs[j].error = exc
 
-        item_id = f"{file_path}::chunk::{i}"
-        point_id = get_deterministic_id(item_id)
-        payload = {
-            **chunk["metadata"],
-            "item_id": item_id,
-            "artifact_type": artifact_type,
-            "file_path": file_path,
-        }
-        points.append(
-            qm.PointStruct(
-                id=point_id,
-                vector=(
-                    embedding.tolist()
-                    if hasattr(embedding, "tolist")
-                    else list(embedding)
-                ),
-                payload=payload,
-            )
-        )
+    return [
+        job.error if job.error is not None else job.reused + len(job.vectors)
+        for job in jobs
+    ]
 
-    if points:
-        await qdrant.upsert_points(
-            collection_name=collection,
-            points=points,
-            wait=True,
-        )
 
-    return len(points)
+async def _embed_and_upsert(
+    chunks: list[dict[str, Any]],
+    collection: str,
+    file_path: str,
+    artifact_type: str,
+    qdrant: Any,
+    cognitive: Any,
+) -> int:
+    """Embed one artifact's chunks and upsert to Qdrant. Returns chunks upserted.
+
+    Single-artifact entry point over _embed_artifacts; raises the
+    artifact's failure instead of returning it.
+    """
+    [result] = await _embed_artifacts(
+        [_EmbedJob(file_path, artifact_type, collection, chunks)],
+        qdrant,
+        cognitive,
+        ensured_collections=set(),
+    )
+    if isinstance(result, Exception):
+        raise result
+    return result
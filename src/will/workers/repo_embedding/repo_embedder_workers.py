@@ -14,7 +14,7 @@ from shared.workers.scheduled_worker import ScheduledWorker
 
 logger = getLogger(__name__)
 
-from .helpers import _chunk_file, _embed_and_upsert
+from .helpers import _chunk_file, _embed_artifacts, _EmbedJob
 
 
 # ID: 1f09a2d8-0307-4172-b1b0-e3f14a918e00
@@ -34,6 +34,9 @@ class RepoEmbedderWorker(ScheduledWorker):
         self._repo_root: Path = BootstrapRegistry.get_repo_path()
         schedule = self._declaration.get("mandate", {}).get("schedule", {})
         self._batch_size: int = schedule.get("batch_size", 10)
+        # Qdrant collections already ensured by this worker; ensure_collection
+        # is a list-collections round-trip, so it runs once per collection.
+        self._ensured_collections: set[str] = set()
 
     async def _before_loop(self) -> None:
         """Lazy-load CognitiveService if not injected (daemon context)."""
@@ -62,6 +65,9 @@ class RepoEmbedderWorker(ScheduledWorker):
             logger.info("RepoEmbedderWorker: nothing to embed, all artifacts current")
             return
 
+        # Chunk every artifact first so the embedder sees one cross-artifact
+        # stream of chunks it can batch, instead of one call per chunk.
+        pending: list[tuple[Any, _EmbedJob]] = []
         for artifact in artifacts:
             artifact_id = artifact["id"]
             file_path = artifact["file_path"]
@@ -83,31 +89,43 @@ class RepoEmbedderWorker(ScheduledWorker):
                         file_path,
                     )
                     continue
-
-                chunk_count = await _embed_and_upsert(
-                    chunks=chunks,
-                    collection=collection,
-                    file_path=file_path,
-                    artifact_type=artifact_type,
-                    qdrant=qdrant,
-                    cognitive=cognitive,
+            except Exception as exc:
+                stats["errors"] += 1
+                logger.warning(
+                    "RepoEmbedderWorker: failed to embed %s: %s", file_path, exc
                 )
+                continue
 
-                await svc.update_artifact_chunk_count(artifact_id, chunk_count)
+            pending.append(
+                (artifact_id, _EmbedJob(file_path, artifact_type, collection, chunks))
+            )
+
+        results = await _embed_artifacts(
+            [job for _, job in pending],
+            qdrant,
+            cognitive,
+            self._ensured_collections,
+        )
+
+        for (artifact_id, job), result in zip(pending, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                await svc.update_artifact_chunk_count(artifact_id, result)
 
                 stats["processed"] += 1
-                stats["chunks_total"] += chunk_count
+                stats["chunks_total"] += result
                 logger.info(
                     "RepoEmbedderWorker: embedded %s → %s chunks → %s",
-                    file_path,
-                    chunk_count,
-                    collection,
+                    job.file_path,
+                    result,
+                    job.collection,
                 )
 
             except Exception as exc:
                 stats["errors"] += 1
                 logger.warning(
-                    "RepoEmbedderWorker: failed to embed %s: %s", file_path, exc
+                    "RepoEmbedderWorker: failed to embed %s: %s", job.file_path, exc
                 )
 
         await self.post_report(
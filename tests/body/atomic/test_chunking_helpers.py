@@ -6,13 +6,22 @@ chunk list bypasses `sync_actions.py`'s `if not chunks: mark_artifact_empty()`
 guard — the embedder short-circuits empty text to `None`, which
 `_embed_and_upsert` silently drops, leaving `chunk_count` stuck at 0
 forever (never reaches the -1 permanently-skipped terminal state).
+
+Also covers `_embed_and_upsert` on content-hash point IDs: stored chunks are
+not re-embedded unless `force` is set, and the file's orphaned points
+(edited-away chunks, legacy `::chunk::{i}` points) are deleted.
 """
 
+import hashlib
+from unittest.mock import AsyncMock, MagicMock
+
 from body.atomic.sync_actions.chunking_helpers import (
     _chunk_by_symbol,
     _chunk_file,
     _chunk_whole,
+    _embed_and_upsert,
 )
+from shared.universal import get_deterministic_id
 
 
 def test_chunk_whole_empty_content_returns_no_chunks():
@@ -52,3 +61,65 @@ def test_chunk_file_empty_python_file_returns_no_chunks(tmp_path):
     empty_file = tmp_path / "__init__.py"
     empty_file.write_text("", encoding="utf-8")
     assert _chunk_file(empty_file, "python") == []
+
+
+def _point_id(item_id: str) -> str:
+    return str(get_deterministic_id(item_id))
+
+
+def _hash_id(path: str, text: str) -> str:
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    return _point_id(f"{path}::chunk::{digest}")
+
+
+async def test_embed_and_upsert_reuses_stored_chunks_and_deletes_orphans():
+    path = "src/pkg/mod.py"
+    stored = [
+        _hash_id(path, "keep"),
+        _hash_id(path, "gone"),
+        _point_id(f"{path}::chunk::0"),
+    ]
+    qdrant = AsyncMock(
+        scroll_all_points=AsyncMock(
+            return_value=[
+                MagicMock(id=pid, payload={"file_path": path}) for pid in stored
+            ]
+        )
+    )
+    cognitive = AsyncMock(get_embedding_for_code=AsyncMock(return_value=[1.0]))
+    chunks = [{"text": t, "metadata": {}} for t in ("keep", "new", "new")]
+
+    count = await _embed_and_upsert(
+        chunks, "core-code", path, "python", qdrant, cognitive
+    )
+
+    assert count == 2
+    cognitive.get_embedding_for_code.assert_awaited_once_with("new")
+    [upserted] = qdrant.upsert_points.await_args.kwargs["points"]
+    assert upserted.id == _hash_id(path, "new")
+    orphans = qdrant.delete_points.await_args.args[0]
+    assert set(orphans) == set(stored[1:])
+
+
+async def test_embed_and_upsert_force_re_embeds_stored_chunks():
+    path = "src/pkg/mod.py"
+    stored = [_hash_id(path, "keep"), _hash_id(path, "gone")]
+    qdrant = AsyncMock(
+        scroll_all_points=AsyncMock(
+            return_value=[
+                MagicMock(id=pid, payload={"file_path": path}) for pid in stored
+            ]
+        )
+    )
+    cognitive = AsyncMock(get_embedding_for_code=AsyncMock(return_value=[1.0]))
+    chunks = [{"text": "keep", "metadata": {}}]
+
+    count = await _embed_and_upsert(
+        chunks, "core-code", path, "python", qdrant, cognitive, force=True
+    )
+
+    assert count == 1
+    cognitive.get_embedding_for_code.assert_awaited_once_with("keep")
+    [upserted] = qdrant.upsert_points.await_args.kwargs["points"]
+    assert upserted.id == stored[0]
+    assert qdrant.delete_points.await_args.args[0] == [stored[1]]
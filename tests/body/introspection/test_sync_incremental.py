@@ -0,0 +1,150 @@
+# tests/body/introspection/test_sync_incremental.py
+
+"""
+Incremental symbol sync — scanner manifest and scoped merge.
+
+Proves:
+  - a second scan against the first scan's manifest reads no module
+  - a module whose stat changed but whose content did not is re-hashed but
+    not re-extracted, and its manifest entry is refreshed
+  - an edited module is re-extracted alone; a deleted one is reported
+    removed
+  - a scanner version change re-extracts every module
+  - the merge COPYs staging rows through the driver connection, falls back
+    to an INSERT without one, and scopes its deletes to the changed modules
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from body.introspection.sync import scanner
+from body.introspection.sync.engine import run_db_merge
+from body.introspection.sync.scanner import SymbolScanner
+
+
+_OLD = time.time() - 3600
+
+
+def _write(root: Path, rel_path: str, source: str, mtime: float = _OLD) -> None:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def _tree(root: Path) -> None:
+    _write(root, "src/pkg/a.py", "def alpha():\n    return beta()\n")
+    _write(root, "src/pkg/b.py", "class Beta:\n    def run(self):\n        pass\n")
+    _write(root, "src/pkg/c.py", "def gamma():\n    pass\n")
+
+
+def _rescan(root: Path, manifest: scanner.SyncManifest) -> tuple:
+    with patch.object(scanner, "_scan_module", wraps=scanner._scan_module) as read:
+        result = SymbolScanner(root).scan_changes(manifest)
+    return result, read
+
+
+def test_unchanged_tree_reads_nothing(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    first = SymbolScanner(tmp_path).scan_changes({})
+    assert sorted(first.changed_files) == [
+        "src/pkg/a.py",
+        "src/pkg/b.py",
+        "src/pkg/c.py",
+    ]
+
+    second, read = _rescan(tmp_path, first.manifest)
+
+    read.assert_not_called()
+    assert second.unchanged == 3
+    assert second.symbols == second.changed_files == second.removed_files == []
+    assert second.manifest == {}
+
+
+def test_touched_module_is_rehashed_not_reextracted(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    manifest = SymbolScanner(tmp_path).scan_changes({}).manifest
+    os.utime(tmp_path / "src/pkg/a.py", (_OLD + 60, _OLD + 60))
+
+    result, read = _rescan(tmp_path, manifest)
+
+    read.assert_called_once()
+    assert result.changed_files == []
+    assert result.unchanged == 3
+    touched = (tmp_path / "src/pkg/a.py").stat().st_mtime_ns
+    assert result.manifest["src/pkg/a.py"][0] == touched
+    assert result.manifest["src/pkg/a.py"][2] == manifest["src/pkg/a.py"][2]
+
+
+def test_edited_and_removed_modules(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    manifest = SymbolScanner(tmp_path).scan_changes({}).manifest
+    _write(tmp_path, "src/pkg/a.py", "def alpha2():\n    pass\n", _OLD + 60)
+    (tmp_path / "src/pkg/c.py").unlink()
+
+    result, _ = _rescan(tmp_path, manifest)
+
+    assert result.changed_files == ["src/pkg/a.py"]
+    assert [s["symbol_path"] for s in result.symbols] == ["src/pkg/a.py::alpha2"]
+    assert result.removed_files == ["src/pkg/c.py"]
+
+
+def test_scanner_version_change_reextracts_everything(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    manifest = SymbolScanner(tmp_path).scan_changes({}).manifest
+
+    with patch.object(scanner, "scanner_version", return_value="next"):
+        result, _ = _rescan(tmp_path, manifest)
+
+    assert len(result.changed_files) == 3
+    assert {entry[3] for entry in result.manifest.values()} == {"next"}
+
+
+def _session(driver: object) -> MagicMock:
+    raw = MagicMock(driver_connection=driver)
+    connection = MagicMock(get_raw_connection=AsyncMock(return_value=raw))
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    session.execute = AsyncMock(return_value=MagicMock(rowcount=0))
+    return session
+
+
+def _symbols(tmp_path: Path) -> list[dict]:
+    _tree(tmp_path)
+    return SymbolScanner(tmp_path).scan_changes({}).symbols
+
+
+async def test_merge_copies_staging_and_scopes_deletes(tmp_path: Path) -> None:
+    symbols = _symbols(tmp_path)
+    driver = MagicMock(copy_records_to_table=AsyncMock())
+    session = _session(driver)
+
+    await run_db_merge(session, symbols, changed_files=["src/pkg/a.py"])
+
+    staged, scoped = driver.copy_records_to_table.await_args_list
+    assert staged.args[0] == "core_symbols_staging"
+    assert len(staged.kwargs["records"]) == len(symbols)
+    assert scoped.args[0] == "core_symbols_sync_scope"
+    assert scoped.kwargs["records"] == [("src/pkg/a.py",)]
+    sql = [str(c.args[0]) for c in session.execute.await_args_list]
+    delete = next(s for s in sql if "DELETE FROM core.symbols" in s)
+    assert "NOT EXISTS" in delete
+    assert "core_symbols_sync_scope" in delete
+    assert not any("NOT IN" in s for s in sql)
+
+
+async def test_full_merge_without_copy_support(tmp_path: Path) -> None:
+    symbols = _symbols(tmp_path)
+    session = _session(driver=object())
+
+    await run_db_merge(session, symbols)
+
+    sql = [str(c.args[0]) for c in session.execute.await_args_list]
+    insert = next(s for s in sql if "INSERT INTO core_symbols_staging" in s)
+    assert insert
+    delete = next(s for s in sql if "DELETE FROM core.symbols" in s)
+    assert "core_symbols_sync_scope" not in delete
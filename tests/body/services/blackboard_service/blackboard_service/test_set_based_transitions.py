@@ -0,0 +1,137 @@
+"""Set-based bulk status transitions in BlackboardService.
+
+Proves (DB mocked — the guard predicates themselves are covered by the
+integration tests beside this file):
+- resolve_entries / release_claimed_entries / abandon_entries /
+  mark_indeterminate issue one UPDATE ... WHERE id = ANY(...) RETURNING for
+  every id and count the returned rows
+- an empty id list touches no session
+- the adjudicate_* drains are UPDATE ... RETURNING statements, one per
+  transition, with no SELECT ... FOR UPDATE round-trip first
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from body.services.blackboard_service import BlackboardService
+
+
+def _session(*returned: list[tuple]) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[
+            MagicMock(fetchall=MagicMock(return_value=rows)) for rows in returned
+        ]
+    )
+    session.begin.return_value.__aenter__ = AsyncMock()
+    session.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+def _sql(session: MagicMock, call: int = 0) -> str:
+    return str(session.execute.await_args_list[call].args[0])
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "resolve_entries",
+        "release_claimed_entries",
+        "abandon_entries",
+        "mark_indeterminate",
+    ],
+)
+async def test_id_transitions_are_one_statement(method: str) -> None:
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    session = _session([(ids[0],), (ids[2],)])
+
+    with patch(
+        "body.services.service_registry.ServiceRegistry.session"
+    ) as session_factory:
+        session_factory.return_value.__aenter__.return_value = session
+        count = await getattr(BlackboardService(), method)(ids)
+
+    assert count == 2
+    assert session.execute.await_count == 1
+    sql = _sql(session)
+    assert "id = ANY(cast(:ids as uuid[]))" in sql
+    assert "RETURNING id" in sql
+    assert session.execute.await_args.args[1] == {"ids": ids}
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "resolve_entries",
+        "release_claimed_entries",
+        "abandon_entries",
+        "mark_indeterminate",
+    ],
+)
+async def test_id_transitions_skip_empty_batches(method: str) -> None:
+    with patch(
+        "body.services.service_registry.ServiceRegistry.session"
+    ) as session_factory:
+        assert await getattr(BlackboardService(), method)([]) == 0
+    session_factory.assert_not_called()
+
+
+async def test_awaiting_reaudit_drain_is_two_updates() -> None:
+    session = _session([("p::ns.a::x.py",)], [("p::ns.b::y.py",)])
+
+    with patch(
+        "body.services.service_registry.ServiceRegistry.session"
+    ) as session_factory:
+        session_factory.return_value.__aenter__.return_value = session
+        result = await BlackboardService().adjudicate_awaiting_reaudit_findings(
+            subject_prefix="p::ns",
+            current_violation_subjects={"p::ns.a::x.py"},
+            resolved_by="test",
+        )
+
+    assert result == {
+        "released_subjects": ["p::ns.a::x.py"],
+        "resolved_subjects": ["p::ns.b::y.py"],
+    }
+    assert session.execute.await_count == 2
+    release, resolve = _sql(session, 0), _sql(session, 1)
+    assert "SET status = 'open'" in release
+    assert "subject = ANY(cast(:current as text[]))" in release
+    assert "subject <> ALL(cast(:current as text[]))" in resolve
+    for sql in (release, resolve):
+        assert sql.lstrip().startswith("UPDATE")
+        assert "RETURNING subject" in sql
+        assert "FOR UPDATE" not in sql
+
+
+@pytest.mark.parametrize(
+    ("method", "status"),
+    [
+        ("adjudicate_indeterminate_findings", "indeterminate"),
+        ("adjudicate_abandoned_findings", "abandoned"),
+    ],
+)
+async def test_clean_pass_drains_are_one_update(method: str, status: str) -> None:
+    session = _session([("p::ns.b::y.py",)])
+
+    with patch(
+        "body.services.service_registry.ServiceRegistry.session"
+    ) as session_factory:
+        session_factory.return_value.__aenter__.return_value = session
+        result = await getattr(BlackboardService(), method)(
+            subject_prefix="p::ns",
+            current_violation_subjects={"p::ns.a::x.py"},
+            resolved_by="test",
+        )
+
+    assert result == {"resolved_subjects": ["p::ns.b::y.py"]}
+    assert session.execute.await_count == 1
+    sql = _sql(session)
+    assert sql.lstrip().startswith("UPDATE")
+    assert f"AND status = '{status}'" in sql
+    assert "subject <> ALL(cast(:current as text[]))" in sql
+    assert session.execute.await_args.args[1]["current"] == ["p::ns.a::x.py"]
@@ -0,0 +1,245 @@
+# tests/body/services/blackboard_service/test_subject_index_plan.py
+
+"""EXPLAIN regression benchmark for the blackboard subject-prefix indexes.
+
+Integration benchmark against a real Postgres. It builds a scratch copy of
+core.blackboard_entries, using CREATE TEMP TABLE ... (LIKE ... INCLUDING
+INDEXES), so the indexes under test are exactly the ones the schema ships
+(20261017_blackboard_subject_prefix_indexes.sql). It seeds the copy with a
+small live working set under one namespace and EXPLAIN ANALYZEs the hot-path
+query shapes of BlackboardClaimService / BlackboardQueryService. Then it
+piles a synthetic million-row history onto the same table: resolved
+findings under the same namespace, plus heartbeat telemetry. Then it
+EXPLAINs them again.
+
+Proves:
+- no hot-path query plans a sequential scan of the ledger
+- the working-set queries (claim, open/active/awaiting_reaudit subject
+  fetches) touch roughly the same number of buffers with a million history
+  rows as with none, so claim and fetch latency stays flat as history
+  accumulates
+- the history lookups (abandoned/resolved subjects by prefix) are index
+  range scans, not filtered full scans
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+_HISTORY_ROWS = 1_000_000
+_WORKING_SET = 2_000
+_PREFIX = "python::purity%"
+# One of the 50 history rules: a selective lookup into the history.
+_HISTORY_PREFIX = "python::purity.rule7::%"
+
+# Hot-path shapes, verbatim from the services apart from the table name.
+_WORKING_SET_QUERIES: dict[str, str] = {
+    "claim_open_findings": """
+        SELECT id FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status = 'open'
+        ORDER BY created_at ASC
+        LIMIT 50
+        FOR UPDATE SKIP LOCKED
+    """,
+    "claim_violation_findings": """
+        SELECT id FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status = 'open'
+        ORDER BY
+            CASE (payload->>'severity')
+                WHEN 'critical' THEN 1
+                WHEN 'error'    THEN 2
+                WHEN 'warning'  THEN 3
+                WHEN 'info'     THEN 4
+                ELSE 5
+            END ASC,
+            created_at ASC
+        LIMIT 50
+        FOR UPDATE SKIP LOCKED
+    """,
+    "fetch_open_finding_subjects_by_prefix": """
+        SELECT subject FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status NOT IN (
+              'resolved', 'abandoned', 'suppressed', 'dry_run_complete',
+              'deferred_to_proposal', 'indeterminate'
+          )
+    """,
+    "fetch_active_finding_subjects_by_prefix": """
+        SELECT subject FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status NOT IN ('resolved', 'abandoned')
+    """,
+    "fetch_awaiting_reaudit_subjects_by_prefix": """
+        SELECT subject FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND status = 'awaiting_reaudit'
+          AND subject LIKE :prefix
+    """,
+}
+
+_HISTORY_QUERIES: dict[str, str] = {
+    "fetch_abandoned_finding_subjects_by_prefix": """
+        SELECT subject FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status = 'abandoned'
+    """,
+    "fetch_resolved_finding_subjects_by_prefix": """
+        SELECT subject FROM bb_bench
+        WHERE entry_type = 'finding'
+          AND subject LIKE :prefix
+          AND status = 'resolved'
+          AND resolution_mechanism = 'human'
+    """,
+}
+
+
+async def _seed_working_set(session: AsyncSession) -> None:
+    await session.execute(
+        text(
+            """
+            INSERT INTO bb_bench
+                (worker_uuid, entry_type, phase, status, subject, payload,
+                 resolution_mechanism, created_at)
+            SELECT gen_random_uuid(), 'finding', 'audit',
+                   (ARRAY['open', 'claimed', 'awaiting_reaudit'])[1 + g % 3],
+                   'python::purity.live_' || (g % 20) || '::src/live_' || g || '.py',
+                   jsonb_build_object(
+                       'severity', (ARRAY['error', 'warning', 'info'])[1 + g % 3]
+                   ),
+                   'reaudit',
+                   now() - make_interval(secs => g)
+            FROM generate_series(1, :n) AS g
+            """
+        ),
+        {"n": _WORKING_SET},
+    )
+
+
+async def _seed_history(session: AsyncSession) -> None:
+    """Half resolved/abandoned findings under the working set's namespace,
+    half heartbeat telemetry: the rows that accumulate forever."""
+    await session.execute(
+        text(
+            """
+            INSERT INTO bb_bench
+                (worker_uuid, entry_type, phase, status, subject, payload,
+                 resolution_mechanism, created_at, resolved_at)
+            SELECT gen_random_uuid(),
+                   CASE WHEN g % 2 = 0 THEN 'finding' ELSE 'heartbeat' END,
+                   'audit',
+                   CASE WHEN g % 2 = 1 THEN 'resolved'
+                        WHEN g % 10 = 0 THEN 'abandoned'
+                        ELSE 'resolved' END,
+                   CASE WHEN g % 2 = 0
+                        THEN 'python::purity.rule' || (g % 50)
+                             || '::src/mod_' || g || '.py'
+                        ELSE 'worker.heartbeat' END,
+                   cast('{}' as jsonb),
+                   CASE WHEN g % 2 = 0
+                        THEN (ARRAY['reaudit', 'human'])[1 + g % 4 / 2]
+                        ELSE NULL END,
+                   now() - interval '30 days' - make_interval(secs => g),
+                   now() - interval '30 days'
+            FROM generate_series(1, :n) AS g
+            """
+        ),
+        {"n": _HISTORY_ROWS},
+    )
+
+
+async def _explain(
+    session: AsyncSession, sql: str, prefix: str = _PREFIX
+) -> dict[str, Any]:
+    result = await session.execute(
+        text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"),
+        {"prefix": prefix},
+    )
+    return result.scalar_one()[0]["Plan"]
+
+
+def _nodes(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(_nodes(child))
+    return nodes
+
+
+def _buffers(plan: dict[str, Any]) -> int:
+    """Blocks touched by the whole plan (temp tables use local buffers)."""
+    return sum(
+        plan.get(key, 0)
+        for key in (
+            "Local Hit Blocks",
+            "Local Read Blocks",
+            "Shared Hit Blocks",
+            "Shared Read Blocks",
+        )
+    )
+
+
+def _assert_indexed(name: str, plan: dict[str, Any]) -> None:
+    nodes = _nodes(plan)
+    seq = [n for n in nodes if n["Node Type"] == "Seq Scan"]
+    assert not seq, f"{name}: sequential scan of the ledger"
+    indexes = {n["Index Name"] for n in nodes if "Index Name" in n}
+    assert indexes, f"{name}: no index used"
+
+
+async def test_hot_path_stays_flat_as_history_accumulates(
+    db_session: AsyncSession,
+) -> None:
+    await db_session.execute(
+        text(
+            """
+            CREATE TEMP TABLE bb_bench
+                (LIKE core.blackboard_entries INCLUDING DEFAULTS INCLUDING INDEXES)
+                ON COMMIT DROP
+            """
+        )
+    )
+    await _seed_working_set(db_session)
+    await db_session.execute(text("ANALYZE bb_bench"))
+    # On a table this small a sequential scan is the right plan; measure
+    # the index plans instead, so the baseline is comparable.
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    before = {
+        name: await _explain(db_session, sql)
+        for name, sql in _WORKING_SET_QUERIES.items()
+    }
+    await db_session.execute(text("SET LOCAL enable_seqscan = on"))
+
+    await _seed_history(db_session)
+    await db_session.execute(text("ANALYZE bb_bench"))
+
+    for name, sql in _WORKING_SET_QUERIES.items():
+        after = await _explain(db_session, sql)
+        _assert_indexed(name, after)
+        # One extra btree level is fine; scanning history is not.
+        assert _buffers(after) <= _buffers(before[name]) * 1.5 + 50, (
+            f"{name}: {_buffers(before[name])} -> {_buffers(after)} buffers "
+            f"after {_HISTORY_ROWS} history rows"
+        )
+
+    for name, sql in _HISTORY_QUERIES.items():
+        plan = await _explain(db_session, sql, _HISTORY_PREFIX)
+        _assert_indexed(name, plan)
+        index_conds = " ".join(
+            n.get("Index Cond", "") for n in _nodes(plan) if "Index Name" in n
+        )
+        assert "~>=~" in index_conds, f"{name}: subject prefix is not a range scan"
+
+    await db_session.rollback()
@@ -0,0 +1,207 @@
+# tests/body/services/crawl_service/test_orchestrator_stat_gated_crawl.py
+"""Stat-gated, batched crawl passes in CrawlOrchestrator.run_crawl.
+
+Proves (CrawlService mocked):
+- the single scope walk resolves the same files as per-glob Path.glob,
+  including ``**`` matching zero directories and the precedence rules
+- a second pass over an unchanged tree hashes nothing, upserts nothing and
+  touches every row in one statement
+- an edited file is re-hashed, upserted in the batch and re-processed; its
+  unchanged neighbours are only touched
+- a file modified within the racy window is re-hashed on the next pass
+- a batch the database rejects is retried row by row, failing only the
+  bad row's file
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from body.services.crawl_service import orchestrator
+from body.services.crawl_service.orchestrator import (
+    CrawlOrchestrator,
+    _resolve_file_artifact_types,
+)
+
+
+_SCOPES = [
+    ("src/**/*.py", "python"),
+    (".intent/**/*.yaml", "intent_yaml"),
+    (".intent/architecture/bridges/**/*.yaml", "architecture_bridge"),
+]
+_COLLECTIONS = {
+    "python": "core_code",
+    "intent_yaml": "core_intent",
+    "architecture_bridge": "core_intent",
+}
+_OLD = time.time() - 3600
+
+
+def _write(root: Path, rel_path: str, content: str, mtime: float = _OLD) -> Path:
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _tree(root: Path) -> None:
+    _write(root, "src/top.py", "def f():\n    return 1\n")
+    _write(root, "src/pkg/mod.py", "def g():\n    return 2\n")
+    _write(root, ".intent/cim/thresholds.yaml", "y: 2\n")
+    _write(root, ".intent/architecture/bridges/worker.yaml", "x: 1\n")
+    _write(root, "docs/readme.md", "# outside every scope\n")
+
+
+class _FakeCrawlService:
+    """Records writes and keeps repo_artifacts state between passes."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, tuple[str, str, str | None]] = {}
+        self.reject: set[str] = set()
+        self.upsert_artifacts_bulk = AsyncMock(side_effect=self._upsert)
+        self.touch_crawled_artifacts = AsyncMock(
+            side_effect=lambda paths, run_id: len(paths)
+        )
+        self.load_artifact_states = AsyncMock(side_effect=lambda: dict(self.rows))
+        self.load_symbol_index = AsyncMock(return_value={})
+        self.close_stale_crawl_runs = AsyncMock(return_value=0)
+        for name in (
+            "open_crawl_run",
+            "close_crawl_run_completed",
+            "close_crawl_run_partial",
+            "close_crawl_run_failed",
+            "delete_stale_symbol_calls",
+            "insert_symbol_calls",
+            "insert_artifact_symbol_links",
+        ):
+            setattr(self, name, AsyncMock())
+        self.purge_verdicts_for_removed_files = AsyncMock(return_value=0)
+        self.delete_orphan_artifacts = AsyncMock(return_value=0)
+
+    def _upsert(self, artifacts, run_id):
+        if any(path in self.reject for path, *_ in artifacts):
+            raise RuntimeError("check constraint")
+        written = {}
+        for path, artifact_type, content_hash, collection in artifacts:
+            if self.rows.get(path) != (content_hash, artifact_type, collection):
+                self.rows[path] = (content_hash, artifact_type, collection)
+                written[path] = f"id-{path}"
+        return written
+
+    def reset_mocks(self) -> None:
+        for value in vars(self).values():
+            if isinstance(value, AsyncMock):
+                value.reset_mock()
+
+
+async def _crawl(svc: _FakeCrawlService, root: Path) -> tuple[dict, MagicMock]:
+    with (
+        patch.object(
+            orchestrator,
+            "_load_crawl_scopes_from_registry",
+            return_value=(_SCOPES, _COLLECTIONS),
+        ),
+        patch.object(
+            orchestrator, "_sha256", side_effect=orchestrator._sha256
+        ) as sha256,
+    ):
+        stats = await CrawlOrchestrator(svc).run_crawl(root)
+    return stats, sha256
+
+
+def test_single_walk_matches_per_glob_resolution(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    (tmp_path / "src" / "link.py").symlink_to(tmp_path / "src" / "top.py")
+
+    resolved = _resolve_file_artifact_types(tmp_path, _SCOPES)
+
+    expected = {}
+    for glob_pattern, artifact_type in _SCOPES:
+        for path in tmp_path.glob(glob_pattern):
+            if not path.is_symlink():
+                expected.setdefault(path, artifact_type)
+    expected[tmp_path / ".intent/architecture/bridges/worker.yaml"] = (
+        "architecture_bridge"
+    )
+    assert resolved == expected
+    assert tmp_path / "src/top.py" in resolved  # ** spans zero directories
+
+
+async def test_unchanged_pass_hashes_nothing_and_touches_in_one_statement(
+    tmp_path: Path,
+) -> None:
+    _tree(tmp_path)
+    svc = _FakeCrawlService()
+    first, sha256 = await _crawl(svc, tmp_path)
+    assert first["files_hashed"] == first["files_scanned"] == 4
+    assert first["files_changed"] == 4
+    svc.upsert_artifacts_bulk.assert_awaited_once()
+    svc.reset_mocks()
+
+    second, sha256 = await _crawl(svc, tmp_path)
+
+    assert second["files_scanned"] == 4
+    assert second["files_hashed"] == 0
+    assert second["files_changed"] == 0
+    sha256.assert_not_called()
+    svc.upsert_artifacts_bulk.assert_not_awaited()
+    svc.touch_crawled_artifacts.assert_awaited_once()
+    assert sorted(svc.touch_crawled_artifacts.await_args.args[0]) == sorted(svc.rows)
+    svc.close_crawl_run_completed.assert_awaited_once()
+
+
+async def test_edited_file_is_rehashed_upserted_and_reprocessed(
+    tmp_path: Path,
+) -> None:
+    _tree(tmp_path)
+    svc = _FakeCrawlService()
+    await _crawl(svc, tmp_path)
+    svc.reset_mocks()
+    _write(tmp_path, "src/pkg/mod.py", "def g():\n    return 3\n", _OLD + 60)
+
+    stats, sha256 = await _crawl(svc, tmp_path)
+
+    assert stats["files_hashed"] == 1
+    assert stats["files_changed"] == 1
+    sha256.assert_called_once_with(tmp_path / "src/pkg/mod.py")
+    (batch, _run_id), _ = svc.upsert_artifacts_bulk.await_args
+    assert [artifact[0] for artifact in batch] == ["src/pkg/mod.py"]
+    assert len(svc.touch_crawled_artifacts.await_args.args[0]) == 3
+
+
+async def test_recently_modified_file_is_not_trusted_by_stat(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    _write(tmp_path, "src/top.py", "def f():\n    return 1\n", time.time())
+    svc = _FakeCrawlService()
+    await _crawl(svc, tmp_path)
+
+    stats, sha256 = await _crawl(svc, tmp_path)
+
+    assert stats["files_hashed"] == 1
+    sha256.assert_called_once_with(tmp_path / "src/top.py")
+
+
+@pytest.mark.parametrize("bad", ["src/top.py", ".intent/cim/thresholds.yaml"])
+async def test_rejected_batch_is_retried_row_by_row(tmp_path: Path, bad: str) -> None:
+    _tree(tmp_path)
+    svc = _FakeCrawlService()
+    svc.reject = {bad}
+
+    stats, _ = await _crawl(svc, tmp_path)
+
+    assert set(svc.rows) == {
+        "src/top.py",
+        "src/pkg/mod.py",
+        ".intent/cim/thresholds.yaml",
+        ".intent/architecture/bridges/worker.yaml",
+    } - {bad}
+    assert stats["files_changed"] == 3
+    assert svc.upsert_artifacts_bulk.await_count == 1 + 4
+    svc.close_crawl_run_partial.assert_awaited_once()
+    assert bad in svc.close_crawl_run_partial.await_args.args[2]
@@ -25,7 +25,7 @@
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -89,6 +89,28 @@ async def test_load_knowledge_graph_failure():
         mock_logger.error.assert_called()
 
 
+async def test_load_knowledge_graph_reuses_unchanged_version():
+    """Each load refreshes the graph; an unchanged graph version reuses the
+    previous symbols list, and a failed refresh keeps the last graph."""
+    repo_path = Path("/test/repo/graph-version")
+    graph = {"symbols": {"a": {"name": "a"}}, "metadata": {"version": 7}}
+    with patch("mind.governance.audit_context.KnowledgeService") as mock_service_class:
+        mock_service_class.return_value.get_graph = AsyncMock(return_value=graph)
+        first = AuditorContext(repo_path)
+        await first.load_knowledge_graph()
+        second = AuditorContext(repo_path)
+        await second.load_knowledge_graph()
+        assert second.symbols_list is first.symbols_list
+        assert mock_service_class.return_value.get_graph.await_count == 2
+
+        mock_service_class.return_value.get_graph = AsyncMock(
+            return_value={"symbols": {}}
+        )
+        third = AuditorContext(repo_path)
+        await third.load_knowledge_graph()
+        assert third.symbols_map == {"a": {"name": "a"}}
+
+
 def test_load_governance_resources():
     """_load_governance_resources iterates ``self.intent_repo.list_policies()``
     and resolves each via ``self.intent_repo.load_policy(policy_id)``,
@@ -0,0 +1,162 @@
+# tests/mind/governance/test_corpus_snapshot__CorpusSnapshot.py
+
+"""
+CorpusSnapshot — the per-audit read-once view for context-level engines.
+
+Proves:
+  - listings equal sorted rglob/glob, and a nested listing reuses the
+    enclosing directory's walk
+  - each file is read once however often its text, tree or YAML is asked
+    for; a read error is re-raised to every caller
+  - trees are shared with shared.utils.ast_cache under the file's content key
+  - files_containing equals a brute-force ``needle in text`` scan for
+    needles with and without word boundaries at either edge
+  - taxonomy_gate's self_resolve check reads each src/ and tests/ file once
+    across every subject prefix and a repeated run in the same audit
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from mind.governance.corpus_snapshot import CorpusSnapshot, corpus_for
+from mind.logic.engines.taxonomy_gate import TaxonomyGateEngine
+from shared.path_resolver import PathResolver
+from shared.utils import ast_cache
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+_FILES = {
+    "src/pkg/a.py": 'PREFIX = "audit.stale::x"\nclass Alpha: pass\n',
+    "src/pkg/sub/b.py": "value = Alpha()\nxaudit.stale_z = 1\n",
+    "src/pkg/c.yaml": "mappings:\n  rule.one: {engine: ast_gate}\n",
+    "src/readme.md": "audit . stale\n",
+}
+
+
+def test_listings_match_glob_and_share_one_walk(tmp_path: Path) -> None:
+    _write(tmp_path, _FILES)
+    corpus = CorpusSnapshot()
+    src = tmp_path / "src"
+
+    with patch("mind.governance.corpus_snapshot.os.walk", wraps=os.walk) as walk:
+        assert corpus.files(src, ".py") == sorted(src.rglob("*.py"))
+        assert corpus.files(src / "pkg", ".yaml") == sorted(
+            (src / "pkg").rglob("*.yaml")
+        )
+        assert corpus.files(src / "pkg", ".py", recursive=False) == sorted(
+            (src / "pkg").glob("*.py")
+        )
+
+    walk.assert_called_once()
+    assert corpus.files(tmp_path / "missing", ".py") == []
+
+
+def test_each_file_is_read_once(tmp_path: Path) -> None:
+    _write(tmp_path, _FILES)
+    corpus = CorpusSnapshot()
+    py = tmp_path / "src/pkg/a.py"
+    yml = tmp_path / "src/pkg/c.yaml"
+    real_read = Path.read_text
+    reads: list[Path] = []
+
+    def _read(self: Path, *args: Any, **kwargs: Any) -> str:
+        reads.append(self)
+        return real_read(self, *args, **kwargs)
+
+    with patch.object(Path, "read_text", _read):
+        assert corpus.tree(py) is corpus.tree(py)
+        assert "Alpha" in corpus.text(py)
+        assert corpus.parse_yaml(yml)["mappings"]["rule.one"]["engine"] == "ast_gate"
+        assert corpus.parse_yaml(yml) is corpus.parse_yaml(yml)
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError):
+                corpus.text(tmp_path / "gone.py")
+
+    assert sorted(reads) == sorted([py, yml, tmp_path / "gone.py"])
+    key = ast_cache.file_content_key(py)
+    assert ast_cache.get_cached_ast(py, key) is corpus.tree(py)
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "audit.stale",  # both edges open
+        "audit.stale::",  # trailing edge closed
+        "::x",  # no leading run
+        ".stale_",  # leading punctuation, trailing open
+        "Alpha",
+        "lpha()",
+        "stale::x\nclass",
+        " . ",  # no word characters at all
+        "absent.prefix",
+    ],
+)
+def test_files_containing_matches_brute_force(tmp_path: Path, needle: str) -> None:
+    _write(tmp_path, _FILES)
+    corpus = CorpusSnapshot()
+    src = tmp_path / "src"
+
+    expected = [
+        p for p in sorted(src.rglob("*")) if p.is_file() and needle in p.read_text()
+    ]
+    assert corpus.files_containing(src, "", needle) == expected
+
+
+def test_corpus_for_falls_back_for_stand_in_contexts() -> None:
+    corpus = CorpusSnapshot()
+    assert corpus_for(SimpleNamespace(corpus=corpus)) is corpus
+    assert isinstance(corpus_for(SimpleNamespace()), CorpusSnapshot)
+
+
+_EMITTER = '''"""Worker.
+
+ADR-091 D2 Revision B resolution classification:
+- Resolver path: run().
+"""
+_SUBJECT_{n} = "worker.prefix_{n}"
+
+
+class Worker{n}:
+    async def run(self):
+        await self.post_finding(
+            subject=f"{{_SUBJECT_{n}}}::x", resolution_mechanism="self_resolve"
+        )
+'''
+
+
+async def test_self_resolve_check_reads_each_file_once(tmp_path: Path) -> None:
+    files = {f"src/will/w{n}.py": _EMITTER.format(n=n) for n in range(3)}
+    files.update({f"tests/test_{n}.py": f'P = "worker.prefix_{n}"\n' for n in range(3)})
+    _write(tmp_path, files)
+    engine = TaxonomyGateEngine(path_resolver=PathResolver(repo_root=tmp_path))
+    context = SimpleNamespace(repo_path=tmp_path, corpus=CorpusSnapshot())
+    real_read = Path.read_text
+    reads: list[Path] = []
+
+    def _read(self: Path, *args: Any, **kwargs: Any) -> str:
+        reads.append(self)
+        return real_read(self, *args, **kwargs)
+
+    with patch.object(Path, "read_text", _read):
+        findings = await engine.verify_context(
+            context, {"check_type": "self_resolve_resolver_owned"}
+        )
+        await engine.verify_context(
+            context, {"check_type": "self_resolve_resolver_owned"}
+        )
+
+    assert findings == []
+    assert sorted(reads) == sorted(tmp_path / rel for rel in files)
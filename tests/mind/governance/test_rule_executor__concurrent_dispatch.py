@@ -0,0 +1,240 @@
+# tests/mind/governance/test_rule_executor__concurrent_dispatch.py
+"""Concurrent per-file dispatch in rule_executor.execute_rule.
+
+Proves that fanning engine.verify() out under audit.verify_concurrency is
+observably identical to the sequential loop:
+
+- in-flight verify() calls never exceed the configured limit
+- findings keep get_files() order even when files complete out of order
+- transient LLM failures aggregate into the same single WARNING
+- the eval cache still serves hits and stores clean results
+- a limit of 1 dispatches strictly sequentially
+- _verify_concurrency falls back to the default field, then to 1
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mind.governance import rule_executor
+from mind.governance.executable_rule import ExecutableRule
+from mind.governance.rule_executor import (
+    _TRANSIENT_LLM_FAILURE_MARKER,
+    clear_eval_cache,
+    execute_rule,
+)
+from mind.logic.engines.base import BaseEngine, EngineResult
+from shared.models import EvidenceClass
+
+
+@pytest.fixture(autouse=True)
+def _reset_eval_cache() -> None:
+    clear_eval_cache()
+    yield
+    clear_eval_cache()
+
+
+# ID: 5e0770c4-5a53-4818-a545-4e7012669bc9
+class _SlowEngine(BaseEngine):
+    """Engine whose verify() latency is inversely related to file order."""
+
+    engine_id = "fake_slow"
+    evidence_class = EvidenceClass.PROVEN
+
+    def __init__(self, *, transient_on: set[str] | None = None) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.call_count = 0
+        self._transient_on = transient_on or set()
+
+    async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
+        self.call_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Earlier files sleep longer, so completion order is reversed.
+            await asyncio.sleep(0.001 * (10 - int(file_path.stem[1:])))
+        finally:
+            self.in_flight -= 1
+        if file_path.stem in self._transient_on:
+            return EngineResult(
+                False, "x", [_TRANSIENT_LLM_FAILURE_MARKER], self.engine_id
+            )
+        if int(file_path.stem[1:]) % 2:
+            return EngineResult(True, "ok", [], self.engine_id)
+        return EngineResult(
+            False, "x", [f"violation in {file_path.name}"], self.engine_id
+        )
+
+
+def _make_files(tmp_path: Path, n: int = 8) -> list[Path]:
+    files = []
+    for i in range(n):
+        p = tmp_path / f"f{i}.py"
+        p.write_text(f"x = {i}")
+        files.append(p)
+    return files
+
+
+def _make_context(repo_path: Path, files: list[Path]) -> Any:
+    ctx = MagicMock()
+    ctx.repo_path = repo_path
+    ctx.force_llm = False
+    ctx.get_files.return_value = files
+    return ctx
+
+
+def _make_rule(engine: str = "fake_slow") -> ExecutableRule:
+    return ExecutableRule(
+        rule_id="test.concurrent",
+        engine=engine,
+        params={},
+        enforcement="blocking",
+        scope=["**/*.py"],
+        rule_content_hash="abc123",
+    )
+
+
+def _patch(
+    monkeypatch: pytest.MonkeyPatch, engine: BaseEngine, concurrency: int
+) -> None:
+    monkeypatch.setattr(
+        "mind.logic.engines.registry.EngineRegistry.get",
+        lambda engine_id: engine,
+    )
+    monkeypatch.setattr(
+        rule_executor, "_verify_concurrency", lambda engine_id: concurrency
+    )
+
+
+async def test_in_flight_verifies_bounded_by_limit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = _SlowEngine()
+    _patch(monkeypatch, engine, concurrency=3)
+    files = _make_files(tmp_path)
+
+    await execute_rule(_make_rule(), _make_context(tmp_path, files))
+
+    assert engine.call_count == len(files)
+    assert engine.max_in_flight == 3
+
+
+async def test_limit_of_one_is_sequential(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = _SlowEngine()
+    _patch(monkeypatch, engine, concurrency=1)
+
+    await execute_rule(_make_rule(), _make_context(tmp_path, _make_files(tmp_path)))
+
+    assert engine.max_in_flight == 1
+
+
+async def test_findings_match_sequential_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    files = _make_files(tmp_path)
+    ctx = _make_context(tmp_path, files)
+
+    _patch(monkeypatch, _SlowEngine(), concurrency=1)
+    sequential = await execute_rule(_make_rule(), ctx)
+    clear_eval_cache()
+    _patch(monkeypatch, _SlowEngine(), concurrency=8)
+    concurrent = await execute_rule(_make_rule(), ctx)
+
+    assert [f.file_path for f in concurrent] == ["f0.py", "f2.py", "f4.py", "f6.py"]
+    assert [(f.file_path, f.message) for f in concurrent] == [
+        (f.file_path, f.message) for f in sequential
+    ]
+
+
+async def test_transient_failures_aggregate_identically(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    files = _make_files(tmp_path)
+    _patch(monkeypatch, _SlowEngine(transient_on={"f0", "f3", "f5"}), concurrency=4)
+
+    findings = await execute_rule(
+        _make_rule(engine="llm_gate"), _make_context(tmp_path, files)
+    )
+
+    aggregates = [
+        f
+        for f in findings
+        if f.context.get("finding_type") == "LLM_TRANSIENT_FAILURE"
+    ]
+    assert len(aggregates) == 1
+    assert aggregates[0].context["failure_count"] == 3
+    assert aggregates[0].context["sample_files"] == ["f0.py", "f3.py", "f5.py"]
+    assert findings[-1] is aggregates[0]
+
+
+async def test_eval_cache_still_serves_hits(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = _SlowEngine()
+    _patch(monkeypatch, engine, concurrency=4)
+    files = _make_files(tmp_path)
+    ctx = _make_context(tmp_path, files)
+
+    first = await execute_rule(_make_rule(), ctx)
+    second = await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == len(files)
+    assert [f.message for f in second] == [f.message for f in first]
+
+
+async def test_session_lock_threaded_to_engine(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    seen: list[Any] = []
+
+    # ID: 0c23e8fc-f6c3-49fc-b9c8-9dae1a237560
+    class _Recorder(BaseEngine):
+        engine_id = "fake_recorder"
+
+        async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
+            seen.append(params.get("_session_lock"))
+            return EngineResult(True, "ok", [], self.engine_id)
+
+    _patch(monkeypatch, _Recorder(), concurrency=4)
+    await execute_rule(_make_rule(), _make_context(tmp_path, _make_files(tmp_path, 3)))
+
+    assert len(seen) == 3
+    assert isinstance(seen[0], asyncio.Lock)
+    assert all(lock is seen[0] for lock in seen)
+
+
+def test_verify_concurrency_reads_engine_then_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from shared.infrastructure.intent import operational_config as oc
+
+    cfg = oc.OperationalConfig(
+        audit=oc.AuditConfig(
+            verify_concurrency=oc.AuditVerifyConcurrencyConfig(default=2, llm_gate=6)
+        )
+    )
+    monkeypatch.setattr(oc, "load_operational_config", lambda: cfg)
+
+    assert rule_executor._verify_concurrency("llm_gate") == 6
+    assert rule_executor._verify_concurrency("ast_gate") == 2
+
+
+def test_verify_concurrency_degrades_to_sequential(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from shared.infrastructure.intent import operational_config as oc
+
+    def _boom() -> Any:
+        raise RuntimeError("config unavailable")
+
+    monkeypatch.setattr(oc, "load_operational_config", _boom)
+
+    assert rule_executor._verify_concurrency("llm_gate") == 1
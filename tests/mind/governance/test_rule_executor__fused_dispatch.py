@@ -0,0 +1,216 @@
+# tests/mind/governance/test_rule_executor__fused_dispatch.py
+"""File-major fused ast_gate dispatch (execute_rules_fused).
+
+Proves:
+- fused findings are identical, per rule, to rule-major execute_rule
+  (clean, violating and unparseable files alike)
+- each file is read once for all fused rules
+- checks see the shared traversal through ASTHelpers.walk while the view
+  is active, and plain ast.walk otherwise
+- context-level and requires_findings_from rules are left to execute_rule
+- rules served from the evaluation cache never read their file
+- a rule whose setup raises is reported through take_fused_findings
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mind.governance.executable_rule import ExecutableRule
+from mind.governance.rule_executor import (
+    clear_eval_cache,
+    execute_rule,
+    execute_rules_fused,
+    take_fused_findings,
+)
+from mind.logic.engines.ast_gate.base import ASTHelpers
+from mind.logic.engines.ast_gate.engine import ASTGateEngine
+from mind.logic.engines.ast_gate.file_view import ASTFileView
+
+
+_SOURCES = {
+    "clean.py": 'from __future__ import annotations\n\n\ndef ok() -> int:\n    """Doc."""\n    return 1\n',
+    "noisy.py": (
+        "import subprocess\n\n\n"
+        "def public():\n    print('hi')\n    subprocess.run(['ls'])\n"
+        "    for i in range(3):\n        print(i)\n"
+    ),
+    "broken.py": "def broken(:\n    pass\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_eval_cache() -> None:
+    clear_eval_cache()
+    yield
+    clear_eval_cache()
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> ASTGateEngine:
+    ast_engine = ASTGateEngine(MagicMock())
+    monkeypatch.setattr(
+        "mind.logic.engines.registry.EngineRegistry.get",
+        lambda engine_id: ast_engine,
+    )
+    return ast_engine
+
+
+def _write_files(root: Path) -> list[Path]:
+    paths = []
+    for name, source in _SOURCES.items():
+        path = root / name
+        path.write_text(source, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _make_context(repo_path: Path, files: list[Path]) -> Any:
+    ctx = MagicMock()
+    ctx.repo_path = repo_path
+    ctx.force_llm = False
+    ctx.get_files.return_value = files
+    ctx.get_tree.return_value = None
+    return ctx
+
+
+def _make_rule(rule_id: str, **params: Any) -> ExecutableRule:
+    return ExecutableRule(
+        rule_id=rule_id,
+        engine="ast_gate",
+        params=params,
+        enforcement="blocking",
+        scope=["**/*.py"],
+        rule_content_hash=f"hash-{rule_id}",
+    )
+
+
+def _rules() -> list[ExecutableRule]:
+    return [
+        _make_rule("t.stable_id", check_type="stable_id_anchor"),
+        _make_rule("t.no_print", check_type="no_print_statements"),
+        _make_rule("t.docstrings", check_type="docstrings_present"),
+        _make_rule("t.fn_length", check_type="max_function_length", limit=3),
+        _make_rule(
+            "t.forbidden",
+            check_type="forbidden_imports_and_calls",
+            forbidden_imports=["subprocess"],
+            forbidden_calls=["subprocess.run"],
+        ),
+    ]
+
+
+def _as_tuples(findings: list[Any]) -> list[tuple]:
+    return [
+        (f.check_id, f.severity, f.message, f.file_path, f.line_number)
+        for f in findings
+    ]
+
+
+async def test_fused_findings_match_rule_major(
+    engine: ASTGateEngine, tmp_path: Path
+) -> None:
+    files = _write_files(tmp_path)
+    ctx = _make_context(tmp_path, files)
+    rules = _rules()
+
+    expected = {}
+    for rule in rules:
+        expected[rule.rule_id] = _as_tuples(await execute_rule(rule, ctx))
+    clear_eval_cache()
+
+    fused = await execute_rules_fused(rules, ctx)
+
+    assert set(fused) == {r.rule_id for r in rules}
+    for rule in rules:
+        assert (
+            _as_tuples(take_fused_findings(fused, rule.rule_id))
+            == expected[rule.rule_id]
+        )
+    assert any(expected.values())
+
+
+async def test_each_file_is_read_once(
+    engine: ASTGateEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = _write_files(tmp_path)
+    ctx = _make_context(tmp_path, files)
+    reads: dict[Path, int] = {}
+    original = Path.read_text
+
+    def _counting_read(self: Path, *args: Any, **kwargs: Any) -> str:
+        if self.parent == tmp_path:
+            reads[self] = reads.get(self, 0) + 1
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read)
+
+    await execute_rules_fused(_rules(), ctx)
+
+    parseable = [p for p in files if p.name != "broken.py"]
+    assert all(reads[p] == 1 for p in parseable)
+
+
+async def test_cached_rules_do_not_read_the_file(
+    engine: ASTGateEngine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Parse errors are never cached, so only parseable files stay unread.
+    files = [p for p in _write_files(tmp_path) if p.name != "broken.py"]
+    ctx = _make_context(tmp_path, files)
+    await execute_rules_fused(_rules(), ctx)
+
+    read = MagicMock(side_effect=AssertionError("file read on a cache hit"))
+    monkeypatch.setattr(Path, "read_text", read)
+    fused = await execute_rules_fused(_rules(), ctx)
+
+    assert not any(isinstance(v, BaseException) for v in fused.values())
+    read.assert_not_called()
+
+
+def test_ast_helpers_walk_uses_the_active_view(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text("import os\n\n\ndef f():\n    os.getcwd()\n", encoding="utf-8")
+    view = ASTFileView(path)
+    assert view.load()
+
+    with view.active():
+        assert ASTHelpers.walk(view.tree) is view.nodes
+        assert ASTHelpers.nodes_of_type(view.tree, ast.Call) is view.calls
+    assert ASTHelpers.walk(view.tree) is not view.nodes
+    assert list(ASTHelpers.walk(view.tree)) == view.nodes
+    assert [type(n) for n in view.imports] == [ast.Import]
+    assert [d.name for d in view.defs] == ["f"]
+
+
+async def test_unfusable_rules_are_left_to_execute_rule(
+    engine: ASTGateEngine, tmp_path: Path
+) -> None:
+    files = _write_files(tmp_path)
+    ctx = _make_context(tmp_path, files)
+    dependent = _make_rule("t.dependent", check_type="no_print_statements")
+    dependent.requires_findings_from = ["t.no_print"]
+    context_level = _make_rule("t.ids", check_type="duplicate_ids")
+    context_level.is_context_level = True
+
+    fused = await execute_rules_fused([dependent, context_level], ctx)
+
+    assert fused == {}
+    assert take_fused_findings(fused, "t.dependent") is None
+
+
+async def test_setup_failure_is_raised_by_take_fused_findings(
+    engine: ASTGateEngine, tmp_path: Path
+) -> None:
+    ctx = _make_context(tmp_path, [])
+    ctx.get_files.side_effect = RuntimeError("walker down")
+    rule = _make_rule("t.no_print", check_type="no_print_statements")
+
+    fused = await execute_rules_fused([rule], ctx)
+
+    with pytest.raises(RuntimeError, match="walker down"):
+        take_fused_findings(fused, "t.no_print")
@@ -0,0 +1,293 @@
+# tests/mind/governance/test_rule_executor__parallel_dispatch.py
+"""Process-pool dispatch for CPU-bound engines (execute_rules_parallel).
+
+Proves:
+- worker-evaluated findings are identical, per rule and in order, to
+  rule-major execute_rule
+- evaluation-cache hits never leave the main process
+- an engine crash inside a worker becomes the same ENFORCEMENT_FAILURE
+  finding as an in-process crash
+- a failing pool batch is re-evaluated in-process
+- a broken pool is shut down so the next run starts a fresh one
+- engines without supports_process_dispatch stay on the main loop
+- precompute_rule_findings honours the context's audit_workers override
+- a real spawned worker pool produces the in-process findings
+"""
+
+from __future__ import annotations
+
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mind.governance import audit_worker_pool
+from mind.governance.executable_rule import ExecutableRule
+from mind.governance.rule_executor import (
+    clear_eval_cache,
+    execute_rule,
+    execute_rules_parallel,
+    precompute_rule_findings,
+    take_fused_findings,
+)
+from mind.logic.engines.ast_gate.engine import ASTGateEngine
+from mind.logic.engines.base import BaseEngine, EngineResult
+from mind.logic.engines.regex_gate import RegexGateEngine
+
+
+_SOURCES = {
+    "clean.py": 'def ok() -> int:\n    """Doc."""\n    return 1\n',
+    "noisy.py": "import subprocess\n\n\ndef public():\n    print('hi')\n    subprocess.run(['ls'])\n",
+    "broken.py": "def broken(:\n    pass\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_eval_cache() -> None:
+    clear_eval_cache()
+    yield
+    clear_eval_cache()
+
+
+@pytest.fixture
+def engines(monkeypatch: pytest.MonkeyPatch) -> dict[str, BaseEngine]:
+    registry: dict[str, BaseEngine] = {
+        "ast_gate": ASTGateEngine(MagicMock()),
+        "regex_gate": RegexGateEngine(),
+    }
+    monkeypatch.setattr(
+        "mind.logic.engines.registry.EngineRegistry.get",
+        lambda engine_id: registry[engine_id],
+    )
+    return registry
+
+
+@pytest.fixture
+def in_process_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> list[Any]:
+    """Run worker batches in this process, through the worker code path."""
+    batches: list[Any] = []
+
+    async def _verify_in_pool(pool: Any, batch: Any) -> list[Any]:
+        batches.append(batch)
+        return await audit_worker_pool._verify_batch_async(batch)
+
+    monkeypatch.setattr(audit_worker_pool, "get_audit_pool", lambda *a: object())
+    monkeypatch.setattr(audit_worker_pool, "verify_in_pool", _verify_in_pool)
+    monkeypatch.setattr(
+        audit_worker_pool,
+        "_WORKER_CONTEXT",
+        audit_worker_pool._WorkerContext(tmp_path),
+    )
+    return batches
+
+
+def _write_files(root: Path) -> list[Path]:
+    paths = []
+    for name, source in _SOURCES.items():
+        path = root / name
+        path.write_text(source, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _make_context(repo_path: Path, files: list[Path]) -> Any:
+    ctx = MagicMock()
+    ctx.repo_path = repo_path
+    ctx.force_llm = False
+    ctx.audit_workers = None
+    ctx.get_files.return_value = files
+    ctx.get_tree.return_value = None
+    return ctx
+
+
+def _make_rule(rule_id: str, engine: str = "ast_gate", **params: Any) -> ExecutableRule:
+    return ExecutableRule(
+        rule_id=rule_id,
+        engine=engine,
+        params=params,
+        enforcement="blocking",
+        scope=["**/*.py"],
+        rule_content_hash=f"hash-{rule_id}",
+    )
+
+
+def _rules() -> list[ExecutableRule]:
+    return [
+        _make_rule("t.no_print", check_type="no_print_statements"),
+        _make_rule("t.docstrings", check_type="docstrings_present"),
+        _make_rule(
+            "t.forbidden",
+            check_type="forbidden_imports_and_calls",
+            forbidden_imports=["subprocess"],
+            forbidden_calls=["subprocess.run"],
+        ),
+        _make_rule("t.regex", engine="regex_gate", forbidden_patterns=["print\\("]),
+    ]
+
+
+def _as_tuples(findings: list[Any]) -> list[tuple]:
+    return [
+        (f.check_id, f.severity, f.message, f.file_path, f.line_number, f.context)
+        for f in findings
+    ]
+
+
+async def _rule_major(rules: list[ExecutableRule], ctx: Any) -> dict[str, list]:
+    expected = {r.rule_id: _as_tuples(await execute_rule(r, ctx)) for r in rules}
+    clear_eval_cache()
+    return expected
+
+
+async def test_parallel_findings_match_rule_major(
+    engines: dict, in_process_pool: list, tmp_path: Path
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+    rules = _rules()
+    expected = await _rule_major(rules, ctx)
+
+    results = await execute_rules_parallel(rules, ctx, workers=2)
+
+    assert in_process_pool, "no batch was sent to the pool"
+    for rule in rules:
+        assert (
+            _as_tuples(take_fused_findings(results, rule.rule_id))
+            == expected[rule.rule_id]
+        )
+
+
+async def test_cache_hits_stay_in_the_main_process(
+    engines: dict, in_process_pool: list, tmp_path: Path
+) -> None:
+    files = [p for p in _write_files(tmp_path) if p.name != "broken.py"]
+    ctx = _make_context(tmp_path, files)
+    await execute_rules_parallel(_rules(), ctx, workers=2)
+    in_process_pool.clear()
+
+    results = await execute_rules_parallel(_rules(), ctx, workers=2)
+
+    assert in_process_pool == []
+    assert not any(isinstance(v, BaseException) for v in results.values())
+
+
+async def test_worker_crash_becomes_enforcement_failure(
+    engines: dict,
+    in_process_pool: list,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path)[:1])
+    rule = _make_rule("t.regex", engine="regex_gate", forbidden_patterns=["x"])
+
+    async def _boom(self: Any, file_path: Path, params: dict) -> EngineResult:
+        raise ValueError("kaput")
+
+    monkeypatch.setattr(RegexGateEngine, "verify", _boom)
+    expected = await _rule_major([rule], ctx)
+
+    results = await execute_rules_parallel([rule], ctx, workers=2)
+
+    findings = take_fused_findings(results, "t.regex")
+    assert _as_tuples(findings) == expected["t.regex"]
+    assert findings[0].context["exception_type"] == "ValueError"
+
+
+async def test_failed_batch_is_evaluated_in_process(
+    engines: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+    rules = _rules()
+    expected = await _rule_major(rules, ctx)
+
+    async def _broken_pool(pool: Any, batch: Any) -> list:
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(audit_worker_pool, "get_audit_pool", lambda *a: object())
+    monkeypatch.setattr(audit_worker_pool, "verify_in_pool", _broken_pool)
+
+    results = await execute_rules_parallel(rules, ctx, workers=2)
+
+    for rule in rules:
+        assert (
+            _as_tuples(take_fused_findings(results, rule.rule_id))
+            == expected[rule.rule_id]
+        )
+
+
+async def test_broken_pool_is_shut_down(
+    engines: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+    shutdowns: list[None] = []
+
+    async def _dead_pool(pool: Any, batch: Any) -> list:
+        raise BrokenProcessPool("a worker terminated abruptly")
+
+    monkeypatch.setattr(audit_worker_pool, "get_audit_pool", lambda *a: object())
+    monkeypatch.setattr(audit_worker_pool, "verify_in_pool", _dead_pool)
+    monkeypatch.setattr(
+        audit_worker_pool, "shutdown_audit_pool", lambda: shutdowns.append(None)
+    )
+
+    results = await execute_rules_parallel(_rules(), ctx, workers=2)
+
+    assert shutdowns == [None]
+    assert not any(isinstance(v, BaseException) for v in results.values())
+
+
+async def test_main_loop_engines_are_not_sharded(
+    engines: dict, in_process_pool: list, tmp_path: Path
+) -> None:
+    class _DbEngine(BaseEngine):
+        engine_id = "db_backed"
+
+        async def verify(self, file_path: Path, params: dict) -> EngineResult:
+            return EngineResult(True, "ok", [], self.engine_id)
+
+    engines["db_backed"] = _DbEngine()
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+
+    results = await execute_rules_parallel(
+        [_make_rule("t.db", engine="db_backed")], ctx, workers=2
+    )
+
+    assert results == {}
+    assert in_process_pool == []
+
+
+async def test_precompute_uses_the_context_override(
+    engines: dict, in_process_pool: list, tmp_path: Path
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+    rules = _rules()
+
+    ctx.audit_workers = 0
+    await precompute_rule_findings(rules, ctx)
+    assert in_process_pool == []
+
+    clear_eval_cache()
+    ctx.audit_workers = 2
+    results = await precompute_rule_findings(rules, ctx)
+    assert in_process_pool
+    assert set(results) == {r.rule_id for r in rules}
+
+
+async def test_spawned_pool_matches_in_process(
+    engines: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ctx = _make_context(tmp_path, _write_files(tmp_path))
+    rules = [r for r in _rules() if r.engine == "regex_gate"]
+    expected = await _rule_major(rules, ctx)
+
+    # Workers build their own registry; keep the real one there.
+    try:
+        results = await execute_rules_parallel(rules, ctx, workers=2)
+    finally:
+        audit_worker_pool.shutdown_audit_pool()
+
+    for rule in rules:
+        assert (
+            _as_tuples(take_fused_findings(results, rule.rule_id))
+            == expected[rule.rule_id]
+        )
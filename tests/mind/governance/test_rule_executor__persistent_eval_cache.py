@@ -0,0 +1,303 @@
+# tests/mind/governance/test_rule_executor__persistent_eval_cache.py
+"""Persistent, content-addressed evaluation cache (EvalFindingsStore).
+
+Proves:
+- a fresh process (empty in-memory cache, re-opened store) serves
+  unchanged (rule, file) pairs from var/cache/audit/ without verify()
+- findings round-trip through the store unchanged
+- a content change or a rule_content_hash change misses
+- clear_eval_cache() clears the store too, and clear_eval_cache(repo_path)
+  truncates a store persisted by an earlier process
+- audit.persistent_eval_cache=False keeps the store out of the loop
+- the store stays within its byte budget, evicting least-recently-used
+- an unchanged stat is not re-hashed, unless the file was modified too
+  recently to trust its stat (racily clean)
+- the engine version covers the engine's private helper modules and
+  engines/base.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from mind.governance import rule_executor
+from mind.governance.executable_rule import ExecutableRule
+from mind.governance.rule_executor import clear_eval_cache, execute_rule
+from mind.logic.engines.base import BaseEngine, EngineResult
+from shared.infrastructure.intent import operational_config
+from shared.infrastructure.storage import eval_store
+from shared.infrastructure.storage.eval_store import EvalFindingsStore
+
+
+@pytest.fixture(autouse=True)
+def _reset_eval_cache() -> None:
+    clear_eval_cache()
+    yield
+    clear_eval_cache()
+
+
+# ID: 0d4b7e21-9c3a-4f86-b5e2-a7f1c8d3e649
+class _CountingEngine(BaseEngine):
+    """Engine that counts verify() calls and reports fixed violations."""
+
+    engine_id = "fake_counting"
+
+    def __init__(self, violations: list[str] | None = None) -> None:
+        self.call_count = 0
+        self._violations = violations or []
+
+    async def verify(self, file_path: Path, params: dict[str, Any]) -> EngineResult:
+        self.call_count += 1
+        return EngineResult(
+            not self._violations, "x", list(self._violations), self.engine_id
+        )
+
+
+def _patch_engine(monkeypatch: pytest.MonkeyPatch, engine: BaseEngine) -> None:
+    monkeypatch.setattr(
+        "mind.logic.engines.registry.EngineRegistry.get",
+        lambda engine_id: engine,
+    )
+
+
+def _make_context(repo_path: Path, files: list[Path]) -> Any:
+    ctx = MagicMock()
+    ctx.repo_path = repo_path
+    ctx.force_llm = False
+    ctx.get_files.return_value = files
+    return ctx
+
+
+def _make_rule(rule_content_hash: str = "abc123") -> ExecutableRule:
+    return ExecutableRule(
+        rule_id="test.rule",
+        engine="fake_counting",
+        params={},
+        enforcement="blocking",
+        scope=["**/*.py"],
+        rule_content_hash=rule_content_hash,
+    )
+
+
+def _fresh_process() -> None:
+    """Forget everything held in memory; only var/cache/audit/ survives."""
+    rule_executor._EVAL_CACHE.clear()
+    eval_store._STORES.clear()
+
+
+async def test_fresh_process_is_served_from_the_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine(["bad thing"])
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    first = await execute_rule(_make_rule(), ctx)
+    _fresh_process()
+    second = await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 1
+    assert (tmp_path / "var" / "cache" / "audit" / eval_store.DB_NAME).exists()
+    assert second == first
+
+
+async def test_content_change_misses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule(), ctx)
+    target.write_text("x = 22")
+    _fresh_process()
+    await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 2
+
+
+async def test_touched_but_identical_file_hits(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule(), ctx)
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _fresh_process()
+    await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 1
+
+
+async def test_rule_hash_change_misses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule("v1"), ctx)
+    _fresh_process()
+    await execute_rule(_make_rule("v2"), ctx)
+
+    assert engine.call_count == 2
+
+
+async def test_clear_eval_cache_clears_the_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule(), ctx)
+    clear_eval_cache()
+    _fresh_process()
+    await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 2
+
+
+async def test_clear_eval_cache_truncates_a_persisted_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule(), ctx)
+    _fresh_process()
+    clear_eval_cache(tmp_path)
+    _fresh_process()
+    await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 2
+
+
+async def test_disabled_by_config(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cfg = operational_config.load_operational_config()
+    off = replace(cfg, audit=replace(cfg.audit, persistent_eval_cache=False))
+    monkeypatch.setattr(operational_config, "load_operational_config", lambda: off)
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    engine = _CountingEngine()
+    _patch_engine(monkeypatch, engine)
+    ctx = _make_context(tmp_path, [target])
+
+    await execute_rule(_make_rule(), ctx)
+    _fresh_process()
+    await execute_rule(_make_rule(), ctx)
+
+    assert engine.call_count == 2
+    assert not (tmp_path / "var").exists()
+
+
+def test_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    store = EvalFindingsStore(tmp_path / eval_store.DB_NAME, max_bytes=1000)
+    payload = "x" * 300
+    keys = [("r", "h", f"f{i}.py", "sha", "v") for i in range(3)]
+    for key in keys:
+        store.put(key, payload)
+        store.flush()
+    store.get(keys[0])
+    store.put(("r", "h", "f3.py", "sha", "v"), payload)
+    store.flush()
+
+    stats = store.stats()
+    assert stats["total_bytes"] <= 1000
+    assert store.get(keys[0]) == payload
+    assert store.get(keys[1]) is None
+
+
+def test_unchanged_stat_is_not_rehashed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    settled = target.stat().st_mtime_ns - 10_000_000_000
+    os.utime(target, ns=(settled, settled))
+    stat = target.stat()
+    store = EvalFindingsStore(tmp_path / eval_store.DB_NAME, max_bytes=1 << 20)
+    sha = store.digest(target, stat.st_mtime_ns, stat.st_size)
+    store.flush()
+
+    reopened = EvalFindingsStore(tmp_path / eval_store.DB_NAME, max_bytes=1 << 20)
+    monkeypatch.setattr(
+        Path, "read_bytes", MagicMock(side_effect=AssertionError("re-hashed"))
+    )
+    assert reopened.digest(target, stat.st_mtime_ns, stat.st_size) == sha
+
+
+def test_racily_clean_file_is_always_rehashed(tmp_path: Path) -> None:
+    target = tmp_path / "module.py"
+    target.write_text("x = 1")
+    stat = target.stat()
+    store = EvalFindingsStore(tmp_path / eval_store.DB_NAME, max_bytes=1 << 20)
+    store.digest(target, stat.st_mtime_ns, stat.st_size)
+
+    # Rewritten within the same timestamp tick, same size.
+    target.write_text("x = 2")
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    fresh = target.stat()
+    expected = hashlib.sha256(b"x = 2").hexdigest()
+    assert store.digest(target, fresh.st_mtime_ns, fresh.st_size) == expected
+    store.flush()
+    reopened = EvalFindingsStore(tmp_path / eval_store.DB_NAME, max_bytes=1 << 20)
+    assert reopened.digest(target, fresh.st_mtime_ns, fresh.st_size) == expected
+
+
+def test_engine_version_covers_helpers_and_base(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class _FakeGate(_CountingEngine):
+        engine_id = "fake_gate"
+
+    _FakeGate.__module__ = "mind.logic.engines.fake_gate"
+    files = {
+        name: tmp_path / name
+        for name in ("fake_gate.py", "_fake_gate_scanner.py", "base.py", "other.py")
+    }
+    for path in files.values():
+        path.write_text("v1")
+    monkeypatch.setattr(
+        rule_executor.inspect,
+        "getfile",
+        lambda obj: files["fake_gate.py" if obj is _FakeGate else "base.py"],
+    )
+
+    def _version() -> str:
+        rule_executor._ENGINE_VERSIONS.pop(_FakeGate, None)
+        return rule_executor._engine_version(_FakeGate())
+
+    versions = {_version()}
+    for name in ("_fake_gate_scanner.py", "base.py", "other.py"):
+        files[name].write_text("v2")
+        versions.add(_version())
+
+    # other.py is neither a helper of fake_gate nor base.py.
+    assert len(versions) == 3
@@ -0,0 +1,164 @@
+"""ScopeIndex — compiled equivalent of audit_context._include_matches.
+
+- differential: for a generated corpus of paths x glob scopes (``**/``,
+  ``/**``, ``*``, ``?``, character classes, unbalanced ``[``), the scope
+  mask and ad-hoc matchers agree with _include_matches on every pair
+- per-path scope masks are memoized
+- AuditorContext.get_files retains and filters exactly the files the
+  pre-index fnmatch loops selected, and reuses the index across cycles
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mind.governance.audit_context import AuditorContext, _include_matches
+from mind.governance.scope_index import ScopeIndex
+
+
+_SEGMENTS = ["src", "mind", "a", "ab", "[x]", "tests", ".hidden", "**", "*", "a?"]
+_LEAVES = ["main.py", "x.txt", "a", "__init__.py", "test_x.py", "[x].py", ".env"]
+_PATTERN_PARTS = [
+    "src",
+    "mind",
+    "a",
+    "**",
+    "*",
+    "*.py",
+    "test_*.py",
+    "a?",
+    "[ab]*",
+    "[!a]*",
+    "[x]",
+    "[",
+    ".env",
+    "",
+]
+
+
+def _paths() -> list[str]:
+    out: list[str] = list(_LEAVES)
+    for depth in (1, 2, 3):
+        for dirs in itertools.product(_SEGMENTS[:6], repeat=depth):
+            out.extend("/".join((*dirs, leaf)) for leaf in _LEAVES)
+    rng = random.Random(11)
+    for _ in range(300):
+        dirs = rng.choices(_SEGMENTS, k=rng.randint(0, 4))
+        out.append("/".join((*dirs, rng.choice(_LEAVES))))
+    return sorted(set(out))
+
+
+def _patterns() -> list[str]:
+    out = [
+        "src/**/*.py",
+        "src/**",
+        "**/*.py",
+        "**/.env",
+        "src/mind/**/test_*.py",
+        "**",
+        "*",
+        "src/*",
+        "src/**/**/a",
+        "src/[",
+        "**/[x]/**",
+    ]
+    rng = random.Random(7)
+    for _ in range(400):
+        out.append(
+            "/".join(rng.choices(_PATTERN_PARTS, k=rng.randint(1, 4))).strip("/") or "*"
+        )
+    return sorted(set(out))
+
+
+PATHS = _paths()
+PATTERNS = _patterns()
+
+
+def test_scope_mask_agrees_with_include_matches() -> None:
+    index = ScopeIndex(PATTERNS)
+
+    for rel in PATHS:
+        mask = index.scope_mask(rel)
+        for i, pat in enumerate(index.scopes):
+            assert bool(mask >> i & 1) is _include_matches(rel, pat), (rel, pat)
+        assert index.matches_any(rel) is any(_include_matches(rel, p) for p in PATTERNS)
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_matcher_agrees_with_include_matches(indexed: bool) -> None:
+    rng = random.Random(3)
+    index = ScopeIndex(PATTERNS if indexed else [])
+    groups = [rng.sample(PATTERNS, k=rng.randint(1, 5)) for _ in range(40)]
+
+    for group in groups:
+        is_match = index.matcher(group)
+        for rel in PATHS:
+            expected = any(_include_matches(rel, p) for p in group)
+            assert is_match(rel) is expected, (rel, group)
+
+
+def test_empty_pattern_set_matches_nothing() -> None:
+    assert ScopeIndex([]).matcher([])("src/main.py") is False
+
+
+def test_scope_masks_are_memoized() -> None:
+    index = ScopeIndex(["src/**/*.py"])
+    index.scope_mask("src/a.py")
+
+    with patch.object(index, "_set_regex") as regex:
+        assert index.scope_mask("src/a.py") == 1
+        regex.match.assert_not_called()
+
+
+def _reference_get_files(
+    rels: list[str], scopes: list[str], include: list[str], exclude: list[str]
+) -> list[str]:
+    retained = [r for r in rels if any(_include_matches(r, s) for s in scopes)]
+    return sorted(
+        r
+        for r in retained
+        if any(_include_matches(r, p) for p in include)
+        and not any(_include_matches(r, p) for p in exclude)
+    )
+
+
+def test_get_files_matches_reference_walk(tmp_path: Path) -> None:
+    rels = [
+        "src/main.py",
+        "src/api/v1/routes.py",
+        "src/api/README.md",
+        "src/mind/coherence/checker.py",
+        "src/mind/coherence/checks/specgap.py",
+        "tests/test_main.py",
+        "docs/index.md",
+        "setup.py",
+    ]
+    for rel in rels:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("", encoding="utf-8")
+    scopes = ["src/**/*.py", "tests/**", "*.py"]
+    ctx = AuditorContext(tmp_path)
+
+    with patch.object(
+        AuditorContext, "_active_per_file_rule_scopes", return_value=scopes
+    ):
+        for include, exclude in [
+            (["src/**/*.py"], ["src/mind/coherence/**/*.py"]),
+            (["**/*.py"], []),
+            (["src/api/**", "tests/**"], ["**/*.md"]),
+            (["docs/**"], []),
+        ]:
+            got = ctx.get_files(include, exclude)
+            rel_got = sorted(p.relative_to(tmp_path).as_posix() for p in got)
+            assert rel_got == _reference_get_files(rels, scopes, include, exclude)
+
+        index = ctx._scope_index
+        ctx.invalidate_file_cache()
+        ctx.get_files(["src/**/*.py"])
+
+    assert ctx._scope_index is index
@@ -10,6 +10,8 @@ The tests exercise:
   - Sub-threshold pair suppression
   - Test-file exclusion
   - _sym_from_chunk helper
+  - No chunk cap; findings ranked by similarity; tiled pairs match brute force
+  - Incremental mode compares only new chunks and keeps earlier pairs
 """
 
 from __future__ import annotations
@@ -18,10 +20,13 @@ import math
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
+from mind.logic.engines import _knowledge_gate_duplication as duplication
 from mind.logic.engines._knowledge_gate_duplication import (
     _check_semantic_duplication,
+    _similar_pairs,
     _sym_from_chunk,
 )
 
@@ -66,6 +71,7 @@ def _make_qdrant_point(
         "artifact_type": artifact_type,
     }
     point.vector = vector
+    point.id = f"{file_path}::{section}"
     return point
 
 
@@ -219,3 +225,95 @@ async def test_threshold_governs_detection() -> None:
     # High threshold (perfect similarity required) — should not find the pair
     findings_high = await _check_semantic_duplication(ctx, {"threshold": 0.9999})
     assert findings_high == []
+
+
+# ── scale, ranking, incremental ──────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_no_chunk_cap_and_ranked_by_similarity() -> None:
+    """Pairs beyond the old 2,000-chunk cap are found; best match reported first."""
+    dim = 2200
+    points = [
+        _make_qdrant_point(f"src/body/m{i}.py", "f", _unit_vec(dim, i))
+        for i in range(2100)
+    ]
+    points += [
+        _make_qdrant_point(
+            "src/body/late_a.py", "f", _similar_vec(_unit_vec(dim, 2050), 0.3)
+        ),
+        _make_qdrant_point(
+            "src/body/late_b.py", "f", _similar_vec(_unit_vec(dim, 0), 0.01)
+        ),
+    ]
+    qdrant = _make_qdrant(collections=["core-code"], points=points)
+    ctx = _make_context(qdrant=qdrant)
+
+    findings = await _check_semantic_duplication(ctx, {"threshold": 0.85})
+
+    assert [f.context["module_b"] for f in findings] == [
+        "src.body.m0",
+        "src.body.m2050",
+    ]
+    assert findings[0].file_path == "src/body/late_b.py"
+
+
+# ID: 4c1e8b27-9a3d-4f65-b0d2-e7a5c9f3b184
+def test_tiled_pairs_match_brute_force(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(7)
+    base = rng.standard_normal((6, 8)).astype(np.float32)
+    mat = np.repeat(base, 4, axis=0) + 0.05 * rng.standard_normal((24, 8)).astype(
+        np.float32
+    )
+    unit = mat / np.linalg.norm(mat, axis=1, keepdims=True)
+    file_codes = np.arange(24) % 5
+    sim = unit @ unit.T
+    expected = {
+        (i, j)
+        for i in range(24)
+        for j in range(i + 1, 24)
+        if sim[i, j] >= 0.9 and file_codes[i] != file_codes[j]
+    }
+    monkeypatch.setattr(duplication, "_TILE_ELEMENTS", 24 * 5)
+
+    full = _similar_pairs(unit, 0.9, file_codes)
+    partial = _similar_pairs(unit, 0.9, file_codes, [3, 17])
+
+    assert {(i, j) for i, j, _ in full} == expected
+    assert {(i, j) for i, j, _ in partial} == {
+        pair for pair in expected if {3, 17} & set(pair)
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_compares_only_new_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(duplication, "_SEMANTIC_PAIR_MEMO", {})
+    dim = 8
+    points = [
+        _make_qdrant_point("src/body/a.py", "foo", _unit_vec(dim, 0)),
+        _make_qdrant_point("src/body/b.py", "foo", _similar_vec(_unit_vec(dim, 0))),
+        _make_qdrant_point("src/body/c.py", "bar", _unit_vec(dim, 1)),
+        _make_qdrant_point("src/body/d.py", "baz", _unit_vec(dim, 2)),
+    ]
+    qdrant = _make_qdrant(collections=["core-code"], points=points)
+    ctx = _make_context(qdrant=qdrant)
+    params = {"threshold": 0.85, "incremental": True}
+    first = await _check_semantic_duplication(ctx, params)
+    assert len(first) == 1
+
+    edited = _make_qdrant_point("src/body/e.py", "bar", _similar_vec(_unit_vec(dim, 1)))
+    qdrant.scroll_all_points = AsyncMock(return_value=[*points, edited])
+    calls = []
+    real = duplication._similar_pairs
+
+    def _spy(unit, threshold, file_codes, rows=None):
+        calls.append(rows)
+        return real(unit, threshold, file_codes, rows)
+
+    monkeypatch.setattr(duplication, "_similar_pairs", _spy)
+    second = await _check_semantic_duplication(ctx, params)
+
+    assert calls == [[4]]
+    assert sorted(f.context["symbol_a"] for f in second) == ["bar", "foo"]
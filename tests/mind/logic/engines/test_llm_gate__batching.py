@@ -0,0 +1,189 @@
+"""Multi-file batched prompts for LLMGateEngine.
+
+- small cache-miss files are packed into one batch prompt and each file
+  takes its verdict from the batch response
+- packing respects the token budget and max-files bound; lone files and
+  oversized files keep the single-file prompt
+- an unparseable batch response falls back to single-file calls
+- a failed batch call reports every member unavailable without a
+  single-file call per member
+- a file the batch response omits is re-evaluated singly
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from mind.logic.engines import llm_gate
+from mind.logic.engines.llm_gate import LLMGateEngine, _pack_batches
+from shared.path_resolver import PathResolver
+
+
+_SINGLE_VIOLATION = json.dumps(
+    {"violation": True, "reasoning": "single", "finding": "single finding"}
+)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / name).write_text(f"{name[0]} = 1", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_gate, "_batch_limits", lambda: (6000, 8, 1500))
+
+
+def _engine(
+    repo: Path, batch_response: Any
+) -> tuple[LLMGateEngine, AsyncMock, AsyncMock]:
+    single = AsyncMock(return_value=_SINGLE_VIOLATION)
+    batch = AsyncMock(
+        return_value=batch_response
+        if isinstance(batch_response, str)
+        else json.dumps(batch_response)
+    )
+    engine = LLMGateEngine(
+        path_resolver=PathResolver(repo_root=repo), llm_client=Mock()
+    )
+    engine._audit_prompt_model = MagicMock(invoke=single)
+    engine._batch_prompt_model = MagicMock(invoke=batch)
+    return engine, single, batch
+
+
+async def _run(engine: LLMGateEngine, files: list[Path]) -> list[Any]:
+    params: dict[str, Any] = {"instruction": "i", "rationale": "r"}
+    params["_rule_state"] = await engine.prepare_rule(files, params)
+    return [await engine.verify(f, params) for f in files]
+
+
+async def test_files_share_one_batch_call(repo: Path) -> None:
+    engine, single, batch = _engine(
+        repo,
+        {
+            "verdicts": [
+                {
+                    "file": "a.py",
+                    "violation": False,
+                    "reasoning": "ok",
+                    "finding": None,
+                },
+                {
+                    "file": "b.py",
+                    "violation": True,
+                    "reasoning": "bad",
+                    "finding": "b!",
+                },
+                {
+                    "file": "c.py",
+                    "violation": False,
+                    "reasoning": "ok",
+                    "finding": None,
+                },
+            ]
+        },
+    )
+    files = [repo / "a.py", repo / "b.py", repo / "c.py"]
+
+    results = await _run(engine, files)
+
+    assert batch.await_count == 1
+    assert single.await_count == 0
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].violations == ["b!"]
+    files_block = batch.await_args.kwargs["context"]["files"]
+    assert "FILE: a.py" in files_block and "FILE: c.py" in files_block
+
+
+async def test_unparseable_batch_falls_back_to_single_calls(repo: Path) -> None:
+    engine, single, batch = _engine(repo, "not json at all")
+    files = [repo / "a.py", repo / "b.py"]
+
+    results = await _run(engine, files)
+
+    assert batch.await_count == 1
+    assert single.await_count == 2
+    assert all(r.violations == ["single finding"] for r in results)
+
+
+async def test_failed_batch_call_is_not_retried_per_file(repo: Path) -> None:
+    engine, single, batch = _engine(repo, "{}")
+    batch.side_effect = TimeoutError("llm host unreachable")
+    files = [repo / "a.py", repo / "b.py"]
+
+    results = await _run(engine, files)
+
+    assert batch.await_count == 1
+    assert single.await_count == 0
+    assert all(r.violations == ["SYSTEM_ERROR_AI_OFFLINE"] for r in results)
+    assert all("ENFORCEMENT_UNAVAILABLE" in r.message for r in results)
+
+
+async def test_omitted_file_is_evaluated_singly(repo: Path) -> None:
+    engine, single, _ = _engine(
+        repo,
+        {
+            "verdicts": [
+                {"file": "a.py", "violation": False, "reasoning": "ok", "finding": None}
+            ]
+        },
+    )
+    files = [repo / "a.py", repo / "b.py"]
+
+    results = await _run(engine, files)
+
+    assert results[0].ok
+    assert not results[1].ok
+    assert single.await_count == 1
+
+
+async def test_batching_disabled_by_zero_budget(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(llm_gate, "_batch_limits", lambda: (0, 8, 1500))
+    engine, single, batch = _engine(repo, {"verdicts": []})
+    files = [repo / "a.py", repo / "b.py"]
+
+    params: dict[str, Any] = {"instruction": "i"}
+    assert await engine.prepare_rule(files, params) is None
+    for f in files:
+        await engine.verify(f, params)
+
+    assert batch.await_count == 0
+    assert single.await_count == 2
+
+
+def test_pack_batches_respects_budget_and_max_files() -> None:
+    candidates = [(f"f{i}.py", "x" * 400) for i in range(5)]  # 100 tokens each
+
+    by_budget = _pack_batches(candidates, budget=250, max_files=8)
+    by_count = _pack_batches(candidates, budget=10_000, max_files=3)
+
+    assert [list(b.members) for b in by_budget] == [
+        ["f0.py", "f1.py"],
+        ["f2.py", "f3.py"],
+    ]  # f4.py alone → single-file prompt
+    assert [list(b.members) for b in by_count] == [
+        ["f0.py", "f1.py", "f2.py"],
+        ["f3.py", "f4.py"],
+    ]
+
+
+async def test_oversized_file_is_not_batched(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (repo / "big.py").write_text("x" * 8000, encoding="utf-8")
+    engine, _, _ = _engine(repo, {"verdicts": []})
+    files = [repo / "a.py", repo / "big.py", repo / "b.py"]
+
+    state = await engine.prepare_rule(files, {"instruction": "i"})
+
+    assert state is not None
+    assert set(state.batches) == {"a.py", "b.py"}
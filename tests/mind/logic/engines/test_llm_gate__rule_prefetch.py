@@ -0,0 +1,174 @@
+"""Rule-level ADR-044 cache prefetch for LLMGateEngine.
+
+Proves prepare_rule()/finalize_rule() turn the per-file cache round-trips
+into one read and one write per rule, without a live database:
+
+- prepare_rule() issues a single query and serves hits from memory
+- fresh crawler hashes are used; stale ones fall back to the inline hash
+- misses are queued and written in one bulk upsert by finalize_rule()
+- force_llm bypasses prefetched verdicts
+- a failing prefetch returns None (per-file path)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from mind.logic.engines.llm_gate import LLMGateEngine, _RuleVerdictPrefetch
+from shared.path_resolver import PathResolver
+
+
+# ID: e99a1f66-8c6a-4f46-b045-5103eef426ac
+class _FakeResult:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+# ID: 49c020a8-62ae-44f9-8e06-9a5a8bd8b55c
+class _FakeSession:
+    """Records every statement; answers the prefetch query with ``rows``."""
+
+    def __init__(self, rows: list[tuple[Any, ...]] | None = None) -> None:
+        self.rows = rows or []
+        self.statements: list[tuple[str, dict[str, Any]]] = []
+        self.commits = 0
+
+    async def execute(self, stmt: Any, params: dict[str, Any]) -> _FakeResult:
+        self.statements.append((str(stmt), params))
+        return _FakeResult(self.rows)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    for name, body in (("a.py", "a = 1"), ("b.py", "b = 2")):
+        (tmp_path / name).write_text(body, encoding="utf-8")
+    return tmp_path
+
+
+def _engine(repo: Path) -> tuple[LLMGateEngine, AsyncMock]:
+    invoke = AsyncMock(
+        return_value=json.dumps({"violation": True, "reasoning": "r", "finding": "bad"})
+    )
+    engine = LLMGateEngine(
+        path_resolver=PathResolver(repo_root=repo), llm_client=Mock()
+    )
+    engine._audit_prompt_model = MagicMock(invoke=invoke)
+    # Batch prompts answer nothing, so every miss takes the single-file path.
+    engine._batch_prompt_model = MagicMock(invoke=AsyncMock(return_value="{}"))
+    return engine, invoke
+
+
+def _params(session: _FakeSession, *, force_llm: bool = False) -> dict[str, Any]:
+    ctx = MagicMock()
+    ctx.db_session = session
+    return {
+        "instruction": "i",
+        "_context": ctx,
+        "_rule_id": "rule.x",
+        "_rule_content_hash": "rch",
+        "_force_llm": force_llm,
+    }
+
+
+async def test_hit_served_from_prefetch_without_per_file_queries(repo: Path) -> None:
+    session = _FakeSession(
+        rows=[
+            ("a.py", _sha("a = 1"), 10, _sha("a = 1"), "PASS", []),
+            ("b.py", None, None, None, None, None),
+        ]
+    )
+    engine, invoke = _engine(repo)
+    params = _params(session)
+    files = [repo / "a.py", repo / "b.py"]
+
+    state = await engine.prepare_rule(files, params)
+    params["_rule_state"] = state
+    hit = await engine.verify(files[0], params)
+    miss = await engine.verify(files[1], params)
+
+    assert isinstance(state, _RuleVerdictPrefetch)
+    assert hit.ok and "cached" in hit.message
+    assert not miss.ok
+    assert invoke.await_count == 1
+    assert len(session.statements) == 1  # only the prefetch query
+    assert list(state.pending) == [("b.py", _sha("b = 2"))]
+
+
+async def test_stale_crawler_hash_falls_back_to_inline(repo: Path) -> None:
+    session = _FakeSession(
+        rows=[("a.py", "stale-hash", 10**9, "stale-hash", "PASS", [])]
+    )
+    engine, invoke = _engine(repo)
+    params = _params(session)
+
+    params["_rule_state"] = await engine.prepare_rule([repo / "a.py"], params)
+    await engine.verify(repo / "a.py", params)
+
+    assert invoke.await_count == 1
+
+
+async def test_finalize_writes_pending_in_one_statement(repo: Path) -> None:
+    session = _FakeSession()
+    engine, _ = _engine(repo)
+    params = _params(session)
+    files = [repo / "a.py", repo / "b.py"]
+
+    params["_rule_state"] = await engine.prepare_rule(files, params)
+    for f in files:
+        await engine.verify(f, params)
+    await engine.finalize_rule(params["_rule_state"], params)
+
+    assert len(session.statements) == 2  # prefetch + bulk upsert
+    sql, bound = session.statements[-1]
+    assert "jsonb_to_recordset" in sql
+    rows = json.loads(bound["rows"])
+    assert [r["file_path"] for r in rows] == ["a.py", "b.py"]
+    assert all(r["verdict"] == "FAIL" for r in rows)
+    assert session.commits == 1
+    assert params["_rule_state"].pending == {}
+
+
+async def test_force_llm_ignores_prefetched_verdicts(repo: Path) -> None:
+    session = _FakeSession(
+        rows=[("a.py", _sha("a = 1"), 10, _sha("a = 1"), "PASS", [])]
+    )
+    engine, invoke = _engine(repo)
+    params = _params(session, force_llm=True)
+
+    params["_rule_state"] = await engine.prepare_rule([repo / "a.py"], params)
+    result = await engine.verify(repo / "a.py", params)
+
+    assert not result.ok
+    assert invoke.await_count == 1
+
+
+async def test_prefetch_failure_returns_none(repo: Path) -> None:
+    session = _FakeSession()
+    session.execute = AsyncMock(side_effect=RuntimeError("db down"))  # type: ignore[method-assign]
+    engine, _ = _engine(repo)
+
+    assert await engine.prepare_rule([repo / "a.py"], _params(session)) is None
+
+
+async def test_prepare_rule_without_session_returns_none(repo: Path) -> None:
+    engine, _ = _engine(repo)
+    params = _params(_FakeSession())
+    params["_context"].db_session = None
+
+    assert await engine.prepare_rule([repo / "a.py"], params) is None
@@ -0,0 +1,175 @@
+# tests/mind/logic/engines/test_regex_gate_scanner.py
+"""Single-pass multi-pattern scanning for regex_gate (RegexFileView).
+
+Proves:
+- every pattern's matches equal stand-alone re.finditer, including patterns
+  hidden behind an earlier alternative, overlaps, leading inline flags and
+  backreferences
+- line numbers from the newline index equal content.count("\\n") + 1
+- patterns announced through expect() are scanned in one pass
+- has_match() equals re.search for every pattern; required-only patterns
+  stop at their first match, and a pattern also forbidden elsewhere still
+  gets its full match list
+- an invalid pattern fails only the rule that uses it
+- fused dispatch reads each file once and yields rule-major's findings
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mind.governance.executable_rule import ExecutableRule
+from mind.governance.rule_executor import (
+    clear_eval_cache,
+    execute_rule,
+    execute_rules_fused,
+)
+from mind.logic.engines._regex_gate_scanner import RegexFileView
+from mind.logic.engines.regex_gate import RegexGateEngine
+
+
+_CONTENT = (
+    "import os\n"
+    "API_KEY = 'abc'\n"
+    "secret = os.environ['SECRET']\n"
+    "xx yy zz\n"
+    "print(api_key)\n"
+)
+_PATTERNS = [
+    r"API_KEY",
+    r"KEY",  # hidden at the offsets where API_KEY wins
+    r"\w+_KEY\s*=",
+    r"(?i)api_key",
+    r"(\w)\1",
+    r"^print\(",
+    r"o",
+    r"absent",
+]
+
+
+def _view(tmp_path: Path, content: str = _CONTENT) -> RegexFileView:
+    path = tmp_path / "mod.py"
+    path.write_text(content, encoding="utf-8")
+    view = RegexFileView(path)
+    assert view.load()
+    return view
+
+
+def test_matches_equal_standalone_finditer(tmp_path: Path) -> None:
+    view = _view(tmp_path)
+    view.expect({"forbidden_patterns": _PATTERNS})
+
+    for pattern in _PATTERNS:
+        expected = [m.start() for m in re.finditer(pattern, _CONTENT, re.MULTILINE)]
+        assert view.matches(pattern) == expected, pattern
+    for offset in range(len(_CONTENT)):
+        assert view.line_of(offset) == _CONTENT.count("\n", 0, offset) + 1
+
+
+def test_expected_patterns_are_scanned_in_one_pass(tmp_path: Path) -> None:
+    view = _view(tmp_path)
+    view.expect({"forbidden_patterns": ["API_KEY", "absent"]})
+    view.expect({"required_patterns": "^import "})
+
+    with patch.object(
+        RegexFileView, "_scan", autospec=True, side_effect=RegexFileView._scan
+    ) as scan:
+        assert view.matches("absent") == []
+        assert view.matches("^import ") == [0]
+        assert view.matches("API_KEY") == [_CONTENT.index("API_KEY")]
+
+    scan.assert_called_once()
+
+
+def test_has_match_equals_search(tmp_path: Path) -> None:
+    view = _view(tmp_path)
+    view.expect({"required_patterns": _PATTERNS})
+    view.expect({"forbidden_patterns": ["KEY"]})
+
+    for pattern in _PATTERNS:
+        expected = re.search(pattern, _CONTENT, re.MULTILINE) is not None
+        assert view.has_match(pattern) is expected, pattern
+    # Only the forbidden pattern was expanded to every match.
+    assert set(view._starts) == {"KEY"}
+    assert view.matches("o") == [m.start() for m in re.finditer("o", _CONTENT)]
+    assert view.has_match("import") is True
+
+
+def test_invalid_pattern_fails_only_its_rule(tmp_path: Path) -> None:
+    view = _view(tmp_path)
+    view.expect({"forbidden_patterns": ["("]})
+    view.expect({"forbidden_patterns": ["SECRET"]})
+
+    assert view.matches("SECRET") == [_CONTENT.index("SECRET")]
+    with pytest.raises(re.error):
+        view.matches("(")
+
+
+@pytest.fixture(autouse=True)
+def _reset_eval_cache() -> None:
+    clear_eval_cache()
+    yield
+    clear_eval_cache()
+
+
+def _rule(rule_id: str, **params: Any) -> ExecutableRule:
+    return ExecutableRule(
+        rule_id=rule_id,
+        engine="regex_gate",
+        params=params,
+        enforcement="blocking",
+        scope=["**/*.py"],
+        rule_content_hash=f"hash-{rule_id}",
+    )
+
+
+async def test_fused_dispatch_reads_once_and_matches_rule_major(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = RegexGateEngine()
+    monkeypatch.setattr(
+        "mind.logic.engines.registry.EngineRegistry.get", lambda engine_id: engine
+    )
+    files = [tmp_path / "a.py", tmp_path / "b.py"]
+    files[0].write_text(_CONTENT, encoding="utf-8")
+    files[1].write_text('"""Doc."""\n', encoding="utf-8")
+    ctx = MagicMock()
+    ctx.repo_path = tmp_path
+    ctx.force_llm = False
+    ctx.get_files.return_value = files
+    rules = [
+        _rule("t.secrets", forbidden_patterns=["API_KEY", "SECRET"]),
+        _rule("t.print", forbidden_patterns=r"^print\("),
+        _rule("t.docstring", required_patterns=['^"""']),
+    ]
+
+    expected = {}
+    for rule in rules:
+        expected[rule.rule_id] = [
+            (f.check_id, f.message, f.file_path, f.line_number)
+            for f in await execute_rule(rule, ctx)
+        ]
+    clear_eval_cache()
+
+    real_read = Path.read_text
+    reads: list[Path] = []
+
+    def _read(self: Path, *args: Any, **kwargs: Any) -> str:
+        reads.append(self)
+        return real_read(self, *args, **kwargs)
+
+    with patch.object(Path, "read_text", _read):
+        fused = await execute_rules_fused(rules, ctx)
+
+    assert sorted(reads) == sorted(files)
+    for rule in rules:
+        assert [
+            (f.check_id, f.message, f.file_path, f.line_number)
+            for f in fused[rule.rule_id]
+        ] == expected[rule.rule_id]
+    assert any("Line 5" in f[1] for f in expected["t.print"])
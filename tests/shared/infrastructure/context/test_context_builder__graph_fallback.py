@@ -9,6 +9,17 @@ from shared.infrastructure.knowledge.knowledge_service import KnowledgeService
 
 
 class _VectorProviderStub:
+    async def embed_query(self, query: str) -> list[float]:
+        return [0.1, 0.2]
+
+    async def search_by_embedding(
+        self,
+        embedding: list[float],
+        top_k: int = 5,
+        collection: str = "core-code",
+    ) -> list[dict]:
+        return await self.search_similar("add validation", top_k, collection)
+
     async def search_similar(
         self,
         query: str,
@@ -0,0 +1,148 @@
+"""ContextBuilder: concurrent providers and content-identity parse cache.
+
+- a second unscoped build re-parses nothing; a changed file re-parses
+- trees already parsed by AuditorContext (shared.utils.ast_cache) are reused
+- workspace crate overlays are always parsed fresh
+- the vector and DB providers run concurrently
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from shared.infrastructure.context import builder as builder_module
+from shared.infrastructure.context.builder import ContextBuilder
+from shared.infrastructure.context.limb_workspace import LimbWorkspace
+from shared.infrastructure.context.models import ContextBuildRequest
+from shared.utils import ast_cache
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("def alpha():\n    return 1\n")
+    (tmp_path / "src" / "b.py").write_text("class Beta:\n    pass\n")
+    return tmp_path
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    builder_module._SYMBOL_CACHE.clear()
+    ast_cache.AST_CACHE.clear()
+    seen: list[str] = []
+    real_parse = ast.parse
+
+    def _counting_parse(source, *args, **kwargs):
+        seen.append(kwargs.get("filename", "<crate>"))
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(builder_module.ast, "parse", _counting_parse)
+    return seen
+
+
+def _builder(workspace: LimbWorkspace) -> ContextBuilder:
+    return ContextBuilder(
+        db_provider=None,
+        vector_provider=None,
+        ast_provider=None,
+        config={},
+        workspace=workspace,
+    )
+
+
+async def _names(builder: ContextBuilder) -> list[str]:
+    evidence = await builder._gather_ast_evidence(
+        ContextBuildRequest(goal="g", trigger="agent", phase="parse"),
+        {
+            "symbols": {
+                "a": {"file_path": "src/a.py"},
+                "b": {"file_path": "src/b.py"},
+            }
+        },
+    )
+    return [e["name"] for e in evidence]
+
+
+async def test_unchanged_files_are_not_reparsed(repo: Path, parses: list[str]) -> None:
+    builder = _builder(LimbWorkspace(repo))
+
+    assert await _names(builder) == ["alpha", "Beta"]
+    assert len(parses) == 2
+    assert await _names(builder) == ["alpha", "Beta"]
+    assert len(parses) == 2
+
+    (repo / "src" / "a.py").write_text("def alpha_two():\n    return 22\n")
+    assert await _names(builder) == ["alpha_two", "Beta"]
+    assert parses[2:] == [str(repo / "src" / "a.py")]
+
+
+async def test_tree_from_shared_ast_cache_is_reused(
+    repo: Path, parses: list[str]
+) -> None:
+    path = repo / "src" / "a.py"
+    key = ast_cache.file_content_key(path)
+    assert key is not None
+    ast_cache.store_ast(path, key, ast.parse(path.read_text()))
+    parses.clear()
+
+    await _names(_builder(LimbWorkspace(repo)))
+
+    assert parses == [str(repo / "src" / "b.py")]
+
+
+async def test_crate_overlay_is_parsed_fresh(repo: Path, parses: list[str]) -> None:
+    workspace = LimbWorkspace(
+        repo, crate_files={"src/a.py": "def gamma():\n    pass\n"}
+    )
+    builder = _builder(workspace)
+
+    assert await _names(builder) == ["gamma", "Beta"]
+    assert await _names(builder) == ["gamma", "Beta"]
+    assert parses.count("<crate>") == 2
+
+
+async def test_vector_and_db_providers_overlap() -> None:
+    db_started = asyncio.Event()
+    embedded: list[bool] = []
+
+    class _Vectors:
+        async def embed_query(self, query: str) -> list[float]:
+            # Sequential providers would time out here: DB runs after vectors.
+            await asyncio.wait_for(db_started.wait(), timeout=2)
+            embedded.append(True)
+            return [1.0]
+
+        async def search_by_embedding(self, embedding, top_k=5, collection=""):
+            return []
+
+    class _DB:
+        async def fetch_symbols_for_scope(self, scope, limit):
+            db_started.set()
+            return []
+
+    builder = ContextBuilder(
+        db_provider=_DB(),
+        vector_provider=_Vectors(),
+        ast_provider=None,
+        config={},
+        workspace=None,
+    )
+
+    packet = await builder.build(
+        ContextBuildRequest(
+            goal="g",
+            trigger="agent",
+            phase="parse",
+            target_files=["src/x.py"],
+            include_constitution=False,
+            include_policy=False,
+            include_runtime=False,
+        )
+    )
+
+    assert "evidence" in packet
+    assert embedded == [True]
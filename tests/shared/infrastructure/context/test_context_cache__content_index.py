@@ -0,0 +1,165 @@
+"""ContextCache — content-aware invalidation, LRU budget and stats.
+
+- a stored packet round-trips through msgpack and counts a hit
+- editing a file the packet quotes invalidates it on the next get()
+- touching a file without changing its bytes keeps the packet valid
+- the size budget evicts least-recently-used packets first
+- hit/miss/eviction counters persist in index.json across instances
+- plain hits and misses do not rewrite index.json until flush()
+- clear_all() rewrites the index, so no entry outlives its packet file
+- two instances sharing a directory merge into index.json instead of
+  overwriting each other, and the size budget counts both
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from shared.infrastructure.context.cache import ContextCache
+
+
+class _DiskFileHandler:
+    """Minimal FileHandler stand-in that really writes (paths are absolute)."""
+
+    def write_runtime_bytes(self, rel_path: str, data: bytes) -> None:
+        Path(rel_path).write_bytes(data)
+
+    def write_runtime_json(self, rel_path: str, payload: Any) -> None:
+        Path(rel_path).write_text(json.dumps(payload), encoding="utf-8")
+
+    def remove_file(self, rel_path: str) -> None:
+        Path(rel_path).unlink(missing_ok=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(ContextCache, "_rel", lambda self, path: str(path))
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def _cache(repo: Path) -> ContextCache:
+    return ContextCache(
+        cache_dir=str(repo / "cache"),
+        file_handler=_DiskFileHandler(),  # type: ignore[arg-type]
+        repo_root=repo,
+    )
+
+
+def _packet(path: str = "src/a.py", filler: str = "") -> dict[str, Any]:
+    return {"evidence": [{"path": path, "content": filler}], "header": {}}
+
+
+def test_round_trip_hit_and_miss(repo: Path) -> None:
+    cache = _cache(repo)
+
+    assert cache.get("k") is None
+    cache.set("k", _packet())
+
+    assert cache.get("k") == _packet()
+    assert (repo / "cache" / "k.msgpack").exists()
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert cache.entries()[0]["dependencies"] == 1
+
+
+def test_changed_source_invalidates_packet(repo: Path) -> None:
+    cache = _cache(repo)
+    cache.set("k", _packet())
+
+    (repo / "src" / "a.py").write_text("x = 2  # edited\n", encoding="utf-8")
+
+    assert cache.get("k") is None
+    assert cache.stats()["invalidations"] == 1
+    assert not (repo / "cache" / "k.msgpack").exists()
+
+
+def test_touched_source_with_same_bytes_stays_valid(repo: Path) -> None:
+    cache = _cache(repo)
+    cache.set("k", _packet())
+    source = repo / "src" / "a.py"
+    stat = source.stat()
+
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    assert cache.get("k") == _packet()
+
+
+def test_size_budget_evicts_least_recently_used(repo: Path) -> None:
+    cache = _cache(repo)
+    cache.set("old", _packet(filler="a" * 400))
+    cache.set("new", _packet(filler="b" * 400))
+    cache.max_bytes = cache.stats()["total_bytes"] + 100
+
+    cache.get("old")  # "new" is now least recently used
+    cache.set("third", _packet(filler="c" * 400))
+
+    keys = {entry["key"] for entry in cache.entries()}
+    assert keys == {"old", "third"}
+    assert cache.stats()["evictions"] == 1
+    assert not (repo / "cache" / "new.msgpack").exists()
+
+
+def test_stats_persist_across_instances(repo: Path) -> None:
+    first = _cache(repo)
+    first.set("k", _packet())
+    first.get("k")
+    first.get("missing")
+    first.flush()
+
+    stats = _cache(repo).stats()
+
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_plain_lookups_do_not_rewrite_index(repo: Path) -> None:
+    cache = _cache(repo)
+    cache.set("k", _packet())
+    index = repo / "cache" / "index.json"
+    written = index.read_text(encoding="utf-8")
+
+    for _ in range(3):
+        assert cache.get("k") == _packet()
+        assert cache.get("missing") is None
+
+    assert index.read_text(encoding="utf-8") == written
+    cache.flush()
+    saved = json.loads(index.read_text(encoding="utf-8"))["stats"]
+    assert (saved["hits"], saved["misses"]) == (3, 3)
+
+
+def test_clear_all_rewrites_index(repo: Path) -> None:
+    cache = _cache(repo)
+    cache.set("k", _packet())
+
+    assert cache.clear_all() == 1
+
+    assert _cache(repo).entries() == []
+    index = json.loads((repo / "cache" / "index.json").read_text(encoding="utf-8"))
+    assert index["entries"] == {}
+
+
+def test_instances_merge_into_shared_index(repo: Path) -> None:
+    daemon = _cache(repo)
+    cli = _cache(repo)
+    daemon.set("a", _packet(filler="a" * 400))
+    cli.set("b", _packet(filler="b" * 400))
+    daemon.get("a")
+    daemon.flush()
+
+    keys = {entry["key"] for entry in _cache(repo).entries()}
+    assert keys == {"a", "b"}
+
+    daemon.max_bytes = _cache(repo).stats()["total_bytes"] + 100
+    daemon.set("c", _packet(filler="c" * 400))
+
+    keys = {entry["key"] for entry in _cache(repo).entries()}
+    assert keys == {"a", "c"}
+    assert not (repo / "cache" / "b.msgpack").exists()
@@ -1,7 +1,7 @@
 """ContextCache — file_handler DI propagation (ADR-126 Stage 1).
 
-Pins that the file_handler injected at construction is forwarded to
-ContextSerializer.to_yaml() on every cache write.
+Pins that cache writes go through the FileHandler injected at construction,
+and that a cache without one writes nothing.
 """
 
 from __future__ import annotations
@@ -13,27 +13,28 @@ from shared.infrastructure.context.cache import ContextCache
 
 
 # ID: ac2da7c7-8b57-4979-aed9-71694eef3f8d
-def test_cache_set_propagates_none_file_handler(tmp_path: Path) -> None:
-    """set() with no file_handler must not raise; serializer receives None."""
+def test_cache_set_without_file_handler_writes_nothing(tmp_path: Path) -> None:
+    """set() with no file_handler must not raise and must not touch disk."""
     cache = ContextCache(cache_dir=str(tmp_path))
 
-    with patch(
-        "shared.infrastructure.context.cache.ContextSerializer.to_yaml"
-    ) as mock_to_yaml:
-        cache.set("key1", {"evidence": []})
-        _packet, _path, fh_arg = mock_to_yaml.call_args[0]
-        assert fh_arg is None
+    cache.set("key1", {"evidence": []})
+
+    assert list(tmp_path.iterdir()) == []
+    assert cache.entries() == []
 
 
 # ID: db0b32e9-9d39-4c78-bf98-4413693bcf24
-def test_cache_set_propagates_injected_file_handler(tmp_path: Path) -> None:
-    """set() must forward the injected FileHandler to ContextSerializer."""
+def test_cache_set_uses_injected_file_handler(tmp_path: Path) -> None:
+    """set() must write the packet and index through the injected FileHandler."""
     mock_fh = MagicMock()
     cache = ContextCache(cache_dir=str(tmp_path), file_handler=mock_fh)
 
-    with patch(
-        "shared.infrastructure.context.cache.ContextSerializer.to_yaml"
-    ) as mock_to_yaml:
+    with patch.object(ContextCache, "_rel", lambda self, path: str(path)):
         cache.set("key2", {"evidence": []})
-        _packet, _path, fh_arg = mock_to_yaml.call_args[0]
-        assert fh_arg is mock_fh
+
+    packet_path, data = mock_fh.write_runtime_bytes.call_args[0]
+    assert packet_path.endswith("key2.msgpack")
+    assert isinstance(data, bytes)
+    index_path, index = mock_fh.write_runtime_json.call_args[0]
+    assert index_path.endswith("index.json")
+    assert "key2" in index["entries"]
@@ -0,0 +1,97 @@
+"""Query-embedding memo cache shared by VectorProvider instances.
+
+- a repeated query (modulo whitespace) is embedded once, across providers
+- a new embed model revision misses the cache
+- LRU eviction and TTL expiry bound the cache; stats() reports hit rate
+- ContextBuilder embeds the goal once and searches all collections
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.infrastructure.context.builder import ContextBuilder
+from shared.infrastructure.context.models import ContextBuildRequest
+from shared.infrastructure.context.providers import embedding_cache, vectors
+from shared.infrastructure.context.providers.embedding_cache import (
+    QueryEmbeddingCache,
+)
+from shared.infrastructure.context.providers.vectors import VectorProvider
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> QueryEmbeddingCache:
+    cache = QueryEmbeddingCache(max_entries=8, ttl_sec=60)
+    monkeypatch.setattr(vectors, "get_query_embedding_cache", lambda: cache)
+    return cache
+
+
+def _cognitive(revision: str = "r1") -> MagicMock:
+    return MagicMock(
+        get_embedding_for_code=AsyncMock(return_value=[0.5, 0.5]),
+        get_embedding_revision=AsyncMock(return_value=revision),
+    )
+
+
+async def test_repeat_query_is_embedded_once_across_providers(
+    _fresh_cache: QueryEmbeddingCache,
+) -> None:
+    cognitive = _cognitive()
+    first = VectorProvider(qdrant_client=MagicMock(), cognitive_service=cognitive)
+    second = VectorProvider(qdrant_client=MagicMock(), cognitive_service=cognitive)
+
+    assert await first.embed_query("add  validation") == [0.5, 0.5]
+    assert await second.embed_query(" add validation\n") == [0.5, 0.5]
+
+    assert cognitive.get_embedding_for_code.await_count == 1
+    assert _fresh_cache.stats()["hit_rate"] == 0.5
+
+
+async def test_new_revision_misses() -> None:
+    provider = VectorProvider(qdrant_client=MagicMock(), cognitive_service=_cognitive())
+    await provider.embed_query("q")
+
+    provider.cognitive_service = _cognitive(revision="r2")
+    await provider.embed_query("q")
+
+    provider.cognitive_service.get_embedding_for_code.assert_awaited_once()
+
+
+def test_lru_eviction_and_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = QueryEmbeddingCache(max_entries=2, ttl_sec=10)
+    clock = [100.0]
+    monkeypatch.setattr(embedding_cache.time, "monotonic", lambda: clock[0])
+
+    cache.put("r", "a", [1.0])
+    cache.put("r", "b", [2.0])
+    assert cache.get("r", "a") == [1.0]
+    cache.put("r", "c", [3.0])  # evicts b, the least recently used
+
+    assert cache.get("r", "b") is None
+    clock[0] += 11
+    assert cache.get("r", "a") is None
+    assert cache.stats()["entries"] == 1
+
+
+async def test_builder_embeds_goal_once_for_all_collections() -> None:
+    cognitive = _cognitive()
+    qdrant = MagicMock(search=AsyncMock(return_value=[]))
+    builder = ContextBuilder(
+        db_provider=None,
+        vector_provider=VectorProvider(
+            qdrant_client=qdrant, cognitive_service=cognitive
+        ),
+        ast_provider=None,
+        config={},
+        workspace=None,
+    )
+
+    await builder._gather_vector_evidence(
+        ContextBuildRequest(goal="add validation", trigger="agent", phase="parse")
+    )
+
+    assert cognitive.get_embedding_for_code.await_count == 1
+    searched = {c.kwargs["collection_name"] for c in qdrant.search.await_args_list}
+    assert searched == {"core_policies", "core-patterns", "core_specs"}
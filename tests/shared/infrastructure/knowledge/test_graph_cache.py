@@ -0,0 +1,144 @@
+# tests/shared/infrastructure/knowledge/test_graph_cache.py
+
+"""
+KnowledgeGraphCache — delta refresh of core.knowledge_graph.
+
+Proves (database session faked by statement):
+  - the first refresh reads the whole view; an unchanged state reads nothing
+  - an updated symbol is re-read through the delta query from the previous
+    high-water mark minus the overlap, and earlier snapshots are not mutated
+  - a deleted symbol is pruned without a full read
+  - a link deletion, which cannot be traced to symbols, forces a full read
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from shared.infrastructure.knowledge import graph_cache
+from shared.infrastructure.knowledge.graph_cache import KnowledgeGraphCache
+
+
+_T0 = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _row(path: str, **extra) -> dict:
+    return {
+        "uuid": f"id-{path}",
+        "symbol_path": path,
+        "module": "pkg.mod",
+        "kind": "function",
+        "capabilities_array": ["cap.a"],
+        **extra,
+    }
+
+
+def _state(**overrides) -> SimpleNamespace:
+    values = {
+        "symbol_count": 2,
+        "symbol_hwm": _T0,
+        "symbol_sum": 10,
+        "link_count": 1,
+        "link_sum": 5,
+        "link_new_count": 0,
+        "link_new_sum": 0,
+        "link_hwm": _T0,
+        "vector_count": 0,
+        "vector_sum": 0,
+        "vector_new_count": 0,
+        "vector_new_sum": 0,
+        "vector_hwm": None,
+        "capability_count": 1,
+        "capability_sum": 3,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class _Session:
+    """Answers each of graph_cache's statements from scripted data."""
+
+    def __init__(self, state, view, delta=(), paths=()) -> None:
+        self.state, self.view, self.delta, self.paths = state, view, delta, paths
+        self.execute = AsyncMock(side_effect=self._execute)
+
+    def _execute(self, statement, params=None):
+        result = MagicMock()
+        if statement is graph_cache._STATE_SQL:
+            result.one.return_value = self.state
+        elif statement is graph_cache._FULL_SQL:
+            result.mappings.return_value.all.return_value = list(self.view)
+        elif statement is graph_cache._DELTA_SQL:
+            result.mappings.return_value.all.return_value = list(self.delta)
+        elif statement is graph_cache._PATHS_SQL:
+            result.scalars.return_value.all.return_value = list(self.paths)
+        return result
+
+    def statements(self) -> list:
+        return [c.args[0] for c in self.execute.await_args_list]
+
+
+async def _loaded() -> tuple[KnowledgeGraphCache, _Session]:
+    cache = KnowledgeGraphCache()
+    session = _Session(_state(), [_row("src/a.py::f"), _row("src/b.py::g")])
+    assert await cache.refresh(session)
+    return cache, session
+
+
+async def test_unchanged_state_reads_nothing() -> None:
+    cache, session = await _loaded()
+    assert set(cache.symbols) == {"src/a.py::f", "src/b.py::g"}
+    assert cache.symbols["src/a.py::f"]["capabilities"] == ["cap.a"]
+    session.execute.reset_mock()
+
+    assert not await cache.refresh(session)
+
+    assert session.statements() == [graph_cache._STATE_SQL]
+    assert cache.version == 1
+
+
+async def test_updated_symbol_is_read_by_delta() -> None:
+    cache, _ = await _loaded()
+    snapshot = cache.symbols
+    session = _Session(
+        _state(symbol_hwm=_T0 + timedelta(minutes=1), symbol_sum=11),
+        view=[],
+        delta=[_row("src/a.py::f", kind="class")],
+    )
+
+    assert await cache.refresh(session)
+
+    assert graph_cache._FULL_SQL not in session.statements()
+    params = session.execute.await_args_list[1].args[1]
+    assert params["symbol_since"] == _T0 - graph_cache._DELTA_OVERLAP
+    assert cache.symbols["src/a.py::f"]["kind"] == "class"
+    assert snapshot["src/a.py::f"]["kind"] == "function"
+    assert cache.version == 2
+
+
+async def test_deleted_symbol_is_pruned() -> None:
+    cache, _ = await _loaded()
+    session = _Session(
+        _state(symbol_count=1, symbol_sum=4), view=[], paths=["src/a.py::f"]
+    )
+
+    assert await cache.refresh(session)
+
+    assert graph_cache._FULL_SQL not in session.statements()
+    assert set(cache.symbols) == {"src/a.py::f"}
+
+
+async def test_link_deletion_forces_full_read() -> None:
+    cache, _ = await _loaded()
+    session = _Session(
+        _state(link_count=0, link_sum=0),
+        view=[_row("src/a.py::f", capabilities_array=[]), _row("src/b.py::g")],
+    )
+
+    assert await cache.refresh(session)
+
+    assert graph_cache._FULL_SQL in session.statements()
+    assert graph_cache._DELTA_SQL not in session.statements()
+    assert cache.symbols["src/a.py::f"]["capabilities"] == []
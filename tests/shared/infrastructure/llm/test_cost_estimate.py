@@ -12,7 +12,7 @@ from decimal import Decimal
 
 import pytest
 
-from shared.infrastructure.llm.client import _compute_cost_estimate
+from shared.infrastructure.llm.exchange_log_writer import _compute_cost_estimate
 
 
 def test_deepseek_chat_rate() -> None:
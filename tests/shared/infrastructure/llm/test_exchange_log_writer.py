@@ -0,0 +1,196 @@
+"""Buffered core.llm_exchange_log writer.
+
+- LLMClient._log_exchange only enqueues; no session is opened on the call path
+- the flusher writes once flush_rows records are waiting, or after the interval
+- aclose() / flush_exchange_log() drain whatever is still queued
+- a full queue drops the oldest record and counts it in stats()
+- rate rows are looked up once per model per TTL window
+- a failing flush is counted and swallowed
+- the flusher logs stats() when rows back up or records are lost, rate-limited
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.infrastructure.llm import client as client_mod
+from shared.infrastructure.llm import exchange_log_writer as elw
+from shared.infrastructure.llm.exchange_log_writer import (
+    ExchangeLogWriter,
+    ExchangeRecord,
+)
+
+
+def _record(model: str = "m", role: str = "Coder") -> ExchangeRecord:
+    return ExchangeRecord(
+        resource_name="r",
+        cognitive_role=role,
+        model_snapshot=model,
+        prompt_tokens=1_000_000,
+        completion_tokens=0,
+        duration_ms=5,
+        privacy_level="standard",
+    )
+
+
+def _writer(**kw) -> tuple[ExchangeLogWriter, list[list[ExchangeRecord]]]:
+    args = {
+        "flush_rows": 3,
+        "flush_interval_sec": 60.0,
+        "max_queue": 100,
+        "rate_cache_ttl_sec": 300.0,
+    }
+    args.update(kw)
+    writer = ExchangeLogWriter(**args)
+    batches: list[list[ExchangeRecord]] = []
+
+    async def _write(batch: list[ExchangeRecord]) -> int:
+        batches.append(batch)
+        return len(batch)
+
+    writer._write = _write  # type: ignore[method-assign]
+    return writer, batches
+
+
+async def test_size_threshold_triggers_one_batched_flush() -> None:
+    writer, batches = _writer()
+
+    for _ in range(3):
+        writer.enqueue(_record())
+    await asyncio.sleep(0.05)
+
+    assert [len(b) for b in batches] == [3]
+    assert writer.stats()["queue_depth"] == 0
+    assert writer.stats()["written"] == 3
+    await writer.aclose()
+
+
+async def test_interval_flushes_a_partial_batch() -> None:
+    writer, batches = _writer(flush_interval_sec=0.02)
+
+    writer.enqueue(_record())
+    assert batches == []
+    await asyncio.sleep(0.1)
+
+    assert [len(b) for b in batches] == [1]
+    await writer.aclose()
+
+
+async def test_aclose_drains_the_queue() -> None:
+    writer, batches = _writer()
+    writer.enqueue(_record())
+    writer.enqueue(_record())
+
+    await writer.aclose()
+
+    assert [len(b) for b in batches] == [2]
+    assert writer.stats()["queue_depth"] == 0
+
+
+async def test_full_queue_drops_oldest() -> None:
+    writer, batches = _writer(max_queue=2, flush_rows=100)
+    for model in ("a", "b", "c"):
+        writer.enqueue(_record(model=model))
+
+    assert writer.stats()["dropped"] == 1
+    await writer.aclose()
+
+    assert [r.model_snapshot for r in batches[0]] == ["b", "c"]
+
+
+async def test_failed_flush_is_counted_and_swallowed() -> None:
+    writer = ExchangeLogWriter(3, 60.0, 100, 300.0)
+
+    async def _boom(batch: list[ExchangeRecord]) -> int:
+        raise RuntimeError("db down")
+
+    writer._write = _boom  # type: ignore[method-assign]
+    writer.enqueue(_record())
+
+    assert await writer.flush() == 0
+    assert writer.stats()["failed_flushes"] == 1
+    await writer.aclose()
+
+
+async def test_losses_are_reported_once_per_interval(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    writer, _ = _writer(max_queue=1, flush_rows=100, stats_interval_sec=3600.0)
+    writer.enqueue(_record())
+    writer.enqueue(_record())
+
+    with caplog.at_level(logging.INFO, logger=elw.__name__):
+        writer._report_stats()
+        writer.enqueue(_record())
+        writer._report_stats()
+
+    lines = [r for r in caplog.records if "llm_exchange_log stats" in r.message]
+    assert len(lines) == 1
+    assert lines[0].levelno == logging.WARNING
+    assert "queue_depth=1" in lines[0].message
+    assert "dropped=1" in lines[0].message
+    await writer.aclose()
+
+
+async def test_idle_healthy_writer_reports_nothing(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    writer, _ = _writer(stats_interval_sec=0.0)
+    writer.enqueue(_record())
+    await writer.flush()
+
+    with caplog.at_level(logging.INFO, logger=elw.__name__):
+        writer._report_stats()
+
+    assert not [r for r in caplog.records if "llm_exchange_log stats" in r.message]
+    await writer.aclose()
+
+
+async def test_rate_lookup_is_cached_per_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    async def _lookup(session, model: str):
+        calls.append(model)
+        return (Decimal("2"), Decimal("4"))
+
+    monkeypatch.setattr(elw, "_lookup_model_rate", _lookup)
+    writer = ExchangeLogWriter(3, 60.0, 100, 300.0)
+    session = MagicMock()
+
+    first = await writer._rate_for(session, _record("a"))
+    await writer._rate_for(session, _record("a"))
+    await writer._rate_for(session, _record("b"))
+    writer.rate_cache_ttl_sec = 0
+    await writer._rate_for(session, _record("a"))
+
+    assert first == (Decimal("2"), Decimal("4"))
+    assert calls == ["a", "b", "a"]
+
+
+async def test_log_exchange_enqueues_without_a_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    writer, batches = _writer()
+    monkeypatch.setattr(client_mod, "get_exchange_log_writer", lambda: writer)
+    llm = client_mod.LLMClient(
+        provider=MagicMock(model_name="m"),
+        resource_config=MagicMock(resource_name="r"),
+    )
+
+    llm._log_exchange("Coder", {"prompt_tokens": 7}, 0.0, "standard")
+    llm._log_exchange(None, {}, 0.0, "standard")
+
+    assert writer.stats()["enqueued"] == 1
+    await writer.aclose()
+    assert batches[0][0].prompt_tokens == 7
+
+
+async def test_flush_exchange_log_without_writer_is_noop() -> None:
+    await elw.flush_exchange_log()
@@ -0,0 +1,109 @@
+"""Pooled, long-lived HTTP transport for AIProvider implementations.
+
+- one httpx.AsyncClient is reused across calls on the same event loop
+- aclose() closes it; the next call opens a fresh pool
+- pool limits come from operational_config.llm
+- LLMClientRegistry.aclose() closes every cached provider's pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+
+from shared.infrastructure.llm.client_registry import LLMClientRegistry
+from shared.infrastructure.llm.providers.ollama import OllamaProvider
+
+
+def _provider() -> OllamaProvider:
+    return OllamaProvider(api_url="http://localhost:11434", model_name="m", timeout=5)
+
+
+async def test_client_is_reused_across_calls() -> None:
+    provider = _provider()
+
+    first = provider.http_client()
+    second = provider.http_client()
+
+    assert first is second
+    await provider.aclose()
+
+
+async def test_aclose_closes_and_next_call_reopens() -> None:
+    provider = _provider()
+    first = provider.http_client()
+
+    await provider.aclose()
+    reopened = provider.http_client()
+
+    assert first.is_closed
+    assert reopened is not first and not reopened.is_closed
+    await provider.aclose()
+
+
+async def test_aclose_before_first_use_is_noop() -> None:
+    await _provider().aclose()
+
+
+def test_new_event_loop_gets_a_fresh_pool() -> None:
+    provider = _provider()
+
+    async def _grab() -> httpx.AsyncClient:
+        return provider.http_client()
+
+    first = asyncio.run(_grab())
+    second = asyncio.run(_grab())
+
+    assert first is not second
+
+
+async def test_chat_completion_uses_pooled_client() -> None:
+    provider = _provider()
+    seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"message": {"content": "hi"}})
+
+    pooled = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    provider._http = pooled
+    provider._http_loop = asyncio.get_running_loop()
+
+    assert await provider.chat_completion("p", user_id="u") == "hi"
+    assert await provider.chat_completion("p", user_id="u") == "hi"
+
+    assert seen == ["/api/chat", "/api/chat"]
+    assert provider.http_client() is pooled
+    await provider.aclose()
+    assert pooled.is_closed
+
+
+async def test_registry_aclose_closes_provider_pools() -> None:
+    registry = LLMClientRegistry()
+    provider = _provider()
+    pooled = provider.http_client()
+    registry._clients["r1"] = MagicMock(provider=provider)
+
+    await registry.aclose()
+
+    assert pooled.is_closed
+    assert registry.get_cached_resource_names() == []
+
+
+async def test_pool_limits_follow_operational_config(monkeypatch) -> None:
+    from shared.infrastructure.intent import operational_config as oc
+    from shared.infrastructure.llm.providers import base
+
+    cfg = oc.OperationalConfig(llm=oc.LLMConfig(http_max_connections=3, http2=False))
+    monkeypatch.setattr(base, "load_operational_config", lambda: cfg)
+    provider = _provider()
+
+    client = provider.http_client()
+    pool = client._transport._pool  # type: ignore[attr-defined]
+
+    assert pool._max_connections == 3
+    assert json.dumps(pool._http2) == "false"
+    await provider.aclose()
@@ -193,3 +193,57 @@ async def test_post_heartbeat_returns_uuid() -> None:
     ):
         result = await pub.post_heartbeat()
     assert isinstance(result, uuid.UUID)
+
+
+# ── post_findings_bulk / post_artifact_findings_bulk ──────────────────────────
+
+
+# ID: 3f2343ad-f6fd-490f-b09e-2eb2984761a1
+async def test_post_findings_bulk_empty_batch_skips_db() -> None:
+    pub = _publisher()
+    with patch("shared.workers.blackboard_publisher.get_session") as get_session:
+        result = await pub.post_findings_bulk([], resolution_mechanism="reaudit")
+    assert result == []
+    get_session.assert_not_called()
+
+
+# ID: 0796d348-ea9c-410a-b132-a94fdaaadee1
+async def test_post_findings_bulk_is_one_statement_collapsing_repeats() -> None:
+    pub = _publisher()
+    mock_session = _mock_session()
+    existing = uuid.uuid4()
+    mock_session.execute.return_value = MagicMock(
+        all=MagicMock(return_value=[(existing, "a")])
+    )
+    with patch(
+        "shared.workers.blackboard_publisher.get_session", return_value=mock_session
+    ):
+        result = await pub.post_findings_bulk(
+            [("a", {"n": 1}), ("b", {"n": 2}), ("a", {"n": 3})],
+            resolution_mechanism="reaudit",
+        )
+
+    assert mock_session.execute.await_count == 1
+    params = mock_session.execute.call_args.args[1]
+    assert params["subjects"] == ["a", "b"]
+    assert params["first_payloads"] == ['{"n": 1}', '{"n": 2}']
+    assert params["payloads"] == ['{"n": 3}', '{"n": 2}']
+    assert params["occurrences"] == [2, 1]
+    # IDs come back in input order; the upserted row's ID wins.
+    assert result[0] == existing and result[2] == existing
+    assert result[1] == params["ids"][1]
+
+
+# ID: 4e58a4a9-2825-43e8-89f6-300cff8489a9
+async def test_post_artifact_findings_bulk_rejects_whole_batch() -> None:
+    pub = _publisher(artifact_type="source_file", rule_namespace="test.runner")
+    with patch("shared.workers.blackboard_publisher.get_session") as get_session:
+        with pytest.raises(ValueError, match="sub_namespace"):
+            await pub.post_artifact_findings_bulk(
+                "source_file",
+                [
+                    ("test.runner.ok", "src/a.py", {}),
+                    ("other.ns", "src/b.py", {}),
+                ],
+            )
+    get_session.assert_not_called()
@@ -0,0 +1,394 @@
+# tests/will/workers/audit_violation_sensor/test_shared_audit_pass.py
+"""Shared, change-driven audit pass for audit sensors (AuditCoordinator),
+and the sensor cycle built on it.
+
+Proves:
+- the first pass audits every rule; an unchanged repo is then served from
+  the baseline without auditing
+- a changed file re-runs per-file rules on that file only, re-runs
+  context-level rules in full and carries every other violation over
+- a removed file drops its violations
+- an edited rule re-runs in full; unchanged rules carry over
+- a failed pass does not advance the baseline
+- sensor_full_sweep_sec=0 makes every pass a full audit
+- with incremental mode off each sensor fully audits only its own
+  namespace, every cycle
+- namespaces share one pass over the union of their rules and each gets
+  only its own slice; a namespace joining later runs only its new rules
+- a quiet sensor cycle neither reloads governance nor audits, and sensors
+  of one auditor context share a coordinator
+- a sensor cycle attributes causes in one lookup and posts its findings in
+  one bulk write
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from will.audit_violation.coordinator import AuditCoordinator, get_audit_coordinator
+from will.workers.audit_violation_sensor import AuditViolationSensor
+
+
+_RULE_IDS = ["ns.ctx", "ns.no_a", "ns.no_b"]
+
+
+def _rules(rule_ids: list[str], **hashes: str) -> dict[str, Any]:
+    return {
+        rule_id: SimpleNamespace(
+            rule_content_hash=hashes.get(rule_id.rpartition(".")[2], "h1"),
+            is_context_level=rule_id.endswith("ctx"),
+            requires_findings_from=[],
+        )
+        for rule_id in rule_ids
+    }
+
+
+class _FakeAuditor:
+    """Stands in for normalize_audit_findings over the files in ``root``.
+
+    *.no_a / *.no_b rules flag files containing "A" / "B"; *.ctx rules flag
+    the alphabetically first file whenever there is more than one.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.calls: list[tuple[list[str], list[str] | None]] = []
+        self.fail = False
+
+    async def __call__(
+        self,
+        core_context: Any,
+        rule_namespace: str,
+        rule_ids: list[str],
+        files: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        self.calls.append((list(rule_ids), files))
+        if self.fail:
+            raise RuntimeError("audit down")
+        every = sorted(p.name for p in self.root.glob("*.py"))
+        violations = []
+        for rule_id in rule_ids:
+            if rule_id.endswith("ctx"):
+                if len(every) > 1:
+                    violations.append(_violation(rule_id, every[0]))
+                continue
+            marker = "A" if rule_id.endswith("no_a") else "B"
+            for name in files if files is not None else every:
+                if marker in (self.root / name).read_text():
+                    violations.append(_violation(rule_id, name))
+        return violations
+
+
+def _violation(rule_id: str, file_path: str) -> dict[str, Any]:
+    return {
+        "file_path": file_path,
+        "line_number": 1,
+        "message": "m",
+        "severity": "error",
+        "rule_id": rule_id,
+        "context": {},
+    }
+
+
+def _pairs(violations: list[dict[str, Any]]) -> set[tuple[str, str]]:
+    return {(v["rule_id"], v["file_path"]) for v in violations}
+
+
+def _bump(path: Path, text: str) -> None:
+    """Rewrite ``path`` with a guaranteed-new mtime."""
+    before = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "a.py").write_text("A\n")
+    (tmp_path / "b.py").write_text("B\n")
+    (tmp_path / "c.py").write_text("ok\n")
+    (tmp_path / ".intent").mkdir()
+    (tmp_path / ".intent" / "rules.yaml").write_text("rules: []\n")
+    return tmp_path
+
+
+def _make_coordinator(
+    repo: Path, full_sweep_sec: float = 3600, incremental: bool = True
+) -> AuditCoordinator:
+    core_context = MagicMock()
+    core_context.auditor_context.repo_path = repo
+    coordinator = AuditCoordinator(core_context, full_sweep_sec, incremental)
+    coordinator._select_rules = MagicMock(side_effect=_rules)  # type: ignore[method-assign]
+    return coordinator
+
+
+@pytest.fixture
+def coordinator(repo: Path) -> AuditCoordinator:
+    return _make_coordinator(repo)
+
+
+@pytest.fixture
+def auditor(repo: Path) -> _FakeAuditor:
+    fake = _FakeAuditor(repo)
+    with patch("will.audit_violation.coordinator.normalize_audit_findings", fake):
+        yield fake
+
+
+async def _cycle(
+    coordinator: AuditCoordinator,
+    namespace: str = "ns",
+    rule_ids: list[str] = _RULE_IDS,
+) -> tuple[set, str]:
+    await coordinator.refresh(["*.py"])
+    raw, mode = await coordinator.audit(namespace, list(rule_ids))
+    return _pairs(raw), mode
+
+
+async def _full_truth(repo: Path, rule_ids: list[str] = _RULE_IDS) -> set:
+    return _pairs(await _FakeAuditor(repo)(None, "", list(rule_ids)))
+
+
+async def test_quiet_pass_reuses_the_baseline(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor
+) -> None:
+    first, mode = await _cycle(coordinator)
+    assert mode == "full"
+    assert first == {("ns.ctx", "a.py"), ("ns.no_a", "a.py"), ("ns.no_b", "b.py")}
+
+    auditor.calls.clear()
+    second, mode = await _cycle(coordinator)
+
+    assert mode == "quiet"
+    assert second == first
+    assert auditor.calls == []
+
+
+async def test_changed_file_reruns_only_its_pairs(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    await _cycle(coordinator)
+    auditor.calls.clear()
+
+    _bump(repo / "c.py", "A B\n")
+    result, mode = await _cycle(coordinator)
+
+    assert mode == "incremental"
+    assert auditor.calls == [(["ns.no_a", "ns.no_b"], ["c.py"]), (["ns.ctx"], None)]
+    assert result == await _full_truth(repo)
+
+
+async def test_removed_file_drops_its_violations(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    await _cycle(coordinator)
+    auditor.calls.clear()
+
+    (repo / "a.py").unlink()
+    result, _ = await _cycle(coordinator)
+
+    assert auditor.calls == [(["ns.ctx"], None)]
+    assert result == await _full_truth(repo)
+    assert not any(path == "a.py" for _, path in result)
+
+
+async def test_edited_rule_reruns_in_full(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    await _cycle(coordinator)
+    auditor.calls.clear()
+
+    _bump(repo / ".intent" / "rules.yaml", "rules: [changed]\n")
+    coordinator._select_rules.side_effect = lambda ids: _rules(ids, no_b="h2")
+    result, mode = await _cycle(coordinator)
+
+    assert mode == "incremental"
+    assert auditor.calls == [(["ns.no_b"], None)]
+    assert result == await _full_truth(repo)
+
+
+async def test_failed_pass_keeps_the_baseline(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    await _cycle(coordinator)
+    _bump(repo / "c.py", "B\n")
+    auditor.fail = True
+    with pytest.raises(RuntimeError):
+        await _cycle(coordinator)
+
+    auditor.fail = False
+    auditor.calls.clear()
+    result, mode = await _cycle(coordinator)
+
+    assert mode == "incremental"
+    assert (["ns.no_a", "ns.no_b"], ["c.py"]) in auditor.calls
+    assert result == await _full_truth(repo)
+
+
+async def test_zero_sweep_interval_is_always_full(
+    auditor: _FakeAuditor, repo: Path
+) -> None:
+    coordinator = _make_coordinator(repo, full_sweep_sec=0)
+    await _cycle(coordinator)
+
+    _, mode = await _cycle(coordinator)
+
+    assert mode == "full"
+
+
+async def test_non_incremental_audits_only_the_callers_namespace(
+    auditor: _FakeAuditor, repo: Path
+) -> None:
+    coordinator = _make_coordinator(repo, full_sweep_sec=0, incremental=False)
+    alpha, beta = ["alpha.no_a"], ["beta.ctx", "beta.no_b"]
+
+    for _ in range(2):
+        alpha_slice, alpha_mode = await _cycle(coordinator, "alpha", alpha)
+        beta_slice, beta_mode = await _cycle(coordinator, "beta", beta)
+
+    assert auditor.calls == [(alpha, None), (beta, None)] * 2
+    assert (alpha_mode, beta_mode) == ("full", "full")
+    assert alpha_slice == await _full_truth(repo, alpha)
+    assert beta_slice == await _full_truth(repo, beta)
+
+
+async def test_namespaces_share_one_pass_and_get_their_slice(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    alpha, beta = ["alpha.no_a"], ["beta.ctx", "beta.no_b"]
+    await _cycle(coordinator, "alpha", alpha)
+    await _cycle(coordinator, "beta", beta)
+    _bump(repo / "c.py", "A B\n")
+    auditor.calls.clear()
+
+    alpha_slice, alpha_mode = await _cycle(coordinator, "alpha", alpha)
+    beta_slice, beta_mode = await _cycle(coordinator, "beta", beta)
+
+    # One pass over the union served both namespaces.
+    assert auditor.calls == [
+        (["alpha.no_a", "beta.no_b"], ["c.py"]),
+        (["beta.ctx"], None),
+    ]
+    assert (alpha_mode, beta_mode) == ("incremental", "quiet")
+    assert alpha_slice == await _full_truth(repo, alpha)
+    assert beta_slice == await _full_truth(repo, beta)
+
+
+async def test_joining_namespace_runs_only_its_rules(
+    coordinator: AuditCoordinator, auditor: _FakeAuditor, repo: Path
+) -> None:
+    await _cycle(coordinator, "alpha", ["alpha.no_a"])
+    auditor.calls.clear()
+
+    beta_slice, mode = await _cycle(coordinator, "beta", ["beta.no_b"])
+
+    assert mode == "incremental"
+    assert auditor.calls == [(["beta.no_b"], None)]
+    assert beta_slice == {("beta.no_b", "b.py")}
+
+
+def _wired_sensor(repo: Path) -> tuple[AuditViolationSensor, MagicMock, MagicMock]:
+    """A sensor over ``repo`` with every collaborator but the audit mocked.
+
+    Returns the sensor, its core context and its intent repository.
+    """
+    core_context = MagicMock()
+    core_context.auditor_context.repo_path = repo
+    sensor = AuditViolationSensor(
+        core_context=core_context,
+        declaration_name="audit_violation_sensor",
+        rule_namespace="ns",
+    )
+    artifact_type = MagicMock()
+    artifact_type.content = {"discovery": ["*.py"]}
+    intent_repo = MagicMock()
+    intent_repo.get_artifact_type.return_value = artifact_type
+    intent_repo._rule_index = dict.fromkeys(_RULE_IDS)
+
+    coordinator = get_audit_coordinator(core_context, sensor._artifact_type)
+    coordinator._select_rules = MagicMock(side_effect=_rules)  # type: ignore[method-assign]
+    bb = AsyncMock()
+    for drain in (
+        "adjudicate_awaiting_reaudit_findings",
+        "adjudicate_indeterminate_findings",
+        "adjudicate_abandoned_findings",
+    ):
+        getattr(bb, drain).return_value = {
+            "released_subjects": [],
+            "resolved_subjects": [],
+        }
+    bb.fetch_active_finding_subjects_by_prefix.return_value = set()
+    core_context.registry.get_blackboard_service = AsyncMock(return_value=bb)
+    consequences = AsyncMock()
+    consequences.find_causes_for_files.return_value = {}
+    core_context.registry.get_consequence_log_service = AsyncMock(
+        return_value=consequences
+    )
+    sensor.post_heartbeat = AsyncMock()  # type: ignore[method-assign]
+    sensor.post_report = AsyncMock()  # type: ignore[method-assign]
+    sensor.post_artifact_findings_bulk = AsyncMock()  # type: ignore[method-assign]
+    return sensor, core_context, intent_repo
+
+
+async def test_quiet_sensor_cycle_skips_governance_reload(
+    auditor: _FakeAuditor, repo: Path
+) -> None:
+    sensor, core_context, intent_repo = _wired_sensor(repo)
+    auditor_context = core_context.auditor_context
+    coordinator = get_audit_coordinator(core_context, sensor._artifact_type)
+
+    with patch(
+        "will.workers.audit_violation_sensor.get_intent_repository",
+        return_value=intent_repo,
+    ):
+        await sensor.run()
+        auditor_context.reload_governance.reset_mock()
+        auditor_context.invalidate_file_cache.reset_mock()
+        auditor.calls.clear()
+        await sensor.run()
+
+    assert get_audit_coordinator(core_context, sensor._artifact_type) is coordinator
+    auditor_context.reload_governance.assert_not_called()
+    auditor_context.invalidate_file_cache.assert_not_called()
+    assert auditor.calls == []
+    payload = sensor.post_report.call_args.kwargs["payload"]
+    assert payload["audit_mode"] == "quiet"
+
+
+async def test_sensor_cycle_posts_in_one_bulk_write(
+    auditor: _FakeAuditor, repo: Path
+) -> None:
+    sensor, core_context, intent_repo = _wired_sensor(repo)
+    consequences = await core_context.registry.get_consequence_log_service()
+    consequences.find_causes_for_files.return_value = {
+        "a.py": {"causing_proposal_id": "p-1", "causing_commit_sha": "abc"},
+        "b.py": {"causing_proposal_id": None, "causing_commit_sha": None},
+    }
+
+    with patch(
+        "will.workers.audit_violation_sensor.get_intent_repository",
+        return_value=intent_repo,
+    ):
+        await sensor.run()
+
+    consequences.find_causes_for_files.assert_awaited_once()
+    assert consequences.find_causes_for_files.await_args.args[0] == ["a.py", "b.py"]
+    consequences.find_cause_for_file.assert_not_called()
+    sensor.post_artifact_findings_bulk.assert_awaited_once()
+    artifact_type, findings = sensor.post_artifact_findings_bulk.await_args.args
+    assert artifact_type == sensor._artifact_type
+    attribution = {
+        (rule_id, path): payload["cause_attribution"]
+        for rule_id, path, payload in findings
+    }
+    assert attribution == {
+        ("ns.ctx", "a.py"): "heuristic",
+        ("ns.no_a", "a.py"): "heuristic",
+        ("ns.no_b", "b.py"): "untracked",
+    }
+    payload = sensor.post_report.call_args.kwargs["payload"]
+    assert payload["posted"] == 3
@@ -0,0 +1,166 @@
+"""Batched, cross-artifact embed pipeline for RepoEmbedderWorker.
+
+- chunks from several artifacts share size-bounded embedding batches
+- empty chunk texts are skipped
+- each collection is ensured once (memoized) and gets one upsert
+- a failed batch fails only the artifacts it carried
+- chunk points are keyed on content hash: stored chunks are not re-embedded,
+  only orphaned points are deleted, identical chunks share one point
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from shared.infrastructure.intent import operational_config as oc
+from will.workers.repo_embedding import helpers
+from will.workers.repo_embedding.helpers import (
+    _chunk_point_id,
+    _embed_artifacts,
+    _EmbedJob,
+    _plan_embed_batches,
+)
+
+
+def _chunks(*texts: str) -> list[dict[str, Any]]:
+    return [{"text": t, "metadata": {"section": f"s{i}"}} for i, t in enumerate(texts)]
+
+
+@pytest.fixture(autouse=True)
+def _cfg(monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = oc.OperationalConfig(
+        embedding=oc.EmbeddingConfig(
+            batch_max_chunks=3, batch_max_chars=1000, batch_concurrency=2
+        )
+    )
+    monkeypatch.setattr(helpers, "load_operational_config", lambda: cfg)
+
+
+def _qdrant(stored: dict[str, list[str]] | None = None) -> AsyncMock:
+    """Qdrant double whose collection already holds ``stored`` chunk texts."""
+    records = [
+        MagicMock(id=_pid(path, text), payload={"file_path": path})
+        for path, texts in (stored or {}).items()
+        for text in texts
+    ]
+    return AsyncMock(scroll_all_points=AsyncMock(return_value=records))
+
+
+def _pid(path: str, text: str) -> str:
+    return _chunk_point_id(path, hashlib.sha256(text.encode()).hexdigest())
+
+
+def _cognitive(fail_on: str | None = None) -> AsyncMock:
+    async def _batch(texts: list[str]) -> list[list[float]]:
+        if fail_on in texts:
+            raise RuntimeError("embedder down")
+        return [[float(len(t))] for t in texts]
+
+    return AsyncMock(get_embeddings_for_code_batch=AsyncMock(side_effect=_batch))
+
+
+def test_plan_packs_across_artifacts_by_count_and_chars() -> None:
+    jobs = [
+        _EmbedJob("a.py", "python", "c", _chunks("aa", "", "bb")),
+        _EmbedJob("b.py", "python", "c", _chunks("cc", "dd")),
+    ]
+
+    assert _plan_embed_batches(jobs, max_chunks=3, max_chars=100) == [
+        [(0, 0), (0, 2), (1, 0)],
+        [(1, 1)],
+    ]
+    assert _plan_embed_batches(jobs, max_chunks=10, max_chars=4) == [
+        [(0, 0), (0, 2)],
+        [(1, 0), (1, 1)],
+    ]
+
+
+async def test_batches_and_one_upsert_per_collection() -> None:
+    qdrant = _qdrant()
+    cognitive = _cognitive()
+    ensured: set[str] = set()
+    jobs = [
+        _EmbedJob("a.py", "python", "core-code", _chunks("a1", "", "a3")),
+        _EmbedJob("b.py", "python", "core-code", _chunks("b1")),
+        _EmbedJob("d.md", "doc", "core-docs", _chunks("d1", "d2")),
+    ]
+
+    results = await _embed_artifacts(jobs, qdrant, cognitive, ensured)
+
+    assert results == [2, 1, 2]
+    assert cognitive.get_embeddings_for_code_batch.await_count == 2
+    assert qdrant.upsert_points.await_count == 2
+    assert ensured == {"core-code", "core-docs"}
+    code_points = qdrant.upsert_points.await_args_list[0].kwargs["points"]
+    assert [p.id for p in code_points] == [
+        _pid("a.py", "a1"),
+        _pid("a.py", "a3"),
+        _pid("b.py", "b1"),
+    ]
+
+
+async def test_ensured_collections_are_not_rechecked() -> None:
+    qdrant = _qdrant()
+    job = _EmbedJob("a.py", "python", "core-code", _chunks("a1"))
+
+    await _embed_artifacts([job], qdrant, _cognitive(), {"core-code"})
+
+    qdrant.ensure_collection.assert_not_awaited()
+    qdrant.upsert_points.assert_awaited_once()
+
+
+async def test_failed_batch_fails_only_its_artifacts() -> None:
+    qdrant = _qdrant()
+    jobs = [
+        _EmbedJob("a.py", "python", "c", _chunks("x1", "x2", "x3")),
+        _EmbedJob("b.py", "python", "c", _chunks("boom")),
+    ]
+
+    results = await _embed_artifacts(jobs, qdrant, _cognitive("boom"), set())
+
+    assert results[0] == 3
+    assert isinstance(results[1], RuntimeError)
+    points = qdrant.upsert_points.await_args.kwargs["points"]
+    assert {p.payload["file_path"] for p in points} == {"a.py"}
+
+
+async def test_unchanged_chunks_are_reused_and_orphans_deleted() -> None:
+    qdrant = _qdrant({"a.py": ["keep", "old"]})
+    cognitive = _cognitive()
+    job = _EmbedJob("a.py", "python", "c", _chunks("keep", "new"))
+
+    [count] = await _embed_artifacts([job], qdrant, cognitive, set())
+
+    assert count == 2
+    cognitive.get_embeddings_for_code_batch.assert_awaited_once_with(["new"])
+    points = qdrant.upsert_points.await_args.kwargs["points"]
+    assert [p.id for p in points] == [_pid("a.py", "new")]
+    assert points[0].payload["content_sha256"] == hashlib.sha256(b"new").hexdigest()
+    qdrant.delete_points.assert_awaited_once_with(
+        [_pid("a.py", "old")], wait=True, collection_name="c"
+    )
+
+
+async def test_fully_unchanged_file_makes_no_calls() -> None:
+    qdrant = _qdrant({"a.py": ["same"]})
+    cognitive = _cognitive()
+    job = _EmbedJob("a.py", "python", "c", _chunks("same", "same"))
+
+    assert await _embed_artifacts([job], qdrant, cognitive, set()) == [1]
+    cognitive.get_embeddings_for_code_batch.assert_not_awaited()
+    qdrant.upsert_points.assert_not_awaited()
+    qdrant.delete_points.assert_not_awaited()
+
+
+async def test_unreadable_store_re_embeds_without_deleting() -> None:
+    qdrant = AsyncMock(scroll_all_points=AsyncMock(side_effect=RuntimeError("x")))
+    cognitive = _cognitive()
+    job = _EmbedJob("a.py", "python", "c", _chunks("k1", "k2"))
+
+    assert await _embed_artifacts([job], qdrant, cognitive, set()) == [2]
+    qdrant.upsert_points.assert_awaited_once()
+    qdrant.delete_points.assert_not_awaited()